@@ -0,0 +1,36 @@
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from simulation.systems.commerce_system import CommerceSystem
+
+N_HOUSEHOLDS = 50000
+
+def run_benchmark():
+    households = [
+        SimpleNamespace(
+            id=i,
+            _bio_state=SimpleNamespace(is_active=True, needs={"survival": 0.0}),
+            _econ_state=SimpleNamespace(is_employed=i % 5 != 0, assets=float(i % 40)),
+        )
+        for i in range(N_HOUSEHOLDS)
+    ]
+    planner = MagicMock()
+    planner.decide_consumption_batch.return_value = {
+        'consume': [1.0] * N_HOUSEHOLDS,
+        'buy': [float(i % 3) for i in range(N_HOUSEHOLDS)],
+        'price': 5.0,
+    }
+    context = {
+        "households": households, "breeding_planner": planner, "government": SimpleNamespace(id=1),
+        "market_data": {}, "time": 1, "sales_tax_rate": 0.05,
+    }
+    system = CommerceSystem(SimpleNamespace())
+
+    start_time = time.perf_counter()
+    planned, transactions = system.plan_consumption_and_leisure(context)
+    elapsed = time.perf_counter() - start_time
+    print(f"{N_HOUSEHOLDS:,} households, {len(transactions):,} emergency buys | plan: {elapsed:.4f}s")
+
+if __name__ == "__main__":
+    for i in range(5):
+        run_benchmark()
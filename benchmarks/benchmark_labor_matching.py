@@ -0,0 +1,48 @@
+import time
+import random
+from modules.labor.system import execute_labor_matching
+from modules.labor.api import JobOfferDTO, JobSeekerDTO
+from modules.common.enums import IndustryDomain
+from modules.simulation.api import AgentID
+from simulation.dtos.api import JobMatchContextDTO
+
+MAJORS = [IndustryDomain.GENERAL, IndustryDomain.FOOD_PROD, IndustryDomain.MANUFACTURING,
+          IndustryDomain.TECHNOLOGY, IndustryDomain.FINANCE, IndustryDomain.SERVICES]
+
+def build_context(n_seekers, n_offers, seed=42):
+    rng = random.Random(seed)
+    offers = [
+        JobOfferDTO(
+            firm_id=AgentID(rng.randint(1, max(1, n_offers // 5))),
+            offer_wage_pennies=rng.randint(800, 4000),
+            required_education=rng.randint(0, 4),
+            major=rng.choice(MAJORS),
+        )
+        for _ in range(n_offers)
+    ]
+    seekers = [
+        JobSeekerDTO(
+            household_id=AgentID(100000 + i),
+            reservation_wage_pennies=rng.randint(500, 4000),
+            education_level=rng.randint(0, 4),
+            major=rng.choice(MAJORS),
+            talent_score=rng.uniform(0.5, 2.0),
+        )
+        for i in range(n_seekers)
+    ]
+    return JobMatchContextDTO(tick=1, available_seekers=seekers, available_offers=offers, market_panic_index=0.0)
+
+def run_benchmark(n_seekers, n_offers):
+    context = build_context(n_seekers, n_offers)
+
+    start_time = time.perf_counter()
+    result = execute_labor_matching(context)
+    end_time = time.perf_counter()
+
+    elapsed = end_time - start_time
+    print(f"Labor matching {n_seekers:>6} seekers x {n_offers:>5} offers: "
+          f"{elapsed:.4f} seconds ({len(result.matched_pairs)} matches)")
+
+if __name__ == "__main__":
+    for n_seekers, n_offers in [(1000, 200), (2500, 500), (5000, 1000), (10000, 2000)]:
+        run_benchmark(n_seekers, n_offers)
@@ -0,0 +1,46 @@
+import time
+from types import SimpleNamespace
+from simulation.components.engines.hr_engine import HREngine
+from simulation.components.state.firm_state_models import HRState
+from simulation.dtos.hr_dtos import HRPayrollContextDTO, TaxPolicyDTO
+from modules.firm.components.budget_gatekeeper import BudgetGatekeeper
+from modules.system.api import DEFAULT_CURRENCY
+
+N_EMPLOYEES = 50000
+
+def run_benchmark():
+    state = HRState()
+    state.employees = [
+        SimpleNamespace(id=i, employer_id=1, is_employed=True, labor_skill=1.0 + (i % 7) * 0.1, education_level=i % 4)
+        for i in range(N_EMPLOYEES)
+    ]
+    state.employee_wages = {i: 1500 + i % 500 for i in range(N_EMPLOYEES)}
+    context = HRPayrollContextDTO(
+        exchange_rates={DEFAULT_CURRENCY: 1.0},
+        tax_policy=TaxPolicyDTO(income_tax_rate=0.1, survival_cost=1000, government_agent_id=999),
+        current_time=1,
+        firm_id=1,
+        wallet_balances={DEFAULT_CURRENCY: 10 ** 12},
+    )
+    config = SimpleNamespace(halo_effect=0.1)
+    engine = HREngine()
+    gatekeeper = BudgetGatekeeper()
+
+    start_time = time.perf_counter()
+    intent = engine.calculate_payroll_obligations(state, context, config)
+    gatekeeper.allocate_budget(context.wallet_balances, intent.wage_obligations)
+    batched = time.perf_counter() - start_time
+
+    # Per-employee obligations (the audit view) through the same gatekeeper
+    start_time = time.perf_counter()
+    gatekeeper.allocate_budget(context.wallet_balances, intent.payroll_batch.to_obligations())
+    expanded = time.perf_counter() - start_time
+
+    print(
+        f"{N_EMPLOYEES:,} employees | batch: {batched:.4f}s | "
+        f"per-employee obligations: {expanded:.4f}s | speedup: {expanded / batched:.1f}x"
+    )
+
+if __name__ == "__main__":
+    for i in range(5):
+        run_benchmark()
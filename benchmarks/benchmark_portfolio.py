@@ -0,0 +1,30 @@
+import time
+import numpy as np
+from simulation.decisions.portfolio_manager import PortfolioManager
+from simulation.dtos import MacroFinancialContext
+
+N_HOUSEHOLDS = 50000
+
+def run_benchmark():
+    rng = np.random.default_rng(0)
+    liquid = rng.uniform(0, 50000.0, N_HOUSEHOLDS)
+    lambdas = rng.uniform(0.1, 10.0, N_HOUSEHOLDS)
+    context = MacroFinancialContext(inflation_rate=0.04, gdp_growth_rate=-0.01, market_volatility=0.2, interest_rate_trend=0.0)
+
+    start_time = time.perf_counter()
+    for cash, lam in zip(liquid.tolist(), lambdas.tolist()):
+        PortfolioManager.optimize_portfolio(cash, lam, 0.03, 0.15, 300.0, 0.02, macro_context=context)
+    scalar = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    PortfolioManager.optimize_portfolios(liquid, lambdas, 0.03, 0.15, 300.0, 0.02, macro_context=context)
+    batched = time.perf_counter() - start_time
+
+    print(
+        f"{N_HOUSEHOLDS:,} households | per-agent: {scalar:.4f}s | "
+        f"batch: {batched:.4f}s | speedup: {scalar / batched:.1f}x"
+    )
+
+if __name__ == "__main__":
+    for i in range(5):
+        run_benchmark()
@@ -0,0 +1,67 @@
+import time
+from types import SimpleNamespace
+from modules.government.tax.service import TaxService
+from modules.government.services.welfare_service import WelfareService
+from modules.government.welfare.registry import WelfareRecipientRegistry, RecipientRosterDTO
+from modules.government.api import ITaxableHousehold
+from simulation.dtos.api import MarketSnapshotDTO
+from modules.system.api import AgentID
+
+N_HOUSEHOLDS = 50000
+
+class DummyConfig:
+    ANNUAL_WEALTH_TAX_RATE = 0.05
+    TICKS_PER_YEAR = 100
+    WEALTH_TAX_THRESHOLD = 5000000
+    UNEMPLOYMENT_BENEFIT_RATIO = 0.5
+    HOUSEHOLD_FOOD_CONSUMPTION_PER_TICK = 1.0
+    GOODS_INITIAL_PRICE = {"basic_food": 1000}
+    STIMULUS_TRIGGER_GDP_DROP = -0.1
+
+class DummyAgent:
+    def __init__(self, agent_id, net_worth, is_employed):
+        self.is_active = True
+        self.balance_pennies = net_worth
+        self.is_employed = is_employed
+        self.needs = None
+        self.id = AgentID(agent_id)
+        self.name = "dummy"
+
+# Register the class as conforming to the protocol to satisfy isinstance (as in benchmark_tax.py)
+ITaxableHousehold.register(DummyAgent)
+
+def run_benchmark():
+    config = DummyConfig()
+    tax_service = TaxService(config)
+    welfare_service = WelfareService(config)
+    snapshot = MarketSnapshotDTO(tick=1, market_signals={}, market_data={"total_production": 1000.0})
+    gdp_history = [1000.0] * 10
+
+    # Half above the wealth-tax threshold, one in five unemployed
+    agents = [DummyAgent(i, 10000000 if i % 2 else 1000000, i % 5 != 0) for i in range(N_HOUSEHOLDS)]
+    registry = WelfareRecipientRegistry()
+    registry.register_many(agents)
+
+    # Baseline: both services scan and protocol-check the raw agent list (benchmark_tax.py path)
+    start_time = time.perf_counter()
+    tax_service.collect_wealth_tax(agents)
+    welfare_service.run_welfare_check(agents, snapshot, 1, gdp_history)
+    baseline = time.perf_counter() - start_time
+
+    # Registry: one columnar roster shared by both services
+    start_time = time.perf_counter()
+    roster = registry.build_roster()
+    tax_result = tax_service.collect_wealth_tax(roster)
+    welfare_result = welfare_service.run_welfare_check(roster, snapshot, 1, gdp_history)
+    batched = time.perf_counter() - start_time
+
+    legs = len(tax_result.payment_requests) + len(welfare_result.payment_requests)
+    print(
+        f"{N_HOUSEHOLDS:,} households, {legs:,} settlement legs | "
+        f"agent-list scan: {baseline:.4f}s | registry roster: {batched:.4f}s | "
+        f"speedup: {baseline / batched:.1f}x"
+    )
+
+if __name__ == "__main__":
+    for i in range(5):
+        run_benchmark()
@@ -11,13 +11,15 @@ from modules.simulation.api import InventorySlot, ItemDTO
 from modules.agent_framework.api import IInventoryComponent, ComponentConfigDTO, InventoryStateDTO
 from modules.finance.api import SystemicIntegrityError
 from simulation.systems.settlement_system import InventorySentry
+from simulation.components.state.versioning import VersionedState
 
 logger = logging.getLogger(__name__)
 
-class InventoryComponent(IInventoryComponent):
+class InventoryComponent(VersionedState, IInventoryComponent):
     """
     Component handling inventory management with quality tracking.
     Supports MAIN and INPUT slots.
+    Slot dicts are revision-tracked so owners can cache inventory snapshots.
     """
 
     def __init__(self, owner_id: str):
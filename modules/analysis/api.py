@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TypedDict, Dict, List, Protocol, Optional, TYPE_CHECKING
+from typing import TypedDict, Dict, List, Mapping, Protocol, Optional, TYPE_CHECKING
 from dataclasses import dataclass
 
 if TYPE_CHECKING:
@@ -66,18 +66,21 @@ class PhenomenaReportDTO(TypedDict):
     resilience_index: ResilienceIndexDTO
     policy_metrics: PolicySynergyMetrics
     detected_events: List[PhenomenonEventDTO]
-    key_timeseries: Dict[str, List[float]] # For plotting GDP, inflation, etc.
+    key_timeseries: Dict[str, List[float]] # For plotting GDP, inflation, etc. (newest `timeseries_window` ticks)
 
 # --- Configuration DTOs ---
 
 class DetectorConfigDTO(TypedDict):
-    """Configuration for a single detector."""
+    """Configuration for a single detector. Streaming detectors may also read an optional 'indicator' key."""
     module: str # e.g., 'modules.analysis.detectors.LiquidityCrisisDetector'
     enabled: bool
     thresholds: Dict[str, float]
 
 class AnalysisConfigDTO(TypedDict):
-    """Top-level configuration for the PhenomenaAnalyzer."""
+    """
+    Top-level configuration for the PhenomenaAnalyzer.
+    May also set 'timeseries_window', the ticks of history kept for key_timeseries.
+    """
     detectors: Dict[str, DetectorConfigDTO]
     resilience_weights: Dict[str, float]
 
@@ -93,6 +96,20 @@ class IDetector(Protocol):
         """Analyze collected data and return detected events."""
         ...
 
+class IStreamingDetector(Protocol):
+    """
+    Interface for a detector that consumes one tick of indicator data at a time
+    and keeps bounded state (running statistics), so its cost per tick is
+    independent of run length.
+    """
+    def consume(self, tick: int, indicators: Mapping[str, float]) -> List[PhenomenonEventDTO]:
+        """Feed one tick of indicators. Returns events that started on this tick."""
+        ...
+
+    def analyze(self) -> List[PhenomenonEventDTO]:
+        """Return every event (episode) detected so far."""
+        ...
+
 class IAnalyzer(Protocol):
     """Interface for the main phenomena analyzer."""
     def run_tick(self, tick: int, sim_state: ISimulationState) -> None:
@@ -1,11 +1,18 @@
 import logging
 import csv
 import os
-from typing import List, Dict, Any, TYPE_CHECKING
+from typing import List, Dict, Any, Optional, Set, Tuple, TYPE_CHECKING
+
+import numpy as np
+
 from simulation.firms import Firm
+from simulation.components.state.versioning import VersionedState
 from modules.finance.domain.corporate_finance import AltmanZScoreCalculator
 from modules.analysis.api import CrisisDistributionDTO
 
+SAFE, GRAY, DISTRESS = 0, 1, 2
+SNAPSHOT_COLUMNS = ("total_assets", "working_capital", "retained_earnings", "average_profit")
+
 if TYPE_CHECKING:
     from simulation.firms import Firm
 
@@ -16,12 +23,29 @@ class CrisisMonitor:
         - Safe: Z > 2.99
         - Gray: 1.81 <= Z <= 2.99
         - Distress: Z < 1.81
+
+    Ratio inputs are kept in per-firm NumPy columns and only re-read for firms
+    that changed since the last tick: firms a settlement moved money for
+    (reported through `mark_dirty`) and firms whose state component revisions
+    moved. Every `full_refresh_interval` ticks all rows are re-read as a
+    safety net for balance changes made outside the settlement system.
     """
 
-    def __init__(self, logger: logging.Logger, run_id: int):
+    def __init__(self, logger: logging.Logger, run_id: int, full_refresh_interval: int = 50):
         self.logger = logger
         self._run_id = run_id
         self._log_file_initialized = False
+        self.full_refresh_interval = full_refresh_interval
+        self._slots: Dict[int, int] = {}
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._columns: Dict[str, np.ndarray] = {name: np.zeros(0, dtype=np.float64) for name in SNAPSHOT_COLUMNS}
+        self._z_scores = np.zeros(0, dtype=np.float64)
+        self._status = np.zeros(0, dtype=np.int8)
+        self._status_counts = np.zeros(3, dtype=np.int64)
+        self._fingerprints: Dict[int, Optional[Tuple[Any, ...]]] = {}
+        self._dirty: Set[int] = set()
+        self._last_full_refresh: Optional[int] = None
+        self.rows_refreshed = 0
         self._initialize_log_file()
 
     @property
@@ -50,28 +74,46 @@ class CrisisMonitor:
             writer.writerow(["tick", "safe_count", "gray_count", "distress_count", "total_active_firms", "survival_rate"])
         self._log_file_initialized = True
 
+    def mark_dirty(self, agent_id: int) -> None:
+        """Flags an agent whose balances changed (IBalanceChangeObserver)."""
+        self._dirty.add(agent_id)
+
     def monitor(self, tick: int, firms: List['Firm']) -> CrisisDistributionDTO:
         """
-        Iterates through active firms, calculates Z-Score, and logs distribution.
+        Refreshes changed firms, updates the Z-Score distribution, and logs it.
         """
-        safe_count = 0
-        gray_count = 0
-        distress_count = 0
-        active_firms_count = 0
+        full_refresh = (
+            self._last_full_refresh is None
+            or tick - self._last_full_refresh >= self.full_refresh_interval
+        )
+        if full_refresh:
+            self._last_full_refresh = tick
 
+        active_ids: Set[int] = set()
+        stale: List['Firm'] = []
         for firm in firms:
             if not firm.is_active:
                 continue
-
-            active_firms_count += 1
-            z_score = self._calculate_z_score_for_firm(firm)
-
-            if z_score > 2.99:
-                safe_count += 1
-            elif z_score >= 1.81:
-                gray_count += 1
-            else:
-                distress_count += 1
+            firm_id = firm.id
+            active_ids.add(firm_id)
+            fingerprint = self._fingerprint(firm)
+            if (
+                full_refresh
+                or firm_id in self._dirty
+                or fingerprint is None
+                or self._fingerprints.get(firm_id) != fingerprint
+            ):
+                self._fingerprints[firm_id] = fingerprint
+                stale.append(firm)
+        self._dirty.clear()
+
+        for firm_id in [firm_id for firm_id in self._slots if firm_id not in active_ids]:
+            self._remove(firm_id)
+        if stale:
+            self._refresh(stale)
+
+        safe_count, gray_count, distress_count = (int(count) for count in self._status_counts)
+        active_firms_count = len(active_ids)
 
         total_firms = len(firms)
         survival_rate = (active_firms_count / total_firms) if total_firms > 0 else 0.0
@@ -100,6 +142,99 @@ class CrisisMonitor:
             active=active_firms_count
         )
 
+    def get_z_scores(self) -> Dict[int, float]:
+        """Latest Z-Score of every monitored firm."""
+        n = len(self._slots)
+        return dict(zip(self._ids[:n].tolist(), self._z_scores[:n].tolist()))
+
+    def _fingerprint(self, firm: 'Firm') -> Optional[Tuple[Any, ...]]:
+        """
+        Revisions of the firm state feeding its snapshot (profit history, debt,
+        capital stock, inventory, prices). None if any of it is not versioned,
+        in which case the firm is re-read every tick.
+        """
+        components = (
+            getattr(firm, "finance_state", None),
+            getattr(firm, "production_state", None),
+            getattr(firm, "sales_state", None),
+            getattr(firm, "inventory_component", None),
+        )
+        if not all(isinstance(c, VersionedState) for c in components):
+            return None
+        return tuple((id(c), c.revision) for c in components)
+
+    def _refresh(self, firms: List['Firm']) -> None:
+        """Re-reads the snapshots of `firms` and re-scores their rows in one pass."""
+        rows = np.fromiter((self._slot(firm.id) for firm in firms), dtype=np.int64, count=len(firms))
+        snapshots = [firm.get_financial_snapshot() for firm in firms]
+        for name, column in self._columns.items():
+            column[rows] = [snapshot[name] for snapshot in snapshots]
+        self.rows_refreshed += len(firms)
+
+        z_scores = self._calculate_z_scores(*(self._columns[name][rows] for name in SNAPSHOT_COLUMNS))
+        status = np.where(z_scores > 2.99, SAFE, np.where(z_scores >= 1.81, GRAY, DISTRESS)).astype(np.int8)
+
+        self._status_counts -= np.bincount(self._status[rows], minlength=3)
+        self._status_counts += np.bincount(status, minlength=3)
+        self._z_scores[rows] = z_scores
+        self._status[rows] = status
+
+    @staticmethod
+    def _calculate_z_scores(
+        total_assets: np.ndarray,
+        working_capital: np.ndarray,
+        retained_earnings: np.ndarray,
+        average_profit: np.ndarray
+    ) -> np.ndarray:
+        """Vectorized AltmanZScoreCalculator.calculate (0.0 where total assets <= 0)."""
+        positive = total_assets > 0
+        denominator = np.where(positive, total_assets, 1.0)
+        x1 = working_capital / denominator
+        x2 = retained_earnings / denominator
+        x3 = average_profit / denominator
+        return np.where(positive, 1.2 * x1 + 1.4 * x2 + 3.3 * x3, 0.0)
+
+    def _slot(self, firm_id: int) -> int:
+        slot = self._slots.get(firm_id)
+        if slot is not None:
+            return slot
+        slot = len(self._slots)
+        if slot == len(self._ids):
+            self._grow(max(16, 2 * slot))
+        self._slots[firm_id] = slot
+        self._ids[slot] = firm_id
+        # New rows start out counted as distress (Z = 0) until their first refresh
+        self._z_scores[slot] = 0.0
+        self._status[slot] = DISTRESS
+        self._status_counts[DISTRESS] += 1
+        return slot
+
+    def _grow(self, capacity: int) -> None:
+        def resized(array: np.ndarray) -> np.ndarray:
+            grown = np.zeros(capacity, dtype=array.dtype)
+            grown[:len(array)] = array
+            return grown
+
+        self._ids = resized(self._ids)
+        self._columns = {name: resized(column) for name, column in self._columns.items()}
+        self._z_scores = resized(self._z_scores)
+        self._status = resized(self._status)
+
+    def _remove(self, firm_id: int) -> None:
+        """Drops a firm's row, moving the last row into its slot."""
+        slot = self._slots.pop(firm_id)
+        self._fingerprints.pop(firm_id, None)
+        self._status_counts[self._status[slot]] -= 1
+        last = len(self._slots)
+        if slot != last:
+            moved_id = int(self._ids[last])
+            self._slots[moved_id] = slot
+            self._ids[slot] = moved_id
+            for column in self._columns.values():
+                column[slot] = column[last]
+            self._z_scores[slot] = self._z_scores[last]
+            self._status[slot] = self._status[last]
+
     def _calculate_z_score_for_firm(self, firm: 'Firm') -> float:
         """
         Helper to calculate Z-Score for a firm instance using the domain calculator.
@@ -0,0 +1,45 @@
+from typing import List, Mapping
+from modules.analysis.api import IStreamingDetector, PhenomenonEventDTO, DetectorConfigDTO
+from modules.analysis.streaming import EWMA, EpisodeTracker, GrowthRate, RollingStats
+
+class BubbleDetector(IStreamingDetector):
+    """
+    Flags a price level that is both far above its recent range (rolling z-score)
+    and still accelerating (EWMA of tick-over-tick growth).
+    Watches `config['indicator']` (default 'cpi').
+    """
+    def __init__(self, config: DetectorConfigDTO):
+        self.config = config
+        self.current_tick = 0
+        thresholds = config.get('thresholds', {})
+        self.indicator = config.get('indicator', 'cpi')
+        self.zscore_threshold = thresholds.get('zscore_threshold', 2.0)
+        self.growth_threshold = thresholds.get('growth_threshold', 0.02)
+        self.window = RollingStats(int(thresholds.get('window', 20)))
+        self.growth = GrowthRate()
+        self.growth_ewma = EWMA(thresholds.get('ewma_alpha', 0.3))
+        self.episodes = EpisodeTracker('BubbleDetector')
+
+    def consume(self, tick: int, indicators: Mapping[str, float]) -> List[PhenomenonEventDTO]:
+        self.current_tick = tick
+        price = indicators.get(self.indicator, 0.0)
+        growth = self.growth_ewma.push(self.growth.push(price))
+
+        # Score against the window before this tick joins it
+        stdev = self.window.stdev
+        zscore = (price - self.window.mean) / stdev if self.window.full and stdev > 0 else 0.0
+        self.window.push(price)
+
+        event = self.episodes.step(
+            tick,
+            zscore > self.zscore_threshold and growth > self.growth_threshold,
+            severity=(zscore - self.zscore_threshold) / self.zscore_threshold,
+            message=f"Price bubble in {self.indicator}: z={zscore:.2f}, growth={growth:.2%}",
+            details={'indicator': self.indicator, 'value': price, 'zscore': zscore, 'growth': growth}
+        )
+        return [event] if event else []
+
+    def analyze(self) -> List[PhenomenonEventDTO]:
+        if not self.config.get('enabled', False):
+            return []
+        return list(self.episodes.events)
@@ -0,0 +1,37 @@
+from typing import List, Mapping
+from modules.analysis.api import IStreamingDetector, PhenomenonEventDTO, DetectorConfigDTO
+from modules.analysis.streaming import EpisodeTracker, RollingMax
+
+class CrashDetector(IStreamingDetector):
+    """
+    Flags a drawdown of `config['indicator']` (default 'gdp') from its peak
+    over the last `window` ticks beyond `drawdown_threshold`.
+    """
+    def __init__(self, config: DetectorConfigDTO):
+        self.config = config
+        self.current_tick = 0
+        thresholds = config.get('thresholds', {})
+        self.indicator = config.get('indicator', 'gdp')
+        self.drawdown_threshold = thresholds.get('drawdown_threshold', 0.10)
+        self.peak = RollingMax(int(thresholds.get('window', 50)))
+        self.episodes = EpisodeTracker('CrashDetector')
+
+    def consume(self, tick: int, indicators: Mapping[str, float]) -> List[PhenomenonEventDTO]:
+        self.current_tick = tick
+        value = indicators.get(self.indicator, 0.0)
+        peak = self.peak.push(tick, value)
+        drawdown = (peak - value) / peak if peak > 0 else 0.0
+
+        event = self.episodes.step(
+            tick,
+            drawdown > self.drawdown_threshold,
+            severity=(drawdown - self.drawdown_threshold) / (1.0 - self.drawdown_threshold) if self.drawdown_threshold < 1.0 else 1.0,
+            message=f"Crash in {self.indicator}: {drawdown:.2%} below peak",
+            details={'indicator': self.indicator, 'value': value, 'peak': peak, 'peak_tick': self.peak.peak_tick, 'drawdown': drawdown}
+        )
+        return [event] if event else []
+
+    def analyze(self) -> List[PhenomenonEventDTO]:
+        if not self.config.get('enabled', False):
+            return []
+        return list(self.episodes.events)
@@ -0,0 +1,44 @@
+from typing import List, Mapping
+from modules.analysis.api import IStreamingDetector, PhenomenonEventDTO, DetectorConfigDTO
+from modules.analysis.streaming import EWMA, EpisodeTracker, GrowthRate
+
+class StagflationDetector(IStreamingDetector):
+    """
+    Flags persistent inflation (EWMA of CPI growth) together with stalled
+    output (EWMA of GDP growth) and high unemployment.
+    """
+    def __init__(self, config: DetectorConfigDTO):
+        self.config = config
+        self.current_tick = 0
+        thresholds = config.get('thresholds', {})
+        alpha = thresholds.get('ewma_alpha', 0.2)
+        self.inflation_threshold = thresholds.get('inflation_threshold', 0.05)
+        self.growth_threshold = thresholds.get('growth_threshold', 0.0)
+        self.unemployment_threshold = thresholds.get('unemployment_threshold', 0.08)
+        self.cpi_growth = GrowthRate()
+        self.gdp_growth = GrowthRate()
+        self.inflation = EWMA(alpha)
+        self.output_growth = EWMA(alpha)
+        self.episodes = EpisodeTracker('StagflationDetector')
+
+    def consume(self, tick: int, indicators: Mapping[str, float]) -> List[PhenomenonEventDTO]:
+        self.current_tick = tick
+        inflation = self.inflation.push(self.cpi_growth.push(indicators.get('cpi', 0.0)))
+        growth = self.output_growth.push(self.gdp_growth.push(indicators.get('gdp', 0.0)))
+        unemployment = indicators.get('unemployment_rate', 0.0)
+
+        event = self.episodes.step(
+            tick,
+            inflation > self.inflation_threshold
+            and growth <= self.growth_threshold
+            and unemployment >= self.unemployment_threshold,
+            severity=(inflation - self.inflation_threshold) * 10,
+            message=f"Stagflation: inflation {inflation:.2%}, growth {growth:.2%}, unemployment {unemployment:.2%}",
+            details={'inflation': inflation, 'growth': growth, 'unemployment_rate': unemployment}
+        )
+        return [event] if event else []
+
+    def analyze(self) -> List[PhenomenonEventDTO]:
+        if not self.config.get('enabled', False):
+            return []
+        return list(self.episodes.events)
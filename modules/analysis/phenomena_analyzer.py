@@ -1,21 +1,33 @@
-from typing import List, Dict, Any, Type
+from typing import List, Dict, Any, Deque, Type, Union
 import importlib
 import re
 import math
-import statistics
-from collections import defaultdict
+from collections import deque
 from modules.analysis.api import (
-    IAnalyzer, IDetector, AnalysisConfigDTO, PhenomenaReportDTO,
+    IAnalyzer, IDetector, IStreamingDetector, AnalysisConfigDTO, PhenomenaReportDTO,
     PhenomenonEventDTO, ResilienceIndexDTO, PolicySynergyMetrics
 )
+from modules.analysis.streaming import RunningStats
 from modules.simulation.api import ISimulationState
 
+RECENT_EVENTS_LIMIT = 100
+KEY_TIMESERIES_LIMIT = 1000  # Newest ticks kept per series for the report
+
 class PhenomenaAnalyzer(IAnalyzer):
+    """
+    Runs the configured detectors every tick. Streaming detectors (those with
+    `consume`) are fed one tick of indicators and report events live;
+    classic detectors get `update` with the simulation state. The report's
+    key time series cover the newest `timeseries_window` ticks.
+    """
     def __init__(self, config: AnalysisConfigDTO):
         self.config = config
-        self.detectors: List[IDetector] = []
-        self.history: Dict[str, List[float]] = defaultdict(list)
+        self.detectors: List[Union[IDetector, IStreamingDetector]] = []
+        window = self.config.get('timeseries_window', KEY_TIMESERIES_LIMIT)
+        self.history: Dict[str, Deque[float]] = {name: deque(maxlen=window) for name in ('gdp', 'cpi')}
+        self.recent_events: Deque[PhenomenonEventDTO] = deque(maxlen=RECENT_EVENTS_LIMIT)
         self.simulation_ticks = 0
+        self._gdp_stats = RunningStats()
         self._load_detectors()
 
     def _load_detectors(self):
@@ -55,13 +67,23 @@ class PhenomenaAnalyzer(IAnalyzer):
 
     def run_tick(self, tick: int, sim_state: ISimulationState) -> None:
         self.simulation_ticks = max(self.simulation_ticks, tick)
+        indicators = sim_state.get_economic_indicators()
+        frame = {
+            'gdp': indicators.gdp,
+            'cpi': indicators.cpi,
+            'unemployment_rate': getattr(indicators, 'unemployment_rate', 0.0)
+        }
+
         for detector in self.detectors:
-            detector.update(tick, sim_state)
+            if hasattr(detector, 'consume'):
+                self.recent_events.extend(detector.consume(tick, frame))
+            else:
+                detector.update(tick, sim_state)
 
         # Record time series
-        indicators = sim_state.get_economic_indicators()
         self.history['gdp'].append(indicators.gdp)
         self.history['cpi'].append(indicators.cpi)
+        self._gdp_stats.push(indicators.gdp)
 
     def generate_report(self) -> PhenomenaReportDTO:
         all_events = []
@@ -76,7 +98,7 @@ class PhenomenaAnalyzer(IAnalyzer):
             'resilience_index': resilience_index,
             'policy_metrics': policy_metrics,
             'detected_events': all_events,
-            'key_timeseries': dict(self.history)
+            'key_timeseries': {name: list(values) for name, values in self.history.items()}
         }
 
     def _calculate_resilience(self, events: List[PhenomenonEventDTO], policy_metrics: PolicySynergyMetrics) -> ResilienceIndexDTO:
@@ -92,19 +114,15 @@ class PhenomenaAnalyzer(IAnalyzer):
 
         # 2. Volatility Score (Stability)
         volatility_score = 0.0
-        if len(self.history['gdp']) > 2:
-            try:
-                # Calculate Coefficient of Variation (CV) = Stdev / Mean
-                gdp_data = self.history['gdp']
-                mean_gdp = statistics.mean(gdp_data)
-                stdev_gdp = statistics.stdev(gdp_data)
-
-                if mean_gdp > 0:
-                    cv = stdev_gdp / mean_gdp
-                    # Map CV to score: 0 CV -> 100 score, >0.1 CV -> 0 score
-                    volatility_score = max(0.0, 100.0 * (1.0 - (cv * 10.0)))
-            except statistics.StatisticsError:
-                pass
+        if self._gdp_stats.count > 2:
+            # Calculate Coefficient of Variation (CV) = Stdev / Mean
+            mean_gdp = self._gdp_stats.mean
+            stdev_gdp = self._gdp_stats.stdev
+
+            if mean_gdp > 0:
+                cv = stdev_gdp / mean_gdp
+                # Map CV to score: 0 CV -> 100 score, >0.1 CV -> 0 score
+                volatility_score = max(0.0, 100.0 * (1.0 - (cv * 10.0)))
 
         # 3. Policy Bonus
         policy_bonus_factor = weights.get('policy_bonus_factor', 1.1)
@@ -1,8 +1,8 @@
 from __future__ import annotations
 from typing import Any, Dict, List
-import statistics
 from modules.analysis.api import VerificationConfigDTO, StormReportDTO
-from modules.simulation.api import MarketSnapshotDTO, ISimulationState
+from modules.analysis.streaming import RunningStats
+from modules.simulation.api import ISimulationState
 
 class StormVerifier:
     def __init__(self, config: VerificationConfigDTO, simulation: ISimulationState):
@@ -15,13 +15,14 @@ class StormVerifier:
             "total_population_ticks": 0,
             "peak_debt_to_gdp": 0.0
         }
-        self._gdp_history: List[float] = []
-        self._cpi_history: List[float] = []
+        # Running statistics instead of full history: O(1) state per run
+        self._gdp_stats = RunningStats()
+        self._cpi_stats = RunningStats()
 
-    def update(self, current_tick: int, market_snapshot: MarketSnapshotDTO):
-        # Store history
-        self._gdp_history.append(market_snapshot.get("gdp", 0.0))
-        self._cpi_history.append(market_snapshot.get("cpi", 0.0))
+    def update(self, current_tick: int, market_snapshot: Dict[str, float]):
+        # Accumulate volatility statistics
+        self._gdp_stats.push(market_snapshot.get("gdp", 0.0))
+        self._cpi_stats.push(market_snapshot.get("cpi", 0.0))
 
         # 1. ZLB Check (Monetary Policy)
         # Access Central Bank base_rate via Protocol
@@ -91,13 +92,13 @@ class StormVerifier:
 
         # Volatility Metrics
         gdp_stdev = 0.0
-        if len(self._gdp_history) > 1:
-            gdp_stdev = statistics.stdev(self._gdp_history)
+        if self._gdp_stats.count > 1:
+            gdp_stdev = self._gdp_stats.stdev
 
         cpi_rolling_mean = 0.0
-        if self._cpi_history:
+        if self._cpi_stats.count:
             # Calculate simple average for now as the "rolling mean" summary
-            cpi_rolling_mean = statistics.mean(self._cpi_history)
+            cpi_rolling_mean = self._cpi_stats.mean
 
         return StormReportDTO(
             zlb_hit=self._metrics["zlb_hit"],
@@ -0,0 +1,172 @@
+"""
+modules/analysis/streaming.py
+
+Constant-state running statistics for streaming phenomenon detectors.
+Each primitive consumes one value per tick and keeps O(1) (or O(window))
+state, so detection cost does not grow with run length.
+"""
+from __future__ import annotations
+import math
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from modules.analysis.api import PhenomenonEventDTO
+
+
+class RunningStats:
+    """Whole-run count, mean and sample variance (Welford's algorithm)."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def push(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class RollingStats:
+    """Mean and sample variance of the last `window` values."""
+
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self._values: Deque[float] = deque()
+        self._sum = 0.0
+        self._sum_sq = 0.0
+
+    def push(self, value: float) -> None:
+        self._values.append(value)
+        self._sum += value
+        self._sum_sq += value * value
+        if len(self._values) > self.window:
+            old = self._values.popleft()
+            self._sum -= old
+            self._sum_sq -= old * old
+
+    @property
+    def count(self) -> int:
+        return len(self._values)
+
+    @property
+    def full(self) -> bool:
+        return len(self._values) == self.window
+
+    @property
+    def mean(self) -> float:
+        return self._sum / len(self._values) if self._values else 0.0
+
+    @property
+    def variance(self) -> float:
+        n = len(self._values)
+        if n < 2:
+            return 0.0
+        # Clamp the rounding residue of the running sums
+        return max(0.0, (self._sum_sq - self._sum * self._sum / n) / (n - 1))
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class EWMA:
+    """Exponentially weighted moving average; seeded with the first value."""
+
+    def __init__(self, alpha: float) -> None:
+        self.alpha = alpha
+        self.value: Optional[float] = None
+
+    def push(self, value: float) -> float:
+        self.value = value if self.value is None else self.alpha * value + (1.0 - self.alpha) * self.value
+        return self.value
+
+
+class RollingMax:
+    """Maximum of the last `window` ticks (monotonic deque, amortized O(1))."""
+
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self._candidates: Deque[Tuple[int, float]] = deque()
+
+    def push(self, tick: int, value: float) -> float:
+        while self._candidates and self._candidates[-1][1] <= value:
+            self._candidates.pop()
+        self._candidates.append((tick, value))
+        while self._candidates[0][0] <= tick - self.window:
+            self._candidates.popleft()
+        return self._candidates[0][1]
+
+    @property
+    def peak(self) -> float:
+        return self._candidates[0][1] if self._candidates else 0.0
+
+    @property
+    def peak_tick(self) -> int:
+        return self._candidates[0][0] if self._candidates else 0
+
+
+class GrowthRate:
+    """Tick-over-tick relative change of a series (0.0 until there is a positive base)."""
+
+    def __init__(self) -> None:
+        self._previous: Optional[float] = None
+
+    def push(self, value: float) -> float:
+        previous, self._previous = self._previous, value
+        if not previous or previous <= 0:
+            return 0.0
+        return (value - previous) / previous
+
+
+class EpisodeTracker:
+    """
+    Turns a per-tick condition into episode events. An episode opens on the
+    first tick the condition holds, is extended (end tick, peak severity) while
+    it keeps holding, and closes on the first tick it does not.
+    """
+
+    def __init__(self, detector_name: str) -> None:
+        self.detector_name = detector_name
+        self.events: List[PhenomenonEventDTO] = []
+        self._open: Optional[PhenomenonEventDTO] = None
+
+    @property
+    def active(self) -> bool:
+        return self._open is not None
+
+    def step(self, tick: int, condition: bool, severity: float = 0.0, message: str = "",
+             details: Optional[Dict[str, Any]] = None) -> Optional[PhenomenonEventDTO]:
+        """Feeds one tick. Returns the event if an episode opened on this tick."""
+        if not condition:
+            self._open = None
+            return None
+
+        severity = max(0.0, min(1.0, severity))
+        if self._open is not None:
+            self._open['end_tick'] = tick
+            if severity > self._open['severity']:
+                self._open['severity'] = severity
+                self._open['message'] = message
+                self._open['details'] = details or {}
+            return None
+
+        self._open = {
+            'detector_name': self.detector_name,
+            'start_tick': tick,
+            'end_tick': tick,
+            'severity': severity,
+            'message': message,
+            'details': details or {}
+        }
+        self.events.append(self._open)
+        return self._open
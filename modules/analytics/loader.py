@@ -3,15 +3,21 @@ Analytics Loader for Simulation Data.
 Handles data loading from SQLite and auxiliary JSON files.
 """
 import sqlite3
+import numpy as np
 import pandas as pd
 import json
 import os
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Sequence, Tuple, Union
 from modules.government.dtos import TaxHistoryItemDTO
 
 logger = logging.getLogger(__name__)
 
+# A run id, "latest" or None (latest)
+RunRef = Union[int, str, None]
+DEFAULT_CHUNKSIZE = 50_000
+MAX_INLINE_PARAMS = 500
+
 class DataLoader:
     def __init__(self, db_path: str = "simulation_data.db"):
         self.db_path = db_path
@@ -32,63 +38,146 @@ class DataLoader:
                 # Fallback if table doesn't exist or other error
                 return 1
 
-    def load_economic_indicators(self, run_id: Optional[int] = None) -> pd.DataFrame:
-        """Loads economic indicators for a specific run."""
+    def _resolve_run_id(self, run_id: RunRef) -> int:
         if run_id is None or run_id == "latest":
-            run_id = self._get_latest_run_id()
-
-        query = f"SELECT * FROM economic_indicators WHERE run_id = {run_id} ORDER BY time ASC"
+            return self._get_latest_run_id()
+        return int(run_id)
 
+    def _table_columns(self, table: str) -> List[str]:
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"PRAGMA table_info({table})")
+            return [info[1] for info in cursor.fetchall()]
+
+    def _select_list(self, table: str, columns: Optional[Sequence[str]], required: Sequence[str] = ()) -> str:
+        """
+        Validated column projection. Names are checked against the table
+        schema, so they are safe to inline (only values are bound as parameters).
+        """
+        if columns is None:
+            return "*"
+        available = self._table_columns(table)
+        unknown = [c for c in columns if c not in available]
+        if unknown:
+            raise ValueError(f"Unknown columns for {table}: {unknown}")
+        selected = list(dict.fromkeys([*required, *columns]))
+        return ", ".join(f'"{c}"' for c in selected)
+
+    @staticmethod
+    def _tick_filter(column: str, start_tick: Optional[int], end_tick: Optional[int],
+                     clauses: List[str], params: List[Any]) -> None:
+        if start_tick is not None:
+            clauses.append(f"{column} >= ?")
+            params.append(int(start_tick))
+        if end_tick is not None:
+            clauses.append(f"{column} <= ?")
+            params.append(int(end_tick))
+
+    @staticmethod
+    def _in_filter(column: str, values: Optional[Iterable[Any]], clauses: List[str], params: List[Any]) -> None:
+        if values is None:
+            return
+        values = list(values)
+        if len(values) > MAX_INLINE_PARAMS:
+            # One JSON parameter instead of one per value (SQLite caps bound variables)
+            clauses.append(f"{column} IN (SELECT value FROM json_each(?))")
+            params.append(json.dumps([int(v) for v in values]))
+            return
+        clauses.append(f"{column} IN ({', '.join('?' * len(values))})" if values else "0")
+        params.extend(values)
+
+    def _read(self, query: str, params: Sequence[Any]) -> pd.DataFrame:
         with self._get_connection() as conn:
-            df = pd.read_sql_query(query, conn)
+            return pd.read_sql_query(query, conn, params=params)
+
+    def _read_chunks(self, query: str, params: Sequence[Any], chunksize: int) -> Iterator[pd.DataFrame]:
+        conn = self._get_connection()
+        try:
+            yield from pd.read_sql_query(query, conn, params=params, chunksize=chunksize)
+        finally:
+            conn.close()
+
+    def load_economic_indicators(self, run_id: RunRef = None, columns: Optional[Sequence[str]] = None,
+                                 start_tick: Optional[int] = None, end_tick: Optional[int] = None) -> pd.DataFrame:
+        """Loads economic indicators for a specific run, optionally restricted to columns and a tick range."""
+        clauses = ["run_id = ?"]
+        params: List[Any] = [self._resolve_run_id(run_id)]
+        self._tick_filter("time", start_tick, end_tick, clauses, params)
+        select = self._select_list("economic_indicators", columns, required=("time",))
+        query = f"SELECT {select} FROM economic_indicators WHERE {' AND '.join(clauses)} ORDER BY time ASC"
+
+        df = self._read(query, params)
 
         if not df.empty:
             df.set_index("time", inplace=True)
         return df
 
-    def load_agent_states(self, run_id: Optional[int] = None) -> pd.DataFrame:
-        """Loads agent states for a specific run."""
-        if run_id is None or run_id == "latest":
-            run_id = self._get_latest_run_id()
-
-        query = f"SELECT * FROM agent_states WHERE run_id = {run_id} ORDER BY time ASC"
-
-        with self._get_connection() as conn:
-            df = pd.read_sql_query(query, conn)
+    def _agent_states_query(self, run_id: RunRef, columns: Optional[Sequence[str]],
+                            agent_ids: Optional[Iterable[int]], agent_type: Optional[str],
+                            start_tick: Optional[int], end_tick: Optional[int]) -> Tuple[str, List[Any]]:
+        # Filters are pushed into SQL and served by the (run_id, agent_id, time) / (run_id, time) indexes
+        clauses = ["run_id = ?"]
+        params: List[Any] = [self._resolve_run_id(run_id)]
+        self._in_filter("agent_id", agent_ids, clauses, params)
+        if agent_type is not None:
+            clauses.append("agent_type = ?")
+            params.append(agent_type)
+        self._tick_filter("time", start_tick, end_tick, clauses, params)
+        select = self._select_list("agent_states", columns)
+        return f"SELECT {select} FROM agent_states WHERE {' AND '.join(clauses)} ORDER BY time ASC", params
+
+    def load_agent_states(self, run_id: RunRef = None, columns: Optional[Sequence[str]] = None,
+                          agent_ids: Optional[Iterable[int]] = None, agent_type: Optional[str] = None,
+                          start_tick: Optional[int] = None, end_tick: Optional[int] = None) -> pd.DataFrame:
+        """Loads agent states for a specific run, filtered in SQL."""
+        query, params = self._agent_states_query(run_id, columns, agent_ids, agent_type, start_tick, end_tick)
 
         # Note: agent_states can be large, we don't set index by default as time is not unique
-        return df
-
-    def load_market_history(self, run_id: Optional[int] = None, market_id: str = "goods_market") -> pd.DataFrame:
+        return self._read(query, params)
+
+    def iter_agent_states(self, run_id: RunRef = None, columns: Optional[Sequence[str]] = None,
+                          agent_ids: Optional[Iterable[int]] = None, agent_type: Optional[str] = None,
+                          start_tick: Optional[int] = None, end_tick: Optional[int] = None,
+                          chunksize: int = DEFAULT_CHUNKSIZE) -> Iterator[pd.DataFrame]:
+        """
+        Streams agent states as DataFrames of at most `chunksize` rows, in time order,
+        so a large run can be reduced without holding the whole table in memory.
+        """
+        query, params = self._agent_states_query(run_id, columns, agent_ids, agent_type, start_tick, end_tick)
+        return self._read_chunks(query, params, chunksize)
+
+    def load_agent_series(self, column: str, run_id: RunRef = None, agent_ids: Optional[Iterable[int]] = None,
+                          start_tick: Optional[int] = None, end_tick: Optional[int] = None,
+                          chunksize: int = DEFAULT_CHUNKSIZE) -> Dict[str, np.ndarray]:
+        """
+        Reads one agent_states column as flat NumPy arrays {"time", "agent_id", column},
+        accumulating chunk by chunk.
+        """
+        fields = ("time", "agent_id", column)
+        parts: Dict[str, List[np.ndarray]] = {f: [] for f in fields}
+        for chunk in self.iter_agent_states(run_id, columns=fields, agent_ids=agent_ids,
+                                            start_tick=start_tick, end_tick=end_tick, chunksize=chunksize):
+            for f in fields:
+                parts[f].append(chunk[f].to_numpy())
+        return {f: np.concatenate(arrays) if arrays else np.empty(0) for f, arrays in parts.items()}
+
+    def load_market_history(self, run_id: RunRef = None, market_id: str = "goods_market",
+                            columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
         """Loads market history for a specific market."""
-        # Note: market_history table does not always have run_id in legacy schema,
-        # but SimulationRepository.save_market_history inserts it?
-        # Let's check schema. SimulationRepository schema for market_history:
-        # INSERT INTO market_history (time, market_id, item_id, avg_price, ...)
-        # It does NOT have run_id!
-        # This implies market_history is cleared between runs or shared?
-        # SimulationRepository.clear_all_data clears it.
-        # So we assume the current DB content belongs to the relevant run(s).
-        # We cannot filter by run_id if the column doesn't exist.
-
-        # Check if table has run_id column
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("PRAGMA table_info(market_history)")
-            columns = [info[1] for info in cursor.fetchall()]
+        # market_history has no run_id column in the current schema: it is cleared
+        # between runs (SimulationRepository.clear_all_data), so the DB content is
+        # assumed to belong to the relevant run. Filter by run only where the column exists.
+        has_run_id = "run_id" in self._table_columns("market_history")
 
-        has_run_id = "run_id" in columns
-
-        query = f"SELECT * FROM market_history WHERE market_id = '{market_id}'"
+        clauses = ["market_id = ?"]
+        params: List[Any] = [market_id]
         if has_run_id and run_id:
-             if run_id == "latest":
-                 run_id = self._get_latest_run_id()
-             query += f" AND run_id = {run_id}"
-
-        query += " ORDER BY time ASC"
+            clauses.append("run_id = ?")
+            params.append(self._resolve_run_id(run_id))
+        select = self._select_list("market_history", columns, required=("time",))
+        query = f"SELECT {select} FROM market_history WHERE {' AND '.join(clauses)} ORDER BY time ASC"
 
-        with self._get_connection() as conn:
-            df = pd.read_sql_query(query, conn)
+        df = self._read(query, params)
 
         if not df.empty:
             df.set_index("time", inplace=True)
@@ -537,6 +537,20 @@ class ISettlementSystem(IAccountRegistry, Protocol):
         """
         ...
 
+    def execute_bulk_transfers(
+        self,
+        transfers: List[Tuple[IFinancialEntity, IFinancialEntity, int, str]],
+        tick: int,
+        currency: CurrencyCode = DEFAULT_CURRENCY
+    ) -> List[Optional[ITransaction]]:
+        """
+        Executes many independent transfers in a single settlement call.
+        Format: (DebitAgent, CreditAgent, Amount, Memo).
+        Legs are applied in order with the same guarantees as `transfer`;
+        a failing leg yields None at its position and does not abort the rest.
+        """
+        ...
+
     def audit_total_m2(self, expected_total: int | None = None) -> bool:
         """
         Audits the total M2 money supply in the system against registered CurrencyHolders.
@@ -1024,6 +1038,10 @@ class IPanicRecorder(Protocol):
     """Protocol for recording panic metrics (e.g., bank run withdrawals)."""
     def record_withdrawal(self, amount_pennies: int) -> None: ...
 
+class IBalanceChangeObserver(Protocol):
+    """Protocol for observers told which agents a settlement moved money for."""
+    def mark_dirty(self, agent_id: AgentID) -> None: ...
+
 @runtime_checkable
 class ISalesTracker(Protocol):
     """Protocol for tracking sales metrics."""
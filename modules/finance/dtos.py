@@ -131,6 +131,22 @@ class SettlementOrder:
     memo: str
     transaction_type: str # e.g., 'WAGE', 'TAX', 'PURCHASE', 'ASSET_ENDOWMENT'
 
+@dataclass(frozen=True)
+class DividendDistributionDTO:
+    """
+    Summary of one firm's pro-rata payout in one currency.
+    Row i of `holder_ids` receives `amounts_pennies[i]`; amounts sum to `total_pennies`.
+    """
+    firm_id: AgentID
+    currency: CurrencyCode
+    total_pennies: int
+    holder_ids: Any  # np.ndarray[int64]
+    amounts_pennies: Any  # np.ndarray[int64]
+
+    @property
+    def recipient_count(self) -> int:
+        return len(self.holder_ids)
+
 @dataclass(frozen=True)
 class TaxCollectionResult:
     """
@@ -1,18 +1,95 @@
 from __future__ import annotations
 from collections import defaultdict
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
 from modules.finance.api import IShareholderRegistry, ShareholderData
 
+
+class CapTable:
+    """
+    Columnar holdings of one firm: parallel holder-id and quantity arrays.
+    Updates are O(1) (removal swaps the last row into the freed slot), so row
+    order is arbitrary; consumers must not depend on it.
+    """
+
+    def __init__(self, capacity: int = 8):
+        self._ids = np.zeros(capacity, dtype=np.int64)
+        self._quantities = np.zeros(capacity, dtype=np.float64)
+        self._slots: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def set(self, agent_id: int, quantity: float) -> None:
+        slot = self._slots.get(agent_id)
+        if slot is None:
+            slot = len(self._slots)
+            if slot == len(self._ids):
+                self._ids = np.resize(self._ids, 2 * slot)
+                self._quantities = np.resize(self._quantities, 2 * slot)
+            self._slots[agent_id] = slot
+            self._ids[slot] = agent_id
+        self._quantities[slot] = quantity
+
+    def remove(self, agent_id: int) -> None:
+        slot = self._slots.pop(agent_id, None)
+        if slot is None:
+            return
+        last = len(self._slots)
+        if slot != last:
+            moved_id = int(self._ids[last])
+            self._ids[slot] = moved_id
+            self._quantities[slot] = self._quantities[last]
+            self._slots[moved_id] = slot
+
+    def holders(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(holder_ids, quantities) views over the live rows."""
+        n = len(self._slots)
+        return self._ids[:n], self._quantities[:n]
+
+
+def allocate_pro_rata(quantities: np.ndarray, holder_ids: np.ndarray, amount_pennies: int,
+                      total_shares: float) -> np.ndarray:
+    """
+    Splits `amount_pennies` pro rata to `quantities / total_shares` in whole pennies.
+
+    Each holder first gets the floor of their exact share; the pennies lost to
+    flooring are handed out one each by largest remainder (ties broken by
+    lower holder id), so the paid total is exactly the floor of the aggregate
+    entitlement. When the holders own every share, that is `amount_pennies`.
+    """
+    n = len(quantities)
+    if n == 0 or amount_pennies <= 0 or total_shares <= 0:
+        return np.zeros(n, dtype=np.int64)
+
+    held = float(quantities.sum())
+    # A registry holding more than `total_shares` never pays out more than `amount_pennies`
+    denominator = max(float(total_shares), held)
+    exact = amount_pennies * (quantities / denominator)
+    amounts = np.floor(exact).astype(np.int64)
+    target = amount_pennies if held >= denominator else int(np.floor(amount_pennies * (held / denominator)))
+    leftover = min(target - int(amounts.sum()), n)
+    if leftover > 0:
+        # Primary key: remainder (descending); secondary: holder id (ascending)
+        order = np.lexsort((holder_ids, -(exact - amounts)))
+        amounts[order[:leftover]] += 1
+    return amounts
+
+
 class ShareholderRegistry:
     """
     Centralized service for tracking corporate share ownership.
     Implements IShareholderRegistry protocol.
     Single source of truth for stock ownership, replacing scattered dictionaries.
+    Each firm's holdings are also kept as a CapTable for vectorized payouts.
     """
 
     def __init__(self):
         # firm_id -> agent_id -> quantity
         self._registry: Dict[int, Dict[int, float]] = defaultdict(lambda: defaultdict(float))
+        self._cap_tables: Dict[int, CapTable] = {}
 
     def register_shares(self, firm_id: int, agent_id: int, quantity: float) -> None:
         """
@@ -22,10 +99,16 @@ class ShareholderRegistry:
         if quantity <= 0:
             if firm_id in self._registry and agent_id in self._registry[firm_id]:
                 del self._registry[firm_id][agent_id]
+                self._cap_tables[firm_id].remove(agent_id)
                 if not self._registry[firm_id]:
                     del self._registry[firm_id]
+                    del self._cap_tables[firm_id]
         else:
             self._registry[firm_id][agent_id] = quantity
+            cap_table = self._cap_tables.get(firm_id)
+            if cap_table is None:
+                cap_table = self._cap_tables[firm_id] = CapTable()
+            cap_table.set(agent_id, quantity)
 
     def get_shareholders_of_firm(self, firm_id: int) -> List[ShareholderData]:
         """
@@ -39,6 +122,16 @@ class ShareholderRegistry:
             for agent_id, qty in self._registry[firm_id].items()
         ]
 
+    def get_cap_table(self, firm_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns (holder_ids, quantities) arrays for a firm, without building row objects.
+        The arrays are views; copy them before mutating the registry if they must persist.
+        """
+        cap_table = self._cap_tables.get(firm_id)
+        if cap_table is None:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64)
+        return cap_table.holders()
+
     def get_total_shares(self, firm_id: int) -> float:
         """
         Returns the total number of outstanding shares for a firm.
@@ -50,3 +143,20 @@ class ShareholderRegistry:
     def clear(self) -> None:
         """Clears the entire registry."""
         self._registry.clear()
+        self._cap_tables.clear()
+
+
+def get_cap_table(registry: Optional[IShareholderRegistry], firm_id: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cap table of `firm_id` from any IShareholderRegistry; registries without
+    columnar storage fall back to their shareholder list.
+    """
+    if registry is None:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64)
+    if isinstance(registry, ShareholderRegistry):
+        return registry.get_cap_table(firm_id)
+    shareholders = registry.get_shareholders_of_firm(firm_id)
+    return (
+        np.array([s['agent_id'] for s in shareholders], dtype=np.int64),
+        np.array([s['quantity'] for s in shareholders], dtype=np.float64),
+    )
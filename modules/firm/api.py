@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from enum import Enum, IntEnum, auto
 
 from modules.simulation.dtos.api import FirmConfigDTO, FinanceStateDTO, ProductionStateDTO, SalesStateDTO, HRStateDTO
-from modules.system.api import MarketSnapshotDTO, MarketContextDTO, CurrencyCode
+from modules.system.api import MarketSnapshotDTO, MarketContextDTO, CurrencyCode, DEFAULT_CURRENCY
 from modules.simulation.api import IInventoryHandler, AgentID
 from modules.common.enums import IndustryDomain
 from modules.finance.api import IFinancialAgent
@@ -257,15 +257,68 @@ class SalesIntentDTO:
 
 # --- Engine Inputs/Outputs (Intent) ---
 
+@dataclass(frozen=True)
+class PayrollBatchDTO:
+    """
+    One firm's payroll for a tick as parallel columns; row i is employee_ids[i].
+    Per-employee obligations are only built when an audit asks for them.
+    """
+    firm_id: AgentID
+    employee_ids: Any  # np.ndarray[int64]
+    gross_pennies: Any  # np.ndarray[int64]
+    tax_pennies: Any  # np.ndarray[int64], income tax withheld
+    government_id: Optional[AgentID] = None
+    currency: CurrencyCode = DEFAULT_CURRENCY
+
+    def __len__(self) -> int:
+        return len(self.employee_ids)
+
+    @property
+    def net_pennies(self) -> Any:
+        return self.gross_pennies - self.tax_pennies
+
+    @property
+    def total_net_pennies(self) -> int:
+        return int(self.net_pennies.sum())
+
+    @property
+    def total_tax_pennies(self) -> int:
+        return int(self.tax_pennies.sum())
+
+    def to_obligations(self) -> List[ObligationDTO]:
+        """Expands the batch into the per-employee wage and withholding obligations."""
+        obligations: List[ObligationDTO] = []
+        for emp_id, net, tax in zip(self.employee_ids.tolist(), self.net_pennies.tolist(), self.tax_pennies.tolist()):
+            if net > 0:
+                obligations.append(ObligationDTO(
+                    amount_pennies=net,
+                    currency=self.currency,
+                    priority=PaymentPriority.WAGE,
+                    recipient_id=emp_id,
+                    description=f"Wage for {emp_id}",
+                ))
+            if tax > 0 and self.government_id is not None:
+                obligations.append(ObligationDTO(
+                    amount_pennies=tax,
+                    currency=self.currency,
+                    priority=PaymentPriority.TAX,
+                    recipient_id=self.government_id,
+                    description=f"Income Tax for {emp_id}",
+                ))
+        return obligations
+
 @dataclass(frozen=True)
 class PayrollIntentDTO:
     """
     Output of HREngine.calculate_payroll_obligations.
+    `wage_obligations` holds at most one net-wage and one withholding obligation
+    summing `payroll_batch`; call `payroll_batch.to_obligations()` for the per-employee view.
     """
     wage_obligations: List[ObligationDTO]
     severance_obligations: List[ObligationDTO]
     total_wages_pennies: int
     total_severance_pennies: int
+    payroll_batch: Optional[PayrollBatchDTO] = None
 
 @dataclass(frozen=True)
 class TaxIntentDTO:
@@ -709,6 +762,7 @@ __all__ = [
     'HRIntentDTO',
     'SalesContextDTO',
     'SalesIntentDTO',
+    'PayrollBatchDTO',
     'PayrollIntentDTO',
     'TaxIntentDTO',
     'IFinanceEngine',
@@ -24,6 +24,7 @@ from modules.common.api import MarketSnapshotDTO
 if TYPE_CHECKING:
     # Legacy import for compatibility if needed elsewhere, but GovBrain uses strict new one
     from simulation.dtos.api import MarketSnapshotDTO as LegacyMarketSnapshotDTO
+    from modules.government.welfare.registry import RecipientRosterDTO
 
 from modules.finance.api import TaxCollectionResult, IFinancialEntity
 from modules.system.api import CurrencyCode, AgentID
@@ -95,10 +96,11 @@ class ITaxService(Protocol):
         """Calculates wealth tax amount (pennies) based on net worth."""
         ...
 
-    def collect_wealth_tax(self, agents: List[IAgent]) -> TaxAssessmentResultDTO:
+    def collect_wealth_tax(self, agents: List[IAgent] | "RecipientRosterDTO") -> TaxAssessmentResultDTO:
         """
         Calculates wealth tax for all eligible agents and returns a DTO
         containing payment requests for the government to execute.
+        Accepts a prebuilt RecipientRosterDTO in place of the agent list.
         """
         ...
 
@@ -135,10 +137,11 @@ class IWelfareService(Protocol):
     A stateless service responsible for all welfare and subsidy logic.
     It does not hold state or have access to agent wallets.
     """
-    def run_welfare_check(self, agents: List[IAgent], market_data: "LegacyMarketSnapshotDTO", current_tick: int, gdp_history: List[float], welfare_budget_multiplier: float = 1.0) -> WelfareResultDTO:
+    def run_welfare_check(self, agents: List[IAgent] | "RecipientRosterDTO", market_data: "LegacyMarketSnapshotDTO", current_tick: int, gdp_history: List[float], welfare_budget_multiplier: float = 1.0) -> WelfareResultDTO:
         """
         Identifies agents needing support and returns a DTO containing
         welfare payment requests for the government to execute.
+        Accepts a prebuilt RecipientRosterDTO in place of the agent list.
         """
         ...
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 # Verified for Wave 5 Government AI - Includes GovernmentSensoryDTO and GovernmentStateDTO
 from dataclasses import dataclass, field
+from enum import Enum
 from typing import List, Optional, Dict, Any, Union, Protocol, runtime_checkable, TYPE_CHECKING
 from simulation.ai.enums import PolicyActionTag
 from modules.system.api import CurrencyCode
@@ -13,6 +14,13 @@ class IAgent(Protocol):
 
 FirmID = int
 HouseholdID = int
+
+class TreasuryAccount(str, Enum):
+    """
+    Placeholder counterparty for requests built by stateless services.
+    Resolved by identity to the Government agent executing the request.
+    """
+    GOVERNMENT = "GOVERNMENT"
 # endregion
 
 # region: Existing DTOs
@@ -144,7 +152,7 @@ class PaymentRequestDTO:
     A stateless request for a financial transfer.
     Generated by a service, executed by the agent holding the wallet.
     """
-    payer: Union[IAgent, FirmID, HouseholdID, str] # Supports "GOVERNMENT" string
+    payer: Union[IAgent, FirmID, HouseholdID, str] # Supports TreasuryAccount.GOVERNMENT
     payee: Union[IAgent, FirmID, HouseholdID, str]
     amount: int # MIGRATION: pennies
     currency: CurrencyCode
@@ -2,6 +2,7 @@ from typing import Any, List, Dict, Optional
 import logging
 from modules.government.api import IPolicyExecutionEngine, GovernmentExecutionContext, GovernmentStateDTO, PolicyDecisionDTO, ExecutionResultDTO
 from modules.government.dtos import PaymentRequestDTO, BailoutResultDTO
+from modules.government.welfare.registry import RecipientRosterDTO
 from simulation.ai.enums import PolicyActionTag
 from modules.system.api import CurrencyCode, DEFAULT_CURRENCY
 from simulation.dtos.api import MarketSnapshotDTO
@@ -84,16 +85,19 @@ class PolicyExecutionEngine(IPolicyExecutionEngine):
             market_data=market_data
         )
 
+        # Columnar view shared by both services (agents may already be a roster)
+        roster = RecipientRosterDTO.coerce(agents)
+
         # 1. Wealth Tax Logic (TaxService)
         # Note: TaxService.collect_wealth_tax returns TaxAssessmentResultDTO with payment requests
-        tax_result = context.tax_service.collect_wealth_tax(agents)
+        tax_result = context.tax_service.collect_wealth_tax(roster)
         result.payment_requests.extend(tax_result.payment_requests)
 
         # 2. Welfare Check (WelfareManager)
         # We need gdp_history for welfare logic (e.g. means testing relative to GDP?)
         # Pass state.gdp_history
         welfare_result = context.welfare_manager.run_welfare_check(
-            agents,
+            roster,
             snapshot,
             state.tick,
             state.gdp_history,
@@ -1,6 +1,6 @@
 from __future__ import annotations
-from collections import Counter, defaultdict
-from typing import List, Dict, Any, Optional
+from collections import defaultdict, deque
+from typing import List, Dict, Any, Deque, Tuple
 
 from modules.government.political.api import (
     IPoliticalOrchestrator,
@@ -10,14 +10,34 @@ from modules.government.political.api import (
 )
 from modules.system.constants import ID_PUBLIC_MANAGER, ID_GOVERNMENT
 
+TOP_GRIEVANCES = 5
+RECENT_RECORD_LIMIT = 1000
+
+
 class PoliticalOrchestrator(IPoliticalOrchestrator):
     """
     Manages the political lifecycle: Voting, Lobbying, and Mandate calculation.
+    Votes and lobbying efforts are folded into running aggregates as they
+    arrive, so the climate query is O(1) in the number of records. Only the
+    most recent records are retained, for inspection.
     """
 
-    def __init__(self):
-        self._vote_buffer: List[VoteRecordDTO] = []
-        self._lobbying_buffer: List[LobbyingEffortDTO] = []
+    def __init__(self, top_k: int = TOP_GRIEVANCES, record_limit: int = RECENT_RECORD_LIMIT):
+        self.top_k = top_k
+        self._vote_buffer: Deque[VoteRecordDTO] = deque(maxlen=record_limit)
+        self._lobbying_buffer: Deque[LobbyingEffortDTO] = deque(maxlen=record_limit)
+        self._reset_aggregates()
+
+    def _reset_aggregates(self) -> None:
+        self._total_weight = 0.0
+        self._weighted_approval_sum = 0.0
+        # grievance -> weighted count, in order of first appearance (used to break ties)
+        self._grievance_weights: Dict[str, float] = {}
+        self._grievance_rank: Dict[str, int] = {}
+        # Bounded top-k grievances, kept sorted by (weight desc, first appearance)
+        self._top_grievances: List[str] = []
+        self._top_dirty = False
+        self._pressure_map: Dict[str, float] = defaultdict(float)
 
     def register_vote(self, vote: VoteRecordDTO) -> None:
         """
@@ -26,59 +46,74 @@ class PoliticalOrchestrator(IPoliticalOrchestrator):
         """
         self._vote_buffer.append(vote)
 
+        weight = vote.political_weight
+        if not isinstance(weight, (int, float)):
+            weight = 1.0 # Defensive fallback for tests/mocks
+
+        self._total_weight += weight
+        self._weighted_approval_sum += (vote.approval_value * weight)
+        if vote.primary_grievance and vote.primary_grievance != "NONE":
+            self._add_grievance(vote.primary_grievance, weight)
+
     def register_lobbying(self, effort: LobbyingEffortDTO) -> None:
         """
         Ingests a verified lobbying effort.
         """
         self._lobbying_buffer.append(effort)
+        # Pressure = Money * Direction
+        self._pressure_map[effort.target_policy] += effort.investment_pennies * effort.desired_shift
+
+    def _grievance_key(self, grievance: str) -> Tuple[float, int]:
+        return (-self._grievance_weights[grievance], self._grievance_rank[grievance])
+
+    def _add_grievance(self, grievance: str, weight: float) -> None:
+        if grievance not in self._grievance_rank:
+            self._grievance_rank[grievance] = len(self._grievance_rank)
+            self._grievance_weights[grievance] = 0.0
+        self._grievance_weights[grievance] += weight
+
+        if self._top_dirty:
+            return
+        if weight < 0:
+            # A falling count can drop out of the top-k; rebuild on the next query
+            self._top_dirty = True
+            return
+
+        top = self._top_grievances
+        if grievance not in top:
+            if len(top) < self.top_k:
+                top.append(grievance)
+            elif self._grievance_key(grievance) < self._grievance_key(top[-1]):
+                top[-1] = grievance
+            else:
+                return
+        top.sort(key=self._grievance_key)
 
     def calculate_political_climate(self, current_tick: int) -> PoliticalClimateDTO:
         """
-        Aggregates all registered votes and lobbying efforts to produce a
-        snapshot of the political climate (Approval, Pressures).
+        Snapshot of the political climate (Approval, Pressures) from the
+        running aggregates of all votes and lobbying efforts registered this cycle.
         """
-        total_weight = 0.0
-        weighted_approval_sum = 0.0
-
-        # weighted grievance counts
-        weighted_grievance_counts: Dict[str, float] = defaultdict(float)
-
-        # 1. Process Votes
-        for vote in self._vote_buffer:
-            weight = vote.political_weight
-            if not isinstance(weight, (int, float)):
-                weight = 1.0 # Defensive fallback for tests/mocks
-
-            total_weight += weight
-            weighted_approval_sum += (vote.approval_value * weight)
-            if vote.primary_grievance and vote.primary_grievance != "NONE":
-                weighted_grievance_counts[vote.primary_grievance] += weight
-
-        overall_approval = weighted_approval_sum / total_weight if total_weight > 0 else 0.5
-
-        # Sort grievances by weighted count
-        sorted_grievances = sorted(weighted_grievance_counts.items(), key=lambda item: item[1], reverse=True)
-        top_grievances = [g[0] for g in sorted_grievances[:5]]
+        if self._top_dirty:
+            self._top_grievances = sorted(self._grievance_weights, key=self._grievance_key)[:self.top_k]
+            self._top_dirty = False
 
-        # 2. Process Lobbying
-        pressure_map: Dict[str, float] = defaultdict(float)
-        for lobby in self._lobbying_buffer:
-            # Pressure = Money * Direction
-            pressure = lobby.investment_pennies * lobby.desired_shift
-            pressure_map[lobby.target_policy] += pressure
+        total_weight = self._total_weight
+        overall_approval = self._weighted_approval_sum / total_weight if total_weight > 0 else 0.5
 
         return PoliticalClimateDTO(
             tick=current_tick,
             overall_approval_rating=overall_approval,
             party_support_breakdown={}, # Placeholder for V2
-            top_grievances=top_grievances,
-            lobbying_pressure=dict(pressure_map)
+            top_grievances=list(self._top_grievances),
+            lobbying_pressure=dict(self._pressure_map)
         )
 
     def reset_cycle(self) -> None:
         """Clears votes and lobbying efforts for the next accumulation cycle."""
         self._vote_buffer.clear()
         self._lobbying_buffer.clear()
+        self._reset_aggregates()
 
     def validate_transfer_targets(self, payer_id: Any, payee_id: Any) -> bool:
         """
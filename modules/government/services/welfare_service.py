@@ -1,12 +1,16 @@
-from typing import List, Any, Dict, Optional
+from typing import List, Any, Dict, Optional, Union
 import logging
+
+import numpy as np
+
 from modules.government.api import IWelfareService
-from modules.government.welfare.api import IWelfareRecipient
+from modules.government.welfare.registry import RecipientRosterDTO
 from modules.government.dtos import (
     WelfareResultDTO,
     BailoutResultDTO,
     PaymentRequestDTO,
     BailoutLoanDTO,
+    TreasuryAccount,
     IAgent
 )
 from simulation.dtos.api import MarketSnapshotDTO
@@ -65,16 +69,18 @@ class WelfareService(IWelfareService):
         # daily_food_need is float quantity.
         return int(max(avg_food_price_pennies * daily_food_need, 1000)) # Min 1000 pennies ($10)
 
-    def run_welfare_check(self, agents: List[IAgent], market_data: MarketSnapshotDTO, current_tick: int, gdp_history: List[float], welfare_budget_multiplier: float = 1.0) -> WelfareResultDTO:
+    def run_welfare_check(self, agents: Union[List[IAgent], RecipientRosterDTO], market_data: MarketSnapshotDTO, current_tick: int, gdp_history: List[float], welfare_budget_multiplier: float = 1.0) -> WelfareResultDTO:
         """
         Identifies agents needing support and returns a DTO containing
         welfare payment requests.
+        Accepts an agent list or a prebuilt RecipientRosterDTO; eligibility is
+        evaluated over the roster's columns rather than agent by agent.
         """
         payment_requests = []
         total_paid = 0
 
-        # Filter for eligible welfare recipients (Safe filtering for mixed lists)
-        welfare_recipients = [a for a in agents if isinstance(a, IWelfareRecipient)]
+        roster = RecipientRosterDTO.coerce(agents)
+        active_recipients = roster.is_welfare_recipient & roster.is_active
 
         # 1. Calculate Survival Cost (Dynamic)
         survival_cost = self.get_survival_cost(market_data)
@@ -91,21 +97,16 @@ class WelfareService(IWelfareService):
         effective_benefit_amount = round_to_pennies(benefit_amount * welfare_budget_multiplier)
 
         if effective_benefit_amount > 0:
-            for agent in welfare_recipients:
-                if not agent.is_active:
-                    continue
-
-                # Unemployment Benefit
-                # We assume agent has is_employed property or check it dynamically
-                if hasattr(agent, "is_employed") and not agent.is_employed:
-                    payment_requests.append(PaymentRequestDTO(
-                        payer="GOVERNMENT", # Placeholder
-                        payee=agent,
-                        amount=effective_benefit_amount,
-                        currency=DEFAULT_CURRENCY,
-                        memo="welfare_support_unemployment"
-                    ))
-                    total_paid += effective_benefit_amount
+            eligible = np.flatnonzero(active_recipients & roster.is_unemployed)
+            for i in eligible.tolist():
+                payment_requests.append(PaymentRequestDTO(
+                    payer=TreasuryAccount.GOVERNMENT,
+                    payee=roster.agents[i],
+                    amount=effective_benefit_amount,
+                    currency=DEFAULT_CURRENCY,
+                    memo="welfare_support_unemployment"
+                ))
+            total_paid += effective_benefit_amount * len(eligible)
 
         # 3. Stimulus Check
         current_gdp = market_data.market_data.get("total_production", 0.0)
@@ -127,17 +128,17 @@ class WelfareService(IWelfareService):
              base_stimulus_amount = survival_cost * 5.0
              effective_stimulus_amount = round_to_pennies(base_stimulus_amount * welfare_budget_multiplier)
 
-             active_households = [a for a in welfare_recipients if a.is_active]
+             active_households = np.flatnonzero(active_recipients)
 
-             for h in active_households:
+             for i in active_households.tolist():
                  payment_requests.append(PaymentRequestDTO(
-                     payer="GOVERNMENT",
-                     payee=h,
+                     payer=TreasuryAccount.GOVERNMENT,
+                     payee=roster.agents[i],
                      amount=effective_stimulus_amount,
                      currency=DEFAULT_CURRENCY,
                      memo="welfare_support_stimulus"
                  ))
-                 total_paid += effective_stimulus_amount
+             total_paid += effective_stimulus_amount * len(active_households)
 
              if effective_stimulus_amount > 0:
                  logger.warning(
@@ -192,7 +193,7 @@ class WelfareService(IWelfareService):
             )
 
             payment_request = PaymentRequestDTO(
-                payer="GOVERNMENT",
+                payer=TreasuryAccount.GOVERNMENT,
                 payee=firm.id,
                 amount=amount,
                 currency=DEFAULT_CURRENCY,
@@ -1,5 +1,8 @@
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Union
 from decimal import Decimal
+
+import numpy as np
+
 from modules.government.api import ITaxService, ITaxableHousehold
 from modules.government.taxation.system import TaxationSystem
 from modules.government.components.fiscal_policy_manager import FiscalPolicyManager
@@ -7,8 +10,10 @@ from modules.government.dtos import (
     FiscalPolicyDTO,
     TaxAssessmentResultDTO,
     PaymentRequestDTO,
+    TreasuryAccount,
     IAgent
 )
+from modules.government.welfare.registry import RecipientRosterDTO
 from modules.finance.api import TaxCollectionResult, IFinancialEntity
 from modules.system.api import CurrencyCode, DEFAULT_CURRENCY
 from simulation.dtos.api import MarketSnapshotDTO
@@ -79,41 +84,45 @@ class TaxService(ITaxService):
         tax_amount = round_to_pennies(taxable_wealth * self._wealth_tax_rate_tick)
         return int(max(0, min(tax_amount, net_worth)))
 
-    def collect_wealth_tax(self, agents: List[IAgent]) -> TaxAssessmentResultDTO:
+    def collect_wealth_tax(self, agents: Union[List[IAgent], RecipientRosterDTO]) -> TaxAssessmentResultDTO:
         """
         Calculates wealth tax for all eligible agents and returns a DTO
         containing payment requests for the government to execute.
+        Accepts an agent list or a prebuilt RecipientRosterDTO; liabilities are
+        evaluated over the roster's balance column in one vectorized pass.
         """
-        requests = []
-        total_projected = 0
-
-        for agent in agents:
-             # Use Protocol to filter taxable households
-             if isinstance(agent, ITaxableHousehold):
-                 if not agent.is_active:
-                     continue
-
-                 # Access net worth via protocol (IFinancialEntity)
-                 net_worth = agent.balance_pennies
+        roster = RecipientRosterDTO.coerce(agents)
+        tax_amounts = self.calculate_wealth_tax_batch(roster.balances)
+        due = np.flatnonzero(roster.is_taxable & roster.is_active & (tax_amounts > 0))
 
-                 tax_amount = self.calculate_wealth_tax(net_worth)
-
-                 if tax_amount > 0:
-                    requests.append(PaymentRequestDTO(
-                        payer=agent,
-                        payee="GOVERNMENT",
-                        amount=tax_amount,
-                        currency=DEFAULT_CURRENCY,
-                        memo="wealth_tax"
-                    ))
-                    total_projected += tax_amount
+        requests = []
+        for i in due.tolist():
+            requests.append(PaymentRequestDTO(
+                payer=roster.agents[i],
+                payee=TreasuryAccount.GOVERNMENT,
+                amount=int(tax_amounts[i]),
+                currency=DEFAULT_CURRENCY,
+                memo="wealth_tax"
+            ))
 
         return TaxAssessmentResultDTO(
             payment_requests=requests,
-            total_collected=int(total_projected),
+            total_collected=int(tax_amounts[due].sum()),
             tax_type="wealth_tax"
         )
 
+    def calculate_wealth_tax_batch(self, net_worths: np.ndarray) -> np.ndarray:
+        """
+        Vectorized calculate_wealth_tax over an int64 array of net worths (pennies).
+        np.rint rounds half to even on the same float product, so results match
+        the scalar path exactly.
+        """
+        net_worths = np.asarray(net_worths, dtype=np.int64)
+        taxable_wealth = (net_worths - self._wealth_threshold).astype(np.float64)
+        tax = np.rint(taxable_wealth * self._wealth_tax_rate_tick).astype(np.int64)
+        tax = np.maximum(0, np.minimum(tax, net_worths))
+        return np.where(net_worths > self._wealth_threshold, tax, 0)
+
     def record_revenue(self, result: TaxCollectionResult) -> None:
         """
         Updates internal ledgers based on a verified tax collection result.
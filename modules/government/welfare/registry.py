@@ -0,0 +1,124 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from modules.government.api import ITaxableHousehold
+from modules.government.welfare.api import IWelfareRecipient
+from modules.system.api import AgentID
+
+
+@dataclass
+class RecipientRosterDTO:
+    """
+    Columnar view of the social-policy population for one tick.
+    Row i describes agents[i]; rows keep the population's iteration order,
+    so services that walk the masks produce requests in the legacy order.
+    """
+    agents: List[Any] = field(default_factory=list)
+    balances: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    is_active: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=bool))
+    is_unemployed: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=bool))
+    is_taxable: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=bool))
+    is_welfare_recipient: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=bool))
+
+    def __len__(self) -> int:
+        return len(self.agents)
+
+    @classmethod
+    def from_members(cls, members: Iterable[Tuple[Any, bool, bool]]) -> "RecipientRosterDTO":
+        """
+        Builds the roster from (agent, is_taxable, is_welfare_recipient) rows.
+        Only the per-tick fields (activity, employment, balance) are read here.
+        """
+        agents: List[Any] = []
+        balances: List[int] = []
+        active: List[bool] = []
+        unemployed: List[bool] = []
+        taxable: List[bool] = []
+        welfare: List[bool] = []
+        for agent, is_taxable, is_welfare in members:
+            is_active = bool(agent.is_active)
+            agents.append(agent)
+            active.append(is_active)
+            taxable.append(is_taxable)
+            welfare.append(is_welfare)
+            unemployed.append(is_welfare and not getattr(agent, "is_employed", True))
+            # Balances are only read where the wealth tax can apply
+            balances.append(int(agent.balance_pennies) if is_taxable and is_active else 0)
+        return cls(
+            agents=agents,
+            balances=np.array(balances, dtype=np.int64),
+            is_active=np.array(active, dtype=bool),
+            is_unemployed=np.array(unemployed, dtype=bool),
+            is_taxable=np.array(taxable, dtype=bool),
+            is_welfare_recipient=np.array(welfare, dtype=bool),
+        )
+
+    @classmethod
+    def from_agents(cls, agents: Iterable[Any]) -> "RecipientRosterDTO":
+        """Builds the roster from a mixed agent list, classifying each agent by protocol."""
+        members = []
+        for agent in agents:
+            is_taxable, is_welfare = _classify(agent)
+            if is_taxable or is_welfare:
+                members.append((agent, is_taxable, is_welfare))
+        return cls.from_members(members)
+
+    @classmethod
+    def coerce(cls, agents: Any) -> "RecipientRosterDTO":
+        if isinstance(agents, cls):
+            return agents
+        return cls.from_agents(agents)
+
+
+def _classify(agent: Any) -> Tuple[bool, bool]:
+    # ITaxableHousehold's members are a superset of IWelfareRecipient's,
+    # so the second (slow) protocol check is only needed for non-taxable agents.
+    if isinstance(agent, ITaxableHousehold):
+        return True, True
+    return False, isinstance(agent, IWelfareRecipient)
+
+
+class WelfareRecipientRegistry:
+    """
+    Id-keyed registry of the agents covered by social policy (wealth tax and welfare).
+    Maintained at agent creation and death so the per-tick check no longer has to
+    scan and protocol-test the whole agent population.
+    Registration order is preserved, matching the order agents join the world.
+    """
+
+    def __init__(self) -> None:
+        self._members: Dict[AgentID, Tuple[Any, bool, bool]] = {}
+        # False until the first registration; callers fall back to the agent list until then.
+        self.is_tracking: bool = False
+
+    def register(self, agent: Any) -> bool:
+        """Registers `agent` if it is taxable or welfare-eligible. Returns True if it was added."""
+        self.is_tracking = True
+        is_taxable, is_welfare = _classify(agent)
+        if not (is_taxable or is_welfare):
+            return False
+        self._members[agent.id] = (agent, is_taxable, is_welfare)
+        return True
+
+    def register_many(self, agents: Iterable[Any]) -> None:
+        self.is_tracking = True
+        for agent in agents:
+            self.register(agent)
+
+    def unregister(self, agent_id: AgentID) -> None:
+        self._members.pop(agent_id, None)
+
+    def __contains__(self, agent_id: Any) -> bool:
+        return agent_id in self._members
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def get_recipients(self) -> List[Any]:
+        return [agent for agent, _, _ in self._members.values()]
+
+    def build_roster(self) -> RecipientRosterDTO:
+        return RecipientRosterDTO.from_members(self._members.values())
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from modules.system.api import TransactionMetadataDTO
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+import heapq
 import logging
 from modules.labor.api import ILaborMarket, JobOfferDTO, JobSeekerDTO, LaborMarketMatchResultDTO, LaborConfigDTO
 from modules.market.api import CanonicalOrderDTO, OrderTelemetrySchema, LaborMarketConfigDTO
@@ -54,35 +55,28 @@ class LaborMarket(ILaborMarket, IMarket):
         result = execute_labor_matching(context, self.config)
 
         # Convert matched_pairs to LaborMarketMatchResultDTO format for backward compatibility
+        # Id-keyed lookups: first posted seeker wins on duplicate ids (as the old linear scan did)
+        seekers_by_id: Dict[AgentID, JobSeekerDTO] = {}
+        for s in self._job_seekers:
+            seekers_by_id.setdefault(s.household_id, s)
+        first_offer_by_firm: Dict[AgentID, JobOfferDTO] = {}
+        for o in self._job_offers:
+            first_offer_by_firm.setdefault(o.firm_id, o)
+
         for seeker_id, firm_id in result.matched_pairs.items():
             wage = result.agreed_wages_pennies[seeker_id]
 
-            # Resolve the exact offer that matched.
-            # To avoid taking just the first one arbitrarily, we look at unmatched_offers from result
-            # meaning the ones that were NOT matched. This still means we need to know the original offer.
-            # However, since the engine removed the matched offer from unmatched_offers,
-            # we can identify it by looking at original offers minus unmatched offers.
-            original_offers_for_firm = [o for o in self._job_offers if o.firm_id == firm_id]
-            unmatched_for_firm = [o for o in result.unmatched_offers if o.firm_id == firm_id]
-
-            # A matched offer is one that is in original but not in unmatched
-            # To handle multiple identical offers, we can just take the first one that is missing from unmatched
-            # Or simpler: base_wage is the highest offer for this firm that was matched.
-            # For simplicity, since the engine sorted by highest wage, the matched offer is the highest one that isn't in unmatched_for_firm
-            # but wait, `result.unmatched_offers` contains actual instances if `.copy()` was shallow.
-            matched_offers = [o for o in original_offers_for_firm if o not in unmatched_for_firm]
-            offer = matched_offers[0] if matched_offers else original_offers_for_firm[0]
-
+            # The engine reports the exact offer each seeker took
+            offer = result.matched_offers.get(seeker_id) or first_offer_by_firm[firm_id]
             base_wage = offer.offer_wage_pennies
 
             # Reconstruct original reservation wage to calculate true surplus
-            seeker = next((s for s in self._job_seekers if s.household_id == seeker_id), None)
+            seeker = seekers_by_id.get(seeker_id)
             res_wage = seeker.reservation_wage_pennies if seeker else wage
             surplus = base_wage - res_wage
 
             # Calculate match score & compatibility dynamically just for the report/telemetry
             # To stay stateless, we can just recalculate the simplified multiplier
-            req_talent = getattr(offer, 'min_match_score', 0.0)
             seeker_talent = getattr(seeker, 'talent_score', 1.0) if seeker else 1.0
             score = 1.0 + (seeker_talent - 1.0) * 0.5
 
@@ -273,124 +267,182 @@ class LaborMarket(ILaborMarket, IMarket):
 # TD-WAVE3-MATCH-REWRITE: Labor Market Bargaining
 from simulation.dtos.api import JobMatchContextDTO, LaborMatchingResultDTO
 
+def _resolve_compatibility_multipliers(config) -> Tuple[float, float, float, float]:
+    mult_perfect = 1.2
+    mult_partial = 1.0
+    mult_mismatch = 0.8
+    mult_general = 1.0
+
+    if config and hasattr(config, 'compatibility'):
+        compat_config = config.compatibility
+        mult_perfect = compat_config.get('PERFECT', mult_perfect)
+        mult_partial = compat_config.get('PARTIAL', mult_partial)
+        mult_mismatch = compat_config.get('MISMATCH', mult_mismatch)
+        mult_general = compat_config.get('GENERAL_PENALTY', mult_general)
+
+    return mult_perfect, mult_partial, mult_mismatch, mult_general
+
+def _major_multiplier(offer_major, seeker_major, secondary_majors,
+                      mult_perfect: float, mult_partial: float, mult_mismatch: float,
+                      mult_general: float) -> Tuple[float, str]:
+    """Returns (multiplier, compatibility label) for an offer/seeker major pair."""
+    if offer_major == seeker_major:
+        return mult_perfect, "PERFECT"
+    if secondary_majors and offer_major in secondary_majors:
+        return mult_partial, "PARTIAL"
+    if offer_major == IndustryDomain.GENERAL or seeker_major == IndustryDomain.GENERAL:
+        return mult_general, "PARTIAL"
+    return mult_mismatch, "MISMATCH"
+
 def execute_labor_matching(context: JobMatchContextDTO, config=None) -> LaborMatchingResultDTO:
     """
     Stateless matching engine.
+
+    Greedy assignment: seekers by talent (desc) each take the best-scoring
+    remaining offer, ties going to the earlier offer in wage-descending order.
+
+    Offers are bucketed by (major, required_education, min_match_score). Within
+    a bucket the major/education multipliers and the talent gate are constant and
+    the score is monotonic in wage, so only each bucket's top offer (a heap keyed
+    by wage-order position) has to be scored per seeker.
     """
     # SORT available_seekers BY hidden_talent DESC (using talent_score from JobSeekerDTO)
     # SORT available_offers BY wage_offered_pennies DESC
     available_seekers = sorted(context.available_seekers, key=lambda s: getattr(s, 'talent_score', 1.0), reverse=True)
     available_offers = sorted(context.available_offers, key=lambda o: getattr(o, 'offer_wage_pennies', 0), reverse=True)
 
+    mult_perfect, mult_partial, mult_mismatch, mult_general = _resolve_compatibility_multipliers(config)
+    monotone_multipliers = min(mult_perfect, mult_partial, mult_mismatch, mult_general) >= 0
+
+    # Offer columns, indexed by position in wage order
+    offer_wages = [getattr(o, 'offer_wage_pennies', 0) for o in available_offers]
+    taken = [False] * len(available_offers)
+
+    buckets: Dict[Tuple[Any, int, float], List[int]] = {}
+    for pos, offer in enumerate(available_offers):
+        key = (
+            getattr(offer, 'major', IndustryDomain.GENERAL),
+            getattr(offer, 'required_education', 0),
+            getattr(offer, 'min_match_score', 0.0),
+        )
+        # Positions are appended in increasing order, so each list is already a valid heap
+        buckets.setdefault(key, []).append(pos)
+
     matched_pairs = {}
     agreed_wages_pennies = {}
-
-    unmatched_offers = available_offers.copy()
+    matched_offers = {}
     unmatched_seekers = []
 
     for seeker in available_seekers:
-        matched = False
-        best_offer = None
-        best_score = -1.0
-        best_wage_pennies = 0
-        best_compatibility = "MISMATCH"
-
-        for offer in unmatched_offers:
-            reservation_wage = getattr(seeker, 'reservation_wage_pennies', 0)
-            offer_wage = getattr(offer, 'offer_wage_pennies', 0)
-
-            # Base logic relaxed to 0.9 for thaw
-            if reservation_wage <= 0:
-                base_score = 1.0
-            else:
-                base_score = offer_wage / reservation_wage
-
-            if base_score < 0.9:
-                continue
-
-            required_talent = getattr(offer, 'min_match_score', 0.0)
-            seeker_talent = getattr(seeker, 'talent_score', 1.0)
-
-            # Talent multiplier
-            talent_multiplier = 1.0 + (seeker_talent - 1.0) * 0.5
+        reservation_wage = getattr(seeker, 'reservation_wage_pennies', 0)
+        seeker_talent = getattr(seeker, 'talent_score', 1.0)
+        seeker_major = getattr(seeker, 'major', IndustryDomain.GENERAL)
+        secondary_majors = getattr(seeker, 'secondary_majors', [])
+        seek_edu = getattr(seeker, 'education_level', 0)
 
-            # Major matching
-            major_multiplier = 1.0
-            compatibility = "MISMATCH"
+        # Talent multiplier
+        talent_multiplier = 1.0 + (seeker_talent - 1.0) * 0.5
 
-            mult_perfect = 1.2
-            mult_partial = 1.0
-            mult_mismatch = 0.8
-            mult_general = 1.0
-
-            if config and hasattr(config, 'compatibility'):
-                compat_config = config.compatibility
-                mult_perfect = compat_config.get('PERFECT', mult_perfect)
-                mult_partial = compat_config.get('PARTIAL', mult_partial)
-                mult_mismatch = compat_config.get('MISMATCH', mult_mismatch)
-                mult_general = compat_config.get('GENERAL_PENALTY', mult_general)
-
-            offer_major = getattr(offer, 'major', IndustryDomain.GENERAL)
-            seeker_major = getattr(seeker, 'major', IndustryDomain.GENERAL)
-            secondary_majors = getattr(seeker, 'secondary_majors', [])
-
-            if offer_major == seeker_major:
-                major_multiplier = mult_perfect
-                compatibility = "PERFECT"
-            elif secondary_majors and offer_major in secondary_majors:
-                major_multiplier = mult_partial
-                compatibility = "PARTIAL"
-            elif offer_major == IndustryDomain.GENERAL or seeker_major == IndustryDomain.GENERAL:
-                major_multiplier = mult_general
-                compatibility = "PARTIAL"
-            else:
-                major_multiplier = mult_mismatch
-
-            # Education matching
-            edu_multiplier = 1.0
-            req_edu = getattr(offer, 'required_education', 0)
-            seek_edu = getattr(seeker, 'education_level', 0)
-            if seek_edu < req_edu:
-                edu_multiplier = 0.5
-            elif seek_edu > req_edu:
-                edu_multiplier = 1.05
-
-            final_score = base_score * major_multiplier * edu_multiplier * talent_multiplier
-
-            if final_score > best_score and seeker_talent >= required_talent:
-                best_score = final_score
-                best_offer = offer
-                best_compatibility = compatibility
-
-                surplus = offer_wage - reservation_wage
-                bargaining_power = 0.5
+        best_pos = -1
+        best_score = -1.0
 
-                if surplus > 0:
-                    best_wage_pennies = int(reservation_wage + (surplus * bargaining_power))
+        if monotone_multipliers and talent_multiplier >= 0:
+            empty_keys = []
+            for key, heap in buckets.items():
+                while heap and taken[heap[0]]:
+                    heapq.heappop(heap)
+                if not heap:
+                    empty_keys.append(key)
+                    continue
+
+                offer_major, req_edu, required_talent = key
+                if seeker_talent < required_talent:
+                    continue
+
+                pos = heap[0]
+                offer_wage = offer_wages[pos]
+
+                # Base logic relaxed to 0.9 for thaw
+                if reservation_wage <= 0:
+                    base_score = 1.0
                 else:
-                    best_wage_pennies = offer_wage
+                    base_score = offer_wage / reservation_wage
+
+                if base_score < 0.9:
+                    continue  # Lower-wage offers in this bucket score lower still
+
+                major_multiplier = _major_multiplier(
+                    offer_major, seeker_major, secondary_majors,
+                    mult_perfect, mult_partial, mult_mismatch, mult_general
+                )[0]
+
+                # Education matching
+                edu_multiplier = 1.0
+                if seek_edu < req_edu:
+                    edu_multiplier = 0.5
+                elif seek_edu > req_edu:
+                    edu_multiplier = 1.05
+
+                final_score = base_score * major_multiplier * edu_multiplier * talent_multiplier
+
+                if final_score > best_score or (final_score == best_score and best_pos >= 0 and pos < best_pos):
+                    best_score = final_score
+                    best_pos = pos
+
+            for key in empty_keys:
+                del buckets[key]
+        else:
+            # Negative multipliers invert the wage ordering: fall back to a full scan
+            for pos, offer in enumerate(available_offers):
+                if taken[pos]:
+                    continue
+                offer_wage = offer_wages[pos]
+                if reservation_wage <= 0:
+                    base_score = 1.0
+                else:
+                    base_score = offer_wage / reservation_wage
+                if base_score < 0.9:
+                    continue
+                major_multiplier = _major_multiplier(
+                    getattr(offer, 'major', IndustryDomain.GENERAL), seeker_major, secondary_majors,
+                    mult_perfect, mult_partial, mult_mismatch, mult_general
+                )[0]
+                req_edu = getattr(offer, 'required_education', 0)
+                edu_multiplier = 1.0
+                if seek_edu < req_edu:
+                    edu_multiplier = 0.5
+                elif seek_edu > req_edu:
+                    edu_multiplier = 1.05
+                final_score = base_score * major_multiplier * edu_multiplier * talent_multiplier
+                if final_score > best_score and seeker_talent >= getattr(offer, 'min_match_score', 0.0):
+                    best_score = final_score
+                    best_pos = pos
+
+        if best_pos >= 0:
+            best_offer = available_offers[best_pos]
+            offer_wage = offer_wages[best_pos]
+            surplus = offer_wage - reservation_wage
+            bargaining_power = 0.5
+
+            if surplus > 0:
+                best_wage_pennies = int(reservation_wage + (surplus * bargaining_power))
+            else:
+                best_wage_pennies = offer_wage
 
-        if best_offer:
             # DTO Type compliance: matched_pairs is Dict[AgentID, AgentID]
             matched_pairs[seeker.household_id] = best_offer.firm_id
-
-            # Since matched_pairs only holds the firm_id, we need to pass the metadata
-            # We can either expand LaborMatchingResultDTO or return it differently
-            # For now, let's keep it pure to the DTO and let the orchestrator re-calculate
-            # or we can just assume match_score 1.0/PERFECT as an initial naive state
-            # if we can't change DTO or we pass it via agreed_wages if we really needed.
-            # We will just comply with the strict DTO typing for matched_pairs
-
             agreed_wages_pennies[seeker.household_id] = best_wage_pennies
-            unmatched_offers.remove(best_offer)
-            matched = True
-
-        if not matched:
+            matched_offers[seeker.household_id] = best_offer
+            taken[best_pos] = True
+        else:
             unmatched_seekers.append(seeker.household_id)
 
+    unmatched_offers = [offer for pos, offer in enumerate(available_offers) if not taken[pos]]
+
     return LaborMatchingResultDTO(
         matched_pairs=matched_pairs,
         agreed_wages_pennies=agreed_wages_pennies,
         unmatched_seekers=unmatched_seekers,
-        unmatched_offers=unmatched_offers
+        unmatched_offers=unmatched_offers,
+        matched_offers=matched_offers
     )
@@ -245,6 +245,8 @@ class IEstateRegistry(Protocol):
     def add_to_estate(self, agent: IAgent) -> None: ...
     def get_agent(self, agent_id: Any) -> Optional[IAgent]: ...
     def get_all_estate_agents(self) -> List[IAgent]: ...
+    def get_resident_estate_agents(self) -> List[IAgent]: ...
+    def get_cold_estate_stubs(self) -> List[Any]: ...
 
 @runtime_checkable
 class IOrchestratorAgent(IAgent, Protocol):
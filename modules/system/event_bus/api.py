@@ -1,4 +1,6 @@
-from typing import Protocol, Callable, TypeVar, Generic, Any
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Protocol, Callable, TypeVar, Generic, Any, Dict, List, Optional
 from modules.events.dtos import FinancialEvent
 
 # A generic event type, but we primarily use FinancialEvent for now
@@ -7,6 +9,34 @@ E = TypeVar('E')
 # A handler for a given event type
 EventHandler = Callable[[E], None]
 
+# A handler that accepts every buffered event of a type in one call
+BatchEventHandler = Callable[[List[E]], None]
+
+class DeliveryMode(str, Enum):
+    """
+    When a subscription receives its events.
+    IMMEDIATE handlers run inline inside publish (legacy behaviour).
+    PHASE handlers are delivered in bulk at the next phase boundary.
+    TICK handlers are delivered in bulk at tick end.
+    """
+    IMMEDIATE = "IMMEDIATE"
+    PHASE = "PHASE"
+    TICK = "TICK"
+
+@dataclass
+class EventBusMetricsDTO:
+    """Throughput and handler latency counters for the EventBus."""
+    published: int = 0
+    delivered: int = 0
+    deferred_pending: int = 0
+    flushes: int = 0
+    events_per_sec: float = 0.0
+    handler_calls: int = 0
+    handler_errors: int = 0
+    avg_handler_latency_ms: float = 0.0
+    max_handler_latency_ms: float = 0.0
+    published_by_type: Dict[str, int] = field(default_factory=dict)
+
 class IEventBus(Protocol[E]):
     """
     A central mediator for publishing and subscribing to system events.
@@ -32,3 +62,39 @@ class IEventBus(Protocol[E]):
             event: The event object to be broadcast.
         """
         ...
+
+class IDeferredEventBus(IEventBus[E], Protocol[E]):
+    """
+    EventBus with deferred, batched delivery.
+    Observer work (telemetry, logging, analysis) is taken off the critical path
+    by buffering events per type and delivering them at phase boundaries or tick end.
+    """
+
+    def subscribe(
+        self,
+        event_type: str,
+        handler: Callable[..., None],
+        delivery: DeliveryMode = DeliveryMode.IMMEDIATE,
+        batch: bool = False
+    ) -> None:
+        """
+        Subscribes a handler.
+
+        Args:
+            delivery: When the handler runs (see DeliveryMode).
+            batch: If True, the handler receives a List of events per flush.
+                   Batch handlers are always deferred (TICK if IMMEDIATE is requested).
+        """
+        ...
+
+    def flush(self, boundary: DeliveryMode = DeliveryMode.TICK) -> int:
+        """
+        Delivers buffered events.
+        PHASE flushes only phase-deferred subscriptions; TICK flushes everything.
+        Returns the number of events delivered.
+        """
+        ...
+
+    def get_metrics(self) -> EventBusMetricsDTO:
+        """Returns a snapshot of throughput and handler latency counters."""
+        ...
@@ -1,40 +1,161 @@
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Callable, Optional, Tuple
 import logging
-from modules.system.event_bus.api import IEventBus, EventHandler, E
+import time
+from modules.system.event_bus.api import IDeferredEventBus, EventHandler, E, DeliveryMode, EventBusMetricsDTO
 
 logger = logging.getLogger(__name__)
 
-class EventBus(IEventBus[E]):
+# (handler, delivery, batch)
+_Subscription = Tuple[Callable[..., None], DeliveryMode, bool]
+
+class EventBus(IDeferredEventBus[E]):
     """
-    A simple, synchronous implementation of the EventBus.
+    EventBus with synchronous (default) and deferred, batched delivery.
+    Deferred events are appended to per-type buffers and delivered in bulk by flush().
     """
-    def __init__(self):
-        self._subscribers: Dict[str, List[EventHandler[E]]] = {}
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self._subscribers: Dict[str, List[_Subscription]] = {}
+        # Per-type dispatch cache: (immediate handlers, has PHASE subs, has TICK subs)
+        self._dispatch_cache: Dict[str, Tuple[List[Callable[..., None]], bool, bool]] = {}
+        # Typed per-tick buffers, split by delivery boundary
+        self._buffers: Dict[DeliveryMode, Dict[str, List[E]]] = {
+            DeliveryMode.PHASE: {},
+            DeliveryMode.TICK: {},
+        }
+        self._clock = clock
+
+        # Counters
+        self._published = 0
+        self._delivered = 0
+        self._flushes = 0
+        self._handler_calls = 0
+        self._handler_errors = 0
+        self._handler_time = 0.0
+        self._handler_time_max = 0.0
+        self._published_by_type: Dict[str, int] = {}
+        self._window_start = clock()
 
-    def subscribe(self, event_type: str, handler: EventHandler[E]) -> None:
+    def subscribe(
+        self,
+        event_type: str,
+        handler: Callable[..., None],
+        delivery: DeliveryMode = DeliveryMode.IMMEDIATE,
+        batch: bool = False
+    ) -> None:
         """Subscribes a handler to a specific event type."""
+        if batch and delivery == DeliveryMode.IMMEDIATE:
+            delivery = DeliveryMode.TICK
         if event_type not in self._subscribers:
             self._subscribers[event_type] = []
-        self._subscribers[event_type].append(handler)
-        logger.debug(f"EventBus: Subscribed handler to {event_type}")
+        self._subscribers[event_type].append((handler, delivery, batch))
+        self._dispatch_cache.pop(event_type, None)
+        logger.debug(f"EventBus: Subscribed handler to {event_type} ({delivery.value}, batch={batch})")
+
+    def _resolve_dispatch(self, event_type: str) -> Tuple[List[Callable[..., None]], bool, bool]:
+        entry = self._dispatch_cache.get(event_type)
+        if entry is None:
+            subs = self._subscribers.get(event_type, [])
+            entry = (
+                [h for h, mode, _ in subs if mode == DeliveryMode.IMMEDIATE],
+                any(mode == DeliveryMode.PHASE for _, mode, _ in subs),
+                any(mode == DeliveryMode.TICK for _, mode, _ in subs),
+            )
+            self._dispatch_cache[event_type] = entry
+        return entry
 
     def publish(self, event: E) -> None:
         """
-        Publishes an event to all subscribed handlers.
+        Publishes an event.
+        Immediate subscribers run inline; deferred subscribers are buffered until flush().
         """
-        event_type = None
         if isinstance(event, dict):
             event_type = event.get('event_type')
-        elif hasattr(event, 'event_type'):
-            event_type = getattr(event, 'event_type')
+        else:
+            event_type = getattr(event, 'event_type', None)
 
         if not event_type:
             logger.error(f"EventBus: Published event without 'event_type': {event}")
             return
 
-        handlers = self._subscribers.get(event_type, [])
-        for handler in handlers:
-            try:
-                handler(event)
-            except Exception as e:
-                logger.error(f"EventBus: Error in handler for {event_type}: {e}", exc_info=True)
+        self._published += 1
+        self._published_by_type[event_type] = self._published_by_type.get(event_type, 0) + 1
+
+        immediate, has_phase, has_tick = self._resolve_dispatch(event_type)
+        if has_phase:
+            self._buffers[DeliveryMode.PHASE].setdefault(event_type, []).append(event)
+        if has_tick:
+            self._buffers[DeliveryMode.TICK].setdefault(event_type, []).append(event)
+
+        for handler in immediate:
+            self._invoke(handler, event, event_type)
+            self._delivered += 1
+
+    def flush(self, boundary: DeliveryMode = DeliveryMode.TICK) -> int:
+        """
+        Delivers buffered events in publish order per type.
+        A PHASE boundary flushes phase-deferred subscriptions only; TICK (tick end) flushes all.
+        """
+        modes = [DeliveryMode.PHASE] if boundary == DeliveryMode.PHASE else [DeliveryMode.PHASE, DeliveryMode.TICK]
+        delivered = 0
+        for mode in modes:
+            buffers = self._buffers[mode]
+            if not buffers:
+                continue
+            # Swap out before dispatch so handlers may publish into a fresh buffer
+            self._buffers[mode] = {}
+            for event_type, events in buffers.items():
+                for handler, sub_mode, is_batch in self._subscribers.get(event_type, []):
+                    if sub_mode != mode:
+                        continue
+                    if is_batch:
+                        self._invoke(handler, events, event_type)
+                    else:
+                        for event in events:
+                            self._invoke(handler, event, event_type)
+                    delivered += len(events)
+        if delivered:
+            self._flushes += 1
+            self._delivered += delivered
+        return delivered
+
+    def _invoke(self, handler: Callable[..., None], payload: Any, event_type: str) -> None:
+        start = self._clock()
+        try:
+            handler(payload)
+        except Exception as e:
+            self._handler_errors += 1
+            logger.error(f"EventBus: Error in handler for {event_type}: {e}", exc_info=True)
+        elapsed = self._clock() - start
+        self._handler_calls += 1
+        self._handler_time += elapsed
+        if elapsed > self._handler_time_max:
+            self._handler_time_max = elapsed
+
+    def get_metrics(self) -> EventBusMetricsDTO:
+        """Returns counters accumulated since the last reset_metrics()."""
+        window = self._clock() - self._window_start
+        pending = sum(len(events) for buffers in self._buffers.values() for events in buffers.values())
+        return EventBusMetricsDTO(
+            published=self._published,
+            delivered=self._delivered,
+            deferred_pending=pending,
+            flushes=self._flushes,
+            events_per_sec=self._published / window if window > 0 else 0.0,
+            handler_calls=self._handler_calls,
+            handler_errors=self._handler_errors,
+            avg_handler_latency_ms=(self._handler_time / self._handler_calls * 1000.0) if self._handler_calls else 0.0,
+            max_handler_latency_ms=self._handler_time_max * 1000.0,
+            published_by_type=dict(self._published_by_type),
+        )
+
+    def reset_metrics(self) -> None:
+        """Starts a new metrics window."""
+        self._published = 0
+        self._delivered = 0
+        self._flushes = 0
+        self._handler_calls = 0
+        self._handler_errors = 0
+        self._handler_time = 0.0
+        self._handler_time_max = 0.0
+        self._published_by_type = {}
+        self._window_start = self._clock()
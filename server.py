@@ -10,6 +10,7 @@ from fastapi import FastAPI, WebSocket, WebSocketDisconnect, status, HTTPExcepti
 from modules.system.builders.simulation_builder import create_simulation
 from simulation.orchestration.dashboard_service import DashboardService
 from simulation.orchestration.agent_service import AgentService
+from simulation.orchestration.read_model import ReadModelPublisher
 from modules.governance.cockpit.api import CockpitCommand
 from modules.system.security import verify_god_mode_token
 from modules.demographics.genealogy.router import router as genealogy_router
@@ -23,6 +24,7 @@ logger = logging.getLogger("server")
 sim = None
 dashboard_service = None
 agent_service = None
+read_model = None
 background_task = None
 is_running = False
 is_ready = False
@@ -36,6 +38,15 @@ def handle_signal(sig, frame):
     logger.info(f"Received signal {sig}. Initiating shutdown...")
     is_running = False
 
+def run_tick_and_publish():
+    """One tick followed by publishing the read model, both on the worker thread (tick boundary)."""
+    sim.run_tick()
+    if read_model:
+        try:
+            read_model.publish()
+        except Exception as e:
+            logger.error(f"Failed to publish read model: {e}", exc_info=True)
+
 async def simulation_loop():
     global sim, is_running
     logger.info("Starting simulation loop...")
@@ -43,7 +54,7 @@ async def simulation_loop():
         if sim:
             try:
                 # Run tick in thread pool to prevent blocking the event loop
-                await asyncio.to_thread(sim.run_tick)
+                await asyncio.to_thread(run_tick_and_publish)
 
                 # Yield control to event loop
                 await asyncio.sleep(0.1)
@@ -55,7 +66,7 @@ async def simulation_loop():
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global sim, dashboard_service, agent_service, background_task, is_running, is_ready
+    global sim, dashboard_service, agent_service, read_model, background_task, is_running, is_ready
 
     # Startup
     logger.info("Initializing simulation...")
@@ -64,6 +75,10 @@ async def lifespan(app: FastAPI):
         sim = create_simulation()
         dashboard_service = DashboardService(sim)
         agent_service = AgentService(sim)
+        # Endpoints serve the published read model, never the live objects the tick loop mutates.
+        # WATCHTOWER_READ_MODEL_PATH also writes it to a mappable file for out-of-process readers.
+        read_model = ReadModelPublisher(sim, dashboard_service, path=os.getenv("WATCHTOWER_READ_MODEL_PATH"))
+        read_model.publish()
 
         is_running = True
         background_task = asyncio.create_task(simulation_loop())
@@ -105,9 +120,10 @@ async def websocket_endpoint(websocket: WebSocket):
     try:
         while True:
             # Check readiness flag before accessing service/DB
-            if is_ready and dashboard_service:
-                # Serves WatchtowerSnapshotDTO (TD-125)
-                snapshot = dashboard_service.get_snapshot()
+            snapshot = read_model.latest.watchtower if is_ready and read_model else None
+            if snapshot is not None:
+                # Serves WatchtowerSnapshotDTO (TD-125) from the last published tick
+                dashboard_service.persistence.save_snapshot(snapshot)
 
                 # Use model_dump to convert Pydantic model to dict
                 data = snapshot.model_dump()
@@ -179,10 +195,10 @@ async def agents_websocket_endpoint(websocket: WebSocket):
     logger.info("Client connected to /ws/agents")
     try:
         while True:
-            if is_ready and agent_service:
+            if is_ready and read_model:
                 # Serves List[AgentBasicDTO]
                 # Default limit 500, could be parameterized via query params in connection
-                agents = agent_service.get_agents_basic(limit=500)
+                agents = read_model.latest.get_agents_basic(limit=500)
                 data = [a.model_dump() for a in agents]
 
                 await websocket.send_json(data)
@@ -196,10 +212,10 @@ async def agents_websocket_endpoint(websocket: WebSocket):
 
 @app.get("/api/v1/inspector/{agent_id}")
 async def get_agent_detail(agent_id: int):
-    if not is_ready or not agent_service:
+    if not is_ready or not read_model:
         raise HTTPException(status_code=503, detail="Simulation not ready")
 
-    agent = agent_service.get_agent_detail(agent_id)
+    agent = read_model.latest.get_agent_detail(agent_id)
     if not agent:
         raise HTTPException(status_code=404, detail="Agent not found")
 
@@ -226,7 +226,7 @@ class CentralBank(ICurrencyHolder, IFinancialAgent, IFinancialEntity, ICentralBa
     def _build_snapshot(self, tick: int, indicators: Dict[str, Any]) -> MacroEconomicSnapshotDTO:
         # Calculate annual inflation
         price_history = self.tracker.metrics.get("goods_price_index", []) # Used to use avg_goods_price, updated tracker uses goods_price_index
-        if not price_history:
+        if len(price_history) == 0:
              price_history = self.tracker.metrics.get("avg_goods_price", []) # Fallback
 
         inflation_rate = 0.0
@@ -28,7 +28,8 @@ from modules.government.dtos import (
     ExecutionResultDTO,
     FiscalContextDTO,
     BondIssueRequestDTO,
-    TaxAssessmentResultDTO
+    TaxAssessmentResultDTO,
+    TreasuryAccount
 )
 from modules.government.api import (
     GovernmentExecutionContext,
@@ -38,12 +39,14 @@ from modules.government.api import (
 )
 from modules.government.services.welfare_service import WelfareService
 from modules.government.tax.service import TaxService
+from modules.government.welfare.registry import WelfareRecipientRegistry, RecipientRosterDTO
 from modules.government.services.fiscal_bond_service import FiscalBondService
 from modules.government.components.infrastructure_manager import InfrastructureManager
 from modules.government.constants import *
 from modules.finance.kernel.ledger import MonetaryLedger
 from modules.government.components.policy_lockout_manager import PolicyLockoutManager
 from modules.system.api import CurrencyCode, DEFAULT_CURRENCY, ICurrencyHolder
+from modules.system.constants import ID_SYSTEM
 from modules.finance.wallet.wallet import Wallet
 from modules.finance.wallet.api import IWallet
 from modules.simulation.api import ISensoryDataProvider, AgentSensorySnapshotDTO
@@ -89,6 +92,8 @@ class Government(ICurrencyHolder, IFinancialAgent, ISensoryDataProvider):
         self.tax_service: ITaxService = TaxService(config_module)
         self.welfare_manager: IWelfareService = WelfareService(config_module) # Kept name for context compat
         self.fiscal_bond_service: IFiscalBondService = FiscalBondService(config_module)
+        # Households covered by social policy, maintained at creation and death
+        self.welfare_registry = WelfareRecipientRegistry()
 
         self.ministry_of_education = MinistryOfEducation(config_module)
         self.infrastructure_manager = InfrastructureManager(self)
@@ -571,6 +576,10 @@ class Government(ICurrencyHolder, IFinancialAgent, ISensoryDataProvider):
     def execute_social_policy(self, agents: List[Any], market_data: Dict[str, Any], current_tick: int) -> List[Transaction]:
         """
         Orchestrates Tax Collection and Welfare Distribution using Execution Engine.
+        Once the welfare registry is tracking (wired at agent creation/death), the
+        population comes from the registry and `agents` is ignored.
+        All resulting flows are settled as one bulk batch and tax revenue is
+        recorded once per tax type.
         """
         decision = PolicyDecisionDTO(
             action_tag=PolicyActionTag.SOCIAL_POLICY,
@@ -581,57 +590,74 @@ class Government(ICurrencyHolder, IFinancialAgent, ISensoryDataProvider):
         state_dto = self._get_state_dto(current_tick)
         context = self._get_execution_context()
 
+        if self.welfare_registry.is_tracking:
+            roster = self.welfare_registry.build_roster()
+        else:
+            roster = RecipientRosterDTO.from_agents(agents)
+
         result = self.execution_engine.execute(
             decision,
             state_dto,
-            agents,
+            roster,
             market_data,
             context
         )
 
-        # Funding for Welfare
-        welfare_reqs = [req for req in result.payment_requests if req.payer == self.id or (hasattr(req.payer, 'id') and req.payer.id == self.id)]
-        total_welfare_needed = sum(req.amount for req in welfare_reqs)
+        # Resolve counterparties once; legs keep the engine's request order
+        legs_by_currency: Dict[CurrencyCode, List[Tuple[Any, Any, int, str]]] = {}
+        total_welfare_needed = 0
+        for req in result.payment_requests:
+            payer = self._resolve_counterparty(req.payer)
+            payee = self._resolve_counterparty(req.payee)
+            # Treasury-paid legs (placeholder, own id or self) need funding
+            if payer is self:
+                total_welfare_needed += int(req.amount)
+            legs_by_currency.setdefault(req.currency, []).append((payer, payee, int(req.amount), req.memo))
 
+        # Funding for Welfare
         if total_welfare_needed > 0:
             current_balance = self.wallet.get_balance(DEFAULT_CURRENCY)
             if current_balance < total_welfare_needed:
                 self._issue_deficit_bonds(total_welfare_needed - current_balance, current_tick)
 
         transactions: List[Transaction] = []
-
-        # Execute Transfers
-        for req in result.payment_requests:
-            payer = req.payer
-            payee = req.payee
-
-            if payer == self.id: payer = self
-            if isinstance(payer, str) and "GOVERNMENT" in payer:
-                payer = self
-
-            if isinstance(payee, str) and "GOVERNMENT" in payee:
-                payee = self
-            elif hasattr(payee, 'id') and payee.id == self.id:
-                payee = self
-            elif payee == self.id:
-                payee = self
-
-            if self.settlement_system:
-                tx = self.settlement_system.transfer(payer, payee, int(req.amount), req.memo, currency=req.currency)
-
-                if tx:
-                    transactions.append(tx)
-                    if payee == self: # Tax
-                         self.record_revenue(TaxCollectionResult(
-                             success=True,
-                             amount_collected=int(req.amount),
-                             tax_type=req.memo if req.memo else "wealth_tax",
-                             payer_id=payer.id if hasattr(payer, 'id') else payer,
-                             payee_id=self.id,
-                             error_message=None
-                         ))
+        if not self.settlement_system:
+            return transactions
+
+        # Execute Transfers (one bulk batch per currency)
+        revenue_by_type: Dict[str, int] = {}
+        payers_by_type: Dict[str, set] = {}
+        for currency, legs in legs_by_currency.items():
+            results = self.settlement_system.execute_bulk_transfers(legs, current_tick, currency=currency)
+            for (payer, payee, amount, memo), tx in zip(legs, results):
+                if not tx:
+                    continue
+                transactions.append(tx)
+                if payee is self: # Tax
+                    tax_type = memo if memo else "wealth_tax"
+                    revenue_by_type[tax_type] = revenue_by_type.get(tax_type, 0) + amount
+                    payers_by_type.setdefault(tax_type, set()).add(payer.id if hasattr(payer, 'id') else payer)
+
+        for tax_type, amount in revenue_by_type.items():
+            payer_ids = payers_by_type[tax_type]
+            self.record_revenue(TaxCollectionResult(
+                success=True,
+                amount_collected=amount,
+                tax_type=tax_type,
+                payer_id=next(iter(payer_ids)) if len(payer_ids) == 1 else ID_SYSTEM,
+                payee_id=self.id,
+                error_message=None
+            ))
         return transactions
 
+    def _resolve_counterparty(self, party: Any) -> Any:
+        """Maps the treasury placeholder, our own id or our own object to `self`."""
+        if party is TreasuryAccount.GOVERNMENT or party is self:
+            return self
+        if getattr(party, 'id', party) == self.id:
+            return self
+        return party
+
     def invest_infrastructure(self, current_tick: int, households: List[Any] = None) -> List[Transaction]:
         return self.infrastructure_manager.invest_infrastructure(current_tick, households)
 
@@ -1,9 +1,17 @@
-from typing import Any, Dict, Optional, NamedTuple
+from typing import Any, Dict, Optional, NamedTuple, Sequence, List
 import math
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Closed-form NPVs agree with the month-by-month discounting loop to within
+# HOUSING_NPV_RTOL * market_price (float summation error of the 120-term loop)
+HOUSING_NPV_RTOL = 1e-9
+# Below this monthly rate the annuity factor is taken as its limit, the number of periods
+_ZERO_RATE_EPS = 1e-12
+
 class HousingDecisionInputs(NamedTuple):
     current_wealth: float
     annual_income: float
@@ -12,6 +20,72 @@ class HousingDecisionInputs(NamedTuple):
     risk_free_rate: float
     price_growth_expectation: float
 
+class HousingNPVParams(NamedTuple):
+    horizon_years: int = 10
+    risk_premium: float = 0.02
+    maintenance_rate: float = 0.01
+    expectation_cap: float = 0.05
+    down_payment_rate: float = 0.2
+
+    @classmethod
+    def from_config(cls, config_module: Any) -> "HousingNPVParams":
+        return cls(
+            horizon_years=getattr(config_module, "HOUSING_NPV_HORIZON_YEARS", 10),
+            risk_premium=getattr(config_module, "HOUSING_NPV_RISK_PREMIUM", 0.02),
+            maintenance_rate=getattr(config_module, "HOUSING_ANNUAL_MAINTENANCE_RATE", 0.01),
+            expectation_cap=getattr(config_module, "HOUSING_EXPECTATION_CAP", 0.05),
+            down_payment_rate=getattr(config_module, "MORTGAGE_DEFAULT_DOWN_PAYMENT_RATE", 0.2),
+        )
+
+def housing_npv(
+    market_price: Any,
+    market_rent_monthly: Any,
+    price_growth_expectation: Any,
+    risk_free_rate: Any,
+    params: HousingNPVParams
+) -> Dict[str, np.ndarray]:
+    """
+    NPV of buying vs renting for many households at once (WO-046 formulas).
+    Arguments are arrays (or scalars) broadcast against each other.
+
+    Both flows are constant per month, so the discounted sums over T months are
+    flow * A with the annuity factor A = (1 - (1+r)^-T) / r (A = T when r = 0).
+    Results match the per-month loop to HOUSING_NPV_RTOL * market_price.
+    """
+    price = np.asarray(market_price, dtype=np.float64)
+    rent = np.asarray(market_rent_monthly, dtype=np.float64)
+    rfr = np.asarray(risk_free_rate, dtype=np.float64)
+
+    T_years = params.horizon_years
+    T_months = T_years * 12
+
+    # Monthly Discount Rate: r = (interest_rate + risk_premium) / 12
+    r_monthly = (rfr + params.risk_premium) / 12.0
+    log_growth = np.log1p(r_monthly)
+    terminal_discount = np.exp(T_months * log_growth)
+    near_zero = np.abs(r_monthly) < _ZERO_RATE_EPS
+    safe_r = np.where(near_zero, 1.0, r_monthly)
+    annuity = np.where(near_zero, float(T_months), -np.expm1(-T_months * log_growth) / safe_r)
+
+    # Buying: shelter utility (= rent saved) minus maintenance; price growth capped
+    cost_own = (price * params.maintenance_rate) / 12.0
+    g_annual = np.minimum(np.asarray(price_growth_expectation, dtype=np.float64), params.expectation_cap)
+    p_future = price * ((1.0 + g_annual) ** T_years)
+    npv_buy = (rent - cost_own) * annuity + p_future / terminal_discount - price
+
+    # Renting: the down payment stays invested at the risk-free rate and is returned at T
+    principal = price * params.down_payment_rate
+    income_invest = principal * (rfr / 12.0)
+    npv_rent = (income_invest - rent) * annuity + principal / terminal_discount
+
+    return {
+        "npv_buy": npv_buy,
+        "npv_rent": npv_rent,
+        "P_future": p_future,
+        "monthly_cost_own": cost_own,
+        "monthly_income_invest": income_invest,
+    }
+
 from simulation.ai.api import IPlanner
 
 class HouseholdSystem2Planner(IPlanner):
@@ -23,6 +97,7 @@ class HouseholdSystem2Planner(IPlanner):
     def __init__(self, agent: Any, config_module: Any):
         self.agent = agent
         self.config = config_module
+        self.npv_params = HousingNPVParams.from_config(config_module)
 
     def calculate_housing_npv(self, inputs: HousingDecisionInputs) -> Dict[str, float]:
         """
@@ -32,75 +107,40 @@ class HouseholdSystem2Planner(IPlanner):
         NPV_Buy = Sum( (U_shelter - Cost_own) / (1+r)^t ) + P_future / (1+r)^T - P_initial
         NPV_Rent = Sum( (Income_invest - Cost_rent) / (1+r)^t ) + Principal / (1+r)^T
         """
-
-        # Parameters
-        T_years = getattr(self.config, "HOUSING_NPV_HORIZON_YEARS", 10)
-        T_months = T_years * 12
-
-        # Monthly Discount Rate
-        # r = (interest_rate + risk_premium) / 12
-        risk_premium = getattr(self.config, "HOUSING_NPV_RISK_PREMIUM", 0.02)
-        r_monthly = (inputs.risk_free_rate + risk_premium) / 12.0
-
-        # Buying Components
-        P_initial = inputs.market_price
-        U_shelter = inputs.market_rent_monthly
-        maintenance_rate = getattr(self.config, "HOUSING_ANNUAL_MAINTENANCE_RATE", 0.01)
-        Cost_own = (P_initial * maintenance_rate) / 12.0
-
-        # Price Growth Expectation (Capped at 5%)
-        g_annual = min(inputs.price_growth_expectation, getattr(self.config, "HOUSING_EXPECTATION_CAP", 0.05))
-        P_future = P_initial * ((1.0 + g_annual) ** T_years)
-
-        # Renting Components
-        # Principal = Down Payment
-        down_payment_rate = getattr(self.config, "MORTGAGE_DEFAULT_DOWN_PAYMENT_RATE", 0.2)
-        Principal = P_initial * down_payment_rate
-        # Income_invest = Principal * (interest_rate / 12)
-        Income_invest = Principal * (inputs.risk_free_rate / 12.0)
-        Cost_rent = inputs.market_rent_monthly
-
-        # Calculate NPVs
-        npv_buy_flow = 0.0
-        npv_rent_flow = 0.0
-
-        for t in range(1, T_months + 1):
-            discount_factor = (1.0 + r_monthly) ** t
-
-            # Buy Flow
-            flow_buy = U_shelter - Cost_own
-            npv_buy_flow += flow_buy / discount_factor
-
-            # Rent Flow
-            flow_rent = Income_invest - Cost_rent
-            npv_rent_flow += flow_rent / discount_factor
-
-        # Terminal Value Discounted
-        terminal_discount = (1.0 + r_monthly) ** T_months
-
-        term_val_buy = P_future / terminal_discount
-        npv_buy = npv_buy_flow + term_val_buy - P_initial
-
-        term_val_rent = Principal / terminal_discount
-        npv_rent = npv_rent_flow + term_val_rent
-        # Note: Rent NPV usually accounts for the Principal being preserved/invested.
-        # The formula: Sum(Income - Rent) + Principal_Future.
-        # Here Principal is simply returned?
-        # Spec: "Principal / (1+r)^T".
-        # This implies the principal grows at 0%? Or is Income_invest paying out the interest?
-        # Yes, Income_invest is the monthly payout. The Principal remains intact.
-
+        results = housing_npv(
+            inputs.market_price, inputs.market_rent_monthly,
+            inputs.price_growth_expectation, inputs.risk_free_rate, self.npv_params
+        )
         return {
-            "npv_buy": npv_buy,
-            "npv_rent": npv_rent,
+            "npv_buy": float(results["npv_buy"]),
+            "npv_rent": float(results["npv_rent"]),
             "details": {
-                "P_future": P_future,
-                "monthly_cost_own": Cost_own,
-                "monthly_cost_rent": Cost_rent,
-                "monthly_income_invest": Income_invest
+                "P_future": float(results["P_future"]),
+                "monthly_cost_own": float(results["monthly_cost_own"]),
+                "monthly_cost_rent": inputs.market_rent_monthly,
+                "monthly_income_invest": float(results["monthly_income_invest"])
             }
         }
 
+    def decide_batch(self, inputs: Sequence[HousingDecisionInputs]) -> List[str]:
+        """
+        `decide` for many households in one NumPy pass. Returns "BUY"/"RENT" per input, in order.
+        """
+        if not inputs:
+            return []
+        columns = np.array(inputs, dtype=np.float64)
+        annual_income = columns[:, 1]
+        rent = columns[:, 2]
+        price = columns[:, 3]
+        rfr = columns[:, 4]
+        growth = columns[:, 5]
+
+        results = housing_npv(price, rent, growth, rfr, self.npv_params)
+        # DTI guardrail first: an unaffordable mortgage always means RENT
+        affordable = (price * 0.8) * rfr <= annual_income * 0.4
+        buy = affordable & (results["npv_buy"] > results["npv_rent"])
+        return ["BUY" if b else "RENT" for b in buy.tolist()]
+
     def decide(self, inputs: HousingDecisionInputs) -> str:
         """
         Executes the decision logic.
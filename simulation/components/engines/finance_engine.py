@@ -6,7 +6,8 @@ from simulation.models import Transaction, Order
 from simulation.components.state.firm_state_models import FinanceState
 from modules.finance.api import InsufficientFundsError, IShareholderRegistry
 from modules.system.api import CurrencyCode, DEFAULT_CURRENCY
-from modules.finance.dtos import MoneyDTO, MultiCurrencyWalletDTO
+from modules.finance.dtos import MoneyDTO, MultiCurrencyWalletDTO, DividendDistributionDTO
+from modules.finance.shareholder_registry import get_cap_table, allocate_pro_rata
 from simulation.dtos.context_dtos import FinancialTransactionContext
 from modules.firm.api import (
     FinanceDecisionInputDTO, BudgetPlanDTO, IFinanceEngine,
@@ -286,35 +287,14 @@ class FinanceEngine(IFinanceEngine):
                 bailout_repaid += ob.amount_pennies
 
             elif otype == 'dividend':
-                # Distribute to shareholders
-                distributable = ob.amount_pennies
+                # Distribute to shareholders as one batched payout
                 cur = ob.currency
-                shareholders = context.shareholder_registry.get_shareholders_of_firm(firm_id)
-
-                paid_total = 0
-                for shareholder in shareholders:
-                    shares = shareholder['quantity']
-                    agent_id = shareholder['agent_id']
-                    if agent_id == firm_id: continue
-
-                    if shares > 0:
-                        amount = int(distributable * (shares / state.total_shares))
-                        if amount > 0:
-                            transactions.append(Transaction(
-                                buyer_id=firm_id,
-                                seller_id=agent_id,
-                                item_id="dividend",
-                                quantity=1.0,
-                                price=amount / 100.0,
-                                market_id="financial",
-                                transaction_type="dividend",
-                                time=current_time,
-                                currency=cur,
-                                total_pennies=amount
-                            ))
-                            paid_total += amount
-
-                dividends_paid[cur] += paid_total
+                distribution_tx = self._build_dividend_distribution(
+                    state, firm_id, context.shareholder_registry, ob.amount_pennies, cur, current_time
+                )
+                if distribution_tx:
+                    transactions.append(distribution_tx)
+                    dividends_paid[cur] += distribution_tx.total_pennies
 
         # Update State
         # 1. Bailout
@@ -347,6 +327,53 @@ class FinanceEngine(IFinanceEngine):
 
         return transactions
 
+    def _build_dividend_distribution(
+        self,
+        state: FinanceState,
+        firm_id: int,
+        registry: Optional[IShareholderRegistry],
+        distributable: int,
+        currency: CurrencyCode,
+        current_time: int
+    ) -> Optional[Transaction]:
+        """
+        One summarized 'dividend_distribution' transaction for a pro-rata payout.
+        Amounts come from the cap table with largest-remainder penny allocation;
+        the settlement handler expands them into a single bulk transfer.
+        """
+        holder_ids, quantities = get_cap_table(registry, firm_id)
+        eligible = (holder_ids != firm_id) & (quantities > 0) # Treasury shares receive nothing
+        holder_ids, quantities = holder_ids[eligible], quantities[eligible]
+
+        amounts = allocate_pro_rata(quantities, holder_ids, distributable, state.total_shares)
+        paid = amounts > 0
+        distribution = DividendDistributionDTO(
+            firm_id=firm_id,
+            currency=currency,
+            total_pennies=int(amounts.sum()),
+            holder_ids=holder_ids[paid],
+            amounts_pennies=amounts[paid],
+        )
+        if distribution.total_pennies <= 0:
+            return None
+
+        return Transaction(
+            buyer_id=firm_id,
+            seller_id=firm_id, # Self as distributor; recipients are in the distribution
+            item_id="dividend",
+            quantity=1.0,
+            price=distribution.total_pennies / 100.0,
+            market_id="financial",
+            transaction_type="dividend_distribution",
+            time=current_time,
+            currency=currency,
+            total_pennies=distribution.total_pennies,
+            metadata=TransactionMetadataDTO(original_metadata={
+                'type': 'dividend', 'currency': currency, 'total_distributable': distributable,
+                'distribution': distribution
+            })
+        )
+
     def generate_financial_transactions(
         self,
         state: FinanceState,
@@ -483,37 +510,18 @@ class FinanceEngine(IFinanceEngine):
 
         # 3. Dividends
         state.dividends_paid_last_tick_pennies = 0
-        shareholders = registry.get_shareholders_of_firm(firm_id) if registry else []
+        holder_ids, _ = get_cap_table(registry, firm_id)
 
         for cur, profit in state.current_profit.items():
             distributable_profit = max(0, int(profit * state.dividend_rate))
-            if distributable_profit > 0 and state.total_shares > 0 and shareholders:
+            if distributable_profit > 0 and state.total_shares > 0 and len(holder_ids):
                 state.dividends_paid_last_tick_pennies += convert(distributable_profit, cur)
 
-                for shareholder in shareholders:
-                    shares = shareholder['quantity']
-                    agent_id = shareholder['agent_id']
-
-                    if agent_id == firm_id: continue # Treasury shares
-
-                    if shares > 0:
-                        # Share ratio is float. Result is pennies.
-                        dividend_amount = int(distributable_profit * (shares / state.total_shares))
-                        transactions.append(
-                            Transaction(
-                                buyer_id=firm_id,
-                                seller_id=agent_id,
-                                item_id="dividend",
-                                quantity=1.0,
-                                price=dividend_amount / 100.0,
-                                market_id="financial",
-                                transaction_type="dividend",
-                                time=current_time,
-                                currency=cur,
-                                total_pennies=dividend_amount,
-                                metadata=TransactionMetadataDTO(original_metadata={'type': 'dividend', 'currency': cur, 'total_distributable': distributable_profit})
-                            )
-                        )
+                distribution_tx = self._build_dividend_distribution(
+                    state, firm_id, registry, distributable_profit, cur, current_time
+                )
+                if distribution_tx:
+                    transactions.append(distribution_tx)
 
         # 4. Reset Period Counters
         total_revenue_primary = 0
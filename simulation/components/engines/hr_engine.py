@@ -2,6 +2,9 @@ from __future__ import annotations
 from modules.system.api import TransactionMetadataDTO
 from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 import logging
+
+import numpy as np
+
 from modules.system.api import DEFAULT_CURRENCY, CurrencyCode, MarketContextDTO
 from modules.hr.api import IEmployeeDataProvider
 from simulation.models import Transaction, Order
@@ -10,7 +13,7 @@ from simulation.dtos.hr_dtos import HRPayrollContextDTO, HRPayrollResultDTO, Emp
 from modules.firm.api import (
     HRDecisionInputDTO, HRDecisionOutputDTO, IHREngine,
     HRContextDTO, HRIntentDTO, IHRDepartment, AgentID,
-    MarketSnapshotDTO, PayrollIntentDTO, ObligationDTO, PaymentPriority
+    MarketSnapshotDTO, PayrollIntentDTO, PayrollBatchDTO, ObligationDTO, PaymentPriority
 )
 
 if TYPE_CHECKING:
@@ -277,63 +280,83 @@ class HREngine(IHREngine, IHRDepartment):
     ) -> PayrollIntentDTO:
         """
         Calculates all payroll obligations (Wages, Taxes, Severance) without applying them.
-        Returns a PayrollIntentDTO containing a list of ObligationDTOs.
+        The whole roster is priced as one PayrollBatchDTO; the intent carries one net-wage
+        and one withholding obligation for it instead of two per employee.
         """
         wage_obligations: List[ObligationDTO] = []
         severance_obligations: List[ObligationDTO] = []
-        total_wages = 0
-        total_severance = 0
-
-        firm_id = context.firm_id
-        current_time = context.current_time
-
-        # Calculate survival cost for tax logic
-        survival_cost = 1000 # Default fallback (10.00)
-        if context.tax_policy:
-            survival_cost = context.tax_policy.survival_cost
 
-        for employee in list(hr_state.employees):
-            # Validate employee
-            if employee.employer_id != firm_id or not employee.is_employed:
-                continue
-
-            base_wage = hr_state.employee_wages.get(employee.id, context.labor_market_min_wage)
-            wage = self.calculate_wage(employee, base_wage, config)
-
-            # Calculate Tax
-            income_tax = 0
-            if context.tax_policy:
-                income_tax = int(wage * context.tax_policy.income_tax_rate) if wage > survival_cost else 0
-
-            net_wage = wage - income_tax
-
-            # 1. Net Wage Obligation
-            if net_wage > 0:
-                wage_obligations.append(ObligationDTO(
-                    amount_pennies=net_wage,
-                    currency=DEFAULT_CURRENCY,
-                    priority=PaymentPriority.WAGE,
-                    recipient_id=employee.id,
-                    description=f"Wage for {employee.id}",
-                ))
-                total_wages += net_wage
-
-            # 2. Income Tax Obligation (Withholding)
-            if income_tax > 0 and context.tax_policy:
-                wage_obligations.append(ObligationDTO(
-                    amount_pennies=income_tax,
-                    currency=DEFAULT_CURRENCY,
-                    priority=PaymentPriority.TAX, # Tax is higher priority than Wage? Or same? Spec says Tax=1, Wage=2.
-                    recipient_id=context.tax_policy.government_agent_id,
-                    description=f"Income Tax for {employee.id}",
-                ))
-                total_wages += income_tax
+        employees = [
+            e for e in hr_state.employees
+            if e.employer_id == context.firm_id and e.is_employed
+        ]
+        batch = self._price_payroll(hr_state, employees, context, config)
+
+        total_net = batch.total_net_pennies
+        total_tax = batch.total_tax_pennies
+        if total_net > 0:
+            wage_obligations.append(ObligationDTO(
+                amount_pennies=total_net,
+                currency=DEFAULT_CURRENCY,
+                priority=PaymentPriority.WAGE,
+                recipient_id=context.firm_id,
+                description="Payroll",
+                metadata={'type': 'payroll_batch', 'batch': batch},
+            ))
+        if total_tax > 0 and context.tax_policy:
+            wage_obligations.append(ObligationDTO(
+                amount_pennies=total_tax,
+                currency=DEFAULT_CURRENCY,
+                priority=PaymentPriority.TAX,
+                recipient_id=context.tax_policy.government_agent_id,
+                description="Payroll Income Tax",
+                metadata={'type': 'payroll_withholding', 'batch': batch},
+            ))
 
         return PayrollIntentDTO(
             wage_obligations=wage_obligations,
             severance_obligations=severance_obligations, # Populated if we handled firing here, but currently firing is separate?
-            total_wages_pennies=total_wages,
-            total_severance_pennies=total_severance
+            total_wages_pennies=total_net + total_tax,
+            total_severance_pennies=0,
+            payroll_batch=batch
+        )
+
+    def _price_payroll(
+        self,
+        hr_state: HRState,
+        employees: List[IEmployeeDataProvider],
+        context: HRPayrollContextDTO,
+        config: FirmConfigDTO
+    ) -> PayrollBatchDTO:
+        """
+        Gross wage (see calculate_wage) and income tax withholding for `employees`, as columns.
+        Uses the same float operations as the scalar formulas, so amounts match them exactly.
+        """
+        n = len(employees)
+        ids = np.fromiter((e.id for e in employees), dtype=np.int64, count=n)
+        base_wages = np.fromiter(
+            (hr_state.employee_wages.get(e.id, context.labor_market_min_wage) for e in employees),
+            dtype=np.float64, count=n
+        )
+        skills = np.fromiter((e.labor_skill for e in employees), dtype=np.float64, count=n)
+        education = np.fromiter((e.education_level for e in employees), dtype=np.float64, count=n)
+
+        gross = np.trunc(base_wages * skills * (1.0 + education * config.halo_effect)).astype(np.int64)
+
+        tax = np.zeros(n, dtype=np.int64)
+        government_id = None
+        if context.tax_policy:
+            # Withholding only applies above the survival cost
+            government_id = context.tax_policy.government_agent_id
+            taxable = gross > context.tax_policy.survival_cost
+            tax[taxable] = np.trunc(gross[taxable] * context.tax_policy.income_tax_rate).astype(np.int64)
+
+        return PayrollBatchDTO(
+            firm_id=context.firm_id,
+            employee_ids=ids,
+            gross_pennies=gross,
+            tax_pennies=tax,
+            government_id=government_id,
         )
 
     def apply_payroll(
@@ -404,75 +427,57 @@ class HREngine(IHREngine, IHRDepartment):
         firm_id = context.firm_id
         current_time = context.current_time
 
-        # Calculate survival cost for tax logic
-        survival_cost = 1000 # Default fallback (10.00)
-        if context.tax_policy:
-            survival_cost = context.tax_policy.survival_cost
-
-        # Create a local copy of wallet balances to simulate spending without mutating the input DTO
-        simulated_balances = context.wallet_balances.copy()
-
-        # Iterate over copy to allow modification of hr_state.employees (if we were removing them,
-        # though now we defer removal for firing cases)
-        # Note: Validation removal still happens immediately as it's state cleanup.
+        # Validation removal happens immediately as it's state cleanup; firing is deferred.
+        employees: List[IEmployeeDataProvider] = []
         for employee in list(hr_state.employees):
-            # Validate employee
             if employee.employer_id != firm_id or not employee.is_employed:
                 self.remove_employee(hr_state, employee)
-                continue
+            else:
+                employees.append(employee)
+        if not employees:
+            return HRPayrollResultDTO(transactions=transactions, employee_updates=employee_updates)
+
+        batch = self._price_payroll(hr_state, employees, context, config)
+        gross = batch.gross_pennies.tolist()
+        taxes = batch.tax_pennies.tolist()
+        government_id = batch.government_id
 
-            base_wage = hr_state.employee_wages.get(employee.id, context.labor_market_min_wage)
-            wage = self.calculate_wage(employee, base_wage, config)
+        # Create a local copy of wallet balances to simulate spending without mutating the input DTO
+        simulated_balances = context.wallet_balances.copy()
+        opening_balance = simulated_balances.get(DEFAULT_CURRENCY, 0)
+
+        # Wages are paid in roster order from the running balance, so everyone up to the
+        # first row whose cumulative gross exceeds the opening balance is paid in full.
+        cumulative = np.cumsum(batch.gross_pennies)
+        paid = int(np.searchsorted(cumulative, opening_balance, side='right'))
+        for i in range(paid):
+            net_wage = gross[i] - taxes[i]
+            self._append_wage_transactions(transactions, firm_id, employees[i].id, net_wage, taxes[i], government_id, current_time)
+            employee_updates.append(EmployeeUpdateDTO(employee_id=employees[i].id, net_income=net_wage))
+        if paid:
+            simulated_balances[DEFAULT_CURRENCY] = opening_balance - int(cumulative[paid - 1])
+
+        # Helper for conversion
+        def convert(amt, cur):
+            if cur == DEFAULT_CURRENCY: return amt
+            rate = exchange_rates.get(cur, 0.0)
+            return amt * rate
+
+        # The rest go one by one: after a shortfall, later (smaller) wages may still fit.
+        for i in range(paid, len(employees)):
+            employee = employees[i]
+            wage = gross[i]
 
             # Affordability Check (Operational Awareness: Total Liquid Assets)
             total_liquid_assets = 0.0
-
-            # Helper for conversion
-            def convert(amt, cur):
-                if cur == DEFAULT_CURRENCY: return amt
-                rate = exchange_rates.get(cur, 0.0)
-                return amt * rate
-
             for cur, amount in simulated_balances.items():
                 total_liquid_assets += convert(amount, cur)
 
             current_balance = simulated_balances.get(DEFAULT_CURRENCY, 0)
 
             if current_balance >= wage:
-                # Calculate Tax
-                income_tax = 0
-                if context.tax_policy:
-                    # Cast to int for pennies
-                    income_tax = int(wage * context.tax_policy.income_tax_rate) if wage > survival_cost else 0
-
-                net_wage = wage - income_tax
-
-                # Transaction 1: Net Wage (Firm -> Employee)
-                tx_wage = Transaction(
-                    buyer_id=firm_id, # Payer
-                    seller_id=employee.id, # Payee
-                    item_id="labor_wage",
-                    quantity=1.0,
-                    price=net_wage / 100.0,
-                    market_id="labor",
-                    transaction_type="wage",
-                    time=current_time
-                , total_pennies=net_wage)
-                transactions.append(tx_wage)
-
-                # Transaction 2: Income Tax (Firm -> Government) [Withholding]
-                if income_tax > 0 and context.tax_policy:
-                    tx_tax = Transaction(
-                        buyer_id=firm_id, # Payer
-                        seller_id=context.tax_policy.government_agent_id, # Payee
-                        item_id="income_tax",
-                        quantity=1.0,
-                        price=income_tax / 100.0,
-                        market_id="system",
-                        transaction_type="tax",
-                        time=current_time
-                    , total_pennies=income_tax)
-                    transactions.append(tx_tax)
+                net_wage = wage - taxes[i]
+                self._append_wage_transactions(transactions, firm_id, employee.id, net_wage, taxes[i], government_id, current_time)
 
                 # Schedule Employee Update (Income)
                 employee_updates.append(
@@ -494,6 +499,41 @@ class HREngine(IHREngine, IHRDepartment):
 
         return HRPayrollResultDTO(transactions=transactions, employee_updates=employee_updates)
 
+    def _append_wage_transactions(
+        self,
+        tx_list: List[Transaction],
+        firm_id: int,
+        employee_id: int,
+        net_wage: int,
+        income_tax: int,
+        government_id: Optional[int],
+        current_time: int
+    ) -> None:
+        # Transaction 1: Net Wage (Firm -> Employee)
+        tx_list.append(Transaction(
+            buyer_id=firm_id, # Payer
+            seller_id=employee_id, # Payee
+            item_id="labor_wage",
+            quantity=1.0,
+            price=net_wage / 100.0,
+            market_id="labor",
+            transaction_type="wage",
+            time=current_time
+        , total_pennies=net_wage))
+
+        # Transaction 2: Income Tax (Firm -> Government) [Withholding]
+        if income_tax > 0 and government_id is not None:
+            tx_list.append(Transaction(
+                buyer_id=firm_id, # Payer
+                seller_id=government_id, # Payee
+                item_id="income_tax",
+                quantity=1.0,
+                price=income_tax / 100.0,
+                market_id="system",
+                transaction_type="tax",
+                time=current_time
+            , total_pennies=income_tax))
+
     def _record_zombie_wage(self, hr_state: HRState, firm_id: int, employee: IEmployeeDataProvider, wage: int, current_time: int, current_balance: int, config: FirmConfigDTO) -> None:
         """Records an unpaid wage without firing the employee."""
         if employee.id not in hr_state.unpaid_wages:
@@ -568,8 +608,7 @@ class HREngine(IHREngine, IHRDepartment):
         employee.employment_start_tick = current_tick
 
     def remove_employee(self, hr_state: HRState, employee: IEmployeeDataProvider):
-        if employee in hr_state.employees:
-            hr_state.employees.remove(employee)
+        hr_state.employees.discard(employee)
         if employee.id in hr_state.employee_wages:
             del hr_state.employee_wages[employee.id]
 
@@ -580,7 +619,7 @@ class HREngine(IHREngine, IHRDepartment):
         """
         # Ensure severance_pay is integer pennies (FloatIncursion Fix)
         severance_pay = int(severance_pay)
-        employee = next((e for e in hr_state.employees if e.id == employee_id), None)
+        employee = hr_state.employees.get(employee_id)
         if not employee:
             return None
 
@@ -606,7 +645,7 @@ class HREngine(IHREngine, IHRDepartment):
         Removes employee from state.
         Should be called after successful severance payment and employee.quit().
         """
-        employee = next((e for e in hr_state.employees if e.id == employee_id), None)
+        employee = hr_state.employees.get(employee_id)
         if employee:
              # employee.quit() is now handled by the Orchestrator
              self.remove_employee(hr_state, employee)
@@ -0,0 +1,99 @@
+"""
+simulation/components/state/employee_roster.py
+
+Id-indexed workforce container for `HRState.employees`.
+"""
+from __future__ import annotations
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from simulation.components.state.versioning import _TrackedMixin, _MISSING
+
+
+class EmployeeRoster(_TrackedMixin):
+    """
+    Ordered collection of employees keyed by agent id.
+
+    Behaves like the list it replaces (iteration in hiring order, `len`, `in`,
+    `append`, `remove`, indexing), but membership, lookup and removal are O(1)
+    dict operations. One employee per id: appending an id that is already on
+    the roster replaces that entry in place. Mutation bumps the owning
+    VersionedState like the other tracked containers.
+    """
+
+    def __init__(self, employees: Iterable[Any] = (), owner: Any = None):
+        self._by_id: Dict[Any, Any] = {}
+        for employee in employees:
+            self._by_id[employee.id] = employee
+        self._owner = owner
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._by_id.values())
+
+    def __contains__(self, employee: Any) -> bool:
+        current = self._by_id.get(getattr(employee, "id", _MISSING), _MISSING)
+        return current is not _MISSING and (current is employee or current == employee)
+
+    def __getitem__(self, index: Any) -> Any:
+        return list(self._by_id.values())[index]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, EmployeeRoster):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def __reduce_ex__(self, protocol):
+        # Copies come back as plain lists; HRState re-wraps them for its new owner.
+        return (list, (list(self),))
+
+    def get(self, employee_id: Any) -> Optional[Any]:
+        return self._by_id.get(employee_id)
+
+    def has_id(self, employee_id: Any) -> bool:
+        return employee_id in self._by_id
+
+    def ids(self) -> List[Any]:
+        return list(self._by_id)
+
+    def copy(self) -> List[Any]:
+        return list(self)
+
+    def append(self, employee: Any) -> None:
+        self._by_id[employee.id] = employee
+        self._touch()
+
+    def extend(self, employees: Iterable[Any]) -> None:
+        for employee in employees:
+            self._by_id[employee.id] = employee
+        self._touch()
+
+    def remove(self, employee: Any) -> None:
+        if employee not in self:
+            raise ValueError(f"{employee!r} is not on the roster")
+        del self._by_id[employee.id]
+        self._touch()
+
+    def discard(self, employee: Any) -> bool:
+        """Removes `employee` if present. Returns True if it was on the roster."""
+        if employee not in self:
+            return False
+        del self._by_id[employee.id]
+        self._touch()
+        return True
+
+    def pop_id(self, employee_id: Any) -> Optional[Any]:
+        employee = self._by_id.pop(employee_id, None)
+        if employee is not None:
+            self._touch()
+        return employee
+
+    def clear(self) -> None:
+        self._by_id.clear()
+        self._touch()
@@ -4,11 +4,13 @@ from typing import Dict, List, Any, Optional, Tuple, Deque
 from collections import deque
 from modules.system.api import CurrencyCode, DEFAULT_CURRENCY
 from modules.hr.api import IEmployeeDataProvider
+from simulation.components.state.versioning import VersionedState
+from simulation.components.state.employee_roster import EmployeeRoster
 
 @dataclass
-class HRState:
+class HRState(VersionedState):
     """State for HR operations."""
-    employees: List[IEmployeeDataProvider] = field(default_factory=list)
+    employees: EmployeeRoster = field(default_factory=EmployeeRoster)  # Id-indexed; plain lists are converted on assignment
     employee_wages: Dict[int, int] = field(default_factory=dict) # MIGRATION: Wages in int pennies
     employees_data: Dict[int, Dict[str, Any]] = field(default_factory=dict) # Metadata (e.g. productivity_modifier)
     unpaid_wages: Dict[int, List[Tuple[int, int]]] = field(default_factory=dict) # MIGRATION: Wages in int pennies
@@ -32,8 +34,18 @@ class HRState:
     def hires_last_tick(self, value: int):
         self.hires_this_tick = value
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "employees" and not (isinstance(value, EmployeeRoster) and value._owner is self):
+            value = EmployeeRoster(value, owner=self)
+        super().__setattr__(name, value)
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        super().__setstate__(state)
+        if "employees" in state:
+            object.__setattr__(self, "employees", EmployeeRoster(state["employees"], owner=self))
+
 @dataclass
-class FinanceState:
+class FinanceState(VersionedState):
     """
     State for Finance operations.
     MIGRATION: All monetary values are now integers (pennies).
@@ -83,7 +95,7 @@ class FinanceState:
         self.revenue_this_tick = {primary_currency: 0}
 
 @dataclass
-class ProductionState:
+class ProductionState(VersionedState):
     """State for Production operations."""
     capital_stock: int = 10000 # MIGRATION: int pennies. Default 100.00
     production_target: float = 0.0
@@ -106,7 +118,7 @@ class ProductionState:
     specialization: str = "GENERIC"
 
 @dataclass
-class SalesState:
+class SalesState(VersionedState):
     """State for Sales operations."""
     marketing_budget: float = 0.0 # This is usually a budget limit or target. Should be int? Yes.
     # But SalesEngine treats it as an allocation. Let's make it float for now if it's a 'rate' derived value, but if it's absolute, int.
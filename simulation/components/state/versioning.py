@@ -0,0 +1,167 @@
+"""
+simulation/components/state/versioning.py
+
+Dirty tracking for mutable agent state components.
+
+A `VersionedState` component carries a monotonically increasing `revision`
+that is bumped whenever one of its attributes is re-assigned or one of its
+dict/list/deque attributes is mutated in place. Consumers (e.g.
+`Firm.get_state_dto`) compare revisions to decide whether a previously built
+snapshot is still valid instead of rebuilding it on every call.
+"""
+from __future__ import annotations
+from collections import deque
+from typing import Any, Dict
+
+_SCALAR_TYPES = (int, float, str, bool, type(None))
+_MISSING = object()
+
+
+class _TrackedMixin:
+    """Notifies the owning VersionedState on in-place mutation."""
+    __slots__ = ()
+
+    def _touch(self) -> None:
+        owner = getattr(self, "_owner", None)
+        if owner is not None:
+            owner.mark_dirty()
+
+
+def _mutator(base: type, name: str):
+    original = getattr(base, name)
+
+    def method(self, *args, **kwargs):
+        result = original(self, *args, **kwargs)
+        self._touch()
+        return result
+
+    method.__name__ = name
+    method.__doc__ = original.__doc__
+    return method
+
+
+class TrackedDict(_TrackedMixin, dict):
+    """dict that bumps its owner's revision on mutation. `copy()` returns a plain dict."""
+
+    def __init__(self, data: Any = (), owner: Any = None):
+        dict.__init__(self, data)
+        self._owner = owner
+
+    def copy(self) -> Dict[Any, Any]:
+        return dict(self)
+
+    def __reduce_ex__(self, protocol):
+        return (dict, (dict(self),))
+
+
+class TrackedList(_TrackedMixin, list):
+    """list that bumps its owner's revision on mutation. `copy()` returns a plain list."""
+
+    def __init__(self, data: Any = (), owner: Any = None):
+        list.__init__(self, data)
+        self._owner = owner
+
+    def copy(self) -> list:
+        return list(self)
+
+    def __reduce_ex__(self, protocol):
+        return (list, (list(self),))
+
+
+class TrackedDeque(_TrackedMixin, deque):
+    """deque that bumps its owner's revision on mutation (maxlen is preserved)."""
+
+    def __init__(self, data: Any = (), maxlen: Any = None, owner: Any = None):
+        deque.__init__(self, data, maxlen)
+        self._owner = owner
+
+    def copy(self) -> deque:
+        return deque(self, self.maxlen)
+
+    def __reduce_ex__(self, protocol):
+        return (deque, (list(self), self.maxlen))
+
+
+for _name in ("__setitem__", "__delitem__", "pop", "popitem", "clear", "update", "setdefault", "__ior__"):
+    setattr(TrackedDict, _name, _mutator(dict, _name))
+for _name in ("__setitem__", "__delitem__", "append", "extend", "insert", "pop", "remove",
+              "clear", "sort", "reverse", "__iadd__", "__imul__"):
+    setattr(TrackedList, _name, _mutator(list, _name))
+for _name in ("__setitem__", "__delitem__", "append", "appendleft", "extend", "extendleft", "pop",
+              "popleft", "remove", "clear", "rotate", "reverse", "__iadd__"):
+    setattr(TrackedDeque, _name, _mutator(deque, _name))
+
+
+def track(value: Any, owner: "VersionedState") -> Any:
+    """Wraps plain dict/list/deque values so in-place mutation bumps `owner`."""
+    kind = type(value)
+    if kind is dict:
+        return TrackedDict(value, owner=owner)
+    if kind is list:
+        return TrackedList(value, owner=owner)
+    if kind is deque:
+        return TrackedDeque(value, maxlen=value.maxlen, owner=owner)
+    if isinstance(value, _TrackedMixin) and getattr(value, "_owner", None) is not owner:
+        # Re-homed from another component: keep a private copy bound to this owner.
+        if isinstance(value, dict):
+            return TrackedDict(value, owner=owner)
+        if isinstance(value, list):
+            return TrackedList(value, owner=owner)
+        return TrackedDeque(value, maxlen=value.maxlen, owner=owner)
+    return value
+
+
+class VersionedState:
+    """
+    Mixin for state components whose snapshots are cached by their owner.
+    Every attribute assignment that changes a value bumps `revision`;
+    container attributes are wrapped so in-place mutation does too.
+    """
+    _revision: int = 0
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "_revision":
+            object.__setattr__(self, name, value)
+            return
+        current = self.__dict__.get(name, _MISSING)
+        if current is not _MISSING and type(value) in _SCALAR_TYPES and type(current) is type(value) and current == value:
+            return  # No-op assignment (e.g. resetting a counter that is already zero)
+        object.__setattr__(self, name, track(value, self))
+        object.__setattr__(self, "_revision", self._revision + 1)
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        # copy/pickle hand back plain containers; re-bind them to this owner.
+        for name, value in state.items():
+            object.__setattr__(self, name, value if name == "_revision" else track(value, self))
+
+    @property
+    def revision(self) -> int:
+        return self._revision
+
+    def mark_dirty(self) -> None:
+        object.__setattr__(self, "_revision", self._revision + 1)
+
+
+
+class SnapshotCacheStats:
+    """Hit/miss counters for a snapshot cache, exposed to telemetry via the global registry."""
+
+    def __init__(self) -> None:
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @property
+    def requests(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def reset(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate}
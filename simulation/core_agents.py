@@ -4,6 +4,7 @@ from typing import override
 import logging
 from logging import Logger
 from collections import deque, defaultdict
+from functools import partial
 import random
 import copy
 import math
@@ -200,7 +201,7 @@ class Household(
             current_food_consumption=0.0,
             expected_inflation=defaultdict(float),
             perceived_avg_prices=perceived_prices,
-            price_history=defaultdict(lambda: deque(maxlen=price_memory_len)),
+            price_history=defaultdict(partial(deque, maxlen=price_memory_len)),
             price_memory_length=price_memory_len,
             adaptation_rate=adaptation_rate,
             labor_income_this_tick_pennies=0,
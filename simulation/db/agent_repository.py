@@ -105,12 +105,17 @@ class AgentRepository(BaseRepository):
         agent_id: int,
         start_tick: Optional[int] = None,
         end_tick: Optional[int] = None,
+        run_id: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         특정 에이전트의 상태 변화 이력을 조회합니다.
+        run_id를 지정하면 (run_id, agent_id, time) 인덱스를 사용합니다.
         """
         query = "SELECT * FROM agent_states WHERE agent_id = ?"
         params: List[Any] = [agent_id]
+        if run_id is not None:
+            query += " AND run_id = ?"
+            params.append(run_id)
         if start_tick is not None and end_tick is not None:
             query += " AND time BETWEEN ? AND ?"
             params.extend([start_tick, end_tick])
@@ -6,6 +6,7 @@ from simulation.db.base_repository import BaseRepository
 
 if TYPE_CHECKING:
     from simulation.dtos import EconomicIndicatorData, AIDecisionData
+    from simulation.metrics.history_store import HistorySpillDTO
 
 logger = logging.getLogger(__name__)
 
@@ -97,6 +98,34 @@ class AnalyticsRepository(BaseRepository):
             self.conn.rollback()
             raise
 
+    def save_indicator_history_batch(self, run_id: int, spills: List["HistorySpillDTO"]):
+        """
+        Tracker history laps를 long format (stride, time, name, value)으로 일괄 저장합니다.
+        NaN (해당 틱에 기록되지 않은 지표)은 저장하지 않습니다.
+        """
+        if not spills:
+            return
+        try:
+            rows = []
+            for spill in spills:
+                ticks = spill.ticks.tolist()
+                for name, values in spill.columns.items():
+                    rows.extend(
+                        (run_id, spill.stride, tick, name, value)
+                        for tick, value in zip(ticks, values.tolist())
+                        if value == value
+                    )
+            self.cursor.executemany(
+                "INSERT INTO indicator_history (run_id, stride, time, name, value) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self.conn.commit()
+            logger.debug(f"Saved {len(rows)} indicator history values from {len(spills)} laps")
+        except sqlite3.Error as e:
+            logger.error(f"Error saving indicator history batch: {e}")
+            self.conn.rollback()
+            raise
+
     def get_economic_indicators(
         self, start_tick: Optional[int] = None, end_tick: Optional[int] = None, run_id: Optional[int] = None
     ) -> List[Dict[str, Any]]:
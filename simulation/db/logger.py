@@ -1,13 +1,13 @@
 import sqlite3
-import json
 import logging
 from typing import Optional, Dict, Any, List
 from modules.system.api import DEFAULT_CURRENCY
+from simulation.db.thought_stream import ThoughtStream, ThoughtContext, encode_context
 
 logger = logging.getLogger(__name__)
 
 class SimulationLogger:
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, thought_sampling_rates: Optional[Dict[str, float]] = None):
         self.db_path = db_path
         self.conn = sqlite3.connect(db_path, check_same_thread=False)
 
@@ -15,9 +15,11 @@ class SimulationLogger:
         self.conn.execute("PRAGMA journal_mode=WAL;")
         self.conn.execute("PRAGMA synchronous=NORMAL;")
 
-        self.buffer: List[tuple] = []
+        # ThoughtStream: sampled, columnar thought buffer with exact per-tick counters
+        self.thoughts = ThoughtStream(thought_sampling_rates)
         self.snapshot_buffer: List[tuple] = []
         self.run_id: Optional[int] = None
+        self.suspended: bool = False  # Set on headless fast-forward ticks
 
     def __enter__(self):
         return self
@@ -25,19 +27,16 @@ class SimulationLogger:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
-    def log_thought(self, tick: int, agent_id: str, action: str, decision: str, reason: str, context: Dict[str, Any]):
+    def log_thought(self, tick: int, agent_id: str, action: str, decision: str, reason: str, context: ThoughtContext = None):
         """
         Logs an agent's thought process.
+        Always counted; kept as a full record according to the reason's sampling rate.
+        `context` may be a callable, evaluated only when the thought is sampled.
+        JSON encoding is deferred to `flush`. Dropped while `suspended`.
         """
-        self.buffer.append((
-            self.run_id,
-            tick,
-            agent_id,
-            action,
-            decision,
-            reason,
-            json.dumps(context, default=str)
-        ))
+        if self.suspended:
+            return
+        self.thoughts.record(tick, agent_id, action, decision, reason, context)
 
     def log_snapshot(self, tick: int, snapshot_data: Any):
         """
@@ -73,18 +72,27 @@ class SimulationLogger:
         """
         Flushes buffered logs to the database in a single transaction.
         """
-        if not self.buffer and not self.snapshot_buffer:
+        if self.thoughts.is_empty and not self.snapshot_buffer:
             return
 
         try:
             self.conn.execute("BEGIN TRANSACTION;")
 
-            if self.buffer:
+            columns, counts = self.thoughts.drain()
+            if columns:
+                run_ids = [self.run_id] * len(columns)
                 self.conn.executemany("""
                     INSERT INTO agent_thoughts (run_id, tick, agent_id, action_type, decision, reason, context_data)
                     VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, self.buffer)
-                self.buffer.clear()
+                """, zip(run_ids, columns.ticks, columns.agent_ids, columns.actions,
+                         columns.decisions, columns.reasons, map(encode_context, columns.contexts)))
+
+            if counts:
+                self.conn.executemany("""
+                    INSERT INTO agent_thought_counts (run_id, tick, action_type, decision, reason, total_count, sampled_count)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, [(self.run_id, tick, action, decision, reason, total, sampled)
+                      for (tick, action, decision, reason), total, sampled in counts])
 
             if self.snapshot_buffer:
                 self.conn.executemany("""
@@ -3,7 +3,7 @@ import logging
 import time
 from typing import Dict, List, Any
 from modules.system.api import IDatabaseMigrator, MigrationReportDTO
-from simulation.db.schema import create_tables
+from simulation.db.schema import create_tables, create_composite_indexes, COMPOSITE_INDEXES
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +52,15 @@ class SchemaMigrator:
         cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='registry_snapshots'")
         health_report["registry_snapshots"] = cursor.fetchone() is not None
 
+        # Check agent_thought_counts table
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='agent_thought_counts'")
+        health_report["agent_thought_counts"] = cursor.fetchone() is not None
+
+        # Check composite analytics indexes
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        index_names = {row[0] for row in cursor.fetchall()}
+        health_report["composite_indexes"] = all(name in index_names for name, _, _ in COMPOSITE_INDEXES)
+
         return health_report
 
     def migrate(self) -> MigrationReportDTO:
@@ -129,6 +138,35 @@ class SchemaMigrator:
                 migrated_tables.append("registry_snapshots (created)")
                 logger.info("Migration complete: Created 'registry_snapshots' table.")
 
+            # Migration 5: Ensure agent_thought_counts table exists (ThoughtStream histograms)
+            if not health.get("agent_thought_counts"):
+                logger.info("Table 'agent_thought_counts' missing. Migrating schema.")
+                cursor = self.conn.cursor()
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS agent_thought_counts (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        run_id INTEGER,
+                        tick INTEGER,
+                        action_type TEXT,
+                        decision TEXT,
+                        reason TEXT,
+                        total_count INTEGER,
+                        sampled_count INTEGER
+                    )
+                """)
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_thought_counts_tick ON agent_thought_counts(run_id, tick)")
+                self.conn.commit()
+                migrated_tables.append("agent_thought_counts (created)")
+                logger.info("Migration complete: Created 'agent_thought_counts' table.")
+
+            # Migration 6: Composite (run_id, [agent_id,] time) indexes for analytics queries
+            if not health.get("composite_indexes"):
+                created = create_composite_indexes(self.conn)
+                if created:
+                    self.conn.commit()
+                    migrated_tables.extend(f"{name} (created)" for name in created)
+                    logger.info(f"Migration complete: Created indexes {created}.")
+
         except Exception as e:
             logger.error(f"Migration failed: {e}")
             errors.append(str(e))
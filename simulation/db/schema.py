@@ -1,5 +1,36 @@
 import sqlite3
 import logging
+from typing import List, Tuple
+
+# Composite indexes for per-run and per-agent analytics queries: (name, table, columns)
+COMPOSITE_INDEXES: Tuple[Tuple[str, str, Tuple[str, ...]], ...] = (
+    ("idx_agent_states_run_agent_time", "agent_states", ("run_id", "agent_id", "time")),
+    ("idx_agent_states_run_time", "agent_states", ("run_id", "time")),
+    ("idx_transactions_run_time", "transactions", ("run_id", "time")),
+    ("idx_economic_indicators_run_time", "economic_indicators", ("run_id", "time")),
+)
+
+
+def create_composite_indexes(conn: sqlite3.Connection) -> List[str]:
+    """
+    Creates any missing COMPOSITE_INDEXES whose table has the indexed columns.
+    Returns the names of the indexes that were created.
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='index'")
+    existing = {row[0] for row in cursor.fetchall()}
+
+    created = []
+    for name, table, columns in COMPOSITE_INDEXES:
+        if name in existing:
+            continue
+        cursor.execute(f"PRAGMA table_info({table})")
+        table_columns = {info[1] for info in cursor.fetchall()}
+        if not set(columns) <= table_columns:
+            continue  # Table missing or legacy layout
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table}({', '.join(columns)})")
+        created.append(name)
+    return created
 
 
 def create_tables(conn: sqlite3.Connection):
@@ -250,6 +281,34 @@ def create_tables(conn: sqlite3.Connection):
     """)
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_thoughts_tick ON agent_thoughts(tick)")
 
+    # Agent Thought Counts 테이블 (exact per-tick histogram; agent_thoughts holds the sampled records)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS agent_thought_counts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_id INTEGER,
+            tick INTEGER,
+            action_type TEXT,
+            decision TEXT,
+            reason TEXT,
+            total_count INTEGER,
+            sampled_count INTEGER
+        )
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_thought_counts_tick ON agent_thought_counts(run_id, tick)")
+
+    # Indicator History 테이블 (laps spilled from the tracker's ring-buffer tiers; stride 1 = every tick)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS indicator_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_id INTEGER,
+            stride INTEGER,
+            time INTEGER,
+            name TEXT,
+            value REAL
+        )
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_indicator_history_run ON indicator_history(run_id, stride, name, time)")
+
     # Tick Snapshots 테이블
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS tick_snapshots (
@@ -268,6 +327,7 @@ def create_tables(conn: sqlite3.Connection):
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_transactions_time ON transactions(time)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_agent_states_time ON agent_states(time)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_market_history_time ON market_history(time)")
+    create_composite_indexes(conn)
 
     conn.commit()
 
@@ -0,0 +1,111 @@
+import json
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+ThoughtContext = Union[Dict[str, Any], Callable[[], Dict[str, Any]], None]
+# (tick, action, decision, reason)
+ThoughtKey = Tuple[int, str, str, str]
+
+
+@dataclass
+class ThoughtColumnsDTO:
+    """Column-oriented batch of sampled thoughts; row i spans index i of every column."""
+    ticks: List[int] = field(default_factory=list)
+    agent_ids: List[str] = field(default_factory=list)
+    actions: List[str] = field(default_factory=list)
+    decisions: List[str] = field(default_factory=list)
+    reasons: List[str] = field(default_factory=list)
+    contexts: List[Optional[Dict[str, Any]]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.ticks)
+
+
+def encode_context(context: Optional[Dict[str, Any]]) -> str:
+    """Compact JSON encoding used by the writer (never on the hot path)."""
+    return json.dumps(context if context is not None else {}, default=str, separators=(",", ":"))
+
+
+class ThoughtStream:
+    """
+    Hot-path buffer for agent thoughts.
+
+    Every thought is counted in the (tick, action, decision, reason) histogram,
+    which is always exact. Only a per-reason fraction of thoughts is kept as a
+    full record; sampling is a deterministic credit counter (rate 0.25 keeps
+    every 4th thought of that reason), so it never consumes simulation RNG.
+    Records are stored column-wise and their context stays a live dict until
+    the writer drains the stream; a callable context is only evaluated for
+    thoughts that are actually sampled.
+    """
+
+    def __init__(self, sampling_rates: Optional[Dict[str, float]] = None, default_rate: float = 1.0):
+        self.sampling_rates: Dict[str, float] = dict(sampling_rates or {})
+        self.default_rate = float(default_rate)
+        self._credit: Dict[str, float] = {}
+        self._columns = ThoughtColumnsDTO()
+        self._counts: Counter = Counter()
+        self._sampled: Counter = Counter()
+
+    def set_sampling_rate(self, reason: str, rate: float) -> None:
+        self.sampling_rates[reason] = float(rate)
+
+    def _admit(self, reason: str) -> bool:
+        rate = self.sampling_rates.get(reason, self.default_rate)
+        if rate >= 1.0:
+            return True
+        if rate <= 0.0:
+            return False
+        credit = self._credit.get(reason, 0.0) + rate
+        if credit >= 1.0:
+            self._credit[reason] = credit - 1.0
+            return True
+        self._credit[reason] = credit
+        return False
+
+    def record(self, tick: int, agent_id: str, action: str, decision: str, reason: str,
+               context: ThoughtContext = None) -> bool:
+        """Counts the thought and keeps it if its reason is sampled. Returns True if kept."""
+        key = (tick, action, decision, reason)
+        self._counts[key] += 1
+        if not self._admit(reason):
+            return False
+
+        self._sampled[key] += 1
+        columns = self._columns
+        columns.ticks.append(tick)
+        columns.agent_ids.append(agent_id)
+        columns.actions.append(action)
+        columns.decisions.append(decision)
+        columns.reasons.append(reason)
+        columns.contexts.append(context() if callable(context) else context)
+        return True
+
+    @property
+    def pending(self) -> int:
+        return len(self._columns)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._counts
+
+    def get_histogram(self, tick: Optional[int] = None) -> Dict[Tuple[str, str, str], int]:
+        """Exact (action, decision, reason) -> count for one tick, or across all buffered ticks."""
+        histogram: Dict[Tuple[str, str, str], int] = {}
+        for (t, action, decision, reason), count in self._counts.items():
+            if tick is None or t == tick:
+                histogram[(action, decision, reason)] = histogram.get((action, decision, reason), 0) + count
+        return histogram
+
+    def drain(self) -> Tuple[ThoughtColumnsDTO, List[Tuple[ThoughtKey, int, int]]]:
+        """
+        Hands the buffered batch to the writer and resets the stream.
+        Returns (sampled columns, [(key, total_count, sampled_count), ...]).
+        """
+        columns = self._columns
+        counts = [(key, total, self._sampled.get(key, 0)) for key, total in self._counts.items()]
+        self._columns = ThoughtColumnsDTO()
+        self._counts = Counter()
+        self._sampled = Counter()
+        return columns, counts
@@ -1,5 +1,8 @@
-from typing import Tuple, Dict
+from typing import Tuple, Dict, Any, Optional
 import math
+
+import numpy as np
+
 from simulation.dtos import MacroFinancialContext
 
 class PortfolioManager:
@@ -15,12 +18,23 @@ class PortfolioManager:
     INTEREST_RATE_STRESS_MULTIPLIER = 2.0
     TOTAL_STRESS_MULTIPLIER_CAP = 3.0
 
+    # Variance assumptions: Sigma_Deposit ~= 0.0 (Risk Free), Sigma_Equity ~= 0.2 (20% Volatility)
+    SIGMA_EQUITY_SQ = 0.2 ** 2  # 0.04
+
     @staticmethod
     def calculate_effective_risk_aversion(base_lambda: float, context: MacroFinancialContext) -> float:
         """
         Calculates an adjusted risk aversion based on the provided macroeconomic context.
         This logic is central to the WO-062 feature and now fully visible for review.
         """
+        return base_lambda * PortfolioManager.calculate_stress_multiplier(context)
+
+    @staticmethod
+    def calculate_stress_multiplier(context: MacroFinancialContext) -> float:
+        """
+        Macro stress factor applied to every agent's risk aversion; depends only on the
+        shared context, so batch callers compute it once per tick.
+        """
         # 1. Inflation Stress (Fear increases when inflation exceeds the 2% target)
         inflation_excess = max(0.0, context.inflation_rate - PortfolioManager.CONST_INFLATION_TARGET)
         stress_inflation = inflation_excess * PortfolioManager.INFLATION_STRESS_MULTIPLIER
@@ -36,9 +50,7 @@ class PortfolioManager:
         total_stress_multiplier = 1.0 + stress_inflation + stress_recession + stress_rate
 
         # Apply a cap to prevent overly extreme aversion
-        total_stress_multiplier = min(PortfolioManager.TOTAL_STRESS_MULTIPLIER_CAP, total_stress_multiplier)
-
-        return base_lambda * total_stress_multiplier
+        return min(PortfolioManager.TOTAL_STRESS_MULTIPLIER_CAP, total_stress_multiplier)
 
     @staticmethod
     def optimize_portfolio(
@@ -110,7 +122,7 @@ class PortfolioManager:
         # We need Assumptions for Risk (Variance):
         # Sigma_Deposit ~= 0.0 (Risk Free)
         # Sigma_Equity ~= 0.2 (20% Volatility - assumption)
-        sigma_equity_sq = 0.2 ** 2  # 0.04
+        sigma_equity_sq = PortfolioManager.SIGMA_EQUITY_SQ
 
         # Expected Utility of Deposit
         u_deposit = risk_free_rate # Variance is 0
@@ -153,3 +165,62 @@ class PortfolioManager:
             target_equity = 0.0
 
         return target_cash, target_deposit, target_equity
+
+    @staticmethod
+    def optimize_portfolios(
+        total_liquid_assets: Any,
+        risk_aversion: Any,
+        risk_free_rate: float,
+        equity_return_proxy: float,
+        survival_cost: Any,
+        inflation_expectation: float,
+        macro_context: Optional[MacroFinancialContext] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        `optimize_portfolio` for many agents at once.
+
+        Args:
+            total_liquid_assets: Array of per-agent liquid funds.
+            risk_aversion: Array (or scalar) of per-agent base lambdas.
+            survival_cost: Array (or scalar) of monthly survival costs.
+            The remaining arguments are shared by every agent, as in `optimize_portfolio`;
+            the macro stress multiplier is computed once.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: (Target Cash, Target Deposit, Target Equity),
+            element-wise identical to calling `optimize_portfolio` per agent.
+        """
+        liquid = np.asarray(total_liquid_assets, dtype=np.float64)
+        effective_risk_aversion = np.asarray(risk_aversion, dtype=np.float64)
+        if macro_context:
+            effective_risk_aversion = effective_risk_aversion * PortfolioManager.calculate_stress_multiplier(macro_context)
+        survival = np.asarray(survival_cost, dtype=np.float64)
+        liquid, effective_risk_aversion, survival = np.broadcast_arrays(liquid, effective_risk_aversion, survival)
+
+        # 1. Safety Margin: 1 month in Cash, the rest of 3 months in Deposit
+        safety_margin_total = survival * 3.0
+        target_cash = survival * 1.0
+        required_deposit_safety = np.maximum(0.0, safety_margin_total - target_cash)
+        investable_surplus = liquid - target_cash - required_deposit_safety
+
+        # 2. Surplus Allocation (Merton weight, capped to [0, 1] of the surplus)
+        sigma_equity_sq = PortfolioManager.SIGMA_EQUITY_SQ
+        risk_premium_required = effective_risk_aversion * sigma_equity_sq
+        excess_return = equity_return_proxy - risk_free_rate
+        attractive = excess_return > risk_premium_required
+        denom = np.maximum(0.0001, effective_risk_aversion * sigma_equity_sq)
+        optimal_equity_weight = np.minimum(1.0, np.maximum(0.0, excess_return / denom))
+
+        target_equity = np.where(attractive, investable_surplus * optimal_equity_weight, 0.0)
+        target_deposit = required_deposit_safety + np.where(
+            attractive, investable_surplus * (1.0 - optimal_equity_weight), investable_surplus
+        )
+
+        # Deficit: only allocate what we have. Priority: Cash > Deposit Safety
+        deficit = investable_surplus <= 0
+        short_of_cash = deficit & (liquid < target_cash)
+        target_deposit = np.where(deficit, np.where(short_of_cash, 0.0, liquid - target_cash), target_deposit)
+        target_cash = np.where(short_of_cash, liquid, target_cash)
+        target_equity = np.where(deficit, 0.0, target_equity)
+
+        return target_cash, target_deposit, target_equity
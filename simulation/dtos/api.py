@@ -101,6 +101,7 @@ class LaborMatchingResultDTO:
     agreed_wages_pennies: Dict[AgentID, int]
     unmatched_seekers: List[AgentID]
     unmatched_offers: List[JobOfferDTO]
+    matched_offers: Dict[AgentID, JobOfferDTO] = field(default_factory=dict)  # seeker_id -> exact offer taken
 
 @dataclass
 class FirmPricingStrategyDTO:
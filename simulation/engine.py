@@ -10,6 +10,7 @@ from simulation.systems.tech.api import FirmTechInfoDTO, HouseholdEducationDTO
 
 from simulation.world_state import WorldState
 from simulation.orchestration.tick_orchestrator import TickOrchestrator
+from simulation.orchestration.run_mode import flush_due, should_observe
 from simulation.action_processor import ActionProcessor
 from simulation.models import Transaction
 from simulation.dtos.commands import GodCommandDTO
@@ -83,7 +84,10 @@ class Simulation:
 
         # Initialize SimulationLogger
         db_path = self.world_state.config_manager.get("simulation.database_name", "simulation_data.db")
-        self.simulation_logger: SimulationLogger = SimulationLogger(db_path)
+        thought_sampling_rates = self.world_state.config_manager.get("simulation.thought_sampling_rates", None)
+        if not isinstance(thought_sampling_rates, dict):
+            thought_sampling_rates = None
+        self.simulation_logger: SimulationLogger = SimulationLogger(db_path, thought_sampling_rates)
         self.simulation_logger.run_id = self.world_state.run_id
         # Expose via global module attribute for access by agents
         simulation.logger = self.simulation_logger
@@ -184,8 +188,17 @@ class Simulation:
             else:
                 return
 
+        # Headless fast-forward: thoughts are not recorded on suspended ticks
+        next_tick = self.world_state.time + 1  # TickOrchestrator advances the clock
+        observe = should_observe(self.world_state, next_tick)
+        self.simulation_logger.suspended = not observe
+
         self.tick_orchestrator.run_tick(injectable_sensory_dto)
-        
+
+        if not observe:
+            # Buffers keep accumulating until the next observed tick flushes them
+            return
+
         # Log macro snapshot for ThoughtStream analysis
         snapshot = self.get_economic_indicators()
         system_state = self.get_system_state()
@@ -204,8 +217,9 @@ class Simulation:
         )
         
         # DIRECTIVE ALPHA OPTIMIZER: Conditional Flush
+        # Under fast-forward sampling, a boundary missed on a suspended tick flushes here
         batch_save_interval = getattr(self, 'batch_save_interval', 10)
-        if self.world_state.time % batch_save_interval == 0:
+        if flush_due(self.world_state, "thoughts", self.world_state.time, batch_save_interval):
             self.simulation_logger.flush()
 
         # REBIRTH PIPELINE: Flush DBManager buffer at the end of each tick
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from modules.system.api import TransactionMetadataDTO
 from collections import deque
-from typing import List, Dict, Any, Optional, override, TYPE_CHECKING, Tuple
+from typing import List, Dict, Any, Optional, override, TYPE_CHECKING, Tuple, ClassVar
 import logging
 import copy
 import math
@@ -20,6 +20,7 @@ from modules.common.dtos.skeletons import MarketStateDTO
 
 # Orchestrator-Engine Refactor
 from simulation.components.state.firm_state_models import HRState, FinanceState, ProductionState, SalesState
+from simulation.components.state.versioning import SnapshotCacheStats
 from simulation.components.engines.hr_engine import HREngine
 from simulation.components.engines.finance_engine import FinanceEngine
 from simulation.components.engines.production_engine import ProductionEngine
@@ -97,6 +98,9 @@ class Firm(ILearningAgent, IFinancialFirm, IFinancialAgent, ILiquidatable, IOrch
     Refactored to Composition (No BaseAgent).
     """
 
+    # Process-wide get_state_dto() cache counters (published to telemetry as 'firm_state_cache')
+    state_dto_cache_stats: ClassVar[SnapshotCacheStats] = SnapshotCacheStats()
+
     # Explicitly override age property from Protocol to allow instance attribute usage
     age: int = 0
     sales_volume_this_tick: float = 0.0
@@ -211,6 +215,9 @@ class Firm(ILearningAgent, IFinancialFirm, IFinancialAgent, ILiquidatable, IOrch
         self.market_insight = DEFAULT_MARKET_INSIGHT # Phase 4.1: Dynamic Cognitive Filter
         self.sales_volume_this_tick: float = 0.0
 
+        # Cached get_state_dto() snapshot, keyed by component revisions
+        self._state_dto_cache: Optional[Tuple[Tuple[Any, ...], FirmStateDTO]] = None
+
     # --- IConfigurable Implementation ---
 
     def get_liquidation_config(self) -> LiquidationConfigDTO:
@@ -1062,6 +1069,39 @@ class Firm(ILearningAgent, IFinancialFirm, IFinancialAgent, ILiquidatable, IOrch
         }
 
     def get_state_dto(self) -> FirmStateDTO:
+        """
+        Returns the public state snapshot, reusing the previous one while nothing has changed.
+        Firm-owned state is covered by component revisions; state owned elsewhere
+        (wallet, employee attributes, cognitive flags) is read directly into the cache key.
+        """
+        key = self._state_dto_cache_key()
+        cached = getattr(self, "_state_dto_cache", None)
+        if cached is not None and cached[0] == key:
+            Firm.state_dto_cache_stats.hits += 1
+            return cached[1]
+
+        Firm.state_dto_cache_stats.misses += 1
+        dto = self._build_state_dto()
+        self._state_dto_cache = (key, dto)
+        return dto
+
+    def _state_dto_cache_key(self) -> Tuple[Any, ...]:
+        hr_state = self.hr_state
+        components = (hr_state, self.finance_state, self.production_state, self.sales_state, self.inventory_component)
+        return (
+            tuple((id(c), c.revision) for c in components),
+            tuple(self.financial_component.get_all_balances().items()),
+            tuple(self.needs.items()),
+            self.is_active,
+            self.major,
+            self.market_insight,
+            tuple(
+                (e.id, getattr(e, 'labor_skill', 1.0), getattr(e, 'age', 0), getattr(e, 'education_level', 0))
+                for e in hr_state.employees
+            ),
+        )
+
+    def _build_state_dto(self) -> FirmStateDTO:
         # Implementation moved from FirmStateDTO.from_firm to here for Protocol Purity
         # Note: This is duplicative with get_snapshot_dto but serves the public API AgentStateDTO (different purpose)
         # get_snapshot_dto is for Engines (all state components). get_state_dto is for DecisionEngine/Output.
@@ -1775,7 +1815,7 @@ class Firm(ILearningAgent, IFinancialFirm, IFinancialAgent, ILiquidatable, IOrch
 
         # Apply employee updates
         for update in payroll_result.employee_updates:
-            employee = next((e for e in self.hr_state.employees if e.id == update.employee_id), None)
+            employee = self.hr_state.employees.get(update.employee_id)
             if not employee: continue
             if update.net_income > 0:
                 employee.labor_income_this_tick = (employee.labor_income_this_tick or 0) + int(update.net_income)
@@ -86,6 +86,7 @@ from modules.system.event_bus.event_bus import EventBus
 from modules.governance.judicial.system import JudicialSystem
 from modules.system.registry import AgentRegistry, GlobalRegistry
 from simulation.registries.estate_registry import EstateRegistry
+from simulation.registries.residency_manager import AgentResidencyManager, ResidentAgentMap
 from modules.household.api import HouseholdFactoryContext
 from simulation.factories.household_factory import HouseholdFactory
 from simulation.utils.config_factory import create_config_dto
@@ -155,7 +156,10 @@ class SimulationInitializer(SimulationInitializerInterface):
 
         global_registry = GlobalRegistry()
         agent_registry = AgentRegistry()
-        estate_registry = EstateRegistry()
+        # Dormant and deceased agents share one residency manager (cold after long inactivity)
+        agent_residency = AgentResidencyManager(agent_lookup=agent_registry.get_agent)
+        agent_registry.inactive_agents = ResidentAgentMap(agent_residency)
+        estate_registry = EstateRegistry(residency=agent_residency)
 
         # Tier 1: Initialize Live Liquidity Oracle (IMPL_SETTLEMENT_SYNC)
         liquidity_oracle = LiquidityOracle(agent_registry=agent_registry, estate_registry=estate_registry)
@@ -186,6 +190,7 @@ class SimulationInitializer(SimulationInitializerInterface):
         sim.telemetry_collector = TelemetryCollector(sim.world_state.global_registry)
         sim.world_state.telemetry_collector = sim.telemetry_collector
         sim.world_state.global_registry.set('system.telemetry_collector', sim.telemetry_collector, origin=OriginType.SYSTEM)
+        sim.world_state.global_registry.set('firm_state_cache', Firm.state_dto_cache_stats, origin=OriginType.SYSTEM)
         sim.monetary_ledger = MonetaryLedger(sim.world_state.transactions, sim, settlement_system=settlement_system)
         sim.settlement_system.set_monetary_ledger(sim.monetary_ledger)
         sim.saga_orchestrator = SagaOrchestrator(monetary_ledger=sim.monetary_ledger, agent_registry=agent_registry)
@@ -194,6 +199,7 @@ class SimulationInitializer(SimulationInitializerInterface):
         sim.shareholder_registry = ShareholderRegistry()
         sim.world_state.shareholder_registry = sim.shareholder_registry
         sim.world_state.estate_registry = estate_registry
+        sim.world_state.agent_residency = agent_residency
 
         # TD-INIT-RACE: Registry must be linked EARLY (Phase 1)
         # Guarantees AgentRegistry.register() works during Population Phase
@@ -413,6 +419,8 @@ class SimulationInitializer(SimulationInitializerInterface):
         sim.ai_training_manager = AITrainingManager(self.households + self.firms, self.config)
         sim.ma_manager = MAManager(sim, self.config, settlement_system=sim.settlement_system)
         sim.persistence_manager = PersistenceManager(run_id=0, config_module=self.config, repository=self.repository)
+        # Older tracker history spills to the DB before the ring buffers overwrite it
+        sim.tracker.set_history_spill(sim.persistence_manager.buffer_indicator_history)
         hh_config_dto = create_config_dto(self.config, HouseholdConfigDTO)
         hh_factory_context = HouseholdFactoryContext(core_config_module=self.config, household_config_dto=hh_config_dto, goods_data=self.goods_data, loan_market=sim.markets.get('loan_market'), ai_training_manager=sim.ai_training_manager, settlement_system=sim.settlement_system, markets=sim.markets, memory_system=sim.persistence_manager, central_bank=sim.central_bank)
         household_factory = HouseholdFactory(hh_factory_context)
@@ -484,6 +492,7 @@ class SimulationInitializer(SimulationInitializerInterface):
         sim.transaction_processor.register_handler('loan_interest', financial_handler)
         sim.transaction_processor.register_handler('deposit_interest', financial_handler)
         sim.transaction_processor.register_handler('dividend', financial_handler)
+        sim.transaction_processor.register_handler('dividend_distribution', financial_handler)
         sim.transaction_processor.register_handler('tax', financial_handler)
         sim.transaction_processor.register_handler('deposit', financial_handler)
         sim.transaction_processor.register_handler('withdrawal', financial_handler)
@@ -501,13 +510,15 @@ class SimulationInitializer(SimulationInitializerInterface):
         sim.transaction_processor.register_handler('education_spending', spending_handler)
         sim.transaction_processor.register_handler('emergency_buy', EmergencyTransactionHandler())
         sim.transaction_processor.register_public_manager_handler(PublicManagerTransactionHandler())
-        sim.lifecycle_manager = AgentLifecycleManager(config_module=self.config, demographic_manager=sim.demographic_manager, inheritance_manager=sim.inheritance_manager, firm_system=sim.firm_system, settlement_system=sim.settlement_system, public_manager=sim.public_manager, logger=self.logger, shareholder_registry=sim.shareholder_registry, household_factory=household_factory, estate_registry=sim.world_state.estate_registry, persistence_manager=sim.world_state.persistence_manager)
+        sim.lifecycle_manager = AgentLifecycleManager(config_module=self.config, demographic_manager=sim.demographic_manager, inheritance_manager=sim.inheritance_manager, firm_system=sim.firm_system, settlement_system=sim.settlement_system, public_manager=sim.public_manager, logger=self.logger, shareholder_registry=sim.shareholder_registry, household_factory=household_factory, estate_registry=sim.world_state.estate_registry, persistence_manager=sim.world_state.persistence_manager, residency_manager=sim.world_state.agent_residency)
         sim.social_system = SocialSystem(self.config)
         sim.event_system = EventSystem(self.config, settlement_system=sim.settlement_system)
         sim.sensory_system = SensorySystem(self.config)
         sim.commerce_system = CommerceSystem(self.config)
         sim.labor_market_analyzer = LaborMarketAnalyzer(self.config)
         sim.crisis_monitor = CrisisMonitor(logger=self.logger, run_id=sim.run_id)
+        if hasattr(sim.settlement_system, 'set_balance_observer'):
+            sim.settlement_system.set_balance_observer(sim.crisis_monitor)
 
         # Inject dependencies into SagaOrchestrator (Phase 3 Complete)
         if sim.saga_orchestrator:
@@ -576,6 +587,11 @@ class SimulationInitializer(SimulationInitializerInterface):
                     settlement_system_local.register_account(bank_id_local, firm.id)
                 firm.settlement_system = settlement_system_local
 
+        # Social-policy roster: households only (system agents and firms are never covered)
+        government_local = sim.world_state.government
+        if government_local and hasattr(government_local, 'welfare_registry'):
+            government_local.welfare_registry.register_many(local_households)
+
         # Determine next available ID (assuming user agents start > 100)
         # TD-INIT-MOCK-LEAK: Filter for integer keys to avoid TypeError during Mock testing.
         max_user_id = 0
@@ -701,6 +717,9 @@ class SimulationInitializer(SimulationInitializerInterface):
         if hasattr(sim.settlement_system, 'set_panic_recorder'):
              sim.settlement_system.set_panic_recorder(sim.world_state)
 
+        # World services are referenced from evicted agents by identity, never copied
+        sim.world_state.agent_residency.share_world(sim.world_state)
+
     def _load_market_safety_config(self) -> Dict[str, PriceLimitConfigDTO]:
         """Loads market safety configuration from JSON."""
         config_path = "config/market_safety.json"
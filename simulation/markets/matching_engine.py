@@ -1,10 +1,38 @@
 from typing import List, Dict, Any, Optional, Tuple, Protocol
-from dataclasses import replace
+from dataclasses import dataclass, replace
 import logging
 from modules.market.api import IMatchingEngine, OrderBookStateDTO, StockMarketStateDTO, MatchingResultDTO, CanonicalOrderDTO, MarketConfigDTO
 from simulation.models import Transaction
+import numpy as np
 logger = logging.getLogger(__name__)
 
+@dataclass
+class ManagedOrder:
+    """A mutable wrapper for an immutable CanonicalOrderDTO to manage its state within the order book."""
+    order: CanonicalOrderDTO
+    remaining_quantity: float
+    created_tick: int
+    is_open: bool = True # False once filled, cancelled or expired (lazy expiry-heap deletion)
+
+    def to_dto(self) -> CanonicalOrderDTO:
+        if self.remaining_quantity == self.order.quantity:
+            return self.order
+        return replace(self.order, quantity=self.remaining_quantity)
+
+class _MutableOrder:
+    """Fill-tracking wrapper around an immutable order DTO."""
+    __slots__ = ('dto', 'remaining_qty')
+
+    def __init__(self, dto: CanonicalOrderDTO):
+        self.dto = dto
+        self.remaining_qty = dto.quantity
+
+    def to_dto(self) -> CanonicalOrderDTO:
+        # DTOs are frozen: untouched orders are handed back as-is
+        if self.remaining_qty == self.dto.quantity:
+            return self.dto
+        return replace(self.dto, quantity=self.remaining_qty)
+
 class OrderBookMatchingEngine(IMatchingEngine):
     """
     Stateless matching engine for Goods and Labor markets.
@@ -55,6 +83,22 @@ class OrderBookMatchingEngine(IMatchingEngine):
         perception = skill * (1.0 + education_weight * education)
         return perception / price
 
+    def _labor_utilities(self, sells: List["_MutableOrder"], education_weight: float = 0.1) -> np.ndarray:
+        """
+        Vectorized `_calculate_labor_utility` over columnar (price, skill, education) arrays.
+        Elementwise float64 ops match the scalar path bit for bit.
+        """
+        n = len(sells)
+        prices = np.fromiter((s.dto.price_pennies for s in sells), dtype=np.float64, count=n)
+        skills = np.fromiter(((s.dto.brand_info or {}).get('labor_skill', 1.0) for s in sells), dtype=np.float64, count=n)
+        education = np.fromiter(((s.dto.brand_info or {}).get('education_level', 0) for s in sells), dtype=np.float64, count=n)
+
+        perception = skills * (1.0 + education_weight * education)
+        utilities = np.full(n, np.inf)
+        priced = prices > 0
+        utilities[priced] = perception[priced] / prices[priced]
+        return utilities
+
     def _match_labor_utility(self, item_id: str, buy_orders: List[CanonicalOrderDTO], sell_orders: List[CanonicalOrderDTO], market_id: str, current_tick: int, config: Optional[MarketConfigDTO] = None) -> Tuple[List[Transaction], List[CanonicalOrderDTO], List[CanonicalOrderDTO], Dict[str, Any]]:
         transactions: List[Transaction] = []
         stats: Dict[str, Any] = {'volume': 0.0}
@@ -66,7 +110,7 @@ class OrderBookMatchingEngine(IMatchingEngine):
         # 2. Sort General Buys by Price Desc (Highest Bidders First)
         general_buys.sort(key=lambda o: o.price_pennies, reverse=True)
 
-        # 3. Sort Sells by Utility Desc (Best Value Workers First)
+        # 3. Group Sells by agent (first-appearance order)
         sell_map: Dict[Any, List[CanonicalOrderDTO]] = {}
         for s_order in sell_orders:
             agent_id = int(s_order.agent_id) if isinstance(s_order.agent_id, (int, float)) else s_order.agent_id
@@ -74,31 +118,23 @@ class OrderBookMatchingEngine(IMatchingEngine):
                 sell_map[agent_id] = []
             sell_map[agent_id].append(s_order)
 
-        class MutableOrder:
-            def __init__(self, dto: CanonicalOrderDTO):
-                self.dto = dto
-                self.remaining_qty = dto.quantity
-            def to_dto(self) -> CanonicalOrderDTO:
-                return replace(self.dto, quantity=self.remaining_qty)
+        mutable_targeted_buys = [_MutableOrder(o) for o in targeted_buys]
+        mutable_general_buys = [_MutableOrder(o) for o in general_buys]
 
-        mutable_targeted_buys = [MutableOrder(o) for o in targeted_buys]
-        mutable_general_buys = [MutableOrder(o) for o in general_buys]
-
-        all_mutable_sells: List[MutableOrder] = []
+        all_mutable_sells: List[_MutableOrder] = []
         for s_list in sell_map.values():
-            m_list = [MutableOrder(o) for o in s_list]
-            all_mutable_sells.extend(m_list)
+            all_mutable_sells.extend(_MutableOrder(o) for o in s_list)
 
         # 4. Process Targeted Buys (Priority)
         # Need mutable_sell_map for O(1) lookup
-        mutable_sell_map: Dict[Any, List[MutableOrder]] = {}
+        mutable_sell_map: Dict[Any, List[_MutableOrder]] = {}
         for s in all_mutable_sells:
             aid = s.dto.agent_id
             if aid not in mutable_sell_map:
                 mutable_sell_map[aid] = []
             mutable_sell_map[aid].append(s)
 
-        remaining_targeted_buys: List[MutableOrder] = []
+        remaining_targeted_buys: List[_MutableOrder] = []
         for b_wrapper in mutable_targeted_buys:
             target_id = b_wrapper.dto.target_agent_id
             target_asks = mutable_sell_map.get(target_id)
@@ -108,30 +144,9 @@ class OrderBookMatchingEngine(IMatchingEngine):
                     if s_wrapper.remaining_qty <= 1e-9: continue
 
                     if b_wrapper.dto.price_pennies >= s_wrapper.dto.price_pennies:
-                        trade_price_pennies = s_wrapper.dto.price_pennies
                         trade_qty = min(b_wrapper.remaining_qty, s_wrapper.remaining_qty)
-                        trade_total_pennies = int(round(trade_price_pennies * trade_qty))
-                        effective_price_dollars = trade_total_pennies / trade_qty / 100.0 if trade_qty > 0 else 0.0
-
-                        quality_val = 1.0
-                        if s_wrapper.dto.brand_info:
-                             quality_val = s_wrapper.dto.brand_info.get('labor_skill', s_wrapper.dto.brand_info.get('quality', 1.0))
-
-                        tx = Transaction(
-                            item_id=item_id,
-                            quantity=trade_qty,
-                            price=effective_price_dollars,
-                            total_pennies=trade_total_pennies,
-                            buyer_id=b_wrapper.dto.agent_id,
-                            seller_id=s_wrapper.dto.agent_id,
-                            market_id=market_id,
-                            transaction_type='labor',
-                            time=current_tick,
-                            quality=quality_val
-                        )
-                        transactions.append(tx)
-                        stats['last_price'] = effective_price_dollars
-                        stats['volume'] += trade_qty
+                        self._record_labor_trade(transactions, stats, item_id, market_id, current_tick,
+                                                 b_wrapper.dto, s_wrapper.dto, s_wrapper.dto.price_pennies, trade_qty)
                         b_wrapper.remaining_qty -= trade_qty
                         s_wrapper.remaining_qty -= trade_qty
 
@@ -145,60 +160,46 @@ class OrderBookMatchingEngine(IMatchingEngine):
         # 5. Process General Buys with Utility Priority
         # Use config for education weight
         edu_weight = config.labor_education_weight if config else 0.1
+        match_mode = config.labor_matching_mode if config else "BID"
 
-        # Sort Active Sells by Utility
+        # Columnar sells in utility order (desc, stable on ties like list.sort(reverse=True))
         active_sells = [s for s in all_mutable_sells if s.remaining_qty > 1e-9]
-        active_sells.sort(key=lambda o: self._calculate_labor_utility(o.dto, edu_weight), reverse=True)
+        order = np.argsort(-self._labor_utilities(active_sells, edu_weight), kind='stable')
+        active_sells = [active_sells[i] for i in order]
+        ask_prices = np.fromiter((s.dto.price_pennies for s in active_sells), dtype=np.float64, count=len(active_sells))
+        remaining = np.fromiter((s.remaining_qty for s in active_sells), dtype=np.float64, count=len(active_sells))
 
         # Matching Loop
         for b_wrapper in mutable_general_buys:
             if b_wrapper.remaining_qty <= 1e-9: continue
+            bid_pennies = b_wrapper.dto.price_pennies
+
+            # Feasible sellers (open and affordable), already in utility order
+            for idx in np.flatnonzero((remaining > 1e-9) & (ask_prices <= bid_pennies)):
+                s_wrapper = active_sells[idx]
+                ask_pennies = s_wrapper.dto.price_pennies
+
+                # Logic: Use BID price or Configured Mode?
+                # "labor_matching_mode"
+                if match_mode == "MIDPOINT":
+                     trade_price_pennies = (bid_pennies + ask_pennies) // 2
+                elif match_mode == "ASK":
+                     trade_price_pennies = ask_pennies
+                else: # BID (default for Labor market usually, as Firm Offer)
+                     trade_price_pennies = bid_pennies
+
+                seller_remaining = float(remaining[idx])
+                trade_qty = min(b_wrapper.remaining_qty, seller_remaining)
+                self._record_labor_trade(transactions, stats, item_id, market_id, current_tick,
+                                         b_wrapper.dto, s_wrapper.dto, trade_price_pennies, trade_qty)
+                b_wrapper.remaining_qty -= trade_qty
+                remaining[idx] = seller_remaining - trade_qty
 
-            # Find best utility seller that is affordable
-            for s_wrapper in active_sells:
-                if s_wrapper.remaining_qty <= 1e-9: continue
+                if b_wrapper.remaining_qty <= 1e-9:
+                    break # Buy order filled
 
-                if b_wrapper.dto.price_pennies >= s_wrapper.dto.price_pennies:
-                    # Match!
-                    # Logic: Use BID price or Configured Mode?
-                    # "labor_matching_mode"
-                    match_mode = config.labor_matching_mode if config else "BID"
-
-                    if match_mode == "MIDPOINT":
-                         trade_price_pennies = (b_wrapper.dto.price_pennies + s_wrapper.dto.price_pennies) // 2
-                    elif match_mode == "ASK":
-                         trade_price_pennies = s_wrapper.dto.price_pennies
-                    else: # BID (default for Labor market usually, as Firm Offer)
-                         trade_price_pennies = b_wrapper.dto.price_pennies
-
-                    trade_qty = min(b_wrapper.remaining_qty, s_wrapper.remaining_qty)
-                    trade_total_pennies = int(round(trade_price_pennies * trade_qty))
-                    effective_price_dollars = trade_total_pennies / trade_qty / 100.0 if trade_qty > 0 else 0.0
-
-                    quality_val = 1.0
-                    if s_wrapper.dto.brand_info:
-                            quality_val = s_wrapper.dto.brand_info.get('labor_skill', s_wrapper.dto.brand_info.get('quality', 1.0))
-
-                    tx = Transaction(
-                        item_id=item_id,
-                        quantity=trade_qty,
-                        price=effective_price_dollars,
-                        total_pennies=trade_total_pennies,
-                        buyer_id=b_wrapper.dto.agent_id,
-                        seller_id=s_wrapper.dto.agent_id,
-                        market_id=market_id,
-                        transaction_type='labor',
-                        time=current_tick,
-                        quality=quality_val
-                    )
-                    transactions.append(tx)
-                    stats['last_price'] = effective_price_dollars
-                    stats['volume'] += trade_qty
-                    b_wrapper.remaining_qty -= trade_qty
-                    s_wrapper.remaining_qty -= trade_qty
-
-                    if b_wrapper.remaining_qty <= 1e-9:
-                        break # Buy order filled
+        for s_wrapper, qty in zip(active_sells, remaining.tolist()):
+            s_wrapper.remaining_qty = qty
 
         final_buys = [b.to_dto() for b in mutable_general_buys if b.remaining_qty > 1e-9]
         final_buys.sort(key=lambda o: o.price_pennies, reverse=True)
@@ -208,6 +209,30 @@ class OrderBookMatchingEngine(IMatchingEngine):
 
         return (transactions, final_buys, final_sells, stats)
 
+    def _record_labor_trade(self, transactions: List[Transaction], stats: Dict[str, Any], item_id: str, market_id: str, current_tick: int, buy: CanonicalOrderDTO, sell: CanonicalOrderDTO, trade_price_pennies: int, trade_qty: float) -> None:
+        trade_total_pennies = int(round(trade_price_pennies * trade_qty))
+        effective_price_dollars = trade_total_pennies / trade_qty / 100.0 if trade_qty > 0 else 0.0
+
+        quality_val = 1.0
+        if sell.brand_info:
+            quality_val = sell.brand_info.get('labor_skill', sell.brand_info.get('quality', 1.0))
+
+        tx = Transaction(
+            item_id=item_id,
+            quantity=trade_qty,
+            price=effective_price_dollars,
+            total_pennies=trade_total_pennies,
+            buyer_id=buy.agent_id,
+            seller_id=sell.agent_id,
+            market_id=market_id,
+            transaction_type='labor',
+            time=current_tick,
+            quality=quality_val
+        )
+        transactions.append(tx)
+        stats['last_price'] = effective_price_dollars
+        stats['volume'] += trade_qty
+
     def _match_item(self, item_id: str, buy_orders: List[CanonicalOrderDTO], sell_orders: List[CanonicalOrderDTO], market_id: str, current_tick: int, config: Optional[MarketConfigDTO] = None) -> Tuple[List[Transaction], List[CanonicalOrderDTO], List[CanonicalOrderDTO], Dict[str, Any]]:
         # Phase 4.1: Utility-Priority Matching for Labor
         if market_id in ['labor', 'research_labor']:
@@ -225,24 +250,16 @@ class OrderBookMatchingEngine(IMatchingEngine):
                 sell_map[agent_id] = []
             sell_map[agent_id].append(s_order)
 
-        class MutableOrder:
-
-            def __init__(self, dto: CanonicalOrderDTO):
-                self.dto = dto
-                self.remaining_qty = dto.quantity
-
-            def to_dto(self) -> CanonicalOrderDTO:
-                return replace(self.dto, quantity=self.remaining_qty)
-        mutable_targeted_buys = [MutableOrder(o) for o in targeted_buys]
-        mutable_general_buys = [MutableOrder(o) for o in general_buys]
-        mutable_sell_map: Dict[Any, List[MutableOrder]] = {}
-        all_mutable_sells: List[MutableOrder] = []
+        mutable_targeted_buys = [_MutableOrder(o) for o in targeted_buys]
+        mutable_general_buys = [_MutableOrder(o) for o in general_buys]
+        mutable_sell_map: Dict[Any, List[_MutableOrder]] = {}
+        all_mutable_sells: List[_MutableOrder] = []
         for s_list in sell_map.values():
             s_list.sort(key=lambda o: o.price_pennies)
-            m_list = [MutableOrder(o) for o in s_list]
+            m_list = [_MutableOrder(o) for o in s_list]
             mutable_sell_map[s_list[0].agent_id] = m_list
             all_mutable_sells.extend(m_list)
-        remaining_targeted_buys: List[MutableOrder] = []
+        remaining_targeted_buys: List[_MutableOrder] = []
         for b_wrapper in mutable_targeted_buys:
             target_id = b_wrapper.dto.target_agent_id
             target_asks = mutable_sell_map.get(target_id)
@@ -344,61 +361,63 @@ class StockMatchingEngine(IMatchingEngine):
         return MatchingResultDTO(transactions=all_transactions, unfilled_buy_orders=unfilled_buy_orders, unfilled_sell_orders=unfilled_sell_orders, market_stats=market_stats)
 
     def _match_firm_stock(self, firm_id: int, buy_orders: List[CanonicalOrderDTO], sell_orders: List[CanonicalOrderDTO], market_id: str, current_tick: int) -> Tuple[List[Transaction], List[CanonicalOrderDTO], List[CanonicalOrderDTO], Dict[str, Any]]:
-        transactions: List[Transaction] = []
-        stats: Dict[str, Any] = {'volume': 0.0}
         buy_orders.sort(key=lambda o: o.price_pennies, reverse=True)
         sell_orders.sort(key=lambda o: o.price_pennies)
+        m_buys = [ManagedOrder(order=o, remaining_quantity=o.quantity, created_tick=current_tick) for o in buy_orders]
+        m_sells = [ManagedOrder(order=o, remaining_quantity=o.quantity, created_tick=current_tick) for o in sell_orders]
+        transactions, stats = self.match_book(firm_id, m_buys, m_sells, market_id, current_tick)
+        final_buys = [o.to_dto() for o in m_buys if o.remaining_quantity > 1e-09]
+        final_sells = [o.to_dto() for o in m_sells if o.remaining_quantity > 1e-09]
+        return (transactions, final_buys, final_sells, stats)
 
-        class MutableOrder:
-
-            def __init__(self, dto: CanonicalOrderDTO):
-                self.dto = dto
-                self.remaining_qty = dto.quantity
-
-            def to_dto(self) -> CanonicalOrderDTO:
-                return replace(self.dto, quantity=self.remaining_qty)
-        m_buys = [MutableOrder(o) for o in buy_orders]
-        m_sells = [MutableOrder(o) for o in sell_orders]
+    def match_book(self, firm_id: int, buys: List[ManagedOrder], sells: List[ManagedOrder], market_id: str, current_tick: int) -> Tuple[List[Transaction], Dict[str, Any]]:
+        """
+        Crosses one firm's book in place.
+        `buys` must be ordered by price_pennies descending and `sells` ascending
+        (time priority within a price); fills are written to `remaining_quantity`.
+        """
+        transactions: List[Transaction] = []
+        stats: Dict[str, Any] = {'volume': 0.0}
         idx_b = 0
         idx_s = 0
         last_price = None
         high = -float('inf')
         low = float('inf')
-        while idx_b < len(m_buys) and idx_s < len(m_sells):
-            b_order = m_buys[idx_b]
-            s_order = m_sells[idx_s]
-            if b_order.remaining_qty <= 1e-09:
+        while idx_b < len(buys) and idx_s < len(sells):
+            b_order = buys[idx_b]
+            s_order = sells[idx_s]
+            if b_order.remaining_quantity <= 1e-09:
                 idx_b += 1
                 continue
-            if s_order.remaining_qty <= 1e-09:
+            if s_order.remaining_quantity <= 1e-09:
                 idx_s += 1
                 continue
-            if b_order.dto.price_pennies >= s_order.dto.price_pennies:
+            b_dto = b_order.order
+            s_dto = s_order.order
+            if b_dto.price_pennies >= s_dto.price_pennies:
                 # WO-STABILIZE-POST-MERGE: Revert to integer division (truncation) for strict integer math consistency
-                trade_price_pennies = (b_order.dto.price_pennies + s_order.dto.price_pennies) // 2
-                trade_qty = min(b_order.remaining_qty, s_order.remaining_qty)
+                trade_price_pennies = (b_dto.price_pennies + s_dto.price_pennies) // 2
+                trade_qty = min(b_order.remaining_quantity, s_order.remaining_quantity)
                 trade_total_pennies = int(round(trade_price_pennies * trade_qty))
                 effective_price_dollars = trade_total_pennies / trade_qty / 100.0 if trade_qty > 0 else 0.0
-                if b_order.dto.agent_id is None or s_order.dto.agent_id is None:
-                    if b_order.dto.agent_id is None:
+                if b_dto.agent_id is None or s_dto.agent_id is None:
+                    if b_dto.agent_id is None:
                         idx_b += 1
-                    if s_order.dto.agent_id is None:
+                    if s_dto.agent_id is None:
                         idx_s += 1
                     continue
-                tx = Transaction(buyer_id=b_order.dto.agent_id, seller_id=s_order.dto.agent_id, item_id=f'stock_{firm_id}', quantity=trade_qty, price=effective_price_dollars, total_pennies=trade_total_pennies, market_id=market_id, transaction_type='stock', time=current_tick)
+                tx = Transaction(buyer_id=b_dto.agent_id, seller_id=s_dto.agent_id, item_id=f'stock_{firm_id}', quantity=trade_qty, price=effective_price_dollars, total_pennies=trade_total_pennies, market_id=market_id, transaction_type='stock', time=current_tick)
                 transactions.append(tx)
                 stats['volume'] += trade_qty
                 last_price = effective_price_dollars
                 high = max(high, effective_price_dollars)
                 low = min(low, effective_price_dollars)
-                b_order.remaining_qty -= trade_qty
-                s_order.remaining_qty -= trade_qty
+                b_order.remaining_quantity -= trade_qty
+                s_order.remaining_quantity -= trade_qty
             else:
                 break
-        final_buys = [o.to_dto() for o in m_buys if o.remaining_qty > 1e-09]
-        final_sells = [o.to_dto() for o in m_sells if o.remaining_qty > 1e-09]
         if last_price is not None:
             stats['last_price'] = last_price
             stats['high'] = high
             stats['low'] = low
-        return (transactions, final_buys, final_sells, stats)
+        return (transactions, stats)
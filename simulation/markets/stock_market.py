@@ -4,23 +4,25 @@
 가계와 기업 간 주식 거래를 중개하는 시장 클래스입니다.
 기존 OrderBookMarket과 유사한 가격-시간 우선 원칙을 적용합니다.
 """
-from typing import Dict, List, Optional, Any, TYPE_CHECKING, Union
+from typing import Dict, List, Optional, Any, TYPE_CHECKING, Union, Tuple
+import bisect
+import heapq
+import itertools
 import logging
 from collections import defaultdict
-from dataclasses import dataclass, replace
+from dataclasses import replace
 from simulation.models import Transaction, Order
 from simulation.core_markets import Market
 from modules.market.api import CanonicalOrderDTO, StockMarketStateDTO, StockIDHelper, OrderTelemetrySchema, IIndexCircuitBreaker, StockMarketConfigDTO
 from modules.finance.api import IShareholderRegistry, IShareholderView
-from simulation.markets.matching_engine import StockMatchingEngine
+from simulation.markets.matching_engine import StockMatchingEngine, ManagedOrder
 logger = logging.getLogger(__name__)
 
-@dataclass
-class ManagedOrder:
-    """A mutable wrapper for an immutable CanonicalOrderDTO to manage its state within the order book."""
-    order: CanonicalOrderDTO
-    remaining_quantity: float
-    created_tick: int
+def _bid_key(managed: ManagedOrder) -> float:
+    return -managed.order.price_limit
+
+def _ask_key(managed: ManagedOrder) -> float:
+    return managed.order.price_limit
 
 class StockMarket(Market):
     """
@@ -38,8 +40,12 @@ class StockMarket(Market):
         self.shareholder_registry = shareholder_registry
         self.index_circuit_breaker = index_circuit_breaker
         self.matched_transactions: List[Transaction] = []
+        # Per-firm books kept price-sorted on insert (best first, time priority within a price)
         self.buy_orders: Dict[int, List[ManagedOrder]] = defaultdict(list)
         self.sell_orders: Dict[int, List[ManagedOrder]] = defaultdict(list)
+        # Expiry index: (created_tick, seq, firm_id, side, order); closed orders are skipped lazily
+        self._expiry_heap: List[Tuple[int, int, int, str, ManagedOrder]] = []
+        self._expiry_seq = itertools.count()
         self.last_prices: Dict[int, float] = {}
         self.reference_prices: Dict[int, float] = {}
         self.daily_volumes: Dict[int, float] = {}
@@ -119,17 +125,17 @@ class StockMarket(Market):
 
     def get_best_bid(self, firm_id: int) -> Optional[float]:
         """특정 기업 주식의 최고 매수호가를 반환합니다."""
-        orders = self.buy_orders.get(firm_id, [])
+        orders = self.buy_orders.get(firm_id)
         if not orders:
             return None
-        return max((managed.order.price_limit for managed in orders))
+        return orders[0].order.price_limit
 
     def get_best_ask(self, firm_id: int) -> Optional[float]:
         """특정 기업 주식의 최저 매도호가를 반환합니다."""
-        orders = self.sell_orders.get(firm_id, [])
+        orders = self.sell_orders.get(firm_id)
         if not orders:
             return None
-        return min((managed.order.price_limit for managed in orders))
+        return orders[0].order.price_limit
 
     def place_order(self, order: CanonicalOrderDTO, tick: int) -> None:
         """
@@ -155,14 +161,13 @@ class StockMarket(Market):
             final_order = replace(order, price_limit=clamped_price, price_pennies=clamped_pennies)
         managed_order = ManagedOrder(order=final_order, remaining_quantity=final_order.quantity, created_tick=tick)
         if final_order.side == 'BUY':
-            self.buy_orders[firm_id].append(managed_order)
-            self.buy_orders[firm_id].sort(key=lambda m: -m.order.price_limit)
+            bisect.insort_right(self.buy_orders[firm_id], managed_order, key=_bid_key)
         elif final_order.side == 'SELL':
-            self.sell_orders[firm_id].append(managed_order)
-            self.sell_orders[firm_id].sort(key=lambda m: m.order.price_limit)
+            bisect.insort_right(self.sell_orders[firm_id], managed_order, key=_ask_key)
         else:
             self.logger.warning(f'Unknown stock order side: {final_order.side}', extra={'tick': tick, 'agent_id': final_order.agent_id})
             return
+        heapq.heappush(self._expiry_heap, (tick, next(self._expiry_seq), firm_id, final_order.side, managed_order))
         self.logger.info(f'Stock {final_order.side} order placed: {final_order.quantity:.1f} shares of firm {firm_id} at {final_order.price_limit:.2f}', extra={'tick': tick, 'agent_id': final_order.agent_id, 'firm_id': firm_id, 'order_type': final_order.side, 'quantity': final_order.quantity, 'price': final_order.price_limit, 'tags': ['stock', 'order']})
 
     def match_orders(self, tick: int) -> List[Transaction]:
@@ -179,42 +184,51 @@ class StockMarket(Market):
             )
             return []
 
-        def to_dto_with_metadata(managed: ManagedOrder) -> CanonicalOrderDTO:
-            dto = replace(managed.order, quantity=managed.remaining_quantity)
-            new_metadata = dto.metadata.copy() if dto.metadata else {}
-            new_metadata['created_tick'] = managed.created_tick
-            return replace(dto, metadata=new_metadata)
-        buy_orders_dto = {firm_id: [to_dto_with_metadata(managed) for managed in orders] for firm_id, orders in self.buy_orders.items()}
-        sell_orders_dto = {firm_id: [to_dto_with_metadata(managed) for managed in orders] for firm_id, orders in self.sell_orders.items()}
-        state = StockMarketStateDTO(buy_orders=buy_orders_dto, sell_orders=sell_orders_dto, market_id=self.id)
-        result = self.matching_engine.match(state, tick)
-        for firm_id_str, price in result.market_stats.get('last_prices', {}).items():
-            firm_id = int(firm_id_str)
-            self.last_prices[firm_id] = price
-        for firm_id_str, volume in result.market_stats.get('daily_volumes', {}).items():
-            firm_id = int(firm_id_str)
-            self.daily_volumes[firm_id] = self.daily_volumes.get(firm_id, 0.0) + volume
-        for firm_id_str, high in result.market_stats.get('daily_high', {}).items():
-            firm_id = int(firm_id_str)
-            if firm_id not in self.daily_high or high > self.daily_high[firm_id]:
-                self.daily_high[firm_id] = high
-        for firm_id_str, low in result.market_stats.get('daily_low', {}).items():
-            firm_id = int(firm_id_str)
-            if firm_id not in self.daily_low or low < self.daily_low[firm_id]:
-                self.daily_low[firm_id] = low
+        # Cross each firm's book in place: no DTO round trip for resting orders
+        all_transactions: List[Transaction] = []
+        for firm_id in list(self.buy_orders.keys()):
+            buys = self.buy_orders[firm_id]
+            sells = self.sell_orders.get(firm_id)
+            if not buys or not sells:
+                continue
+            # Books are price_limit-ordered; the engine crosses on price_pennies (stable, near-linear re-sort)
+            m_buys = sorted(buys, key=lambda m: m.order.price_pennies, reverse=True)
+            m_sells = sorted(sells, key=lambda m: m.order.price_pennies)
+            transactions, stats = self.matching_engine.match_book(firm_id, m_buys, m_sells, self.id, tick)
+            if not transactions:
+                continue
+            all_transactions.extend(transactions)
+            self._settle_book(buys)
+            self._settle_book(sells)
+
+            self.last_prices[firm_id] = stats['last_price']
+            self.daily_volumes[firm_id] = self.daily_volumes.get(firm_id, 0.0) + stats['volume']
+            if firm_id not in self.daily_high or stats['high'] > self.daily_high[firm_id]:
+                self.daily_high[firm_id] = stats['high']
+            if firm_id not in self.daily_low or stats['low'] < self.daily_low[firm_id]:
+                self.daily_low[firm_id] = stats['low']
+        return all_transactions
 
-        def from_dto(dto: CanonicalOrderDTO) -> ManagedOrder:
-            created_tick = dto.metadata.get('created_tick', tick) if dto.metadata else tick
-            return ManagedOrder(order=dto, remaining_quantity=dto.quantity, created_tick=created_tick)
-        self.buy_orders = defaultdict(list)
-        for firm_id_str, dtos in result.unfilled_buy_orders.items():
-            firm_id = int(firm_id_str)
-            self.buy_orders[firm_id] = [from_dto(dto) for dto in dtos]
-        self.sell_orders = defaultdict(list)
-        for firm_id_str, dtos in result.unfilled_sell_orders.items():
-            firm_id = int(firm_id_str)
-            self.sell_orders[firm_id] = [from_dto(dto) for dto in dtos]
-        return result.transactions
+    def _settle_book(self, book: List[ManagedOrder]) -> None:
+        """Drops filled orders and refreshes partially filled DTO quantities after a match."""
+        kept = []
+        for managed in book:
+            if managed.remaining_quantity > 1e-09:
+                if managed.remaining_quantity != managed.order.quantity:
+                    managed.order = replace(managed.order, quantity=managed.remaining_quantity)
+                kept.append(managed)
+            else:
+                managed.is_open = False
+        book[:] = kept
+
+    def _remove_from_book(self, book: List[ManagedOrder], managed: ManagedOrder, key) -> bool:
+        idx = bisect.bisect_left(book, key(managed), key=key)
+        while idx < len(book):
+            if book[idx] is managed:
+                del book[idx]
+                return True
+            idx += 1
+        return False
 
     def clear_expired_orders(self, current_tick: int) -> int:
         """
@@ -228,16 +242,18 @@ class StockMarket(Market):
         """
         expiry_ticks = self.config_dto.order_expiry_ticks
         removed_count = 0
-        for firm_id in list(self.buy_orders.keys()):
-            original_count = len(self.buy_orders[firm_id])
-            self.buy_orders[firm_id] = [managed for managed in self.buy_orders[firm_id] if current_tick - managed.created_tick < expiry_ticks]
-            removed = original_count - len(self.buy_orders[firm_id])
-            removed_count += removed
-        for firm_id in list(self.sell_orders.keys()):
-            original_count = len(self.sell_orders[firm_id])
-            self.sell_orders[firm_id] = [managed for managed in self.sell_orders[firm_id] if current_tick - managed.created_tick < expiry_ticks]
-            removed = original_count - len(self.sell_orders[firm_id])
-            removed_count += removed
+        heap = self._expiry_heap
+        while heap and current_tick - heap[0][0] >= expiry_ticks:
+            _, _, firm_id, side, managed = heapq.heappop(heap)
+            if not managed.is_open:
+                continue
+            managed.is_open = False
+            if side == 'BUY':
+                book, key = self.buy_orders.get(firm_id), _bid_key
+            else:
+                book, key = self.sell_orders.get(firm_id), _ask_key
+            if book is not None and self._remove_from_book(book, managed, key):
+                removed_count += 1
         if removed_count > 0:
             self.logger.debug(f'Cleared {removed_count} expired stock orders', extra={'tick': current_tick, 'tags': ['stock', 'cleanup']})
         return removed_count
@@ -259,6 +275,7 @@ class StockMarket(Market):
         """
         self.buy_orders.clear()
         self.sell_orders.clear()
+        self._expiry_heap.clear()
         self.reset_daily_stats()
 
     def cancel_orders(self, agent_id: str) -> None:
@@ -271,19 +288,13 @@ class StockMarket(Market):
         for firm_id, orders in self.buy_orders.items():
             original_len = len(orders)
             # ManagedOrder.order is CanonicalOrderDTO
-            self.buy_orders[firm_id] = [
-                m for m in orders
-                if str(m.order.agent_id) != str(agent_id) and m.order.agent_id != agent_id
-            ]
+            self.buy_orders[firm_id] = self._drop_agent_orders(orders, agent_id)
             removed_count += original_len - len(self.buy_orders[firm_id])
 
         # Iterate over sell orders
         for firm_id, orders in self.sell_orders.items():
             original_len = len(orders)
-            self.sell_orders[firm_id] = [
-                m for m in orders
-                if str(m.order.agent_id) != str(agent_id) and m.order.agent_id != agent_id
-            ]
+            self.sell_orders[firm_id] = self._drop_agent_orders(orders, agent_id)
             removed_count += original_len - len(self.sell_orders[firm_id])
 
         if removed_count > 0:
@@ -292,6 +303,15 @@ class StockMarket(Market):
                 extra={"market_id": self.id, "agent_id": agent_id, "removed_count": removed_count}
             )
 
+    def _drop_agent_orders(self, orders: List[ManagedOrder], agent_id: str) -> List[ManagedOrder]:
+        kept = []
+        for m in orders:
+            if str(m.order.agent_id) != str(agent_id) and m.order.agent_id != agent_id:
+                kept.append(m)
+            else:
+                m.is_open = False
+        return kept
+
     def get_telemetry_snapshot(self) -> List[OrderTelemetrySchema]:
         """Returns Pydantic schemas for UI consumption."""
         snapshot = []
@@ -1,9 +1,11 @@
 from __future__ import annotations
-from typing import List, Dict, Any, TYPE_CHECKING, Mapping, Optional
+from typing import List, Dict, Any, TYPE_CHECKING, Callable, Mapping, Optional
 import logging
 import statistics
 from collections import deque
 
+import numpy as np
+
 if TYPE_CHECKING:
     from simulation.world_state import WorldState
 
@@ -14,6 +16,7 @@ from simulation.firms import Firm
 from simulation.core_markets import Market
 from modules.system.api import DEFAULT_CURRENCY, CurrencyCode
 from modules.finance.exchange.engine import CurrencyExchangeEngine
+from simulation.metrics.history_store import HistorySpillDTO, IndicatorHistoryStore
 
 logger = logging.getLogger(__name__)
 
@@ -27,30 +30,32 @@ class EconomicIndicatorTracker:
     def __init__(self, config_module: Any) -> None:
         """EconomicIndicatorTracker를 초기화합니다.
 
-        metrics: 추적할 경제 지표들을 저장하는 딕셔너리.
+        history: 추적할 경제 지표들의 시계열 저장소 (metrics는 그 매 틱 뷰).
         config_module: 시뮬레이션 설정을 담고 있는 모듈.
         all_fieldnames: CSV 파일 저장 시 사용될 모든 필드 이름 리스트 (이제 사용되지 않음).
         """
-        self.metrics: Dict[str, List[float]] = {
-            "goods_price_index": [],
-            "unemployment_rate": [],
-            "avg_wage": [],
-            "money_supply": [],
-            "monetary_base": [],
-            "total_labor_income": [],
-            "total_sales_volume": [],
+        # Indicator history: constant-memory ring buffers at raw / every-10 / every-100 tick resolution
+        self.history = IndicatorHistoryStore()
+        self.history.declare([
+            "goods_price_index",
+            "unemployment_rate",
+            "avg_wage",
+            "money_supply",
+            "monetary_base",
+            "total_labor_income",
+            "total_sales_volume",
             # TD-015: New Centralized Metrics
-            "gdp": [],
-            "gini": [],
-            "social_cohesion": [],
-            "active_population": [],
+            "gdp",
+            "gini",
+            "social_cohesion",
+            "active_population",
             # Population Distribution (Quintiles) - stored as individual series or flattened
-            "quintile_1_avg_assets": [],
-            "quintile_2_avg_assets": [],
-            "quintile_3_avg_assets": [],
-            "quintile_4_avg_assets": [],
-            "quintile_5_avg_assets": [],
-        }
+            "quintile_1_avg_assets",
+            "quintile_2_avg_assets",
+            "quintile_3_avg_assets",
+            "quintile_4_avg_assets",
+            "quintile_5_avg_assets",
+        ])
 
         # Watchtower Hardening: SMA History (Window=50)
         self.history_window = 50
@@ -416,15 +421,8 @@ class EconomicIndicatorTracker:
         for field in self.all_fieldnames:
             record.setdefault(field, 0)
 
-        # Store the record in metrics with bounded size to prevent OOM
-        for key, value in record.items():
-            if key != "time":
-                # Ensure we have a list for this key
-                lst = self.metrics.setdefault(key, [])
-                lst.append(value)
-                # Keep max 2000 points to bound memory usage
-                if len(lst) > 2000:
-                    lst.pop(0)
+        # Store the record in the fixed-capacity history (memory is bounded however long the run)
+        self.history.record(time, {key: value for key, value in record.items() if key != "time"})
 
         # Update SMA Histories
         self.gdp_history.append(record.get("gdp", 0.0))
@@ -442,13 +440,18 @@ class EconomicIndicatorTracker:
             "m2_leak_sma": statistics.mean(self.m2_leak_history) if self.m2_leak_history else 0.0
         }
 
+    def set_history_spill(self, spill: Optional[Callable[[HistorySpillDTO], None]]) -> None:
+        """history의 오래된 구간을 넘겨받을 persistence hook을 설정합니다."""
+        self.history.spill = spill
+
+    @property
+    def metrics(self) -> Mapping[str, np.ndarray]:
+        """지표별 시계열 (매 틱, 최근 history.capacity 개). Read-only zero-copy views."""
+        return self.history.raw
+
     def get_latest_indicators(self) -> Dict[str, Any]:
         """가장 최근에 기록된 경제 지표들을 딕셔너리 형태로 반환합니다."""
-        latest_indicators = {}
-        for key, values in self.metrics.items():
-            if values:
-                latest_indicators[key] = values[-1]
-        return latest_indicators
+        return self.history.latest()
 
     def calculate_monetary_aggregates(self, world_state: 'WorldState') -> Dict[str, float]:
         """
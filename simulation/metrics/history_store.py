@@ -0,0 +1,196 @@
+"""
+simulation/metrics/history_store.py
+
+Fixed-capacity indicator history: one preallocated NumPy column per indicator,
+kept at several resolutions (every tick, every 10 ticks, every 100 ticks).
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_CAPACITY = 2000
+DEFAULT_STRIDES: Tuple[int, ...] = (1, 10, 100)
+
+
+class RingColumn:
+    """
+    Fixed-capacity column with O(1) append and zero-copy chronological views.
+
+    Every value is written twice, at slot `i` and `i + capacity` of a buffer of
+    twice the capacity, so the newest `capacity` values are always one
+    contiguous slice. Views are read-only and only valid until the slot they
+    expose is overwritten (i.e. for the next `capacity - len` appends at least).
+    """
+
+    def __init__(self, capacity: int, dtype: Any = np.float64, fill: Any = np.nan):
+        self.capacity = capacity
+        self._buffer = np.full(2 * capacity, fill, dtype=dtype)
+        self._total = 0
+
+    def __len__(self) -> int:
+        return min(self._total, self.capacity)
+
+    @property
+    def total(self) -> int:
+        """Values appended since creation, including those already overwritten."""
+        return self._total
+
+    @property
+    def nbytes(self) -> int:
+        return self._buffer.nbytes
+
+    def append(self, value: Any) -> None:
+        slot = self._total % self.capacity
+        self._buffer[slot] = value
+        self._buffer[slot + self.capacity] = value
+        self._total += 1
+
+    def view(self, last: Optional[int] = None) -> np.ndarray:
+        """Oldest-to-newest values still held (or only the `last` n of them)."""
+        n = len(self)
+        start = self._total % self.capacity if self._total >= self.capacity else 0
+        window = self._buffer[start:start + n]
+        if last is not None:
+            window = window[max(0, n - last):]
+        window = window.view()
+        window.flags.writeable = False
+        return window
+
+    def latest(self) -> Any:
+        if self._total == 0:
+            raise IndexError("empty column")
+        return self._buffer[(self._total - 1) % self.capacity]
+
+
+@dataclass(frozen=True)
+class HistorySpillDTO:
+    """A full lap of one tier, handed to persistence before it is overwritten."""
+    stride: int
+    ticks: Any  # np.ndarray[int64]
+    columns: Dict[str, Any]  # name -> np.ndarray[float64], aligned with ticks
+
+
+class HistoryTier:
+    """
+    One resolution of the history. Stride 1 stores every tick; stride k stores
+    the mean of each block of k ticks, stamped with the block's last tick.
+    """
+
+    def __init__(self, stride: int, capacity: int):
+        self.stride = stride
+        self.capacity = capacity
+        self.ticks = RingColumn(capacity, dtype=np.int64, fill=-1)
+        self.columns: Dict[str, RingColumn] = {}
+        self._sums: Dict[str, float] = {}
+        self._counts: Dict[str, int] = {}
+        self._block = 0
+
+    def _column(self, name: str) -> RingColumn:
+        column = self.columns.get(name)
+        if column is None:
+            column = self.columns[name] = RingColumn(self.capacity)
+            # Late indicators are back-filled with NaN so every column stays aligned with `ticks`
+            column._total = self.ticks.total
+        return column
+
+    def record(self, tick: int, values: Mapping[str, float]) -> bool:
+        """Feeds one tick. Returns True if a row was appended to this tier."""
+        if self.stride == 1:
+            row = values
+        else:
+            for name, value in values.items():
+                self._sums[name] = self._sums.get(name, 0.0) + value
+                self._counts[name] = self._counts.get(name, 0) + 1
+            self._block += 1
+            if self._block < self.stride:
+                return False
+            row = {name: self._sums[name] / self._counts[name] for name in self._sums}
+            self._sums.clear()
+            self._counts.clear()
+            self._block = 0
+
+        for name in row:
+            self._column(name)
+        for name, column in self.columns.items():
+            column.append(row.get(name, np.nan))
+        self.ticks.append(tick)
+        return True
+
+    def spill(self) -> HistorySpillDTO:
+        return HistorySpillDTO(
+            stride=self.stride,
+            ticks=self.ticks.view().copy(),
+            columns={name: column.view().copy() for name, column in self.columns.items()},
+        )
+
+
+class _SeriesView(Mapping):
+    """Read-only `name -> values` mapping over one tier (zero-copy arrays)."""
+
+    def __init__(self, store: "IndicatorHistoryStore", stride: int):
+        self._store = store
+        self._stride = stride
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        if name not in self._store.tiers[self._stride].columns:
+            raise KeyError(name)
+        return self._store.series(name, self._stride)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._store.tiers[self._stride].columns))
+
+    def __len__(self) -> int:
+        return len(self._store.tiers[self._stride].columns)
+
+
+class IndicatorHistoryStore:
+    """
+    Run-scoped, constant-memory history of named indicators.
+
+    `record` is O(indicators) per tick regardless of run length; `series`
+    returns zero-copy views. Each tier holds its newest `capacity` rows. When
+    a tier completes a lap, that lap is passed to `spill` (if set) before its
+    rows start being overwritten, so older data can be kept by persistence.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, strides: Sequence[int] = DEFAULT_STRIDES,
+                 spill: Optional[Callable[[HistorySpillDTO], None]] = None):
+        self.capacity = capacity
+        self.tiers: Dict[int, HistoryTier] = {stride: HistoryTier(stride, capacity) for stride in strides}
+        self.spill = spill
+        self._latest: Dict[str, float] = {}
+        self.raw = _SeriesView(self, 1)
+
+    def declare(self, names: Sequence[str]) -> None:
+        """Creates (empty) columns up front so they are listed before their first value."""
+        for tier in self.tiers.values():
+            for name in names:
+                tier._column(name)
+
+    def record(self, tick: int, values: Mapping[str, float]) -> None:
+        self._latest.update(values)
+        for tier in self.tiers.values():
+            if tier.record(tick, values) and tier.ticks.total % self.capacity == 0 and self.spill:
+                self.spill(tier.spill())
+
+    def series(self, name: str, stride: int = 1, last: Optional[int] = None) -> np.ndarray:
+        column = self.tiers[stride].columns.get(name)
+        if column is None:
+            return np.zeros(0, dtype=np.float64)
+        return column.view(last)
+
+    def ticks(self, stride: int = 1, last: Optional[int] = None) -> np.ndarray:
+        return self.tiers[stride].ticks.view(last)
+
+    def latest(self) -> Dict[str, float]:
+        """Most recent recorded value of every indicator."""
+        return dict(self._latest)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(
+            tier.ticks.nbytes + sum(column.nbytes for column in tier.columns.values())
+            for tier in self.tiers.values()
+        )
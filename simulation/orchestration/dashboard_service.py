@@ -31,21 +31,31 @@ class DashboardService:
 
         self._last_tick_time = datetime.now()
         self._last_tick = 0
+        self._aggregates: Dict[str, float] = {}
+        self._aggregates_tick: Optional[int] = None
         # PersistenceBridge handles Optional[Simulation] internally
         self.persistence = PersistenceBridge(self.simulation)
 
     def get_snapshot(self) -> WatchtowerSnapshotDTO:
+        snapshot = self.build_snapshot()
+        self.persistence.save_snapshot(snapshot)
+        return snapshot
+
+    def build_snapshot(self) -> WatchtowerSnapshotDTO:
+        """Reads the live world state into a snapshot without archiving it."""
         state = self.state
         tracker = state.tracker
         gov = state.government
 
-        # --- 1. System Integrity ---
-        # Use smoothed M2 leak if available (Watchtower Hardening)
-        m2_leak = self._calculate_m2_leak(state)
+        smoothed = {}
         if isinstance(tracker, IEconomicIndicatorTracker):
-             smoothed = tracker.get_smoothed_values()
-             if smoothed.get("m2_leak_sma") is not None:
-                 m2_leak = smoothed.get("m2_leak_sma")
+            smoothed = tracker.get_smoothed_values()
+
+        # --- 1. System Integrity ---
+        # Use smoothed M2 leak if available (Watchtower Hardening); the full M2 scan is only the fallback
+        m2_leak = smoothed.get("m2_leak_sma")
+        if m2_leak is None:
+            m2_leak = self._calculate_m2_leak(state)
 
         # FPS Calculation
         current_time = datetime.now()
@@ -60,9 +70,6 @@ class DashboardService:
 
         # --- 2. Macro Economy ---
         latest = tracker.get_latest_indicators() if tracker else {}
-        smoothed = {}
-        if isinstance(tracker, IEconomicIndicatorTracker):
-            smoothed = tracker.get_smoothed_values()
 
         # GDP (Nominal) - Smoothed
         gdp = smoothed.get("gdp_sma", latest.get("gdp", 0.0))
@@ -95,7 +102,7 @@ class DashboardService:
         savings_rate = max(0.0, loan_rate - 2.0) # Heuristic: Spread
 
         # Supply
-        monetary_aggregates = tracker.calculate_monetary_aggregates(state) if tracker else {"m0": 0.0, "m1": 0.0, "m2": 0.0}
+        monetary_aggregates = self._monetary_aggregates(state, tracker)
         m0 = monetary_aggregates["m0"]
         m1 = monetary_aggregates["m1"]
         m2 = monetary_aggregates["m2"]
@@ -185,10 +192,17 @@ class DashboardService:
                 metrics=PopulationMetricsDTO(birth=birth_rate, death=death_rate)
             )
         )
-
-        self.persistence.save_snapshot(snapshot)
         return snapshot
 
+    def _monetary_aggregates(self, state, tracker) -> Dict[str, float]:
+        """M0/M1/M2 walk every account, so they are computed at most once per tick."""
+        if not tracker:
+            return {"m0": 0.0, "m1": 0.0, "m2": 0.0}
+        if self._aggregates_tick != state.time:
+            self._aggregates = tracker.calculate_monetary_aggregates(state)
+            self._aggregates_tick = state.time
+        return self._aggregates
+
     def _calculate_m2_leak(self, state) -> float:
         m2_current = state.calculate_total_money().get(DEFAULT_CURRENCY, 0.0)
         m2_start = state.baseline_money_supply
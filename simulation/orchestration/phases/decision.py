@@ -22,7 +22,7 @@ class Phase1_Decision(IPhaseStrategy):
         self.world_state = world_state
         self.input_factory = DecisionInputFactory()
         self.snapshot_factory = MarketSnapshotFactory()
-        self.perception_system = PerceptionSystem()
+        self.perception_system = PerceptionSystem(seed=getattr(world_state.config_module, 'RANDOM_SEED', None))
 
     def execute(self, state: SimulationState) -> SimulationState:
         self._snapshot_agent_pre_states(state)
@@ -58,7 +58,7 @@ class Phase1_Decision(IPhaseStrategy):
                 firm_pre_states[firm.id] = {'pre_strategic_state': pre_strategic_state, 'pre_tactical_state': pre_tactical_state, 'chosen_intention': firm.decision_engine.ai_engine.chosen_intention, 'chosen_tactic': firm.decision_engine.ai_engine.last_chosen_tactic}
             # Phase 4.1: Perceptual Filters
             market_insight = firm.market_insight if hasattr(firm, 'market_insight') else 0.5
-            filtered_snapshot = self.perception_system.apply_filter(market_insight, base_input_dto.market_snapshot)
+            filtered_snapshot = self.perception_system.apply_filter(market_insight, base_input_dto.market_snapshot, agent_id=firm.id)
             filtered_policy = self.perception_system.apply_policy_filter(market_insight, base_input_dto.government_policy)
 
             firm_input = replace(
@@ -91,7 +91,7 @@ class Phase1_Decision(IPhaseStrategy):
                 household_pre_states[household.id] = {'pre_strategic_state': pre_strategic_state}
             # Phase 4.1: Perceptual Filters
             market_insight = household._econ_state.market_insight if hasattr(household, '_econ_state') else 0.5
-            filtered_snapshot = self.perception_system.apply_filter(market_insight, base_input_dto.market_snapshot)
+            filtered_snapshot = self.perception_system.apply_filter(market_insight, base_input_dto.market_snapshot, agent_id=household.id)
             filtered_policy = self.perception_system.apply_policy_filter(market_insight, base_input_dto.government_policy)
 
             household_input = replace(
@@ -179,14 +179,15 @@ class Phase1_Decision(IPhaseStrategy):
         if self.world_state.commerce_system:
             planned_cons, commerce_txs = self.world_state.commerce_system.plan_consumption_and_leisure(commerce_context, self.world_state.stress_scenario_config)
             state.planned_consumption = planned_cons
-            for tx in commerce_txs:
-                if tx.transaction_type == 'PHASE23_MARKET_ORDER':
+            # The commerce batch is homogeneous: either order-book bids or settled system buys
+            if commerce_txs and commerce_txs[0].transaction_type == 'PHASE23_MARKET_ORDER':
+                for tx in commerce_txs:
                     order = Order(agent_id=tx.buyer_id, side='BUY', item_id=tx.item_id, quantity=tx.quantity, price_pennies=int(tx.price * 100), price_limit=tx.price, market_id=tx.item_id)
                     market = state.markets.get(tx.item_id)
                     if market:
                         new_txs = market.place_order(order, state.time)
                         if new_txs:
                             state.transactions.extend(new_txs)
-                else:
-                    state.transactions.append(tx)
+            else:
+                state.transactions.extend(commerce_txs)
         return state
\ No newline at end of file
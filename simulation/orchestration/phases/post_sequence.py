@@ -5,6 +5,7 @@ import logging
 from simulation.orchestration.api import IPhaseStrategy
 from simulation.dtos.api import SimulationState, AIDecisionData
 from simulation.orchestration.utils import prepare_market_data
+from simulation.orchestration.run_mode import flush_due, should_observe
 from simulation.systems.api import LearningUpdateContext
 from modules.system.api import DEFAULT_CURRENCY
 from modules.housing.api import HousingContextDTO
@@ -139,7 +140,9 @@ class Phase5_PostSequence(IPhaseStrategy):
         if state.primary_government:
              state.primary_government.finalize_tick(state.time)
 
-        if self.world_state.persistence_manager and self.world_state.analytics_system:
+        observe = should_observe(self.world_state, state.time)
+
+        if observe and self.world_state.persistence_manager and self.world_state.analytics_system:
              # TD-272: Aggregation via AnalyticsSystem
              agent_states, transactions, indicators, market_history = self.world_state.analytics_system.aggregate_tick_data(self.world_state)
 
@@ -150,7 +153,7 @@ class Phase5_PostSequence(IPhaseStrategy):
                  market_history
              )
 
-             if state.time % self.world_state.batch_save_interval == 0:
+             if flush_due(self.world_state, "checkpoint", state.time, self.world_state.batch_save_interval):
                  self.world_state.persistence_manager.checkpoint_state(state.time, self.world_state.global_registry)
 
         # Reset counters
@@ -179,10 +182,10 @@ class Phase5_PostSequence(IPhaseStrategy):
                     extra={"firm_id": f.id}
                 )
 
-        if self.world_state.generational_wealth_audit and state.time % 100 == 0:
+        if observe and self.world_state.generational_wealth_audit and state.time % 100 == 0:
              self.world_state.generational_wealth_audit.run_audit(state.households, state.time)
 
-        if self.world_state.crisis_monitor:
+        if observe and self.world_state.crisis_monitor:
              self.world_state.crisis_monitor.monitor(state.time, state.firms)
 
         for market in state.markets.values():
@@ -5,6 +5,7 @@ from datetime import datetime
 from simulation.orchestration.api import IPhaseStrategy
 from simulation.dtos.watchtower_v2 import WatchtowerV2DTO
 from simulation.orchestration.dashboard_service import DashboardService
+from simulation.orchestration.run_mode import should_observe
 
 if TYPE_CHECKING:
     from simulation.dtos.api import SimulationState
@@ -23,6 +24,10 @@ class Phase_ScenarioAnalysis(IPhaseStrategy):
         self.world_state = world_state
 
     def execute(self, state: SimulationState) -> SimulationState:
+        # Headless fast-forward: nobody is watching this tick
+        if not should_observe(self.world_state, state.time):
+            return state
+
         # Check if components are available
         telemetry_collector = getattr(self.world_state, "telemetry_collector", None)
         scenario_verifier = getattr(self.world_state, "scenario_verifier", None)
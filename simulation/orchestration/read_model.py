@@ -0,0 +1,315 @@
+"""
+simulation/orchestration/read_model.py
+
+Versioned, immutable read replica of the world state for the Watchtower API.
+
+The simulation publishes one `ReadModelSnapshot` per tick boundary (from the
+tick worker thread). Query handlers only ever read the latest published
+snapshot, so they never touch live agents, cannot observe a half-finished
+tick, and do not contend with the tick loop beyond a reference read.
+
+With a `path`, every version is also written as a single memory-mappable
+file (written aside, then atomically renamed into place), so a separate API
+process can serve the same data through `ReadModelReader`.
+"""
+from __future__ import annotations
+from dataclasses import dataclass, field
+import json
+import logging
+import mmap
+import os
+import struct
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from simulation.dtos.agents import AgentBasicDTO, AgentDetailDTO
+from simulation.dtos.watchtower import WatchtowerSnapshotDTO
+from simulation.core_agents import Household
+from simulation.firms import Firm
+from simulation.metrics.history_store import IndicatorHistoryStore
+
+if TYPE_CHECKING:
+    from simulation.engine import Simulation
+    from simulation.orchestration.dashboard_service import DashboardService
+
+logger = logging.getLogger(__name__)
+
+KIND_HOUSEHOLD = 0
+KIND_FIRM = 1
+_KIND_NAMES = {KIND_HOUSEHOLD: "household", KIND_FIRM: "firm"}
+_NO_ID = -1
+
+# One row per agent; optional fields use NaN / _NO_ID as "not applicable"
+AGENT_DTYPE = np.dtype([
+    ("id", "<i8"),
+    ("kind", "i1"),
+    ("is_active", "?"),
+    ("wealth", "<i8"),
+    ("income", "<i8"),
+    ("expense", "<i8"),
+    ("age", "<f8"),
+    ("employer_id", "<i8"),
+    ("current_wage", "<i8"),
+    ("employees_count", "<i8"),
+    ("production", "<f8"),
+])
+
+# magic, version, tick, agent rows, indicator values, metadata bytes
+_MAGIC = b"WTREAD01"
+_HEADER = struct.Struct("<8sqqqqq")
+
+
+def _readonly(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+@dataclass(frozen=True, eq=False)
+class ReadModelSnapshot:
+    """
+    One published version of the read model. Arrays are read-only views
+    (over the mapped file when loaded by a reader); nothing here refers to live agents.
+    """
+    version: int
+    tick: int
+    agents: Any  # np.ndarray[AGENT_DTYPE], in world iteration order
+    extras: Dict[int, Dict[str, Any]] = field(default_factory=dict)  # Dict-valued detail fields
+    watchtower: Optional[WatchtowerSnapshotDTO] = None
+    indicators: Dict[str, Any] = field(default_factory=dict)  # name -> np.ndarray[float64]
+    _order: Any = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_order", np.argsort(self.agents["id"], kind="stable"))
+
+    @classmethod
+    def empty(cls) -> "ReadModelSnapshot":
+        return cls(version=0, tick=0, agents=_readonly(np.zeros(0, dtype=AGENT_DTYPE)))
+
+    def __len__(self) -> int:
+        return len(self.agents)
+
+    # --- Queries ---
+
+    def _row_of(self, agent_id: int) -> Optional[int]:
+        ids = self.agents["id"]
+        pos = int(np.searchsorted(ids, agent_id, sorter=self._order))
+        if pos < len(ids) and ids[self._order[pos]] == agent_id:
+            return int(self._order[pos])
+        return None
+
+    def get_agents_basic(self, limit: int = 500) -> List[AgentBasicDTO]:
+        """Active households and firms, in world order (same contract as AgentService)."""
+        rows = self.agents[self.agents["is_active"]][:limit]
+        return [
+            AgentBasicDTO(id=int(r["id"]), type=_KIND_NAMES[int(r["kind"])], wealth=int(r["wealth"]),
+                          income=int(r["income"]), expense=int(r["expense"]))
+            for r in rows
+        ]
+
+    def get_agent_detail(self, agent_id: int) -> Optional[AgentDetailDTO]:
+        row = self._row_of(agent_id)
+        if row is None:
+            return None
+        r = self.agents[row]
+        extras = self.extras.get(int(r["id"]), {})
+        basic = dict(id=int(r["id"]), type=_KIND_NAMES[int(r["kind"])], wealth=int(r["wealth"]),
+                     income=int(r["income"]), expense=int(r["expense"]), is_active=bool(r["is_active"]))
+        if r["kind"] == KIND_HOUSEHOLD:
+            return AgentDetailDTO(
+                **basic,
+                age=None if np.isnan(r["age"]) else float(r["age"]),
+                needs=extras.get("needs"),
+                inventory=extras.get("inventory"),
+                employer_id=None if r["employer_id"] == _NO_ID else int(r["employer_id"]),
+                current_wage=int(r["current_wage"]),
+            )
+        return AgentDetailDTO(
+            **basic,
+            sector=extras.get("sector"),
+            employees_count=int(r["employees_count"]),
+            production=None if np.isnan(r["production"]) else float(r["production"]),
+            revenue_this_turn=extras.get("revenue_this_turn"),
+            expenses_this_tick=extras.get("expenses_this_tick"),
+        )
+
+    def get_indicator(self, name: str) -> np.ndarray:
+        return self.indicators.get(name, _readonly(np.zeros(0, dtype=np.float64)))
+
+    # --- Wire format ---
+
+    def to_bytes(self) -> bytes:
+        """Header | agent rows | indicator values (float64) | JSON metadata."""
+        spans: Dict[str, Tuple[int, int]] = {}
+        blocks: List[np.ndarray] = []
+        start = 0
+        for name, values in self.indicators.items():
+            spans[name] = (start, len(values))
+            blocks.append(np.asarray(values, dtype="<f8"))
+            start += len(values)
+        values_block = np.concatenate(blocks) if blocks else np.zeros(0, dtype="<f8")
+
+        meta = json.dumps({
+            "watchtower": self.watchtower.model_dump() if self.watchtower is not None else None,
+            "indicators": spans,
+            "extras": self.extras,
+        }, default=_json_default, separators=(",", ":")).encode("utf-8")
+
+        agents = np.ascontiguousarray(self.agents, dtype=AGENT_DTYPE)
+        header = _HEADER.pack(_MAGIC, self.version, self.tick, len(agents), len(values_block), len(meta))
+        return b"".join((header, agents.tobytes(), values_block.tobytes(), meta))
+
+    @classmethod
+    def from_buffer(cls, buffer: Any) -> "ReadModelSnapshot":
+        """Zero-copy view over a serialized snapshot (bytes or a mapped file)."""
+        magic, version, tick, n_agents, n_values, meta_len = _HEADER.unpack_from(buffer, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"Not a read model snapshot (magic {magic!r})")
+        offset = _HEADER.size
+        agents = np.frombuffer(buffer, dtype=AGENT_DTYPE, count=n_agents, offset=offset)
+        offset += n_agents * AGENT_DTYPE.itemsize
+        values = np.frombuffer(buffer, dtype="<f8", count=n_values, offset=offset)
+        offset += n_values * 8
+        meta = json.loads(bytes(memoryview(buffer)[offset:offset + meta_len]))
+
+        indicators = {name: values[s:s + n] for name, (s, n) in meta["indicators"].items()}
+        extras = {int(k): v for k, v in meta["extras"].items()}
+        watchtower = meta["watchtower"]
+        return cls(
+            version=version,
+            tick=tick,
+            agents=agents,
+            extras=extras,
+            watchtower=WatchtowerSnapshotDTO.model_validate(watchtower) if watchtower is not None else None,
+            indicators=indicators,
+        )
+
+
+def collect_agent_rows(agents: Iterable[Any]) -> Tuple[np.ndarray, Dict[int, Dict[str, Any]]]:
+    """Copies the Watchtower fields of every household and firm into columns."""
+    rows: List[Tuple[Any, ...]] = []
+    extras: Dict[int, Dict[str, Any]] = {}
+    for agent in agents:
+        try:
+            if isinstance(agent, Household):
+                rows.append((
+                    agent.id, KIND_HOUSEHOLD, bool(agent.is_active), agent.total_wealth,
+                    agent.labor_income_this_tick, agent._econ_state.consumption_expenditure_this_tick_pennies,
+                    float(agent.age) if agent.age is not None else np.nan,
+                    agent.employer_id if agent.employer_id is not None else _NO_ID,
+                    agent.current_wage or 0, 0, np.nan,
+                ))
+                extras[agent.id] = {"needs": dict(agent._bio_state.needs), "inventory": dict(agent.inventory)}
+            elif isinstance(agent, Firm):
+                rows.append((
+                    agent.id, KIND_FIRM, bool(agent.is_active), agent.total_wealth,
+                    int(sum(agent.finance_state.revenue_this_turn.values())),
+                    int(sum(agent.finance_state.expenses_this_tick.values())),
+                    np.nan, _NO_ID, 0, len(agent.hr_state.employees),
+                    float(agent.current_production) if agent.current_production is not None else np.nan,
+                ))
+                extras[agent.id] = {
+                    "sector": agent.sector,
+                    "revenue_this_turn": dict(agent.finance_state.revenue_this_turn),
+                    "expenses_this_tick": dict(agent.finance_state.expenses_this_tick),
+                }
+        except Exception as e:
+            logger.warning(f"Failed to read agent {getattr(agent, 'id', '?')} into the read model: {e}")
+    return np.array(rows, dtype=AGENT_DTYPE), extras
+
+
+def collect_indicator_history(tracker: Any) -> Dict[str, np.ndarray]:
+    """
+    Copies the tracker's series (ring-buffer views are overwritten by later ticks).
+    Downsampled tiers of an IndicatorHistoryStore are published as "name@stride".
+    """
+    history = getattr(tracker, "history", None)
+    if isinstance(history, IndicatorHistoryStore):
+        series: Dict[str, np.ndarray] = {}
+        for stride, tier in history.tiers.items():
+            suffix = "" if stride == 1 else f"@{stride}"
+            series.update({f"{name}{suffix}": _readonly(column.view().copy()) for name, column in tier.columns.items()})
+        return series
+    metrics = getattr(tracker, "metrics", None)
+    if not isinstance(metrics, Mapping):
+        return {}
+    return {name: _readonly(np.array(values, dtype=np.float64)) for name, values in metrics.items()}
+
+
+class ReadModelPublisher:
+    """
+    Builds and publishes the read model at tick boundaries.
+    `publish` must run on the tick thread between ticks; readers use `latest`,
+    which is swapped in one reference assignment and never mutated afterwards.
+    """
+
+    def __init__(self, simulation: "Simulation", dashboard_service: Optional["DashboardService"] = None,
+                 path: Optional[str] = None, interval: int = 1):
+        self.simulation = simulation
+        self.dashboard_service = dashboard_service
+        self.path = path
+        self.interval = max(1, int(interval))
+        self._latest = ReadModelSnapshot.empty()
+
+    @property
+    def latest(self) -> ReadModelSnapshot:
+        return self._latest
+
+    def publish(self) -> ReadModelSnapshot:
+        state = self.simulation.world_state
+        tick = int(state.time)
+        if self._latest.version and (tick == self._latest.tick or tick % self.interval != 0):
+            return self._latest
+
+        agents, extras = collect_agent_rows(state.agents.values())
+        snapshot = ReadModelSnapshot(
+            version=self._latest.version + 1,
+            tick=tick,
+            agents=_readonly(agents),
+            extras=extras,
+            watchtower=self.dashboard_service.build_snapshot() if self.dashboard_service else None,
+            indicators=collect_indicator_history(state.tracker),
+        )
+        self._latest = snapshot
+        if self.path:
+            self._write(snapshot)
+        return snapshot
+
+    def _write(self, snapshot: ReadModelSnapshot) -> None:
+        staging = f"{self.path}.tmp"
+        with open(staging, "wb") as f:
+            f.write(snapshot.to_bytes())
+        os.replace(staging, self.path)
+
+
+class ReadModelReader:
+    """
+    Serves the latest snapshot written by a ReadModelPublisher, possibly from another process.
+    The file is re-mapped only when a new version has been renamed into place; a mapping
+    of the previous version stays valid for readers still holding it.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._stamp: Optional[Tuple[int, int, int]] = None
+        self._latest = ReadModelSnapshot.empty()
+
+    @property
+    def latest(self) -> ReadModelSnapshot:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return self._latest
+        stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if stamp != self._stamp and st.st_size >= _HEADER.size:
+            with open(self.path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._latest = ReadModelSnapshot.from_buffer(mapped)
+            self._stamp = stamp
+        return self._latest
@@ -0,0 +1,172 @@
+"""
+simulation/orchestration/run_mode.py
+
+Headless fast-forward: tick ranges in which observer work (telemetry harvest,
+scenario verification, snapshot/thought logging, analytics persistence,
+crisis/wealth diagnostics) is suspended or only sampled every N ticks.
+
+Only work with no feedback into the economy is gated. Phase0/Phase6 metrics
+stay on because the tracker, money-supply baseline and circuit breaker they
+feed are read by agents and policy, so economic state evolves identically
+whether fast-forward is on or off.
+"""
+from __future__ import annotations
+import hashlib
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Plain-data state hashed for the institutions beside the agent population
+_MARKET_FIELDS = ("last_traded_prices", "last_prices", "get_daily_volume")
+_BANK_FIELDS = ("base_rate", "get_total_deposits", "get_all_balances")
+_GOVERNMENT_FIELDS = ("total_debt", "income_tax_rate", "corporate_tax_rate", "get_all_balances")
+_CENTRAL_BANK_FIELDS = ("base_rate", "get_all_balances")
+
+
+@dataclass(frozen=True)
+class FastForwardWindowDTO:
+    """A headless tick range. `end_tick` is inclusive; None keeps it open."""
+    start_tick: int
+    end_tick: Optional[int] = None
+    sample_interval: int = 0  # 0 = observers fully suspended; N = observe every N-th tick
+
+    def contains(self, tick: int) -> bool:
+        return tick >= self.start_tick and (self.end_tick is None or tick <= self.end_tick)
+
+
+class RunModeController:
+    """
+    Decides, per tick, whether observers run. Outside every fast-forward
+    window all ticks are observed; inside one only sampled ticks are.
+    """
+
+    def __init__(self, windows: Iterable[FastForwardWindowDTO] = ()):
+        self.windows: List[FastForwardWindowDTO] = list(windows)
+        self.suspended_ticks = 0
+        self._last_counted_tick: Optional[int] = None
+        self._last_flushed: Dict[str, int] = {}  # flush channel -> tick it last flushed at
+
+    @classmethod
+    def from_config(cls, entries: Any) -> "RunModeController":
+        """Builds windows from `simulation.fast_forward` config entries (list of dicts)."""
+        if not isinstance(entries, list):
+            return cls()
+        return cls(
+            FastForwardWindowDTO(
+                start_tick=int(entry.get("start_tick", 0)),
+                end_tick=int(entry["end_tick"]) if entry.get("end_tick") is not None else None,
+                sample_interval=int(entry.get("sample_interval", 0)),
+            )
+            for entry in entries
+            if isinstance(entry, dict)
+        )
+
+    def fast_forward(self, start_tick: int, end_tick: Optional[int] = None,
+                     sample_interval: int = 0) -> FastForwardWindowDTO:
+        window = FastForwardWindowDTO(start_tick, end_tick, sample_interval)
+        self.windows.append(window)
+        return window
+
+    def clear(self) -> None:
+        self.windows.clear()
+
+    def window_at(self, tick: int) -> Optional[FastForwardWindowDTO]:
+        for window in self.windows:
+            if window.contains(tick):
+                return window
+        return None
+
+    def is_headless(self, tick: int) -> bool:
+        return self.window_at(tick) is not None
+
+    def should_observe(self, tick: int) -> bool:
+        window = self.window_at(tick)
+        if window is None:
+            return True
+        observe = window.sample_interval > 0 and tick % window.sample_interval == 0
+        if not observe and self._last_counted_tick != tick:
+            self._last_counted_tick = tick
+            self.suspended_ticks += 1
+        return observe
+
+    def flush_due(self, channel: str, tick: int, interval: int) -> bool:
+        """
+        True if a multiple of `interval` has passed since `channel` last flushed,
+        and records the flush. Call it on observed ticks only: a boundary that
+        fell on a suspended tick is then caught up on the next observed one.
+        """
+        interval = max(1, interval)
+        last = self._last_flushed.setdefault(channel, tick - 1)  # First call: due only on a boundary
+        if tick // interval <= last // interval:
+            return False
+        self._last_flushed[channel] = tick
+        return True
+
+
+def should_observe(world_state: Any, tick: int) -> bool:
+    """True unless `world_state` has a run mode that suspends observers at `tick`."""
+    run_mode = getattr(world_state, "run_mode", None)
+    if not isinstance(run_mode, RunModeController):
+        return True
+    return run_mode.should_observe(tick)
+
+
+def flush_due(world_state: Any, channel: str, tick: int, interval: int) -> bool:
+    """Periodic-flush check that survives sampling; plain `tick % interval` without a run mode."""
+    run_mode = getattr(world_state, "run_mode", None)
+    if not isinstance(run_mode, RunModeController):
+        return tick % max(1, interval) == 0
+    return run_mode.flush_due(channel, tick, interval)
+
+
+def compute_state_hash(world_state: Any) -> str:
+    """
+    Digest of the economic state: clock, id allocation, every registered
+    agent's activity flag, balances and inventory, market prices and volume,
+    and bank, government and central-bank state. Used to check that observer
+    settings do not change how the economy evolves.
+    """
+    digest = hashlib.sha256()
+    digest.update(repr((world_state.time, world_state.next_agent_id)).encode())
+    for agent_id in sorted(world_state.agents, key=str):
+        agent = world_state.agents[agent_id]
+        balances = agent.get_all_balances() if hasattr(agent, "get_all_balances") else {}
+        items = agent.get_all_items() if hasattr(agent, "get_all_items") else {}
+        digest.update(repr((
+            agent_id,
+            type(agent).__name__,
+            bool(getattr(agent, "is_active", True)),
+            sorted(balances.items()),
+            sorted(items.items()),
+        )).encode())
+    markets = getattr(world_state, "markets", None) or {}
+    for market_id in sorted(markets, key=str):
+        digest.update(repr((market_id, _plain_state(markets[market_id], _MARKET_FIELDS))).encode())
+    for name, fields in (("bank", _BANK_FIELDS), ("government", _GOVERNMENT_FIELDS),
+                         ("central_bank", _CENTRAL_BANK_FIELDS)):
+        institution = getattr(world_state, name, None)
+        if institution is not None:
+            digest.update(repr((name, _plain_state(institution, fields))).encode())
+    return digest.hexdigest()
+
+
+def _plain_state(obj: Any, fields: Tuple[str, ...]) -> List[Tuple[str, Any]]:
+    """
+    Values of the named attributes (or zero-argument getters) of `obj`.
+    Anything that is not plain data is skipped, so stand-ins hash stably.
+    """
+    state = []
+    for name in fields:
+        value = getattr(obj, name, None)
+        if callable(value):
+            try:
+                value = value()
+            except TypeError:
+                continue
+        if isinstance(value, dict):
+            if not all(isinstance(v, (int, float, str, bool)) for v in value.values()):
+                continue
+            value = sorted(value.items(), key=lambda item: str(item[0]))
+        elif not isinstance(value, (int, float, str, bool)):
+            continue
+        state.append((name, value))
+    return state
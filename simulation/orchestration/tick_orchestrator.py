@@ -18,6 +18,7 @@ from simulation.orchestration.phases.god_commands import Phase_GodCommands
 from modules.system.api import DEFAULT_CURRENCY
 from modules.government.politics_system import PoliticsSystem
 from modules.system.command_pipeline.api import CommandBatchDTO
+from modules.system.event_bus.api import DeliveryMode
 
 if TYPE_CHECKING:
     from simulation.world_state import WorldState
@@ -96,9 +97,13 @@ class TickOrchestrator:
         sim_state = self._create_simulation_state_dto(injectable_sensory_dto, command_batch)
 
         # 3. Execute all phases in sequence
+        event_bus = getattr(state, "event_bus", None)
         for phase in self.phases:
             sim_state = phase.execute(sim_state)
             self._drain_and_sync_state(sim_state)
+            # Phase boundary: deliver phase-deferred observer events in bulk
+            if event_bus is not None and hasattr(event_bus, "flush"):
+                event_bus.flush(DeliveryMode.PHASE)
 
         # 4. Final persistence and cleanup
         self._finalize_tick(sim_state)
@@ -177,6 +182,11 @@ class TickOrchestrator:
     def _finalize_tick(self, sim_state: SimulationState):
         state = self.world_state
 
+        # Tick end: deliver all remaining deferred events
+        event_bus = getattr(state, "event_bus", None)
+        if event_bus is not None and hasattr(event_bus, "flush"):
+            event_bus.flush(DeliveryMode.TICK)
+
         # TD-160: Clear world_state transactions to prevent memory leak
         state.transactions.clear()
 
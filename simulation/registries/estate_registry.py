@@ -5,6 +5,7 @@ import logging
 from modules.simulation.api import AgentID, IAgent
 from modules.system.constants import ID_PUBLIC_MANAGER, ID_GOVERNMENT
 from modules.finance.api import IFinancialEntity, IFinancialAgent
+from simulation.registries.residency_manager import AgentResidencyManager, AgentStubDTO, ResidentAgentMap
 
 if TYPE_CHECKING:
     from modules.finance.api import ISettlementSystem
@@ -18,8 +19,10 @@ class EstateRegistry:
     Maintains a record of agents removed from the active AgentRegistry to allow
     final financial settlements (escheatment, tax, dividends) to complete.
     """
-    def __init__(self) -> None:
-        self._estate: Dict[AgentID, IAgent] = {}
+    def __init__(self, residency: Optional[AgentResidencyManager] = None) -> None:
+        # Estate members live in the residency manager; long-settled ones go to its cold store.
+        self.residency = residency if residency is not None else AgentResidencyManager()
+        self._estate: ResidentAgentMap = ResidentAgentMap(self.residency)
 
     def add_to_estate(self, agent: IAgent) -> None:
         """Moves an agent to the estate registry."""
@@ -27,6 +30,10 @@ class EstateRegistry:
              self._estate[agent.id] = agent
              logger.info(f"ESTATE: Agent {agent.id} added to Estate Registry.")
 
+    def __contains__(self, agent_id: Any) -> bool:
+        """Membership without rehydrating a cold agent."""
+        return agent_id in self._estate
+
     def get_agent(self, agent_id: Any) -> Optional[IAgent]:
         """Retrieves an agent from the estate."""
         # Handle int/str conversion if necessary, similar to AgentRegistry
@@ -46,9 +53,15 @@ class EstateRegistry:
         return None
 
     def get_all_estate_agents(self) -> List[IAgent]:
-        """Returns all agents currently in the estate."""
+        """Returns all agents currently in the estate. Rehydrates cold members; prefer the resident/cold split."""
         return list(self._estate.values())
 
+    def get_resident_estate_agents(self) -> List[IAgent]:
+        return self._estate.resident_values()
+
+    def get_cold_estate_stubs(self) -> List[AgentStubDTO]:
+        return self._estate.cold_stubs()
+
     def process_estate_distribution(self, agent: IAgent, settlement_system: 'ISettlementSystem', tick: int = 0) -> List[Transaction]:
         """
         Distributes assets of the dead agent.
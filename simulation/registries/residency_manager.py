@@ -0,0 +1,462 @@
+"""
+simulation/registries/residency_manager.py
+
+Residency management for dormant and deceased agents.
+
+Dead and inactive agents are kept for estate settlement, inheritance and
+inspection, but are rarely read. The residency manager holds them as live
+objects while they are still in use and, once they have been dormant for
+`cold_after_ticks`, serializes them into a compressed cold store, leaving a
+light AgentStubDTO behind. Reading a cold agent through the manager (or one of
+its ResidentAgentMap views) rehydrates it transparently.
+
+Only agents that nothing outside the manager still references are evicted, so
+rehydration never produces a second copy of an object someone else holds.
+References from a cold agent to the rest of the world (other agents, shared
+world services, wallets) are stored as references and re-linked on
+rehydration rather than copied.
+"""
+from __future__ import annotations
+from collections.abc import MutableMapping
+from dataclasses import dataclass, field
+from enum import Enum
+from types import BuiltinFunctionType, FunctionType, ModuleType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import gc
+import importlib
+import io
+import logging
+import pickle
+import sys
+import zlib
+
+from modules.finance.wallet.wallet import Wallet
+from modules.simulation.api import AgentID
+from modules.system.api import DEFAULT_CURRENCY, CurrencyCode
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COLD_AFTER_TICKS = 50
+DEFAULT_SWEEP_INTERVAL = 10
+# Blobs above this size usually mean a shared world object was reached by value; such agents stay resident.
+DEFAULT_MAX_BLOB_BYTES = 4 * 1024 * 1024
+
+# Objects that keep their identity while their agent is cold (shared with live agents, e.g. joint wallets)
+_ANCHORED_TYPES: Tuple[type, ...] = (Wallet,)
+# Never owned by an agent: not walked when sizing, always pickled by reference
+_GLOBAL_TYPES: Tuple[type, ...] = (type, ModuleType, FunctionType, BuiltinFunctionType, Enum)
+
+
+@dataclass(frozen=True)
+class AgentStubDTO:
+    """What stays resident for a cold agent: identity, lineage and final balances."""
+    id: AgentID
+    agent_type: str
+    is_active: bool
+    generation: int = 0
+    parent_id: Optional[AgentID] = None
+    children_ids: Tuple[AgentID, ...] = ()
+    final_balances: Dict[CurrencyCode, int] = field(default_factory=dict)
+    wallet: Optional[Any] = None  # Household wallet (may be shared with a live spouse)
+    evicted_tick: int = 0
+    blob_bytes: int = 0
+    resident_bytes: int = 0
+
+
+@dataclass(frozen=True)
+class ResidencyStatsDTO:
+    live_count: int
+    cold_count: int
+    pinned_count: int
+    cold_store_bytes: int
+    memory_saved_bytes: int
+    evictions: int
+    rehydrations: int
+    referenced_count: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "live_count": self.live_count,
+            "cold_count": self.cold_count,
+            "pinned_count": self.pinned_count,
+            "cold_store_bytes": self.cold_store_bytes,
+            "memory_saved_bytes": self.memory_saved_bytes,
+            "evictions": self.evictions,
+            "rehydrations": self.rehydrations,
+            "referenced_count": self.referenced_count,
+        }
+
+
+@dataclass
+class _ColdRecord:
+    blob: bytes
+    anchors: Dict[int, Any]
+    stub: AgentStubDTO
+
+
+class _ColdPickler(pickle.Pickler):
+    def __init__(self, file: io.BytesIO, manager: "AgentResidencyManager", root: Any, anchors: Dict[int, Any]):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._manager = manager
+        self._root = root
+        self._anchors = anchors
+
+    def persistent_id(self, obj: Any) -> Optional[Tuple[str, Any]]:
+        key = self._manager._external_key(obj, self._root)
+        if key is not None and key[0] == "anchor":
+            self._anchors[key[1]] = obj
+        return key
+
+
+class _ColdUnpickler(pickle.Unpickler):
+    def __init__(self, file: io.BytesIO, manager: "AgentResidencyManager", anchors: Dict[int, Any]):
+        super().__init__(file)
+        self._manager = manager
+        self._anchors = anchors
+
+    def persistent_load(self, pid: Tuple[str, Any]) -> Any:
+        kind, key = pid
+        if kind == "anchor":
+            return self._anchors[key]
+        if kind == "shared":
+            return self._manager._shared_by_key[key]
+        if kind == "module":
+            return importlib.import_module(key)
+        if kind == "agent":
+            return self._manager._resolve_agent(key)
+        raise pickle.UnpicklingError(f"Unknown persistent id {pid!r}")
+
+
+class AgentResidencyManager:
+    """
+    Owns dormant/deceased agent objects and moves long-dormant ones to a cold store.
+
+    `admit` hands an agent to the manager, `get` returns it (rehydrating if cold),
+    and `sweep` evicts agents not accessed for `cold_after_ticks`. World services
+    referenced by agents must be registered with `share` (or `share_world`) so
+    they are linked, not copied; other agents are resolved through `agent_lookup`.
+    """
+
+    def __init__(self, cold_after_ticks: int = DEFAULT_COLD_AFTER_TICKS,
+                 sweep_interval: int = DEFAULT_SWEEP_INTERVAL,
+                 max_blob_bytes: int = DEFAULT_MAX_BLOB_BYTES,
+                 agent_lookup: Optional[Callable[[AgentID], Any]] = None):
+        self.cold_after_ticks = cold_after_ticks
+        self.sweep_interval = max(1, sweep_interval)
+        self.max_blob_bytes = max_blob_bytes
+        self.agent_lookup = agent_lookup
+
+        self._resident: Dict[AgentID, Any] = {}
+        self._last_access: Dict[AgentID, int] = {}
+        self._cold: Dict[AgentID, _ColdRecord] = {}
+        self._pinned: Dict[AgentID, str] = {}  # agent id -> reason it cannot be evicted
+        self._referenced: Dict[AgentID, int] = {}  # agent id -> refcount when last found referenced from outside
+        self._holders: Dict[AgentID, int] = {}  # agent id -> number of ResidentAgentMap views listing it
+        self._shared: Dict[int, str] = {}
+        self._shared_by_key: Dict[str, Any] = {}
+        self._tick = 0
+
+        self.evictions = 0
+        self.rehydrations = 0
+
+    # --- Shared world objects ---
+
+    def share(self, obj: Any, key: str) -> None:
+        """Registers a world object that cold agents reference but never own."""
+        if obj is None:
+            return
+        self._shared[id(obj)] = key
+        self._shared_by_key[key] = obj
+
+    def share_world(self, world_state: Any) -> None:
+        """Shares every service and collection hanging off the world state."""
+        self.share(world_state, "world")
+        for name, value in vars(world_state).items():
+            if value is None or isinstance(value, (int, float, str, bool)):
+                continue
+            self.share(value, f"world.{name}")
+            if isinstance(value, dict):
+                for k, v in value.items():
+                    if not hasattr(v, "is_active"):  # agents are resolved by id instead
+                        self.share(v, f"world.{name}[{k!r}]")
+
+    # --- Residency ---
+
+    def admit(self, agent: Any) -> None:
+        """Takes `agent` under management (resident); it becomes eligible for eviction once dormant."""
+        agent_id = agent.id
+        self._cold.pop(agent_id, None)
+        self._referenced.pop(agent_id, None)
+        self._resident[agent_id] = agent
+        self._last_access[agent_id] = self._tick
+
+    def discard(self, agent_id: AgentID) -> None:
+        self._resident.pop(agent_id, None)
+        self._cold.pop(agent_id, None)
+        self._last_access.pop(agent_id, None)
+        self._pinned.pop(agent_id, None)
+        self._referenced.pop(agent_id, None)
+        self._holders.pop(agent_id, None)
+
+    def retain(self, agent: Any) -> None:
+        """Admits `agent` on behalf of a view; it stays managed until every view has released it."""
+        if self._resident.get(agent.id) is not agent:
+            self.admit(agent)
+        self._holders[agent.id] = self._holders.get(agent.id, 0) + 1
+
+    def release(self, agent_id: AgentID) -> None:
+        """Drops one view's hold on `agent_id`, discarding it once no view lists it."""
+        remaining = self._holders.get(agent_id, 0) - 1
+        if remaining > 0:
+            self._holders[agent_id] = remaining
+        else:
+            self.discard(agent_id)
+
+    def __contains__(self, agent_id: Any) -> bool:
+        return agent_id in self._resident or agent_id in self._cold
+
+    def __len__(self) -> int:
+        return len(self._resident) + len(self._cold)
+
+    def is_cold(self, agent_id: AgentID) -> bool:
+        return agent_id in self._cold
+
+    def get(self, agent_id: AgentID) -> Optional[Any]:
+        """The agent object, rehydrated from the cold store if needed."""
+        agent = self._resident.get(agent_id)
+        if agent is None:
+            if agent_id not in self._cold:
+                return None
+            agent = self._rehydrate(agent_id)
+        self._last_access[agent_id] = self._tick
+        return agent
+
+    def get_stub(self, agent_id: AgentID) -> Optional[AgentStubDTO]:
+        record = self._cold.get(agent_id)
+        return record.stub if record else None
+
+    def resident_agents(self) -> List[Any]:
+        return list(self._resident.values())
+
+    def cold_stubs(self) -> List[AgentStubDTO]:
+        return [record.stub for record in self._cold.values()]
+
+    # --- Eviction ---
+
+    def sweep(self, tick: int) -> int:
+        """Advances the clock and, every `sweep_interval` ticks, evicts dormant agents. Returns evictions."""
+        self._tick = tick
+        if tick % self.sweep_interval != 0:
+            return 0
+        cutoff = tick - self.cold_after_ticks
+        dormant = [
+            agent_id for agent_id in self._resident
+            if self._last_access.get(agent_id, tick) <= cutoff and agent_id not in self._pinned
+        ]
+        return sum(1 for agent_id in dormant if self.evict(agent_id))
+
+    def evict(self, agent_id: AgentID) -> bool:
+        """Moves a resident agent to the cold store. Returns False if it has to stay resident."""
+        agent = self._resident.get(agent_id)
+        if agent is None:
+            return False
+
+        # References held here: _resident, the local name and getrefcount's argument
+        refcount = sys.getrefcount(agent)
+        if self._referenced.get(agent_id) == refcount:
+            return False  # Nothing let go of it since the last attempt; skip the graph walk
+        resident_bytes, internal_refs = self._measure(agent)
+        if refcount - internal_refs > 3:
+            self._referenced[agent_id] = refcount
+            return False  # Still referenced from outside; a cold copy would diverge from it
+        self._referenced.pop(agent_id, None)
+
+        anchors: Dict[int, Any] = {}
+        buffer = io.BytesIO()
+        try:
+            _ColdPickler(buffer, self, agent, anchors).dump(agent)
+        except Exception as e:  # Unpicklable members (locks, sockets, local callables)
+            self._pinned[agent_id] = f"{type(e).__name__}: {e}"
+            logger.debug(f"RESIDENCY | Agent {agent_id} pinned resident: {self._pinned[agent_id]}")
+            return False
+        if buffer.tell() > self.max_blob_bytes:
+            self._pinned[agent_id] = f"blob of {buffer.tell()} bytes exceeds {self.max_blob_bytes}"
+            return False
+
+        blob = zlib.compress(buffer.getvalue())
+        stub = self._build_stub(agent, len(blob), resident_bytes)
+        self._cold[agent_id] = _ColdRecord(blob=blob, anchors=anchors, stub=stub)
+        del self._resident[agent_id]
+        self.evictions += 1
+        return True
+
+    def _rehydrate(self, agent_id: AgentID) -> Any:
+        record = self._cold.pop(agent_id)
+        try:
+            agent = _ColdUnpickler(io.BytesIO(zlib.decompress(record.blob)), self, record.anchors).load()
+        except Exception:
+            self._cold[agent_id] = record
+            raise
+        self._resident[agent_id] = agent
+        self.rehydrations += 1
+        return agent
+
+    def _resolve_agent(self, agent_id: AgentID) -> Any:
+        if agent_id in self:
+            return self.get(agent_id)
+        return self.agent_lookup(agent_id) if self.agent_lookup else None
+
+    def _external_key(self, obj: Any, root: Any) -> Optional[Tuple[str, Any]]:
+        """Persistent id for objects that belong to the world rather than to `root`."""
+        if obj is root:
+            return None
+        shared = self._shared.get(id(obj))
+        if shared is not None:
+            return ("shared", shared)
+        if isinstance(obj, ModuleType):
+            return ("module", obj.__name__)
+        if isinstance(obj, _ANCHORED_TYPES):
+            return ("anchor", id(obj))
+        agent_id = _agent_id_of(obj)
+        if agent_id is not None:
+            if self._resident.get(agent_id) is obj:
+                return ("agent", agent_id)
+            if self.agent_lookup is not None and self.agent_lookup(agent_id) is obj:
+                return ("agent", agent_id)
+        return None
+
+    def _measure(self, root: Any) -> Tuple[int, int]:
+        """
+        (approximate bytes owned by `root`, references to `root` from inside its own graph).
+        Walks the object graph, stopping at anything the pickler stores by reference.
+        """
+        seen = {id(root)}
+        stack = [root]
+        total = 0
+        internal_refs = 0
+        while stack:
+            obj = stack.pop()
+            total += sys.getsizeof(obj, 0)
+            for child in gc.get_referents(obj):
+                if child is root:
+                    internal_refs += 1
+                    continue
+                if id(child) in seen or isinstance(child, _GLOBAL_TYPES):
+                    continue
+                seen.add(id(child))
+                if self._external_key(child, root) is not None:
+                    continue
+                stack.append(child)
+        return total, internal_refs
+
+    def _build_stub(self, agent: Any, blob_bytes: int, resident_bytes: int) -> AgentStubDTO:
+        balances: Dict[CurrencyCode, int] = {}
+        if hasattr(agent, "get_assets_by_currency"):
+            balances = dict(agent.get_assets_by_currency())
+        elif hasattr(agent, "balance_pennies"):
+            balances = {DEFAULT_CURRENCY: agent.balance_pennies}
+        econ_state = getattr(agent, "_econ_state", None)
+        return AgentStubDTO(
+            id=agent.id,
+            agent_type=type(agent).__name__,
+            is_active=bool(getattr(agent, "is_active", False)),
+            generation=getattr(agent, "generation", 0) or 0,
+            parent_id=getattr(agent, "parent_id", None),
+            children_ids=tuple(getattr(agent, "children_ids", ()) or ()),
+            final_balances=balances,
+            wallet=getattr(econ_state, "wallet", None),
+            evicted_tick=self._tick,
+            blob_bytes=blob_bytes,
+            resident_bytes=resident_bytes,
+        )
+
+    # --- Reporting ---
+
+    def stats(self) -> ResidencyStatsDTO:
+        cold_store_bytes = sum(len(r.blob) for r in self._cold.values())
+        saved = sum(r.stub.resident_bytes - r.stub.blob_bytes for r in self._cold.values())
+        return ResidencyStatsDTO(
+            live_count=len(self._resident),
+            cold_count=len(self._cold),
+            pinned_count=len(self._pinned),
+            referenced_count=len(self._referenced),
+            cold_store_bytes=cold_store_bytes,
+            memory_saved_bytes=max(0, saved),
+            evictions=self.evictions,
+            rehydrations=self.rehydrations,
+        )
+
+
+def _agent_id_of(obj: Any) -> Optional[int]:
+    # Only plain instances with an integer id can be agents
+    try:
+        agent_id = obj.__dict__.get("id") if hasattr(obj, "__dict__") and isinstance(obj.__dict__, dict) else None
+    except Exception:
+        return None
+    return agent_id if isinstance(agent_id, int) and not isinstance(agent_id, bool) else None
+
+
+class ResidentAgentMap(MutableMapping):
+    """
+    Dict-like view (agent id -> agent) over a residency manager.
+    Several views can share one manager, so an agent that is both inactive and in
+    the estate is stored once. Reading a cold entry rehydrates it; deleting an entry
+    releases it, and the manager drops the agent once no view lists it.
+    """
+
+    def __init__(self, manager: AgentResidencyManager, data: Optional[Dict[AgentID, Any]] = None):
+        self.manager = manager
+        self._ids: Dict[AgentID, None] = {}
+        if data:
+            self.update(data)
+
+    def __getitem__(self, agent_id: AgentID) -> Any:
+        if agent_id not in self._ids:
+            raise KeyError(agent_id)
+        agent = self.manager.get(agent_id)
+        if agent is None:
+            raise KeyError(agent_id)
+        return agent
+
+    def __setitem__(self, agent_id: AgentID, agent: Any) -> None:
+        if agent_id not in self._ids:
+            self._ids[agent_id] = None
+            self.manager.retain(agent)
+        elif self.manager._resident.get(agent_id) is not agent:
+            self.manager.admit(agent)
+
+    def __delitem__(self, agent_id: AgentID) -> None:
+        del self._ids[agent_id]
+        self.manager.release(agent_id)
+
+    def __contains__(self, agent_id: Any) -> bool:
+        return agent_id in self._ids
+
+    def __iter__(self) -> Iterator[AgentID]:
+        return iter(list(self._ids))
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def update(self, other: Any = (), **kwargs: Any) -> None:
+        if other is self:
+            return  # Merging a view into itself would rehydrate every cold entry
+        super().update(other, **kwargs)
+
+    def clear(self) -> None:
+        for agent_id in self._ids:
+            self.manager.release(agent_id)
+        self._ids.clear()
+
+    def get_stub(self, agent_id: AgentID) -> Optional[AgentStubDTO]:
+        return self.manager.get_stub(agent_id) if agent_id in self._ids else None
+
+    def resident_values(self) -> List[Any]:
+        resident = self.manager._resident
+        return [resident[i] for i in self._ids if i in resident]
+
+    def cold_stubs(self) -> List[AgentStubDTO]:
+        return [stub for stub in (self.manager.get_stub(i) for i in self._ids) if stub is not None]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self._ids)} agents)"
@@ -3,16 +3,39 @@ Implements the CommerceSystem which orchestrates consumption, purchases, and lei
 """
 from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 import logging
+
+import numpy as np
+
 import simulation
 from simulation.systems.api import ICommerceSystem, CommerceContext
 from simulation.models import Transaction
 from modules.system.api import DEFAULT_CURRENCY
+from simulation.constants import SYSTEM_MARKET_MAKER_ID
 
 if TYPE_CHECKING:
     from simulation.dtos.scenario import StressScenarioConfig
 
 logger = logging.getLogger(__name__)
 
+
+def _padded_column(values: Any, n: int) -> np.ndarray:
+    """Planner output as a float column of length n (missing tail entries are 0)."""
+    column = np.zeros(n, dtype=np.float64)
+    m = min(n, len(values))
+    if m:
+        column[:m] = np.asarray(values[:m], dtype=np.float64)
+    return column
+
+
+def _household_cash(household: Any) -> float:
+    assets = household._econ_state.assets
+    return assets.get(DEFAULT_CURRENCY, 0.0) if isinstance(assets, dict) else float(assets)
+
+
+def _cash_column(households: List[Any], indices: np.ndarray) -> np.ndarray:
+    return np.array([_household_cash(households[i]) for i in indices.tolist()], dtype=np.float64)
+
+
 class CommerceSystem(ICommerceSystem):
     """
     Orchestrates the consumption and leisure phase of the tick.
@@ -28,154 +51,150 @@ class CommerceSystem(ICommerceSystem):
         Phase 1: Decisions.
         Determines desired consumption and generates transactions for Fast Purchase.
         Returns (PlannedConsumptionMap, Transactions).
+        Scenario adjustments, affordability and emergency-buy quantities are
+        evaluated as array operations; emergency buys are emitted as one
+        contiguous batch in household order.
         """
         households = context["households"]
         breeding_planner = context["breeding_planner"]
         market_data = context["market_data"]
         current_time = context["time"]
 
-        planned_consumptions = {}
-        transactions = []
+        planned_consumptions: Dict[int, Dict[str, Any]] = {}
+        n = len(households)
+        if n == 0:
+            return planned_consumptions, []
 
         # 1. Vectorized Decision Making
         batch_decisions = breeding_planner.decide_consumption_batch(households, market_data)
 
-        consume_list = batch_decisions.get('consume', [0] * len(households))
-        buy_list = batch_decisions.get('buy', [0] * len(households))
+        consume_list = batch_decisions.get('consume', [0] * n)
+        buy_list = batch_decisions.get('buy', [0] * n)
         food_price = batch_decisions.get('price', 5.0)
-
-        for i, household in enumerate(households):
-            if not household._bio_state.is_active:
-                continue
-
-            c_amt = 0.0
-            if i < len(consume_list):
-                c_amt = consume_list[i]
-                # Phase 28: Deflationary Spiral - Consumption Collapse
-                if scenario_config and scenario_config.is_active and scenario_config.scenario_name == 'deflation':
-                    if not household._econ_state.is_employed and scenario_config.consumption_pessimism_factor > 0:
-                        original_amt = c_amt
-                        c_amt *= (1 - scenario_config.consumption_pessimism_factor)
-                        logger.debug(f"PESSIMISM_IMPACT | Household {household.id} consumption reduced from {original_amt:.2f} to {c_amt:.2f}")
-
-            # Store plan
-            planned_consumptions[household.id] = {
-                "consume_amount": c_amt,
+        tax_rate = context.get('sales_tax_rate', 0.05)
+
+        active = np.fromiter((bool(h._bio_state.is_active) for h in households), dtype=bool, count=n)
+        consume = _padded_column(consume_list, n)
+        buy = _padded_column(buy_list, n)
+
+        # Phase 28: Deflationary Spiral - Consumption Collapse
+        if scenario_config and scenario_config.is_active and scenario_config.scenario_name == 'deflation':
+            if scenario_config.consumption_pessimism_factor > 0:
+                unemployed = np.fromiter(
+                    (not h._econ_state.is_employed for h in households), dtype=bool, count=n
+                ) & active
+                consume[unemployed] *= (1 - scenario_config.consumption_pessimism_factor)
+                logger.debug(f"PESSIMISM_IMPACT | Consumption reduced for {int(unemployed.sum())} unemployed households")
+
+        # Store plan
+        consume_amounts = consume.tolist()
+        for i in np.flatnonzero(active).tolist():
+            planned_consumptions[households[i].id] = {
+                "consume_amount": consume_amounts[i],
                 "buy_amount": 0.0,
                 "consumed_immediately_from_buy": 0.0
             }
 
-            # ThoughtStream: Instrument non-consumption
-            survival_need = household._bio_state.needs.get("survival", 0.0)
-            threshold = getattr(breeding_planner, "survival_threshold", 50.0)
+        # ThoughtStream: Instrument non-consumption
+        if simulation.logger:
+            self._log_rejected_consumption(
+                households, active & (consume <= 0), breeding_planner, batch_decisions, tax_rate, current_time
+            )
+
+        # 2b. Fast Purchase (Emergency Buy) -> Generate Transactions
+        buyers = np.flatnonzero(active & (buy > 0))
+        if len(buyers) == 0:
+            return planned_consumptions, []
+
+        # WO-053: Disable Emergency Buy for Industrial Revolution to force market clearing
+        is_phase23 = scenario_config and scenario_config.scenario_name == 'phase23_industrial_rev' and scenario_config.is_active
+
+        if is_phase23:
+            # WO-053: Force market interaction via OrderBook
+            # Bid at reference price to ensure survival and volume, relying on Glut to drive price down
+            price = market_data.get("basic_food_current_sell_price", 5.0)
+            seller_id = SYSTEM_MARKET_MAKER_ID
+            market_id = "basic_food"
+            tx_type = "PHASE23_MARKET_ORDER"
+        else:
+            # Legacy Emergency Buy: affordability against cash, tax included (TD-231)
+            cash = _cash_column(households, buyers)
+            cost = buy[buyers] * food_price * (1 + tax_rate)
+            buyers = buyers[cash >= cost]
+            price = food_price
+            government = context.get("government")
+            seller_id = government.id if government else SYSTEM_MARKET_MAKER_ID
+            market_id = "system"
+            tx_type = "emergency_buy"
+
+        quantities = buy[buyers].tolist()
+        # np.rint rounds half to even, as round_to_pennies does
+        totals = np.rint(price * buy[buyers] * 100).astype(np.int64).tolist()
+
+        transactions: List[Transaction] = []
+        for i, quantity, total_pennies in zip(buyers.tolist(), quantities, totals):
+            household_id = households[i].id
+            planned_consumptions[household_id]["buy_amount"] = quantity
+            transactions.append(Transaction(
+                buyer_id=household_id,
+                seller_id=seller_id,
+                item_id="basic_food",
+                quantity=quantity,
+                price=price,
+                total_pennies=total_pennies,
+                market_id=market_id,
+                transaction_type=tx_type,
+                time=current_time
+            ))
+
+        logger.debug(
+            f"VECTOR_BUY_PLAN | {len(transactions)} households planning fast-track food purchases",
+            extra={"tags": ["consumption", "vector_buy"]}
+        )
+
+        return planned_consumptions, transactions
+
+    def _log_rejected_consumption(self, households: List[Any], not_consuming: np.ndarray, breeding_planner: Any,
+                                  batch_decisions: Dict[str, Any], tax_rate: float, current_time: int) -> None:
+        """Logs a REJECT thought for each household that starves despite an urgent survival need."""
+        threshold = getattr(breeding_planner, "survival_threshold", 50.0)
+        default_price = getattr(self.config, 'DEFAULT_FALLBACK_PRICE', 5.0)
+        price = batch_decisions.get('price', default_price)
+        price_with_tax = price * (1 + tax_rate)
 
+        for i in np.flatnonzero(not_consuming).tolist():
+            household = households[i]
+            survival_need = household._bio_state.needs.get("survival", 0.0)
             try:
                 survival_val = float(survival_need)
             except (TypeError, ValueError):
                 survival_val = 0.0
+            if survival_val <= threshold:
+                continue
 
-            if c_amt <= 0 and survival_val > threshold:
-                reason = "UNKNOWN"
-                context_data = {}
-
-                food_inventory = household.get_quantity("basic_food")
-                if food_inventory <= 0:
-                    # Stock Out. Could we afford it?
-                    default_price = getattr(self.config, 'DEFAULT_FALLBACK_PRICE', 5.0)
-                    price = batch_decisions.get('price', default_price)
-
-                    # TD-231: Account for Sales Tax in affordability check
-                    tax_rate = context.get('sales_tax_rate', 0.05)
-                    price_with_tax = price * (1 + tax_rate)
-
-                    assets = household._econ_state.assets
-                    cash = assets.get(DEFAULT_CURRENCY, 0.0) if isinstance(assets, dict) else float(assets)
-
-                    if cash < price_with_tax:
-                        reason = "INSOLVENT"
-                        context_data = {"cash": cash, "price": price, "price_with_tax": price_with_tax, "need": survival_need}
-                    else:
-                        reason = "STOCK_OUT"
-                        context_data = {"inventory": household._econ_state.inventory.copy(), "cash": cash}
+            context_data: Any = {}
+            if household.get_quantity("basic_food") <= 0:
+                # Stock Out. Could we afford it?
+                cash = _household_cash(household)
+                if cash < price_with_tax:
+                    reason = "INSOLVENT"
+                    context_data = {"cash": cash, "price": price, "price_with_tax": price_with_tax, "need": survival_need}
                 else:
-                     reason = "UTILITY_CONSTRAINT"
-
-                if simulation.logger:
-                    simulation.logger.log_thought(
-                        tick=current_time,
-                        agent_id=str(household.id),
-                        action="CONSUME_FOOD",
-                        decision="REJECT",
-                        reason=reason,
-                        context=context_data
-                    )
-
-            # 2b. Fast Purchase (Emergency Buy) -> Generate Transaction
-            # WO-053: Disable Emergency Buy for Industrial Revolution to force market clearing
-            is_phase23 = scenario_config and scenario_config.scenario_name == 'phase23_industrial_rev' and scenario_config.is_active
-
-            if i < len(buy_list):
-                b_amt = buy_list[i]
-                if b_amt > 0:
-                    if is_phase23:
-                        # WO-053: Force market interaction via OrderBook
-                        ref_price = market_data.get("basic_food_current_sell_price", 5.0)
-                        # Bid at reference price to ensure survival and volume, relying on Glut to drive price down
-                        bid_price = ref_price
-
-                        # Use a proper constant for the system seller ID
-                        from simulation.constants import SYSTEM_MARKET_MAKER_ID
-                        from modules.finance.utils.currency_math import round_to_pennies
-
-                        total_pennies = round_to_pennies(bid_price * b_amt * 100)
-                        tx = Transaction(
-                            buyer_id=household.id,
-                            seller_id=SYSTEM_MARKET_MAKER_ID,
-                            item_id="basic_food",
-                            quantity=b_amt,
-                            price=bid_price,
-                            total_pennies=total_pennies,
-                            market_id="basic_food",
-                            transaction_type="PHASE23_MARKET_ORDER",
-                            time=current_time
-                        )
-                        transactions.append(tx)
-                        planned_consumptions[household.id]["buy_amount"] = b_amt
-
-                    else:
-                        # Legacy Emergency Buy
-                        tax_rate = context.get('sales_tax_rate', 0.05)
-                        cost = b_amt * food_price * (1 + tax_rate) # TD-231: Include tax
-
-                        assets = household._econ_state.assets
-                        cash = assets.get(DEFAULT_CURRENCY, 0.0) if isinstance(assets, dict) else float(assets)
-
-                        if cash >= cost:
-                            planned_consumptions[household.id]["buy_amount"] = b_amt
-                            government = context.get("government")
-                            seller_id = government.id if government else 999999
-                            from modules.finance.utils.currency_math import round_to_pennies
-
-                            total_pennies = round_to_pennies(food_price * b_amt * 100)
-                            tx = Transaction(
-                                buyer_id=household.id,
-                                seller_id=seller_id,
-                                item_id="basic_food",
-                                quantity=b_amt,
-                                price=food_price,
-                                total_pennies=total_pennies,
-                                market_id="system",
-                                transaction_type="emergency_buy",
-                                time=current_time
-                            )
-                            transactions.append(tx)
-
-                            logger.debug(
-                                f"VECTOR_BUY_PLAN | Household {household.id} planning to buy {b_amt:.1f} food (Fast Track)",
-                                extra={"agent_id": household.id, "tags": ["consumption", "vector_buy"]}
-                            )
-
-        return planned_consumptions, transactions
+                    reason = "STOCK_OUT"
+                    # Built only if the thought is sampled (avoids an inventory copy per household)
+                    inventory = household._econ_state.inventory
+                    context_data = lambda inventory=inventory, cash=cash: {"inventory": inventory.copy(), "cash": cash}
+            else:
+                reason = "UTILITY_CONSTRAINT"
+
+            simulation.logger.log_thought(
+                tick=current_time,
+                agent_id=str(household.id),
+                action="CONSUME_FOOD",
+                decision="REJECT",
+                reason=reason,
+                context=context_data
+            )
 
     def finalize_consumption_and_leisure(self, context: CommerceContext, planned_consumptions: Dict[int, Dict[str, Any]]) -> Dict[int, float]:
         """
@@ -203,15 +222,7 @@ class CommerceSystem(ICommerceSystem):
             # Phase 4.1: Service Consumption (Education)
             # Check for education service in inventory (purchased previously or via budget)
             edu_amt = household.get_quantity("education_service")
-            from unittest.mock import MagicMock
-            try:
-                # If it's a MagicMock, float(edu_amt) returns 1.0. 
-                # We should avoid consuming for unconfigured mocks.
-                is_real_amount = not isinstance(edu_amt, MagicMock) and float(edu_amt) > 0
-            except (TypeError, ValueError):
-                is_real_amount = False
-
-            if is_real_amount:
+            if isinstance(edu_amt, (int, float, np.number)) and edu_amt > 0:
                 # Consume all available education service
                 household.consume("education_service", edu_amt, current_time)
                 consumed_items["education_service"] = edu_amt
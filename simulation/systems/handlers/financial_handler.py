@@ -13,6 +13,7 @@ class FinancialTransactionHandler(ITransactionHandler):
     Handles financial transactions:
     - interest_payment (Expense)
     - dividend (Capital Income)
+    - dividend_distribution (Batched pro-rata dividend, Capital Income)
     - tax (Atomic Payment)
     """
 
@@ -39,6 +40,9 @@ class FinancialTransactionHandler(ITransactionHandler):
                  if hasattr(buyer, "capital_income_this_tick"):
                      buyer.capital_income_this_tick += int(trade_value)
 
+        elif tx_type == "dividend_distribution":
+             success = self._settle_distribution(tx, buyer, context)
+
         elif tx_type == "tax":
             # Atomic Settlement to Government
             # Buyer pays, Seller is typically None or Gov (transaction target).
@@ -88,6 +92,31 @@ class FinancialTransactionHandler(ITransactionHandler):
 
         return success is not None
 
+    def _distribution_legs(self, tx: Transaction, payer: Any, context: TransactionContext,
+                           reverse: bool = False) -> List[Tuple[Any, Any, int, str]]:
+        distribution = tx.metadata.original_metadata["distribution"]
+        memo = f"rollback:dividend:{tx.id}" if reverse else f"dividend:{distribution.firm_id}"
+        legs = []
+        for holder_id, amount in zip(distribution.holder_ids.tolist(), distribution.amounts_pennies.tolist()):
+            holder = context.agents.get(holder_id) or context.inactive_agents.get(holder_id)
+            legs.append((holder, payer, amount, memo) if reverse else (payer, holder, amount, memo))
+        return legs
+
+    def _settle_distribution(self, tx: Transaction, firm: Any, context: TransactionContext) -> bool:
+        """
+        Pays a summarized pro-rata dividend (DividendDistributionDTO) in one bulk
+        settlement pass. Legs settle independently, as individual dividends did;
+        unresolvable holders are skipped.
+        """
+        legs = self._distribution_legs(tx, firm, context)
+        results = context.settlement_system.execute_bulk_transfers(legs, context.time, currency=tx.currency)
+
+        for (_, holder, amount, _), result in zip(legs, results):
+            if result is not None and isinstance(holder, Household) and hasattr(holder, "capital_income_this_tick"):
+                # Household capital income tracking
+                holder.capital_income_this_tick += amount
+        return any(result is not None for result in results)
+
     def rollback(self, tx: Transaction, context: TransactionContext) -> bool:
         """
         Reverses financial transactions by transferring funds back.
@@ -98,6 +127,12 @@ class FinancialTransactionHandler(ITransactionHandler):
         # Determine original Source (Buyer) and Destination (Seller/Gov)
         # Rollback: Destination pays Source
 
+        if tx_type == "dividend_distribution":
+            firm = context.agents.get(tx.buyer_id) or context.inactive_agents.get(tx.buyer_id)
+            legs = [leg for leg in self._distribution_legs(tx, firm, context, reverse=True) if leg[0] is not None]
+            results = context.settlement_system.execute_bulk_transfers(legs, context.time, currency=tx.currency)
+            return all(result is not None for result in results)
+
         source = context.agents.get(tx.buyer_id) or context.inactive_agents.get(tx.buyer_id)
         destination = context.agents.get(tx.seller_id) or context.inactive_agents.get(tx.seller_id)
 
@@ -1,8 +1,9 @@
 from __future__ import annotations
 import logging
-from typing import TYPE_CHECKING, Any, List, Optional, Dict, cast, Union
+from typing import TYPE_CHECKING, Any, List, Optional, Dict, Tuple, cast, Union
 from uuid import uuid4, UUID
 from dataclasses import asdict, is_dataclass
+import numpy as np
 
 from simulation.models import Order
 from modules.market.housing_planner_api import HousingDecisionDTO as HousingPurchaseDecisionDTO
@@ -129,48 +130,84 @@ class HousingSystem:
         if context.government:
             government = context.government
 
-        # Maintenance Costs
-        for unit in context.real_estate_units:
+        # Maintenance Costs & Rent Collection (Batched)
+        transfers, evictions = self._build_housing_settlement_batch(context, settlement, government)
+
+        if transfers and settlement:
+            settlement.execute_bulk_transfers(transfers, tick=context.tick, currency=DEFAULT_CURRENCY)
+
+        for unit, tenant in evictions:
+            logger.info(f'EVICTION | Household {tenant.id} evicted from Unit {unit.id} due to non-payment.', extra={'agent_id': tenant.id, 'unit_id': unit.id})
+            unit.occupant_id = None
+            if isinstance(tenant, IResident):
+                tenant.residing_property_id = None
+                tenant.is_homeless = True
+
+    def _build_housing_settlement_batch(
+        self,
+        context: HousingContextDTO,
+        settlement: Optional[ISettlementSystem],
+        government: Optional[IFinancialAgent]
+    ) -> Tuple[List[Tuple[IFinancialAgent, IFinancialAgent, int, str]], List[Tuple[Any, Any]]]:
+        """
+        Builds the tick's maintenance and rent obligations as one settlement batch.
+        Affordability is screened in a single ordered pass against opening balances
+        plus the batch's own pending deltas, so the resulting legs and evictions are
+        identical to settling unit by unit.
+        Returns (transfers, evictions) where evictions are (unit, tenant) pairs.
+        """
+        units = context.real_estate_units
+        transfers: List[Tuple[IFinancialAgent, IFinancialAgent, int, str]] = []
+        evictions: List[Tuple[Any, Any]] = []
+        if not units:
+            return transfers, evictions
+
+        maintenance_costs = np.array(
+            [unit.estimated_value for unit in units], dtype=np.float64
+        ) * self.config.MAINTENANCE_RATE_PER_TICK
+
+        registry = context.agent_registry
+        opening: Dict[Any, int] = {}
+        pending: Dict[Any, int] = {}
+
+        def available(agent: IFinancialAgent) -> int:
+            if agent.id not in opening:
+                opening[agent.id] = agent.get_balance(DEFAULT_CURRENCY)
+            return opening[agent.id] + pending.get(agent.id, 0)
+
+        def stage(debit: IFinancialAgent, credit: IFinancialAgent, amount: int, memo: str) -> None:
+            transfers.append((debit, credit, amount, memo))
+            pending[debit.id] = pending.get(debit.id, 0) - amount
+            pending[credit.id] = pending.get(credit.id, 0) + amount
+
+        for idx, unit in enumerate(units):
             if unit.owner_id is not None and unit.owner_id != -1:
-                owner = context.agent_registry.get_agent(unit.owner_id)
-                # DEBUG PRINT
-                # print(f"DEBUG: Owner {unit.owner_id}, Exists: {bool(owner)}, IsFinAgent: {isinstance(owner, IFinancialAgent)}")
-
+                owner = registry.get_agent(unit.owner_id)
                 if owner and isinstance(owner, IFinancialAgent):
-                    cost = unit.estimated_value * self.config.MAINTENANCE_RATE_PER_TICK
-
-                    # Protocol Safe Balance Check
-                    owner_assets = owner.get_balance(DEFAULT_CURRENCY)
-
-                    payable = min(cost, owner_assets)
+                    payable = min(float(maintenance_costs[idx]), available(owner))
                     if payable > 0 and settlement and government:
-                        settlement.transfer(owner, government, int(payable), 'housing_maintenance', tick=context.tick, currency=DEFAULT_CURRENCY)
-
-            # Rent Collection
-            if unit.occupant_id is not None and unit.owner_id is not None:
-                if unit.occupant_id == unit.owner_id:
-                    continue
-                tenant = context.agent_registry.get_agent(unit.occupant_id)
-                owner = context.agent_registry.get_agent(unit.owner_id)
-
-                # DEBUG PRINT
-                # print(f"DEBUG: Rent Check. Tenant {unit.occupant_id}: {bool(tenant)} (IsFin: {isinstance(tenant, IFinancialAgent)}). Owner {unit.owner_id}: {bool(owner)} (IsFin: {isinstance(owner, IFinancialAgent)})")
-
-                if tenant and owner and getattr(tenant, 'is_active', True) and getattr(owner, 'is_active', True):
-                    # Check protocols
-                    if isinstance(tenant, IFinancialAgent) and isinstance(owner, IFinancialAgent):
-                        rent = unit.rent_price
-                        tenant_assets = tenant.get_balance(DEFAULT_CURRENCY)
-
-                        if tenant_assets >= rent:
-                            if settlement:
-                                settlement.transfer(tenant, owner, int(rent), 'rent_payment', tick=context.tick, currency=DEFAULT_CURRENCY)
-                        else:
-                            logger.info(f'EVICTION | Household {tenant.id} evicted from Unit {unit.id} due to non-payment.', extra={'agent_id': tenant.id, 'unit_id': unit.id})
-                            unit.occupant_id = None
-                            if isinstance(tenant, IResident):
-                                tenant.residing_property_id = None
-                                tenant.is_homeless = True
+                        stage(owner, government, int(payable), 'housing_maintenance')
+
+            if unit.occupant_id is None or unit.owner_id is None:
+                continue
+            if unit.occupant_id == unit.owner_id:
+                continue
+
+            tenant = registry.get_agent(unit.occupant_id)
+            owner = registry.get_agent(unit.owner_id)
+            if not (tenant and owner and getattr(tenant, 'is_active', True) and getattr(owner, 'is_active', True)):
+                continue
+            if not (isinstance(tenant, IFinancialAgent) and isinstance(owner, IFinancialAgent)):
+                continue
+
+            rent = unit.rent_price
+            if available(tenant) >= rent:
+                if settlement:
+                    stage(tenant, owner, int(rent), 'rent_payment')
+            else:
+                evictions.append((unit, tenant))
+
+        return transfers, evictions
 
     def initiate_purchase(self, decision: HousingPurchaseDecisionDTO, buyer_id: int):
         """
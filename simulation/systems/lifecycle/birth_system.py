@@ -193,3 +193,8 @@ class BirthSystem(IBirthSystem):
 
             if context.ai_training_manager:
                 context.ai_training_manager.agents.append(agent)
+
+            # Social-policy roster (wealth tax / welfare)
+            government = getattr(context, 'government', None)
+            if government and hasattr(government, 'welfare_registry'):
+                government.welfare_registry.register(agent)
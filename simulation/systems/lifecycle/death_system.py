@@ -124,6 +124,10 @@ class DeathSystem(IDeathSystem):
              if self.settlement_system:
                 self.settlement_system.remove_agent_from_all_accounts(household.id)
 
+             # Drop from the social-policy roster
+             if context.primary_government and hasattr(context.primary_government, 'welfare_registry'):
+                 context.primary_government.welfare_registry.unregister(household.id)
+
         # --- Global List Cleanup ---
 
         # O(1) Dictionary Cleanup - TD-SYS-PERF-DEATH
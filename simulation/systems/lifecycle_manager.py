@@ -23,6 +23,7 @@ from modules.hr.service import HRService
 from modules.finance.service import TaxService
 from modules.finance.api import IShareholderRegistry
 from modules.simulation.api import IEstateRegistry
+from simulation.registries.residency_manager import AgentResidencyManager
 
 # New Imports
 from simulation.systems.lifecycle.api import LifecycleConfigDTO, BirthConfigDTO, DeathConfigDTO
@@ -49,11 +50,13 @@ class AgentLifecycleManager(AgentLifecycleManagerInterface):
                  tax_service: Optional[ITaxService] = None,
                  agent_registry: Optional[IAgentRegistry] = None,
                  estate_registry: Optional[IEstateRegistry] = None,
-                 persistence_manager: Optional[Any] = None):
+                 persistence_manager: Optional[Any] = None,
+                 residency_manager: Optional[AgentResidencyManager] = None):
 
         self.config = config_module
         self.logger = logger
         self.persistence_manager = persistence_manager
+        self.residency_manager = residency_manager
 
         # Dependencies for LiquidationManager
         # Prefer injected dependencies, fallback to instantiation for backward compatibility
@@ -178,6 +181,10 @@ class AgentLifecycleManager(AgentLifecycleManagerInterface):
             if not getattr(agent, "is_active", True):
                 del state.agents[agent_id]
 
+        # 5. Residency: long-dormant inactive/estate agents move to the cold store
+        if self.residency_manager:
+            self.residency_manager.sweep(state.time)
+
         return all_transactions
 
 if __name__ == "__main__":
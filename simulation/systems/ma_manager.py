@@ -1,6 +1,7 @@
-from typing import List, Dict, Any, TYPE_CHECKING
+from typing import List, Dict, Any, Set, Tuple, TYPE_CHECKING
 import logging
 import random
+import numpy as np
 from modules.finance.api import IMonetaryAuthority
 from modules.system.api import DEFAULT_CURRENCY
 from modules.finance.utils.currency_math import round_to_pennies
@@ -62,109 +63,133 @@ class MAManager:
         if not firms:
             return
 
-        # Calculate stats for relative thresholds
-        # Refactor: Use finance.balance
-        avg_assets = sum(self._get_balance(f) for f in firms) / len(firms)
-        
-        predators = []
-        preys = []
-        hostile_targets = [] # Phase 21
-        bankrupts = []
-
-        for firm in firms:
-            # Update Valuation first
-            firm.calculate_valuation()
-            
-            # Bankruptcy Criteria
-            # Refactor: Use finance.balance
-            firm_balance = self._get_balance(firm)
-
-            if firm_balance < 0:
-                bankrupts.append(firm)
-                continue
-            
-            # Standard Distress (Friendly M&A)
-            if firm.finance_state.consecutive_loss_turns >= self.bankruptcy_loss_threshold:
-                 preys.append(firm)
-            elif firm_balance < avg_assets * 0.2:
-                preys.append(firm)
-            
-            # Phase 21: Hostile Takeover Criteria
-            # FIXED: Intrinsic value should be in pennies for consistent comparison with market_cap (pennies)
-            intrinsic_value_pennies = firm.finance_state.valuation_pennies
-
-            market_cap_pennies = firm.get_market_cap()
-            threshold = getattr(self.config, "HOSTILE_TAKEOVER_DISCOUNT_THRESHOLD", 0.7)
-
-            if market_cap_pennies < intrinsic_value_pennies * threshold:
-                hostile_targets.append(firm)
-
-            # Predator Criteria
-            if firm_balance > avg_assets * 1.5 and firm.finance_state.current_profit.get(DEFAULT_CURRENCY, 0) > 0:
-                predators.append(firm)
+        predators, preys, hostile_targets, bankrupts, market_caps = self._screen_firms(firms)
 
         # 2. M&A Matching Loop
         random.shuffle(predators)
         
         # --- Hostile Takeover Loop ---
-        hostile_premium = getattr(self.config, "HOSTILE_TAKEOVER_PREMIUM", 1.2)
         friendly_premium = getattr(self.config, "FRIENDLY_MERGER_PREMIUM", 1.1)
 
-        for predator in list(predators): # Copy list to iterate
-            # Check strategy
-            expansion_mode = "ORGANIC"
-            if hasattr(predator, "system2_planner") and predator.system2_planner:
-                guidance = predator.system2_planner.cached_guidance
-                expansion_mode = guidance.get("expansion_mode", "ORGANIC")
+        # Columnar target book: capacity requirement per target, in screening order.
+        # `target_open` replaces list.remove/`in` bookkeeping.
+        target_ids = np.array([t.id for t in hostile_targets])
+        target_required = np.array([market_caps[t.id] * 1.5 for t in hostile_targets], dtype=np.float64)
+        target_open = np.ones(len(hostile_targets), dtype=bool)
+        taken_over: Set[int] = set()
 
+        remaining_predators = []
+        for predator in predators:
             target_found = False
-            for target in hostile_targets:
-                if target.id == predator.id: continue
-                if target in bankrupts: continue
-
-                # Check Capacity
-                target_mcap_pennies = target.get_market_cap()
-                if self._get_balance(predator) > target_mcap_pennies * 1.5:
-                    # Attempt Hostile Takeover
-                    # MIGRATION: Pass market_cap (pennies)
-                    success = self._attempt_hostile_takeover(predator, target, target_mcap_pennies, current_tick)
+            if target_open.any():
+                predator_balance = self._get_balance(predator)
+                eligible = target_open & (target_required < predator_balance) & (target_ids != predator.id)
+
+                # Attempts follow screening order; each attempt consumes one RNG roll.
+                for idx in np.flatnonzero(eligible):
+                    target = hostile_targets[idx]
+                    success = self._attempt_hostile_takeover(predator, target, market_caps[target.id], current_tick)
                     if success:
                         target_found = True
-                        if target in preys: preys.remove(target)
-                        if target in hostile_targets: hostile_targets.remove(target)
+                        target_open[idx] = False
+                        taken_over.add(target.id)
                         break
 
-            if target_found:
-                predators.remove(predator)
+            if not target_found:
+                remaining_predators.append(predator)
+        predators = remaining_predators
 
         # --- Friendly M&A Loop (Existing Logic) ---
-        active_preys = [p for p in preys if p not in bankrupts and p.is_active]
-        
+        bankrupt_ids = {f.id for f in bankrupts}
+        active_preys = [p for p in preys if p.id not in taken_over and p.id not in bankrupt_ids and p.is_active]
+        min_cash_ratio = getattr(self.config, "MIN_ACQUISITION_CASH_RATIO", 1.5)
+
+        # Predator capacity array in (shuffled) priority order; acquired predators drop to -inf.
+        # The running max turns "first predator that can afford" into a searchsorted.
+        predator_balances = np.array([self._get_balance(p) for p in predators], dtype=np.float64)
+        running_max = np.maximum.accumulate(predator_balances) if len(predators) else predator_balances
+
         for prey in active_preys:
-            acquired = False
-            for predator in predators:
-                if predator.id == prey.id:
-                    continue
-                
-                # Check if Predator can afford
-                target_valuation = prey.valuation # int pennies
-                offer_price_float = target_valuation * friendly_premium
-                offer_price_pennies = round_to_pennies(offer_price_float)
-                
-                # Check Cash Requirement
-                min_cash_ratio = getattr(self.config, "MIN_ACQUISITION_CASH_RATIO", 1.5)
-                if self._get_balance(predator) >= offer_price_pennies * min_cash_ratio:
-                    # Attempt Deal
-                    self._execute_merger(predator, prey, offer_price_pennies, current_tick, is_hostile=False)
-                    acquired = True
-                    predators.remove(predator)
-                    break
+            if not len(predators):
+                break
+
+            # Check if Predator can afford
+            target_valuation = prey.valuation # int pennies
+            offer_price_float = target_valuation * friendly_premium
+            offer_price_pennies = round_to_pennies(offer_price_float)
+            required_cash = offer_price_pennies * min_cash_ratio
+
+            idx = int(np.searchsorted(running_max, required_cash, side="left"))
+            if idx < len(predators) and predators[idx].id == prey.id:
+                later = np.flatnonzero(predator_balances[idx + 1:] >= required_cash)
+                idx = idx + 1 + int(later[0]) if len(later) else len(predators)
+            if idx >= len(predators):
+                continue
+
+            # Attempt Deal
+            predator = predators[idx]
+            self._execute_merger(predator, prey, offer_price_pennies, current_tick, is_hostile=False)
+            predator_balances[idx] = -np.inf
+            running_max = np.maximum.accumulate(predator_balances)
             
         # 3. Process Bankruptcies (Liquidation)
         for firm in bankrupts:
             if firm.is_active:
                 self._execute_bankruptcy(firm, current_tick, markets_state)
 
+    def _screen_firms(self, firms: List["Firm"]) -> Tuple[List["Firm"], List["Firm"], List["Firm"], List["Firm"], Dict[int, Any]]:
+        """
+        Columnar screening pass.
+        Gathers balances, valuations, market caps, loss streaks and profits once per firm,
+        then derives the bankrupt/prey/hostile/predator masks in one vectorized step.
+        Returns (predators, preys, hostile_targets, bankrupts, market_caps_by_id), each list in firm order.
+        """
+        n = len(firms)
+        balances = np.empty(n, dtype=np.float64)
+        valuations = np.zeros(n, dtype=np.float64)
+        market_caps = np.zeros(n, dtype=np.float64)
+        raw_caps: List[Any] = [None] * n
+        loss_streaks = np.zeros(n, dtype=np.int64)
+        profits = np.zeros(n, dtype=np.float64)
+
+        balance_total = 0
+        for i, firm in enumerate(firms):
+            # Update Valuation first
+            firm.calculate_valuation()
+            # Refactor: Use finance.balance
+            balance = self._get_balance(firm)
+            balance_total += balance
+            balances[i] = balance
+            if balance < 0:
+                continue
+
+            # FIXED: Intrinsic value should be in pennies for consistent comparison with market_cap (pennies)
+            valuations[i] = firm.finance_state.valuation_pennies
+            raw_caps[i] = firm.get_market_cap()
+            market_caps[i] = raw_caps[i]
+            loss_streaks[i] = firm.finance_state.consecutive_loss_turns
+            profits[i] = firm.finance_state.current_profit.get(DEFAULT_CURRENCY, 0)
+
+        # Calculate stats for relative thresholds
+        avg_assets = balance_total / n
+        threshold = getattr(self.config, "HOSTILE_TAKEOVER_DISCOUNT_THRESHOLD", 0.7)
+
+        # Bankruptcy Criteria
+        bankrupt_mask = balances < 0
+        solvent = ~bankrupt_mask
+        # Standard Distress (Friendly M&A)
+        prey_mask = solvent & ((loss_streaks >= self.bankruptcy_loss_threshold) | (balances < avg_assets * 0.2))
+        # Phase 21: Hostile Takeover Criteria
+        hostile_mask = solvent & (market_caps < valuations * threshold)
+        # Predator Criteria
+        predator_mask = solvent & (balances > avg_assets * 1.5) & (profits > 0)
+
+        def select(mask: np.ndarray) -> List["Firm"]:
+            return [firms[i] for i in np.flatnonzero(mask)]
+
+        caps_by_id = {firms[i].id: raw_caps[i] for i in np.flatnonzero(hostile_mask)}
+        return select(predator_mask), select(prey_mask), select(hostile_mask), select(bankrupt_mask), caps_by_id
+
     def _attempt_hostile_takeover(self, predator: "Firm", target: "Firm", market_cap: float, tick: int) -> bool:
         """
         Phase 21: Probabilistic Hostile Takeover.
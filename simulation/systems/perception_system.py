@@ -1,40 +1,142 @@
 from collections import deque
-from typing import Dict, Any, List, Optional
+from collections.abc import Mapping
+from typing import Dict, Any, List, Optional, Iterator, Callable
 from dataclasses import replace
-import random
 import logging
 
+import numpy as np
+
 from modules.system.api import MarketSnapshotDTO, MarketSignalDTO, HousingMarketSnapshotDTO
 from simulation.dtos.api import GovernmentPolicyDTO
 
 logger = logging.getLogger(__name__)
 
+MA_WINDOW = 3
+LAG_TICKS = 5
+LAG_NOISE_LEVEL = 0.05
+DEFAULT_NOISE_SEED = 0  # Used when no RANDOM_SEED is configured, so noise stays reproducible
+
+
+def _is_price_key(key: str, val: Any) -> bool:
+    # Heuristic: numeric values whose key mentions a price or a cost
+    return isinstance(val, (int, float)) and ("price" in key or "cost" in key)
+
+
+class _AgentNoise:
+    """
+    Per-agent Gaussian noise stream for one tick.
+    The vector is drawn on first use only, from a generator seeded by
+    (system seed, tick, agent id), so values do not depend on read order.
+    """
+
+    def __init__(self, seed_key: List[int], size: int, noise_level: float):
+        self._seed_key = seed_key
+        self._size = size
+        self._noise_level = noise_level
+        self._draws: Optional[np.ndarray] = None
+
+    def __getitem__(self, slot: int) -> float:
+        if self._draws is None:
+            rng = np.random.default_rng(self._seed_key)
+            self._draws = rng.normal(0.0, self._noise_level, self._size)
+        return float(self._draws[slot])
+
+
+class _NoisyView(Mapping):
+    """
+    Read-only mapping over a lagged snapshot field.
+    Noise is applied to a slot the first time it is read; untouched entries are never copied.
+    """
+
+    def __init__(self, base: Dict[str, Any], slots: Dict[str, int], noise: _AgentNoise,
+                 perturb: Callable[[Any, float], Any]):
+        self._base = base
+        self._slots = slots
+        self._noise = noise
+        self._perturb = perturb
+        self._materialized: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._materialized:
+            return self._materialized[key]
+        value = self._base[key]
+        slot = self._slots.get(key)
+        if slot is not None:
+            value = self._perturb(value, self._noise[slot])
+            self._materialized[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._base)
+
+    def __len__(self) -> int:
+        return len(self._base)
+
+    def copy(self) -> Dict[str, Any]:
+        return {k: self[k] for k in self._base}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.copy()!r})"
+
+
+def _perturb_signal(sig: MarketSignalDTO, noise: float) -> MarketSignalDTO:
+    # MarketSignalDTO is frozen
+    return replace(sig, last_traded_price=int(sig.last_traded_price * (1 + noise)))
+
+
+def _perturb_value(val: Any, noise: float) -> Any:
+    return val * (1 + noise)
+
+
 class PerceptionSystem:
-    def __init__(self):
+    """
+    Phase 4.1: Perceptual filters.
+    Tier views (real-time, 3-tick MA, 5-tick lag) are computed once per `update`;
+    each laggard gets its own shallow copy of the MA dicts, and low-insight
+    agents only pay for the noisy fields they actually read.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
         self.snapshot_history: deque[MarketSnapshotDTO] = deque(maxlen=10)
         self.current_snapshot: Optional[MarketSnapshotDTO] = None
+        self.seed: int = int(seed) if seed is not None else DEFAULT_NOISE_SEED
+
+        # Per-tick tier views
+        self._moving_average_view: Optional[MarketSnapshotDTO] = None
+        self._lagged_base: Optional[MarketSnapshotDTO] = None
+        self._lag_signal_slots: Dict[str, int] = {}
+        self._lag_data_slots: Dict[str, int] = {}
+        self._anonymous_draws = 0
 
     def update(self, current_snapshot: MarketSnapshotDTO):
         self.current_snapshot = current_snapshot
         self.snapshot_history.append(current_snapshot)
+        self._rebuild_tier_views()
 
-    def apply_filter(self, agent_insight: float, current_snapshot: MarketSnapshotDTO) -> MarketSnapshotDTO:
+    def apply_filter(self, agent_insight: float, current_snapshot: MarketSnapshotDTO,
+                     agent_id: Optional[int] = None) -> MarketSnapshotDTO:
         """
         Applies perceptual distortion based on agent insight.
         > 0.8: Smart Money (Real Time)
         > 0.3: Laggards (3-Tick MA)
         <= 0.3: Lemons (5-Tick Lag + Noise)
+        `agent_id` selects the agent's noise stream; callers without one draw
+        from a per-tick sequence instead.
         """
         insight = float(agent_insight)
         if insight > 0.8:
             return current_snapshot
 
+        if not self.snapshot_history:
+            return current_snapshot  # Nothing observed yet
+
         if insight > 0.3:
-            # 3-Tick Moving Average
-            return self._calculate_moving_average(3)
+            # 3-Tick Moving Average (copied so one agent's edits don't leak to the others)
+            view = self._moving_average_view
+            return replace(view, market_signals=dict(view.market_signals), market_data=dict(view.market_data))
 
         # 5-Tick Lag + Noise
-        return self._get_lagged_snapshot_with_noise(5, 0.05)
+        return self._get_lagged_snapshot_with_noise(agent_id)
 
     def apply_policy_filter(self, agent_insight: float, policy: Optional[GovernmentPolicyDTO]) -> Optional[GovernmentPolicyDTO]:
         """
@@ -60,6 +162,29 @@ class PerceptionSystem:
 
         return replace(policy, market_panic_index=new_panic)
 
+    def _rebuild_tier_views(self) -> None:
+        self._moving_average_view = self._calculate_moving_average(MA_WINDOW)
+
+        if len(self.snapshot_history) <= LAG_TICKS:
+            target_snap = self.snapshot_history[0] # Oldest available
+        else:
+            target_snap = self.snapshot_history[-(LAG_TICKS + 1)]
+        self._lagged_base = target_snap
+
+        # Noise slots: one per priced signal, then one per price/cost data key
+        slot = 0
+        self._lag_signal_slots = {}
+        for k, sig in target_snap.market_signals.items():
+            if sig.last_traded_price is not None:
+                self._lag_signal_slots[k] = slot
+                slot += 1
+        self._lag_data_slots = {}
+        for key, val in target_snap.market_data.items():
+            if _is_price_key(key, val):
+                self._lag_data_slots[key] = slot
+                slot += 1
+        self._anonymous_draws = 0
+
     def _calculate_moving_average(self, window_size: int) -> MarketSnapshotDTO:
         if not self.snapshot_history:
             return self.current_snapshot # Fallback
@@ -92,9 +217,8 @@ class PerceptionSystem:
 
         # Average Market Data (prices)
         avg_data = base.market_data.copy()
-        # Identify price keys (heuristic: ends with _price, _cost)
         for key, val in avg_data.items():
-            if isinstance(val, (int, float)) and ("price" in key or "cost" in key):
+            if _is_price_key(key, val):
                 total = 0.0
                 count = 0
                 for snap in history:
@@ -106,27 +230,22 @@ class PerceptionSystem:
 
         return replace(base, market_signals=avg_signals, market_data=avg_data)
 
-    def _get_lagged_snapshot_with_noise(self, lag: int, noise_level: float) -> MarketSnapshotDTO:
-        if len(self.snapshot_history) <= lag:
-            target_snap = self.snapshot_history[0] # Oldest available
+    def _get_lagged_snapshot_with_noise(self, agent_id: Optional[int]) -> MarketSnapshotDTO:
+        target_snap = self._lagged_base
+        n_slots = len(self._lag_signal_slots) + len(self._lag_data_slots)
+        if n_slots == 0:
+            return target_snap
+
+        mask = 0xFFFFFFFFFFFFFFFF
+        if agent_id is None:
+            stream = [self.seed & mask, int(target_snap.tick) & mask, 1, self._anonymous_draws]
+            self._anonymous_draws += 1
         else:
-            target_snap = self.snapshot_history[-(lag + 1)]
+            stream = [self.seed & mask, int(target_snap.tick) & mask, 0, int(agent_id) & mask]
+        noise = _AgentNoise(stream, n_slots, LAG_NOISE_LEVEL)
 
-        # Apply Gaussian Noise to prices
-        noisy_signals = {}
-        for k, sig in target_snap.market_signals.items():
-            if sig.last_traded_price is not None:
-                noise = random.gauss(0, noise_level)
-                new_price = int(sig.last_traded_price * (1 + noise))
-                # MarketSignalDTO is frozen
-                noisy_signals[k] = replace(sig, last_traded_price=new_price)
-            else:
-                noisy_signals[k] = sig
-
-        noisy_data = target_snap.market_data.copy()
-        for key, val in noisy_data.items():
-            if isinstance(val, (int, float)) and ("price" in key or "cost" in key):
-                noise = random.gauss(0, noise_level)
-                noisy_data[key] = val * (1 + noise)
+        # Apply Gaussian Noise to prices, lazily
+        noisy_signals = _NoisyView(target_snap.market_signals, self._lag_signal_slots, noise, _perturb_signal)
+        noisy_data = _NoisyView(target_snap.market_data, self._lag_data_slots, noise, _perturb_value)
 
         return replace(target_snap, market_signals=noisy_signals, market_data=noisy_data)
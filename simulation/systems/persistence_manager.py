@@ -12,6 +12,7 @@ import json
 
 if TYPE_CHECKING:
     from simulation.models import Transaction
+    from simulation.metrics.history_store import HistorySpillDTO
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +34,7 @@ class PersistenceManager:
         self.transaction_buffer: List[TransactionData] = []
         self.economic_indicator_buffer: List[EconomicIndicatorData] = []
         self.market_history_buffer: List[MarketHistoryData] = []
+        self.indicator_history_buffer: List[HistorySpillDTO] = []
 
     def buffer_data(
         self,
@@ -57,12 +59,17 @@ class PersistenceManager:
         if market_history:
             self.market_history_buffer.extend(market_history)
 
+    def buffer_indicator_history(self, spill: HistorySpillDTO) -> None:
+        """Receives a completed lap of the tracker's history (IndicatorHistoryStore.spill hook)."""
+        self.indicator_history_buffer.append(spill)
+
     def flush_buffers(self, current_tick: int):
         """
         Periodically flushes buffered states to the database repository.
         """
         if not (self.agent_state_buffer or self.transaction_buffer or 
-                self.economic_indicator_buffer or self.market_history_buffer):
+                self.economic_indicator_buffer or self.market_history_buffer or
+                self.indicator_history_buffer):
             return
 
         logger.info(
@@ -86,6 +93,10 @@ class PersistenceManager:
             self.repository.markets.save_market_history_batch(self.market_history_buffer)
             self.market_history_buffer.clear()
 
+        if self.indicator_history_buffer:
+            self.repository.analytics.save_indicator_history_batch(self.run_id, self.indicator_history_buffer)
+            self.indicator_history_buffer.clear()
+
         logger.info(
             f"DB_FLUSH_END | Finished flushing buffers to DB at tick {current_tick}",
             extra={"tick": current_tick, "tags": ["db_flush"]}
@@ -3,9 +3,62 @@ Implements the SensorySystem which processes raw economic indicators into smooth
 """
 from collections import deque
 from typing import Any, Deque, List, Optional
+
+import numpy as np
+
 from simulation.systems.api import ISensorySystem, SensoryContext
 from simulation.dtos import GovernmentSensoryDTO
-from modules.simulation.api import ISensoryDataProvider, AgentSensorySnapshotDTO
+from modules.simulation.api import ISensoryDataProvider
+
+SMA_WINDOW = 10
+
+
+class RunningSMA:
+    """
+    Fixed-window simple moving average kept as a running sum (O(1) per update).
+    The sum is re-accumulated from the window periodically to bound float drift.
+    """
+
+    RESYNC_INTERVAL = 1000
+
+    def __init__(self, window: int = SMA_WINDOW):
+        self.buffer: Deque[float] = deque(maxlen=window)
+        self._sum = 0.0
+        self._updates = 0
+
+    def append(self, value: float) -> None:
+        if len(self.buffer) == self.buffer.maxlen:
+            self._sum -= self.buffer[0]
+        self.buffer.append(value)
+        self._sum += value
+        self._updates += 1
+        if self._updates % self.RESYNC_INTERVAL == 0:
+            self._sum = sum(self.buffer)
+
+    @property
+    def value(self) -> float:
+        return self._sum / len(self.buffer) if self.buffer else 0.0
+
+
+def _bottom_k(wealth: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k lowest values, O(n) via np.argpartition.
+    Ties at the boundary are resolved in index order, matching a stable sort.
+    """
+    pivot = wealth[np.argpartition(wealth, k - 1)[k - 1]]
+    below = np.flatnonzero(wealth < pivot)
+    tied = np.flatnonzero(wealth == pivot)
+    return np.concatenate((below, tied[:k - len(below)]))
+
+
+def _top_k(wealth: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest values; boundary ties keep the last ones in index order."""
+    n = len(wealth)
+    pivot = wealth[np.argpartition(wealth, n - k)[n - k]]
+    above = np.flatnonzero(wealth > pivot)
+    tied = np.flatnonzero(wealth == pivot)
+    return np.concatenate((tied[len(tied) - (k - len(above)):], above))
+
 
 class SensorySystem(ISensorySystem):
     """
@@ -17,11 +70,16 @@ class SensorySystem(ISensorySystem):
         self.config = config
 
         # State Ownership
-        self.inflation_buffer: Deque[float] = deque(maxlen=10)
-        self.unemployment_buffer: Deque[float] = deque(maxlen=10)
-        self.gdp_growth_buffer: Deque[float] = deque(maxlen=10)
-        self.wage_buffer: Deque[float] = deque(maxlen=10)
-        self.approval_buffer: Deque[float] = deque(maxlen=10)
+        self.inflation_sma = RunningSMA()
+        self.unemployment_sma = RunningSMA()
+        self.gdp_growth_sma = RunningSMA()
+        self.wage_sma = RunningSMA()
+        self.approval_sma = RunningSMA()
+        self.inflation_buffer: Deque[float] = self.inflation_sma.buffer
+        self.unemployment_buffer: Deque[float] = self.unemployment_sma.buffer
+        self.gdp_growth_buffer: Deque[float] = self.gdp_growth_sma.buffer
+        self.wage_buffer: Deque[float] = self.wage_sma.buffer
+        self.approval_buffer: Deque[float] = self.approval_sma.buffer
 
         self.last_avg_price_for_sma: float = 10.0
         self.last_gdp_for_sma: float = 0.0
@@ -58,15 +116,11 @@ class SensorySystem(ISensorySystem):
         approval = government.approval_rating
 
         # Append to Buffers
-        self.inflation_buffer.append(inflation_rate)
-        self.unemployment_buffer.append(unemployment_rate)
-        self.gdp_growth_buffer.append(gdp_growth)
-        self.wage_buffer.append(avg_wage)
-        self.approval_buffer.append(approval)
-
-        # Calculate SMA
-        def calculate_sma(buffer: Deque[float]) -> float:
-            return sum(buffer) / len(buffer) if buffer else 0.0
+        self.inflation_sma.append(inflation_rate)
+        self.unemployment_sma.append(unemployment_rate)
+        self.gdp_growth_sma.append(gdp_growth)
+        self.wage_sma.append(avg_wage)
+        self.approval_sma.append(approval)
 
         # WO-057-A: Robust Sensing for AdaptiveGovBrain
         gini_index = 0.0
@@ -78,51 +132,43 @@ class SensorySystem(ISensorySystem):
 
         # Only process if we have households
         # Use ISensoryDataProvider protocol
-        active_snapshots: List[tuple[Any, AgentSensorySnapshotDTO]] = []
+        wealth_list: List[float] = []
+        approval_list: List[float] = []
 
         for h in households:
             # We assume households implement ISensoryDataProvider as per Protocol Purity
-            # But we can check or try/except for robustness during migration if needed
-            # For this task, we assume strict compliance or fallback
+            # Legacy agents not yet migrated are skipped
             if isinstance(h, ISensoryDataProvider):
                 snapshot = h.get_sensory_snapshot()
                 if snapshot['is_active']:
-                    active_snapshots.append((h, snapshot))
-            else:
-                # Fallback for legacy agents not yet migrated (should not happen if all are migrated)
-                pass
-
-        if active_snapshots:
-             assets_list = [snap['total_wealth'] for _, snap in active_snapshots]
+                    wealth_list.append(snapshot['total_wealth'])
+                    approval_list.append(snapshot['approval_rating'])
 
+        if wealth_list:
              if inequality_tracker:
-                 gini_index = inequality_tracker.calculate_gini_coefficient(assets_list)
-
-             # Sort by assets
-             combined = sorted(active_snapshots, key=lambda x: x[1]['total_wealth'])
+                 gini_index = inequality_tracker.calculate_gini_coefficient(wealth_list)
 
-             # Extract approval ratings from sorted list
-             n = len(combined)
+             wealth = np.asarray(wealth_list, dtype=np.float64)
+             approvals = np.asarray(approval_list, dtype=np.float64)
+             n = len(wealth)
 
              # Low Asset: Bottom 50%
              n_low = int(n * 0.5)
-             low_group = combined[:n_low]
-             if low_group:
-                 approval_low_asset = sum(snap['approval_rating'] for _, snap in low_group) / len(low_group)
+             if n_low > 0:
+                 approval_low_asset = float(approvals[_bottom_k(wealth, n_low)].mean())
 
              # High Asset: Top 20%
              n_high = int(n * 0.2)
-             high_group = combined[-n_high:] if n_high > 0 else []
-             if high_group:
-                 approval_high_asset = sum(snap['approval_rating'] for _, snap in high_group) / len(high_group)
+             if n_high > 0:
+                 approval_high_asset = float(approvals[_top_k(wealth, n_high)].mean())
 
         return GovernmentSensoryDTO(
             tick=time,
-            inflation_sma=calculate_sma(self.inflation_buffer),
-            unemployment_sma=calculate_sma(self.unemployment_buffer),
-            gdp_growth_sma=calculate_sma(self.gdp_growth_buffer),
-            wage_sma=calculate_sma(self.wage_buffer),
-            approval_sma=calculate_sma(self.approval_buffer),
+            inflation_sma=self.inflation_sma.value,
+            unemployment_sma=self.unemployment_sma.value,
+            gdp_growth_sma=self.gdp_growth_sma.value,
+            wage_sma=self.wage_sma.value,
+            approval_sma=self.approval_sma.value,
             current_gdp=current_gdp,
             gini_index=gini_index,
             approval_low_asset=approval_low_asset,
@@ -7,7 +7,7 @@ from simulation.finance.api import ITransaction
 from modules.finance.api import (
     IFinancialAgent, IFinancialEntity, IBank, InsufficientFundsError,
     IPortfolioHandler, PortfolioDTO, PortfolioAsset, IHeirProvider, LienDTO, AgentID,
-    IMonetaryAuthority, IEconomicMetricsService, IPanicRecorder, ICentralBank,
+    IMonetaryAuthority, IEconomicMetricsService, IPanicRecorder, IBalanceChangeObserver, ICentralBank,
     FXMatchDTO, IAccountRegistry, FloatIncursionError, ZeroSumViolationError,
     IMonetaryLedger, ILiquidator, ILiquidityOracle
 )
@@ -86,6 +86,7 @@ class SettlementSystem(IMonetaryAuthority):
         self.liquidity_oracle = liquidity_oracle # Tier 1: Live Liquidity Oracle
 
         self.panic_recorder: Optional[IPanicRecorder] = None # Injected by SimulationInitializer
+        self.balance_observer: Optional[IBalanceChangeObserver] = None # Injected by SimulationInitializer
         self.monetary_authority: Optional[ICentralBank] = None # Added for LLR Linkage
         self.monetary_ledger: Optional[IMonetaryLedger] = None # WO-IMPL-FINANCIAL-FIX-PH33
 
@@ -114,6 +115,10 @@ class SettlementSystem(IMonetaryAuthority):
     def set_panic_recorder(self, recorder: IPanicRecorder) -> None:
         self.panic_recorder = recorder
 
+    def set_balance_observer(self, observer: IBalanceChangeObserver) -> None:
+        """Sets the observer notified of both parties of every completed settlement."""
+        self.balance_observer = observer
+
     def set_metrics_service(self, service: IEconomicMetricsService) -> None:
         """Sets the economic metrics service for recording system-wide financial events."""
         self.metrics_service = service
@@ -309,11 +314,28 @@ class SettlementSystem(IMonetaryAuthority):
                 total_debt += d
 
         if self.estate_registry:
-            for agent in self.estate_registry.get_all_estate_agents():
+            for agent in self.estate_registry.get_resident_estate_agents():
                 a, d = process_agent(agent)
                 total_assets += a
                 total_debt += d
 
+            # Cold estate members are counted from their stubs instead of being rehydrated
+            for stub in self.estate_registry.get_cold_estate_stubs():
+                if stub.id in processed_ids or stub.id in excluded_ids:
+                    continue
+                processed_ids.add(stub.id)
+                if stub.wallet is not None:
+                    if id(stub.wallet) in processed_wallets:
+                        continue
+                    processed_wallets.add(id(stub.wallet))
+                    balance = stub.wallet.get_balance(currency)
+                else:
+                    balance = stub.final_balances.get(currency, 0)
+                if balance > 0:
+                    total_assets += balance
+                elif balance < 0:
+                    total_debt += abs(balance)
+
         return total_assets, total_debt
 
     def _is_m2_agent(self, agent: Any) -> bool:
@@ -571,6 +593,109 @@ class SettlementSystem(IMonetaryAuthority):
 
         return tx_records
 
+    def execute_bulk_transfers(
+        self,
+        transfers: List[Tuple[IFinancialAgent, IFinancialAgent, int, str]],
+        tick: int,
+        currency: CurrencyCode = DEFAULT_CURRENCY
+    ) -> List[Optional[Transaction]]:
+        """
+        Executes a batch of independent transfers through one engine pass.
+        Format: (DebitAgent, CreditAgent, Amount, Memo)
+        Unlike execute_multiparty_settlement, the batch is NOT atomic: each leg
+        succeeds or fails on its own, exactly as sequential `transfer` calls would.
+        M2 boundary effects are aggregated per memo and recorded once per memo.
+        """
+        results: List[Optional[Transaction]] = []
+        if not transfers:
+            return results
+
+        agents_involved: List[Any] = []
+        for debit, credit, amount, _ in transfers:
+            if isinstance(amount, float):
+                raise FloatIncursionError(f"Settlement integrity violation: amount must be int, got float: {amount}.")
+            if not isinstance(amount, int):
+                raise TypeError(f"Settlement integrity violation: amount must be int, got {type(amount)}.")
+            if amount < 0:
+                raise ValueError(f"Cannot transfer negative amount: {amount}")
+            agents_involved.append(debit)
+            agents_involved.append(credit)
+
+        try:
+            engine = self._get_engine(context_agents=agents_involved)
+        except RuntimeError:
+            self.logger.error("BULK_SETTLEMENT_FAIL | Engine init failed.")
+            return [None] * len(transfers)
+
+        valid_memos: Dict[str, bool] = {}
+        m2_flags: Dict[AgentID, bool] = {}
+        expansion_by_memo: Dict[str, int] = {}
+        contraction_by_memo: Dict[str, int] = {}
+
+        for debit, credit, amount, memo in transfers:
+            if memo not in valid_memos:
+                valid_memos[memo] = self._validate_memo(memo)
+            if not valid_memos[memo] or debit is None or credit is None:
+                results.append(None)
+                continue
+
+            if amount == 0:
+                results.append(self._create_transaction_record(debit.id, credit.id, amount, memo, tick))
+                continue
+
+            if not self._prepare_seamless_funds(debit, amount, currency):
+                results.append(None)
+                continue
+
+            with FinancialSentry.unlocked():
+                result = engine.process_transaction(
+                    source_account_id=debit.id,
+                    destination_account_id=credit.id,
+                    amount=amount,
+                    currency=currency,
+                    description=memo
+                )
+
+            if result.status != 'COMPLETED':
+                self.logger.warning(f"BULK_SETTLEMENT_LEG_FAIL | {result.status}: {result.message}")
+                results.append(None)
+                continue
+
+            if memo == "withdrawal":
+                if self.metrics_service:
+                    self.metrics_service.record_withdrawal(amount)
+                if self.panic_recorder:
+                    self.panic_recorder.record_withdrawal(amount)
+
+            if self.monetary_ledger:
+                if debit.id not in m2_flags:
+                    m2_flags[debit.id] = self._is_m2_agent(debit)
+                if credit.id not in m2_flags:
+                    m2_flags[credit.id] = self._is_m2_agent(credit)
+                is_debit_m2 = m2_flags[debit.id]
+                is_credit_m2 = m2_flags[credit.id]
+
+                if not is_debit_m2 and is_credit_m2:
+                    expansion_by_memo[memo] = expansion_by_memo.get(memo, 0) + amount
+                elif is_debit_m2 and not is_credit_m2:
+                    contraction_by_memo[memo] = contraction_by_memo.get(memo, 0) + amount
+
+            if self.estate_registry and self.estate_registry.get_agent(credit.id):
+                if hasattr(self.estate_registry, 'process_estate_distribution'):
+                    distribution_txs = self.estate_registry.process_estate_distribution(credit, self, tick)
+                    if distribution_txs:
+                        self._internal_tx_queue.extend(distribution_txs)
+
+            results.append(self._create_transaction_record(debit.id, credit.id, amount, memo, tick))
+
+        if self.monetary_ledger:
+            for memo, total in expansion_by_memo.items():
+                self.monetary_ledger.record_monetary_expansion(total, source=memo, currency=currency)
+            for memo, total in contraction_by_memo.items():
+                self.monetary_ledger.record_monetary_contraction(total, source=memo, currency=currency)
+
+        return results
+
     def _validate_memo(self, memo: str) -> bool:
         if not isinstance(memo, str):
             self.logger.warning(f"Invalid memo type: {type(memo)}. Rejecting.")
@@ -703,6 +828,10 @@ class SettlementSystem(IMonetaryAuthority):
             self.logger.error(f"FX_SWAP_FAIL | Atomic batch failed. Results: {[r.message for r in results]}")
             return None
 
+        if self.balance_observer:
+            self.balance_observer.mark_dirty(party_a.id)
+            self.balance_observer.mark_dirty(party_b.id)
+
         # 7. Return Summary Transaction
         # We return a representative transaction record for the swap event.
         # We return the "primary" leg (A->B) with metadata about the swap.
@@ -971,6 +1100,10 @@ class SettlementSystem(IMonetaryAuthority):
         if buyer_id is None or seller_id is None:
              return None
 
+        if self.balance_observer:
+            self.balance_observer.mark_dirty(buyer_id)
+            self.balance_observer.mark_dirty(seller_id)
+
         original = {"memo": memo}
 
         # WO-IMPL-FINANCIAL-INTEGRITY-FIX: Mark creation/destruction as executed
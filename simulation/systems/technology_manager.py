@@ -1,6 +1,5 @@
 from __future__ import annotations
 import logging
-import random
 import numpy as np
 from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional, Set, TYPE_CHECKING
@@ -31,24 +30,47 @@ class TechnologyManager:
     Handles the invention and diffusion of new technologies (The S-Curve).
     """
 
-    def __init__(self, config_module: Any, logger: logging.Logger, strategy: Optional["ScenarioStrategy"] = None):
+    DEFAULT_FIRM_CAPACITY = 256
+    DEFAULT_TECH_CAPACITY = 8
+
+    def __init__(
+        self,
+        config_module: Any,
+        logger: logging.Logger,
+        strategy: Optional["ScenarioStrategy"] = None,
+        rng: Optional[np.random.Generator] = None
+    ):
         self.config = config_module
         self.logger = logger
         self.strategy = strategy
-        
+
+        # Seeded Generator keeps unlock rolls and diffusion reproducible.
+        if rng is None:
+            seed = getattr(config_module, "RANDOM_SEED", None)
+            rng = np.random.default_rng(seed if isinstance(seed, int) else None)
+        self.rng = rng
+
         # Tech Registry
         self.tech_tree: Dict[str, TechNode] = {}
         self.active_techs: List[str] = [] # List of unlocked tech IDs
-        
-        # Vectorized Adoption Registry (WO-136)
-        # Rows: Firm ID (mapped directly if small, or via map if sparse/large)
-        # We assume Firm IDs are effectively < 50000.
-        # adoption_matrix[firm_id, tech_idx] = True/False
-        self.adoption_matrix = np.zeros((1000, 0), dtype=bool)
+
+        # Compact Adoption Store (WO-136)
+        # Rows are dense firm slots (NOT raw firm ids): firm ids come from a global
+        # counter shared with households, so indexing by id wastes rows.
+        # adoption_matrix[firm_row, tech_idx] = True/False
+        firm_capacity = getattr(config_module, "TECH_ADOPTION_INITIAL_CAPACITY", self.DEFAULT_FIRM_CAPACITY)
+        if not isinstance(firm_capacity, int) or firm_capacity <= 0:
+            firm_capacity = self.DEFAULT_FIRM_CAPACITY
+        self.adoption_matrix = np.zeros((firm_capacity, self.DEFAULT_TECH_CAPACITY), dtype=bool)
+        self.firm_id_to_row: Dict[int, int] = {}
+        self._free_rows: List[int] = list(range(firm_capacity - 1, -1, -1))
+        # Last synced roster (firm ids in order) and its rows; reused while unchanged
+        self._roster_ids: Optional[List[int]] = None
+        self._roster_rows: Optional[np.ndarray] = None
 
         self.tech_id_to_idx: Dict[str, int] = {}
         self.idx_to_tech_id: List[str] = []
-        
+
         self.human_capital_index: float = 1.0 # WO-054
 
         self._initialize_tech_tree()
@@ -73,6 +95,10 @@ class TechnologyManager:
         )
         self._register_tech(fertilizer)
 
+    @property
+    def tech_count(self) -> int:
+        return len(self.idx_to_tech_id)
+
     def _register_tech(self, tech: TechNode):
         """Register a tech node and assign it an index."""
         if tech.id in self.tech_tree:
@@ -83,37 +109,62 @@ class TechnologyManager:
         self.idx_to_tech_id.append(tech.id)
         self.tech_tree[tech.id] = tech
 
-        # Resize adoption matrix to include new tech column
-        current_rows = self.adoption_matrix.shape[0]
-        # Create new column of zeros
-        new_col = np.zeros((current_rows, 1), dtype=bool)
-        self.adoption_matrix = np.hstack((self.adoption_matrix, new_col))
+        # Grow tech columns geometrically (preallocated, no per-tech hstack)
+        cols = int(self.adoption_matrix.shape[1])
+        if tech._idx >= cols:
+            new_cols = max(cols * 2, tech._idx + 1)
+            grown = np.zeros((self.adoption_matrix.shape[0], new_cols), dtype=bool)
+            grown[:, :cols] = self.adoption_matrix
+            self.adoption_matrix = grown
 
-    def _ensure_capacity(self, max_firm_id: int):
-        """Resize adoption matrix rows if necessary."""
+    def _ensure_capacity(self, required_rows: int):
+        """Grow the firm-row capacity (doubling) so at least `required_rows` rows exist."""
         current_rows = int(self.adoption_matrix.shape[0])
-        # TD-TEST-MOCK-LEAK: Prevent comparison between MagicMock and int
-        try:
-            if not isinstance(max_firm_id, int):
-                max_firm_id = int(max_firm_id)
-        except (TypeError, ValueError):
+        if required_rows <= current_rows:
             return
 
-        if max_firm_id >= current_rows:
-            # Expand to at least double or max_id + buffer
-            new_rows = max(max_firm_id + 1, current_rows * 2)
-            rows_to_add = new_rows - current_rows
-            cols = int(self.adoption_matrix.shape[1])
+        new_rows = max(required_rows, current_rows * 2)
+        grown = np.zeros((new_rows, self.adoption_matrix.shape[1]), dtype=bool)
+        grown[:current_rows] = self.adoption_matrix
+        self.adoption_matrix = grown
+        # Keep lowest rows at the end of the stack so they are reused first
+        self._free_rows = list(range(new_rows - 1, current_rows - 1, -1)) + self._free_rows
 
-            # Append zeros
-            padding = np.zeros((rows_to_add, cols), dtype=bool)
-            self.adoption_matrix = np.vstack((self.adoption_matrix, padding))
+    def _get_row(self, firm_id: int) -> Optional[int]:
+        """Returns the dense row for a firm, or None if the firm is not tracked."""
+        try:
+            return self.firm_id_to_row.get(int(firm_id))
+        except (TypeError, ValueError):
+            # TD-TEST-MOCK-LEAK: MagicMock ids are never tracked
+            return None
+
+    def _assign_row(self, firm_id: int) -> int:
+        """Maps a firm to a dense row, reusing rows released by exited firms."""
+        row = self.firm_id_to_row.get(firm_id)
+        if row is not None:
+            return row
+        if not self._free_rows:
+            self._ensure_capacity(int(self.adoption_matrix.shape[0]) + 1)
+        row = self._free_rows.pop()
+        self.adoption_matrix[row, :] = False
+        self.firm_id_to_row[firm_id] = row
+        self._roster_ids = None
+        return row
+
+    def release_firm(self, firm_id: int) -> None:
+        """Releases the adoption row of an exited firm so it can be recycled."""
+        row = self.firm_id_to_row.pop(firm_id, None)
+        if row is not None:
+            self.adoption_matrix[row, :] = False
+            self._free_rows.append(row)
+            self._roster_ids = None
 
     def update(self, current_tick: int, firms: List[FirmTechInfoDTO], human_capital_index: float) -> None:
         """
         Called every tick.
         1. Check Unlocks.
         2. Process Diffusion (Spread).
+        `firms` is the active roster; tracked firms missing from it have exited and are released.
         """
         # WO-054: Update Human Capital Index from parameter
         self.human_capital_index = human_capital_index
@@ -125,38 +176,69 @@ class TechnologyManager:
             rd = firm.get("current_rd_investment", 0.0)
             current_rd_by_sector[sector] = current_rd_by_sector.get(sector, 0.0) + rd
 
+        # Map the active roster onto dense rows (recycling rows of exited firms)
+        rows = self._sync_roster(firms)
+
         # 1. Unlock Check (Probabilistic)
         self._check_probabilistic_unlocks(current_rd_by_sector, current_tick)
 
         # 2. Diffusion Process (S-Curve)
-        self._process_diffusion(firms, current_tick)
+        self._process_diffusion(firms, current_tick, rows)
+
+    def _sync_roster(self, firms: List[FirmTechInfoDTO]) -> np.ndarray:
+        """
+        Returns the dense row of every firm in `firms` (same order).
+        Tracked firms absent from the roster have exited and their rows are released.
+        """
+        firm_ids = [int(f["id"]) for f in firms]
+        if firm_ids == self._roster_ids and self._roster_rows is not None:
+            return self._roster_rows
+
+        row_map = self.firm_id_to_row
+        rows = [row_map.get(fid) for fid in firm_ids]
+
+        tracked = len(rows) - rows.count(None)
+        if len(row_map) > tracked:
+            active_ids = set(firm_ids)
+            for firm_id in [fid for fid in row_map if fid not in active_ids]:
+                self.release_firm(firm_id)
+
+        if tracked < len(rows):
+            rows = [row if row is not None else self._assign_row(fid) for fid, row in zip(firm_ids, rows)]
+
+        self._roster_ids = firm_ids
+        self._roster_rows = np.array(rows, dtype=np.intp)
+        return self._roster_rows
 
     def _check_probabilistic_unlocks(self, current_rd_by_sector: Dict[str, float], current_tick: int):
         """
         WO-136: Probabilistic unlock based on accumulated R&D.
         P = min(0.1, (Sector_Accumulated_RD / Tech_Cost_Threshold)^2)
+        All locked techs are rolled in one vectorized draw.
         """
-        for tech in self.tech_tree.values():
-            if tech.is_unlocked:
-                continue
-
-            sector_rd = current_rd_by_sector.get(tech.sector, 0.0)
-            if tech.sector == "ALL":
-                # Sum all sectors if tech is universal
-                sector_rd = sum(current_rd_by_sector.values())
+        locked = [tech for tech in self.tech_tree.values() if not tech.is_unlocked]
+        if not locked:
+            return
 
-            if sector_rd <= 0:
-                continue
+        total_rd = sum(current_rd_by_sector.values())
+        sector_rd = np.array(
+            [total_rd if tech.sector == "ALL" else current_rd_by_sector.get(tech.sector, 0.0) for tech in locked],
+            dtype=np.float64
+        )
+        funded = sector_rd > 0
+        if not np.any(funded):
+            return
 
-            # Calculate probability
-            ratio = sector_rd / tech.cost_threshold
-            # WO-136: Probability cap is configurable
-            prob_cap = getattr(self.config, "TECH_UNLOCK_PROB_CAP", 0.1)
-            prob = min(prob_cap, ratio ** 2)
+        thresholds = np.array([tech.cost_threshold for tech in locked], dtype=np.float64)
+        # WO-136: Probability cap is configurable
+        prob_cap = getattr(self.config, "TECH_UNLOCK_PROB_CAP", 0.1)
+        probs = np.minimum(prob_cap, (sector_rd / thresholds) ** 2)
 
-            # Roll dice
-            if random.random() < prob:
-                self._unlock_tech(tech, current_tick)
+        # Roll dice (funded techs only, in registration order)
+        funded_indices = np.flatnonzero(funded)
+        rolls = self.rng.random(len(funded_indices))
+        for i in funded_indices[rolls < probs[funded_indices]]:
+            self._unlock_tech(locked[i], current_tick)
 
     def _unlock_tech(self, tech: TechNode, current_tick: int):
         """Unlock technology."""
@@ -176,111 +258,86 @@ class TechnologyManager:
         boost = min(1.5, 0.5 * max(0.0, self.human_capital_index - 1.0))
         return base_rate * (1.0 + boost)
 
-    def _process_diffusion(self, firms: List[FirmTechInfoDTO], current_tick: int):
+    def _process_diffusion(self, firms: List[FirmTechInfoDTO], current_tick: int, rows: Optional[np.ndarray] = None):
         """
         Simulate the spread of technology to non-adopters.
-        WO-136: Vectorized implementation for 2,000+ agents using Numpy Matrix.
+        WO-136: One vectorized (firms x active techs) step per tick.
         """
-        if not firms:
+        if not firms or not self.active_techs:
             return
 
-        firm_ids = np.array([f["id"] for f in firms], dtype=int)
-
-        # Ensure matrix capacity
-        max_firm_id = np.max(firm_ids)
-        self._ensure_capacity(max_firm_id)
-
+        if rows is None:
+            rows = self._sync_roster(firms)
+        firm_ids = np.array([f["id"] for f in firms], dtype=np.int64)
         sectors = np.array([f["sector"] for f in firms])
 
-        for tech_id in self.active_techs:
-            tech = self.tech_tree[tech_id]
-            tech_idx = tech._idx
-            
-            # WO-054: Calculate effective rate
-            effective_rate = self._get_effective_diffusion_rate(tech.diffusion_rate)
-
-            # 1. Sector Mask
-            if tech.sector == "ALL":
-                sector_mask = np.ones(len(firms), dtype=bool)
-            else:
-                sector_mask = (sectors == tech.sector)
-
-            if not np.any(sector_mask):
-                continue
-
-            # 2. Adoption Mask (Fast Vectorized Lookup)
-            # adoption_matrix[firm_ids, tech_idx] returns array of booleans corresponding to firms
-            already_adopted_mask = self.adoption_matrix[firm_ids, tech_idx]
-
-            # 3. Candidates: In Sector AND Not Adopted
-            candidate_mask = sector_mask & (~already_adopted_mask)
-
-            candidate_indices = np.where(candidate_mask)[0]
-            if len(candidate_indices) == 0:
-                continue
-
-            # 4. Roll Dice (Vectorized)
-            random_rolls = np.random.rand(len(candidate_indices))
+        techs = [self.tech_tree[tech_id] for tech_id in self.active_techs]
+        tech_cols = np.array([tech._idx for tech in techs], dtype=np.intp)
+        effective_rates = np.array(
+            [self._get_effective_diffusion_rate(tech.diffusion_rate) for tech in techs], dtype=np.float64
+        )
 
-            # 5. Determine Adopters
-            adopter_indices = candidate_indices[random_rolls < effective_rate]
+        # 1. Sector Mask (firms x techs)
+        sector_mask = np.column_stack([
+            np.ones(len(firms), dtype=bool) if tech.sector == "ALL" else (sectors == tech.sector)
+            for tech in techs
+        ])
 
-            if len(adopter_indices) == 0:
-                continue
+        # 2. Candidates: In Sector AND Not Adopted
+        already_adopted = self.adoption_matrix[np.ix_(rows, tech_cols)]
+        candidate_mask = sector_mask & ~already_adopted
+        if not np.any(candidate_mask):
+            return
 
-            # 6. Apply Adoption
-            adopter_firm_ids = firm_ids[adopter_indices]
+        # 3. Roll Dice (one draw per candidate, row-major order)
+        adopters = np.zeros_like(candidate_mask)
+        adopters[candidate_mask] = self.rng.random(int(candidate_mask.sum())) < np.broadcast_to(
+            effective_rates, candidate_mask.shape
+        )[candidate_mask]
+        if not np.any(adopters):
+            return
 
-            # Batch update adoption matrix
-            self.adoption_matrix[adopter_firm_ids, tech_idx] = True
+        # 4. Apply Adoption
+        firm_pos, tech_pos = np.nonzero(adopters)
+        self.adoption_matrix[rows[firm_pos], tech_cols[tech_pos]] = True
 
-            # Logging (this loop is now the only O(NewAdopters) part)
-            for firm_id in adopter_firm_ids:
-                 self.logger.info(
-                    f"TECH_DIFFUSION | Firm {firm_id} adopted {tech.name}. Rate: {effective_rate:.4f} (Base: {tech.diffusion_rate})",
-                    extra={"tick": current_tick, "agent_id": int(firm_id), "tech_id": tech.id}
-                )
+        # Logging (this loop is now the only O(NewAdopters) part)
+        for f_pos, t_pos in zip(firm_pos, tech_pos):
+            tech = techs[t_pos]
+            firm_id = int(firm_ids[f_pos])
+            self.logger.info(
+                f"TECH_DIFFUSION | Firm {firm_id} adopted {tech.name}. Rate: {effective_rates[t_pos]:.4f} (Base: {tech.diffusion_rate})",
+                extra={"tick": current_tick, "agent_id": firm_id, "tech_id": tech.id}
+            )
 
     def _adopt(self, firm_id: int, tech: TechNode):
         """Register adoption (Legacy/Manual)."""
-        self._ensure_capacity(firm_id)
-        self.adoption_matrix[firm_id, tech._idx] = True
+        row = self._assign_row(int(firm_id))
+        self.adoption_matrix[row, tech._idx] = True
 
     def has_adopted(self, firm_id: int, tech_id: str) -> bool:
         tech_idx = self.tech_id_to_idx.get(tech_id)
         if tech_idx is None:
             return False
 
-        try:
-            # Shield against MagicMocks bypassing type hints in tests
-            f_id = int(firm_id)
-            if hasattr(self.adoption_matrix, 'shape') and not hasattr(self.adoption_matrix.shape[0], '_mock_name'):
-                rows = int(self.adoption_matrix.shape[0])
-                if f_id >= rows:
-                    return False
-            else:
-                # If it's a mock or doesn't have shape, treat as False or skip
-                return False
-        except:
+        row = self._get_row(firm_id)
+        if row is None:
             return False
 
-        return bool(self.adoption_matrix[firm_id, tech_idx])
+        return bool(self.adoption_matrix[row, tech_idx])
 
     def get_productivity_multiplier(self, firm_id: int) -> float:
         """
         Calculate total TFP multiplier for a firm based on adopted techs.
         """
-        if firm_id >= int(self.adoption_matrix.shape[0]):
+        row = self._get_row(firm_id)
+        if row is None:
             return 1.0
-        
-        # Get all adopted techs for this firm
-        # row: self.adoption_matrix[firm_id] -> boolean array
-        adopted_indices = np.where(self.adoption_matrix[firm_id])[0]
-        
-        total_mult = 1.0
-        for tech_idx in adopted_indices:
-            tech_id = self.idx_to_tech_id[tech_idx]
-            tech = self.tech_tree[tech_id]
-            total_mult *= tech.multiplier
-        
-        return total_mult
+
+        n_techs = self.tech_count
+        adopted = self.adoption_matrix[row, :n_techs]
+        if not adopted.any():
+            return 1.0
+
+        multipliers = np.array([self.tech_tree[tech_id].multiplier for tech_id in self.idx_to_tech_id], dtype=np.float64)
+        return float(np.prod(multipliers[adopted]))
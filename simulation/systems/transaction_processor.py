@@ -211,7 +211,7 @@ class TransactionProcessor(SystemInterface):
 
             # Inactive Agent Guard
             # Skip transaction if an agent is inactive, unless it's a special type or in EstateRegistry
-            allowed_inactive_types = ["escheatment", "liquidation", "asset_buyout", "asset_transfer", "education_spending", "wage", "dividend"]
+            allowed_inactive_types = ["escheatment", "liquidation", "asset_buyout", "asset_transfer", "education_spending", "wage", "dividend", "dividend_distribution"]
             
             # Check if inactive agents are actually in the Estate Registry (valid for settlement)
             estate_safe = True
@@ -23,6 +23,7 @@ if TYPE_CHECKING:
     from simulation.systems.inheritance_manager import InheritanceManager
     from simulation.systems.housing_system import HousingSystem
     from simulation.systems.persistence_manager import PersistenceManager
+    from simulation.registries.residency_manager import AgentResidencyManager
     from simulation.systems.analytics_system import AnalyticsSystem
     from simulation.systems.firm_management import FirmSystem
     from simulation.systems.technology_manager import TechnologyManager
@@ -57,6 +58,7 @@ from simulation.dtos.commands import GodCommandDTO
 from modules.simulation.dtos.api import MoneySupplyDTO
 from modules.system.server_bridge import CommandQueue, TelemetryExchange
 from simulation.orchestration.dashboard_service import DashboardService
+from simulation.orchestration.run_mode import RunModeController
 
 class WorldState(IAnalyticsContext, IPopulationContext, IFirmContext, IFinanceContext, IHousingContext):
     """
@@ -136,13 +138,19 @@ class WorldState(IAnalyticsContext, IPopulationContext, IFirmContext, IFinanceCo
         self.currency_holders: List[ICurrencyHolder] = [] # Added for Phase 33
         self._currency_holders_set: set = set()
         self.estate_registry: Optional[IEstateRegistry] = None
+        self.agent_residency: Optional[AgentResidencyManager] = None # Cold store for dormant/deceased agents
         # FOUND-03: Global Registry - Initialized via Dependency Injection (simulation.lock via initializer)
         self.global_registry: Optional[IGlobalRegistry] = None
         self.telemetry_collector: Optional[Any] = None
+        self.event_bus: Optional[Any] = None # IDeferredEventBus (flushed by TickOrchestrator)
         self.scenario_verifier: Optional[Any] = None
 
         # Attributes with default values
         self.batch_save_interval: int = self.config_manager.get("simulation.batch_save_interval", 50)
+        # Headless fast-forward windows (observers suspended or sampled)
+        self.run_mode: RunModeController = RunModeController.from_config(
+            self.config_manager.get("simulation.fast_forward", None)
+        )
         self.household_time_allocation: Dict[int, float] = {}
         self.last_interest_rate: float = 0.0
 
@@ -272,7 +280,7 @@ class WorldState(IAnalyticsContext, IPopulationContext, IFirmContext, IFinanceCo
         """
         if not self.monetary_ledger:
             # If ledger is missing in tests or genesis, return empty DTO rather than crash or iterate.
-            return MoneySupplyDTO(total_m2_pennies=0, total_debt_pennies=0)
+            return MoneySupplyDTO(total_m2_pennies=0, system_debt_pennies=0)
         return self.monetary_ledger.calculate_total_money()
 
 
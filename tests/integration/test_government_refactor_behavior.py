@@ -223,11 +223,10 @@ class TestGovernmentRefactor:
 
         # Verify Tax Collection
         # Expect 1 transfer call: Rich -> Gov
-        calls = government.settlement_system.transfer.call_args_list
+        calls = government.settlement_system.execute_bulk_transfers.call_args.args[0]
         assert len(calls) == 1
 
-        args, _ = calls[0]
-        payer, payee, amount, memo = args[0], args[1], args[2], args[3]
+        payer, payee, amount, memo = calls[0]
 
         assert payer == rich_agent
         assert payee == government # Should be the object!
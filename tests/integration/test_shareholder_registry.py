@@ -45,6 +45,49 @@ def test_stock_market_integration():
     assert len(shareholders) == 1
     assert shareholders[0]['agent_id'] == 201
 
+def test_cap_table_tracks_registry():
+    registry = ShareholderRegistry()
+    for agent_id in range(10):
+        registry.register_shares(firm_id=1, agent_id=agent_id, quantity=float(agent_id + 1))
+    registry.register_shares(firm_id=1, agent_id=3, quantity=0.0)
+    registry.register_shares(firm_id=1, agent_id=9, quantity=2.5)
+
+    holder_ids, quantities = registry.get_cap_table(1)
+    expected = {s['agent_id']: s['quantity'] for s in registry.get_shareholders_of_firm(1)}
+    assert dict(zip(holder_ids.tolist(), quantities.tolist())) == expected
+
+    for agent_id in list(expected):
+        registry.register_shares(firm_id=1, agent_id=agent_id, quantity=0.0)
+    assert len(registry.get_cap_table(1)[0]) == 0
+
+def test_pro_rata_allocation_is_exact_and_deterministic():
+    import random
+    import numpy as np
+    from modules.finance.shareholder_registry import allocate_pro_rata
+
+    rng = random.Random(5)
+    for _ in range(200):
+        n = rng.randint(1, 50)
+        holder_ids = np.array(rng.sample(range(1000), n), dtype=np.int64)
+        quantities = np.array([rng.choice([1.0, 3.0, 7.5, 10.0]) for _ in range(n)])
+        amount = rng.randint(1, 100000)
+
+        # Holders own every share: the full amount is paid
+        amounts = allocate_pro_rata(quantities, holder_ids, amount, quantities.sum())
+        assert amounts.sum() == amount
+        exact = amount * quantities / quantities.sum()
+        assert (np.abs(amounts - exact) < 1).all()
+
+        # Unregistered (treasury) shares: pay the floor of the aggregate entitlement
+        total_shares = quantities.sum() * 1.25
+        amounts = allocate_pro_rata(quantities, holder_ids, amount, total_shares)
+        assert amounts.sum() == int(amount * quantities.sum() / total_shares)
+
+        # Row order does not matter
+        perm = np.array(rng.sample(range(n), n))
+        shuffled = allocate_pro_rata(quantities[perm], holder_ids[perm], amount, total_shares)
+        assert dict(zip(holder_ids[perm].tolist(), shuffled.tolist())) == dict(zip(holder_ids.tolist(), amounts.tolist()))
+
 if __name__ == "__main__":
     # Manual run helper
     try:
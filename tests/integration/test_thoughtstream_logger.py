@@ -120,3 +120,43 @@ def test_logger_functionality(db_connection):
     assert s2[6] == 20
 
     conn.close()
+
+def test_sampled_thoughts_keep_exact_counts(db_connection):
+    db_path = db_connection
+    built = []
+
+    def lazy_context():
+        built.append(1)
+        return {"inventory": {"basic_food": 0}}
+
+    with SimulationLogger(db_path, thought_sampling_rates={"STOCK_OUT": 0.25}) as logger:
+        logger.run_id = 7
+        for i in range(40):
+            logger.log_thought(tick=3, agent_id=str(i), action="CONSUME_FOOD", decision="REJECT",
+                               reason="STOCK_OUT", context=lazy_context)
+        for i in range(5):
+            logger.log_thought(tick=3, agent_id=str(i), action="CONSUME_FOOD", decision="REJECT",
+                               reason="INSOLVENT", context={"cash": i})
+
+        assert logger.thoughts.get_histogram(3) == {
+            ("CONSUME_FOOD", "REJECT", "STOCK_OUT"): 40,
+            ("CONSUME_FOOD", "REJECT", "INSOLVENT"): 5,
+        }
+
+    # Deterministic 1-in-4 sampling; contexts only built for kept records
+    assert len(built) == 10
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    cursor.execute("SELECT reason, COUNT(*) FROM agent_thoughts WHERE run_id=7 GROUP BY reason ORDER BY reason")
+    assert cursor.fetchall() == [("INSOLVENT", 5), ("STOCK_OUT", 10)]
+
+    cursor.execute("""
+        SELECT reason, total_count, sampled_count FROM agent_thought_counts
+        WHERE run_id=7 AND tick=3 ORDER BY reason
+    """)
+    assert cursor.fetchall() == [("INSOLVENT", 5, 5), ("STOCK_OUT", 40, 10)]
+
+    cursor.execute("SELECT context_data FROM agent_thoughts WHERE run_id=7 AND reason='STOCK_OUT' LIMIT 1")
+    assert json.loads(cursor.fetchone()[0]) == {"inventory": {"basic_food": 0}}
+    conn.close()
@@ -171,3 +171,90 @@ class TestLaborMatching:
         tx = result.transactions[0]
         assert tx.buyer_id == 'BuyerA'
         assert tx.seller_id == 'Seller1'
+
+
+def _legacy_labor_utility_match(buy_orders, sell_orders, edu_weight=0.1, match_mode='BID'):
+    """Reference copy of the original nested buyer x seller utility loop."""
+    def utility(o):
+        if o.price_pennies <= 0:
+            return float('inf')
+        brand = o.brand_info or {}
+        return brand.get('labor_skill', 1.0) * (1.0 + edu_weight * brand.get('education_level', 0)) / o.price_pennies
+
+    targeted = [[o, o.quantity] for o in buy_orders if o.target_agent_id is not None]
+    general = sorted(([o, o.quantity] for o in buy_orders if o.target_agent_id is None), key=lambda b: b[0].price_pennies, reverse=True)
+    by_agent = {}
+    for o in sell_orders:
+        by_agent.setdefault(o.agent_id, []).append(o)
+    sells = [[o, o.quantity] for lst in by_agent.values() for o in lst]
+    trades = []
+    leftover = []
+    for b in targeted:
+        for s in [s for s in sells if s[0].agent_id == b[0].target_agent_id]:
+            if b[1] <= 1e-9: break
+            if s[1] <= 1e-9: continue
+            if b[0].price_pennies >= s[0].price_pennies:
+                q = min(b[1], s[1])
+                trades.append((b[0].agent_id, s[0].agent_id, q, int(round(s[0].price_pennies * q))))
+                b[1] -= q
+                s[1] -= q
+        if b[1] > 1e-9:
+            leftover.append(b)
+    if leftover:
+        general = sorted(general + leftover, key=lambda b: b[0].price_pennies, reverse=True)
+    active = sorted((s for s in sells if s[1] > 1e-9), key=lambda s: utility(s[0]), reverse=True)
+    for b in general:
+        if b[1] <= 1e-9: continue
+        for s in active:
+            if s[1] <= 1e-9: continue
+            if b[0].price_pennies >= s[0].price_pennies:
+                if match_mode == 'MIDPOINT':
+                    p = (b[0].price_pennies + s[0].price_pennies) // 2
+                elif match_mode == 'ASK':
+                    p = s[0].price_pennies
+                else:
+                    p = b[0].price_pennies
+                q = min(b[1], s[1])
+                trades.append((b[0].agent_id, s[0].agent_id, q, int(round(p * q))))
+                b[1] -= q
+                s[1] -= q
+                if b[1] <= 1e-9: break
+    final_buys = [(b[0].agent_id, b[1]) for b in sorted((b for b in general if b[1] > 1e-9), key=lambda b: b[0].price_pennies, reverse=True)]
+    final_sells = [(s[0].agent_id, s[0].price_pennies, s[1]) for s in sorted((s for s in active if s[1] > 1e-9), key=lambda s: s[0].price_pennies)]
+    return trades, final_buys, final_sells
+
+
+class TestVectorizedLaborMatching:
+
+    def test_matches_legacy_loop_on_random_books(self):
+        import random
+        from modules.market.api import MarketConfigDTO
+        engine = OrderBookMatchingEngine()
+        for seed in range(25):
+            rng = random.Random(seed)
+            workers = [f'W{i}' for i in range(rng.randint(1, 40))]
+            sells = [
+                CanonicalOrderDTO(agent_id=rng.choice(workers), side='SELL', item_id='labor',
+                                  quantity=rng.choice([1.0, 0.5, 2.0, 1.0 / 3.0]),
+                                  price_pennies=rng.choice([0, 1000, 1200, rng.randint(500, 3000)]),
+                                  market_id='labor',
+                                  brand_info=rng.choice([None, {'labor_skill': rng.choice([1.0, 2.0, rng.uniform(0.5, 3.0)]), 'education_level': rng.randint(0, 4)}]))
+                for _ in range(rng.randint(1, 60))
+            ]
+            buys = [
+                CanonicalOrderDTO(agent_id=f'F{i}', side='BUY', item_id='labor',
+                                  quantity=rng.choice([1.0, 3.0, 2.5]),
+                                  price_pennies=rng.choice([1000, 1500, rng.randint(500, 3500)]),
+                                  market_id='labor',
+                                  target_agent_id=rng.choice([None, None, rng.choice(workers)]))
+                for i in range(rng.randint(1, 15))
+            ]
+            for mode in ('BID', 'ASK', 'MIDPOINT'):
+                config = MarketConfigDTO(labor_education_weight=0.2, labor_matching_mode=mode)
+                state = OrderBookStateDTO(buy_orders={'labor': list(buys)}, sell_orders={'labor': list(sells)}, market_id='labor')
+                result = engine.match(state, current_tick=1, config=config)
+                trades, final_buys, final_sells = _legacy_labor_utility_match(buys, sells, 0.2, mode)
+
+                assert [(tx.buyer_id, tx.seller_id, tx.quantity, tx.total_pennies) for tx in result.transactions] == trades
+                assert [(o.agent_id, o.quantity) for o in result.unfilled_buy_orders['labor']] == final_buys
+                assert [(o.agent_id, o.price_pennies, o.quantity) for o in result.unfilled_sell_orders['labor']] == final_sells
@@ -54,3 +54,45 @@ class TestPoliticalOrchestrator:
         orchestrator.reset_cycle()
         climate = orchestrator.calculate_political_climate(2)
         assert climate.overall_approval_rating == 0.5 # Default when no votes
+
+    def test_running_aggregates_match_full_recount(self):
+        import random
+        from collections import defaultdict
+        rng = random.Random(3)
+        grievances = ["NONE", "HIGH_TAX", "LOW_WELFARE", "INFLATION", "UNEMPLOYMENT", "HOUSING", "INEQUALITY", "CRIME"]
+        orchestrator = PoliticalOrchestrator(record_limit=50)
+        votes = [
+            VoteRecordDTO(agent_id=i, tick=1, approval_value=rng.random(),
+                          primary_grievance=rng.choice(grievances), political_weight=rng.choice([1.0, 1.0, 2.0, 10.0]))
+            for i in range(400)
+        ]
+        efforts = [
+            LobbyingEffortDTO(firm_id=i, tick=1, target_policy=rng.choice(["CORPORATE_TAX", "SUBSIDY_AGRI"]),
+                              desired_shift=rng.choice([-0.05, 0.05]), investment_pennies=rng.randint(1, 10000))
+            for i in range(60)
+        ]
+        for vote in votes:
+            orchestrator.register_vote(vote)
+        for effort in efforts:
+            orchestrator.register_lobbying(effort)
+
+        climate = orchestrator.calculate_political_climate(1)
+
+        # Full recount over every record, as the buffer-walking implementation did
+        total = sum(v.political_weight for v in votes)
+        approval = sum(v.approval_value * v.political_weight for v in votes) / total
+        counts = defaultdict(float)
+        for v in votes:
+            if v.primary_grievance != "NONE":
+                counts[v.primary_grievance] += v.political_weight
+        expected_top = [g for g, _ in sorted(counts.items(), key=lambda item: item[1], reverse=True)[:5]]
+        pressure = defaultdict(float)
+        for e in efforts:
+            pressure[e.target_policy] += e.investment_pennies * e.desired_shift
+
+        assert climate.overall_approval_rating == pytest.approx(approval)
+        assert climate.top_grievances == expected_top
+        assert climate.lobbying_pressure == pytest.approx(dict(pressure))
+        # Only the most recent records are retained
+        assert len(orchestrator._vote_buffer) == 50
+        assert len(orchestrator._lobbying_buffer) == 50
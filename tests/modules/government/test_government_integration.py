@@ -34,8 +34,8 @@ def test_execute_social_policy_integration(mock_config):
     # Setup Government
     gov = Government(id=1, initial_assets=1000000, config_module=mock_config) # $10,000
     gov.settlement_system = MagicMock()
-    # Mock transfer to return True
-    gov.settlement_system.transfer.return_value = True
+    # Every leg of the bulk batch succeeds
+    gov.settlement_system.execute_bulk_transfers.side_effect = lambda legs, tick, currency=DEFAULT_CURRENCY: [True] * len(legs)
 
     # Create Mock Agent conforming to IWelfareRecipient
     agent = MagicMock()
@@ -67,21 +67,20 @@ def test_execute_social_policy_integration(mock_config):
     # Benefit = 10.0 * 0.5 = 5.0.
 
     # Check settlement system calls
-    # Expect transfer from Gov to Agent for Welfare
-    gov.settlement_system.transfer.assert_called()
+    # Expect one bulk batch containing the Gov -> Agent welfare leg
+    gov.settlement_system.execute_bulk_transfers.assert_called_once()
 
-    # Find the welfare transfer call
-    calls = gov.settlement_system.transfer.call_args_list
+    # Find the welfare leg
+    legs = gov.settlement_system.execute_bulk_transfers.call_args.args[0]
     welfare_call = None
-    for call in calls:
-        args, kwargs = call
-        # signature: transfer(payer, payee, amount, memo, currency=...)
-        if args[0] == gov and args[1] == agent:
-            welfare_call = call
+    for leg in legs:
+        # leg: (payer, payee, amount, memo)
+        if leg[0] == gov and leg[1] == agent:
+            welfare_call = leg
             break
 
     assert welfare_call is not None, "Welfare transfer not found"
-    args, kwargs = welfare_call
+    args = welfare_call
     # Survival cost = 1000.0 * 1.0 = 1000. Benefit = 50% = 500.
     assert args[2] == 500
     assert args[3] == "welfare_support_unemployment"
@@ -90,7 +89,7 @@ def test_execute_social_policy_tax_and_welfare(mock_config):
     # Setup Government
     gov = Government(id=1, initial_assets=1000000, config_module=mock_config)
     gov.settlement_system = MagicMock()
-    gov.settlement_system.transfer.return_value = True
+    gov.settlement_system.execute_bulk_transfers.side_effect = lambda legs, tick, currency=DEFAULT_CURRENCY: [True] * len(legs)
 
     # Rich Unemployed Agent
     agent = MagicMock(spec=GoldenAgent)
@@ -119,12 +118,11 @@ def test_execute_social_policy_tax_and_welfare(mock_config):
     # Check Tax Transfer (Agent -> Gov)
     # Check Welfare Transfer (Gov -> Agent)
 
-    calls = gov.settlement_system.transfer.call_args_list
+    calls = gov.settlement_system.execute_bulk_transfers.call_args.args[0]
 
     # Tax Call
     tax_found = False
-    for call in calls:
-        args, kwargs = call
+    for args in calls:
         if args[0] == agent and args[1] == gov:
             assert args[2] == 10
             assert args[3] == "wealth_tax"
@@ -133,8 +131,7 @@ def test_execute_social_policy_tax_and_welfare(mock_config):
 
     # Welfare Call
     welfare_found = False
-    for call in calls:
-        args, kwargs = call
+    for args in calls:
         if args[0] == gov and args[1] == agent:
             # Survival cost 1000. Benefit 50% = 500.
             assert args[2] == 500
@@ -175,3 +172,73 @@ def test_make_policy_decision_integration(mock_config):
     # Should lower tax rates
     assert gov.income_tax_rate < 0.1
     assert gov.corporate_tax_rate < 0.2
+
+def _m2_economy(mock_config, treasury_pennies):
+    """Government, one unemployed household and a money-issuing central bank on real wallets."""
+    from modules.finance.wallet.wallet import Wallet
+    from modules.government.dtos import BondIssuanceResultDTO
+    from simulation.systems.settlement_system import FinancialSentry
+
+    gov = Government(id=1, initial_assets=treasury_pennies, config_module=mock_config)
+    household = MagicMock()
+    household.id = 101
+    household.is_active = True
+    household.is_employed = False
+    household.wallet = Wallet(101, {DEFAULT_CURRENCY: 5000})
+    household.get_balance.side_effect = lambda currency=DEFAULT_CURRENCY: household.wallet.get_balance(currency)
+    household.needs = {}
+    central_bank = MagicMock()
+    central_bank.id = 0
+    central_bank.wallet = Wallet(0, {DEFAULT_CURRENCY: 10**12})  # Outside M2
+
+    def move(payer, payee, amount, memo, currency=DEFAULT_CURRENCY):
+        if payer.wallet.get_balance(currency) < amount:
+            return None
+        with FinancialSentry.unlocked():
+            payer.wallet.subtract(amount, currency)
+            payee.wallet.add(amount, currency)
+        return True
+
+    gov.settlement_system = MagicMock()
+    gov.settlement_system.transfer.side_effect = move
+    gov.settlement_system.execute_bulk_transfers.side_effect = (
+        lambda legs, tick, currency=DEFAULT_CURRENCY: [move(p, q, a, m, currency) for p, q, a, m in legs]
+    )
+    gov.finance_system = MagicMock()
+    gov.fiscal_bond_service = MagicMock()
+    gov.fiscal_bond_service.issue_bonds.side_effect = lambda request, context, pool: BondIssuanceResultDTO(
+        payment_request=PaymentRequestDTO(payer=central_bank, payee=gov, amount=request.amount_pennies,
+                                          currency=DEFAULT_CURRENCY, memo="bond_issuance"),
+        bond_dto=MagicMock()
+    )
+    gov.gdp_history = [1000.0] * 20
+
+    def m2():
+        return gov.wallet.get_balance(DEFAULT_CURRENCY) + household.wallet.get_balance(DEFAULT_CURRENCY)
+
+    return gov, household, m2
+
+def test_welfare_shortfall_is_bond_funded_and_m2_grows_by_shortfall(mock_config):
+    market_data = {"goods_market": {"basic_food_current_sell_price": 10.0}, "total_production": 1000.0}
+    gov, household, m2 = _m2_economy(mock_config, treasury_pennies=200)
+    before = m2()
+
+    gov.execute_social_policy([household], market_data, current_tick=100)
+
+    # Benefit 500 vs treasury 200: bonds sold to the central bank cover exactly the 300 gap
+    gov.fiscal_bond_service.issue_bonds.assert_called_once()
+    assert gov.fiscal_bond_service.issue_bonds.call_args.args[0].amount_pennies == 300
+    assert household.wallet.get_balance(DEFAULT_CURRENCY) == 5500
+    assert gov.wallet.get_balance(DEFAULT_CURRENCY) == 0
+    assert m2() == before + 300
+
+def test_funded_welfare_leaves_m2_unchanged(mock_config):
+    market_data = {"goods_market": {"basic_food_current_sell_price": 10.0}, "total_production": 1000.0}
+    gov, household, m2 = _m2_economy(mock_config, treasury_pennies=1000000)
+    before = m2()
+
+    gov.execute_social_policy([household], market_data, current_tick=100)
+
+    gov.fiscal_bond_service.issue_bonds.assert_not_called()
+    assert household.wallet.get_balance(DEFAULT_CURRENCY) == 5500
+    assert m2() == before
@@ -52,3 +52,16 @@ def test_collect_wealth_tax_below_threshold(tax_service, golden_agent):
 
     assert len(result.payment_requests) == 0
     assert result.total_collected == 0 # Penny standard (int)
+
+def test_calculate_wealth_tax_batch_matches_scalar(tax_service):
+    import numpy as np
+    rng = np.random.default_rng(7)
+    # Include exact threshold, zero and half-penny boundaries
+    net_worths = np.concatenate([
+        rng.integers(0, 50_000_000, 2000),
+        np.array([0, 100000, 100001, 102500, 107500, 112500]),
+    ]).astype(np.int64)
+
+    batch = tax_service.calculate_wealth_tax_batch(net_worths)
+
+    assert batch.tolist() == [tax_service.calculate_wealth_tax(int(nw)) for nw in net_worths]
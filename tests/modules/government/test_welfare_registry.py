@@ -0,0 +1,85 @@
+import pytest
+from unittest.mock import MagicMock
+from simulation.agents.government import Government
+from modules.government.welfare.registry import WelfareRecipientRegistry, RecipientRosterDTO
+from modules.system.api import DEFAULT_CURRENCY
+from modules.system.constants import ID_SYSTEM
+from simulation.factories.golden_agents import create_golden_agent
+
+
+@pytest.fixture
+def mock_config():
+    config = MagicMock()
+    config.TICKS_PER_YEAR = 100
+    config.ANNUAL_WEALTH_TAX_RATE = 0.02
+    config.WEALTH_TAX_THRESHOLD = 100000
+    config.UNEMPLOYMENT_BENEFIT_RATIO = 0.5
+    config.HOUSEHOLD_FOOD_CONSUMPTION_PER_TICK = 1.0
+    config.GOODS_INITIAL_PRICE = {"basic_food": 10.0}
+    config.STIMULUS_TRIGGER_GDP_DROP = -0.1
+    return config
+
+
+def _household(agent_id, assets, is_employed):
+    return create_golden_agent(agent_id=agent_id, assets_pennies=assets, is_employed=is_employed)
+
+
+def test_registry_tracks_creation_and_death():
+    registry = WelfareRecipientRegistry()
+    assert not registry.is_tracking
+
+    households = [_household(i, 1000, True) for i in (11, 12, 13)]
+    registry.register_many(households)
+    firm = MagicMock(spec=["id", "is_active"])
+    firm.id = 99
+    assert registry.register(firm) is False
+
+    registry.unregister(12)
+
+    assert registry.is_tracking
+    assert len(registry) == 2
+    assert 12 not in registry and 99 not in registry
+    assert [a.id for a in registry.get_recipients()] == [11, 13]
+
+
+def test_roster_columns_match_agent_attributes():
+    agents = [_household(1, 500, False), _household(2, 300000, True), _household(3, 700, False)]
+    agents[2].is_active = False
+
+    roster = RecipientRosterDTO.from_agents(agents)
+
+    assert roster.is_active.tolist() == [True, True, False]
+    assert roster.is_unemployed.tolist() == [True, False, True]
+    # Inactive agents are never assessed, so their balance is not read
+    assert roster.balances.tolist() == [500, 300000, 0]
+
+
+def test_social_policy_uses_registry_and_records_revenue_once(mock_config):
+    gov = Government(id=1, initial_assets=1000000, config_module=mock_config)
+    gov.settlement_system = MagicMock()
+    gov.settlement_system.execute_bulk_transfers.side_effect = lambda legs, tick, currency=DEFAULT_CURRENCY: [True] * len(legs)
+    gov.gdp_history = [1000.0] * 20
+
+    rich = [_household(i, 200000, True) for i in (21, 22)]
+    poor = _household(23, 100, False)
+    gov.welfare_registry.register_many(rich + [poor])
+    gov.record_revenue = MagicMock(wraps=gov.record_revenue)
+
+    market_data = {"goods_market": {"basic_food_current_sell_price": 10.0}, "total_production": 1000.0}
+    # The stale agent list is ignored once the registry is tracking
+    txs = gov.execute_social_policy([], market_data, current_tick=5)
+
+    gov.settlement_system.execute_bulk_transfers.assert_called_once()
+    legs = gov.settlement_system.execute_bulk_transfers.call_args.args[0]
+    assert [(leg[0].id, leg[1].id, leg[2], leg[3]) for leg in legs] == [
+        (21, 1, 20, "wealth_tax"),
+        (22, 1, 20, "wealth_tax"),
+        (1, 23, 500, "welfare_support_unemployment"),
+    ]
+    assert len(txs) == 3
+
+    gov.record_revenue.assert_called_once()
+    recorded = gov.record_revenue.call_args.args[0]
+    assert recorded.amount_collected == 40
+    assert recorded.payer_id == ID_SYSTEM
+    assert gov.tax_service.get_tax_revenue()["wealth_tax"] == 40
@@ -192,6 +192,44 @@ class TestFinanceEngine:
         assert maint_tx.total_pennies == 1000
         assert maint_tx.price == 10.0
 
+    def test_dividends_settle_as_one_distribution(self):
+        from modules.finance.shareholder_registry import ShareholderRegistry
+        engine = FinanceEngine()
+        state = FinanceState()
+        state.total_shares = 1000.0
+        state.dividend_rate = 0.5
+        state.current_profit = {DEFAULT_CURRENCY: 20001}
+        config = MagicMock(spec=FirmConfigDTO)
+        config.inventory_holding_cost_rate = 0.0
+        config.firm_maintenance_fee = 0
+        config.bailout_repayment_ratio = 0.1
+
+        registry = ShareholderRegistry()
+        registry.register_shares(firm_id=1, agent_id=1, quantity=100.0) # Treasury shares
+        for agent_id in range(2, 302):
+            registry.register_shares(firm_id=1, agent_id=agent_id, quantity=3.0)
+
+        context = FinancialTransactionContext(
+            government_id=999,
+            tax_rates={},
+            market_context=MarketContextDTO(exchange_rates={DEFAULT_CURRENCY: 1.0}, benchmark_rates={}),
+            shareholder_registry=registry
+        )
+        transactions = engine.generate_financial_transactions(
+            state, firm_id=1, balances={DEFAULT_CURRENCY: 100000}, config=config, current_time=10, context=context, inventory_value=0
+        )
+
+        dividend_txs = [t for t in transactions if t.item_id == "dividend"]
+        assert len(dividend_txs) == 1
+        tx = dividend_txs[0]
+        assert tx.transaction_type == "dividend_distribution"
+        distribution = tx.metadata.original_metadata["distribution"]
+        # 900 of 1000 shares are held externally: floor(10000 * 0.9) pennies, exactly
+        assert tx.total_pennies == distribution.total_pennies == 9000
+        assert int(distribution.amounts_pennies.sum()) == 9000
+        assert distribution.recipient_count == 300
+        assert 1 not in distribution.holder_ids.tolist()
+
 class TestProductionEngine:
     def test_produce_depreciation(self):
         engine = ProductionEngine()
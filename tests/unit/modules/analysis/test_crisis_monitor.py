@@ -0,0 +1,96 @@
+import random
+
+import pytest
+from unittest.mock import MagicMock
+
+from modules.analysis.crisis_monitor import CrisisMonitor
+from modules.finance.domain.corporate_finance import AltmanZScoreCalculator
+from simulation.components.state.versioning import VersionedState
+
+
+class Ledger(VersionedState):
+    def __init__(self):
+        self.profit_history = []
+        self.total_debt_pennies = 0
+
+
+class FakeFirm:
+    """Firm stand-in: cash outside versioned state, everything else in a Ledger."""
+
+    def __init__(self, firm_id, cash):
+        self.id = firm_id
+        self.is_active = True
+        self.cash = cash
+        self.finance_state = Ledger()
+        self.production_state = Ledger()
+        self.sales_state = Ledger()
+        self.inventory_component = Ledger()
+        self.snapshot_reads = 0
+
+    def get_financial_snapshot(self):
+        self.snapshot_reads += 1
+        history = self.finance_state.profit_history
+        return {
+            "total_assets": self.cash,
+            "working_capital": self.cash - self.finance_state.total_debt_pennies,
+            "retained_earnings": sum(history),
+            "average_profit": int(sum(history) / len(history)) if history else 0,
+            "total_debt": self.finance_state.total_debt_pennies,
+        }
+
+
+def scalar_distribution(firms):
+    counts = [0, 0, 0]
+    for firm in firms:
+        if not firm.is_active:
+            continue
+        z = AltmanZScoreCalculator.calculate(**{k: v for k, v in firm.get_financial_snapshot().items() if k != "total_debt"})
+        counts[0 if z > 2.99 else 1 if z >= 1.81 else 2] += 1
+    return counts
+
+
+@pytest.fixture
+def monitor(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return CrisisMonitor(logger=MagicMock(), run_id=0, full_refresh_interval=1000)
+
+
+def test_incremental_distribution_matches_full_recalculation(monitor):
+    rng = random.Random(7)
+    firms = [FakeFirm(i, rng.randint(-500, 5000)) for i in range(60)]
+
+    for tick in range(40):
+        for firm in rng.sample(firms, 10):
+            if rng.random() < 0.5:
+                firm.cash += rng.randint(-2000, 2000)
+                monitor.mark_dirty(firm.id)  # Settlement-fed
+            else:
+                firm.finance_state.profit_history.append(rng.randint(-800, 1500))
+        if tick % 10 == 5:
+            firms[tick].is_active = False
+        if tick == 20:
+            firms.append(FakeFirm(100, 4000))
+
+        dto = monitor.monitor(tick, firms)
+        assert [dto.safe, dto.gray, dto.distress] == scalar_distribution(firms)
+        assert dto.active == sum(f.is_active for f in firms)
+
+    for firm in firms:
+        if firm.is_active:
+            expected = AltmanZScoreCalculator.calculate(**{k: v for k, v in firm.get_financial_snapshot().items() if k != "total_debt"})
+            assert monitor.get_z_scores()[firm.id] == expected
+
+
+def test_only_changed_firms_are_reread(monitor):
+    firms = [FakeFirm(i, 1000) for i in range(5)]
+    monitor.monitor(0, firms)
+    assert monitor.rows_refreshed == 5
+
+    monitor.monitor(1, firms)
+    assert monitor.rows_refreshed == 5
+
+    firms[0].finance_state.total_debt_pennies = 900
+    monitor.mark_dirty(firms[3].id)
+    monitor.monitor(2, firms)
+    assert monitor.rows_refreshed == 7
+    assert [f.snapshot_reads for f in firms] == [2, 1, 1, 2, 1]
@@ -0,0 +1,108 @@
+import random
+import statistics
+
+import pytest
+from unittest.mock import MagicMock
+
+from modules.analysis.phenomena_analyzer import PhenomenaAnalyzer
+from modules.analysis.storm_verifier import StormVerifier
+from modules.analysis.streaming import EpisodeTracker, RollingMax, RollingStats, RunningStats
+from modules.simulation.api import EconomicIndicatorsDTO
+
+
+def test_running_statistics_match_full_recalculation():
+    rng = random.Random(3)
+    values = [rng.uniform(50.0, 150.0) for _ in range(500)]
+    running, rolling, peak = RunningStats(), RollingStats(30), RollingMax(30)
+
+    for tick, value in enumerate(values):
+        running.push(value)
+        rolling.push(value)
+        assert peak.push(tick, value) == max(values[max(0, tick - 29):tick + 1])
+
+    assert running.mean == pytest.approx(statistics.mean(values))
+    assert running.stdev == pytest.approx(statistics.stdev(values))
+    assert rolling.mean == pytest.approx(statistics.mean(values[-30:]))
+    assert rolling.stdev == pytest.approx(statistics.stdev(values[-30:]))
+
+
+def test_episode_tracker_merges_consecutive_ticks():
+    tracker = EpisodeTracker("Test")
+    assert tracker.step(1, True, 0.2, "a") is not None
+    assert tracker.step(2, True, 0.6, "b") is None
+    tracker.step(3, False)
+    tracker.step(5, True, 0.1, "c")
+
+    assert [(e['start_tick'], e['end_tick'], e['severity'], e['message']) for e in tracker.events] == [
+        (1, 2, 0.6, "b"), (5, 5, 0.1, "c")
+    ]
+
+
+def make_analyzer():
+    def conf(module, **thresholds):
+        return {'enabled': True, 'module': f'modules.analysis.detectors.{module}', 'thresholds': thresholds}
+
+    return PhenomenaAnalyzer({
+        'detectors': {
+            'bubble': conf('BubbleDetector', window=10),
+            'crash': conf('CrashDetector', window=20, drawdown_threshold=0.2),
+            'stagflation': conf('StagflationDetector', unemployment_threshold=0.1),
+        },
+        'resilience_weights': {}
+    })
+
+
+def test_streaming_detectors_report_live_episodes():
+    analyzer = make_analyzer()
+    sim_state = MagicMock()
+    path = (
+        [(100.0, 1.0 + 0.001 * (t % 3), 0.05) for t in range(20)]           # calm
+        + [(100.0, 1.0 * 1.08 ** (t + 1), 0.05) for t in range(5)]          # price run-up
+        + [(100.0 - 15.0 * (t + 1), 1.5, 0.05) for t in range(3)]           # crash
+        + [(55.0 - t, 1.5 * 1.1 ** (t + 1), 0.15) for t in range(6)]        # stagflation
+    )
+
+    live = []
+    for tick, (gdp, cpi, unemployment) in enumerate(path):
+        sim_state.get_economic_indicators.return_value = EconomicIndicatorsDTO(gdp=gdp, cpi=cpi, unemployment_rate=unemployment)
+        before = len(analyzer.recent_events)
+        analyzer.run_tick(tick, sim_state)
+        live.extend((tick, e['detector_name']) for e in list(analyzer.recent_events)[before:])
+
+    assert (20, 'BubbleDetector') in live
+    assert (26, 'CrashDetector') in live
+    assert any(name == 'StagflationDetector' and tick >= 28 for tick, name in live)
+    sim_state.get_system_state.assert_not_called()  # Streaming detectors only read indicators
+
+    report = analyzer.generate_report()
+    crash = [e for e in report['detected_events'] if e['detector_name'] == 'CrashDetector']
+    assert len(crash) == 1 and crash[0]['start_tick'] == 26 and crash[0]['end_tick'] == len(path) - 1
+
+
+def test_storm_verifier_volatility_from_running_stats():
+    simulation = MagicMock()
+    simulation.central_bank = None
+    simulation.government = None
+    simulation.households = []
+    verifier = StormVerifier({'zlb_threshold': 0.0, 'deficit_spending_threshold': 0.0, 'basic_food_key': 'food',
+                              'max_starvation_rate': 1.0, 'max_debt_to_gdp': 1.0}, simulation)
+    gdp = [100.0, 104.0, 97.0, 110.0]
+    for tick, value in enumerate(gdp):
+        verifier.update(tick, {'gdp': value, 'cpi': 1.0 + tick})
+
+    metrics = verifier.generate_report()['volatility_metrics']
+    assert metrics['gdp_stdev'] == pytest.approx(statistics.stdev(gdp))
+    assert metrics['cpi_rolling_mean'] == pytest.approx(2.5)
+
+
+def test_key_timeseries_keep_only_the_newest_window():
+    analyzer = PhenomenaAnalyzer({'detectors': {}, 'resilience_weights': {}, 'timeseries_window': 50})
+    sim_state = MagicMock()
+    for tick in range(200):
+        sim_state.get_economic_indicators.return_value = EconomicIndicatorsDTO(gdp=float(tick), cpi=1.0, unemployment_rate=0.05)
+        analyzer.run_tick(tick, sim_state)
+
+    timeseries = analyzer.generate_report()['key_timeseries']
+    assert timeseries['gdp'] == [float(t) for t in range(150, 200)]
+    assert len(timeseries['cpi']) == 50
+    assert analyzer.simulation_ticks == 199
@@ -0,0 +1,77 @@
+import sqlite3
+
+import numpy as np
+import pytest
+
+from modules.analytics.loader import DataLoader
+from simulation.db.schema import create_tables
+
+
+@pytest.fixture
+def loader(tmp_path):
+    db_path = str(tmp_path / "analytics.db")
+    conn = sqlite3.connect(db_path)
+    create_tables(conn)
+    for run_id in (1, 2):
+        conn.execute(
+            "INSERT INTO simulation_runs (run_id, start_time, config_hash) VALUES (?, '2024-01-01', 'h')", (run_id,)
+        )
+        for tick in range(5):
+            conn.execute(
+                "INSERT INTO economic_indicators (run_id, time, unemployment_rate, avg_wage) VALUES (?, ?, ?, ?)",
+                (run_id, tick, 0.05 * run_id, 10.0 * tick),
+            )
+            for agent_id in range(1000):
+                conn.execute(
+                    "INSERT INTO agent_states (run_id, time, agent_id, agent_type, assets, is_active) "
+                    "VALUES (?, ?, ?, ?, ?, 1)",
+                    (run_id, tick, agent_id, "household" if agent_id % 4 else "firm", run_id * 1000 + agent_id * 10 + tick),
+                )
+    conn.commit()
+    conn.close()
+    return DataLoader(db_path)
+
+
+def test_composite_indexes_serve_run_and_agent_queries(loader):
+    conn = sqlite3.connect(loader.db_path)
+    plan = " ".join(str(row) for row in conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM agent_states WHERE run_id = ? AND agent_id = ? ORDER BY time", (1, 7)
+    ))
+    conn.close()
+    assert "idx_agent_states_run_agent_time" in plan
+
+
+def test_agent_state_filters_are_pushed_down(loader):
+    df = loader.load_agent_states(run_id=2, columns=["agent_id", "assets"], agent_ids=[3, 7], start_tick=1, end_tick=3)
+    assert list(df.columns) == ["agent_id", "assets"]
+    assert sorted(df["agent_id"].unique()) == [3, 7]
+    assert len(df) == 6
+    assert (df["assets"] >= 2000).all()
+
+    firms = loader.load_agent_states(run_id="latest", agent_type="firm", columns=["agent_id"])
+    assert len(firms) == 250 * 5
+
+    # Large id lists are bound as a single JSON parameter
+    many = loader.load_agent_states(run_id=1, columns=["agent_id"], agent_ids=range(600), end_tick=0)
+    assert len(many) == 600
+    assert loader.load_agent_states(run_id=1, agent_ids=[]).empty
+
+
+def test_chunked_reads_match_full_read(loader):
+    full = loader.load_agent_states(run_id=1, columns=["time", "agent_id", "assets"])
+    chunks = list(loader.iter_agent_states(run_id=1, columns=["time", "agent_id", "assets"], chunksize=700))
+    assert max(len(c) for c in chunks) == 700
+    assert sum(len(c) for c in chunks) == len(full)
+
+    series = loader.load_agent_series("assets", run_id=1, chunksize=700)
+    assert isinstance(series["assets"], np.ndarray)
+    np.testing.assert_array_equal(series["assets"], full["assets"].to_numpy())
+
+
+def test_indicator_projection_and_unknown_columns(loader):
+    df = loader.load_economic_indicators(run_id=1, columns=["avg_wage"], start_tick=2)
+    assert list(df.index) == [2, 3, 4]
+    assert list(df.columns) == ["avg_wage"]
+
+    with pytest.raises(ValueError):
+        loader.load_agent_states(run_id=1, columns=["assets; DROP TABLE agent_states"])
@@ -0,0 +1,115 @@
+import random
+import unittest
+from types import SimpleNamespace
+
+from modules.labor.system import execute_labor_matching, LaborMarket
+from modules.labor.api import JobOfferDTO, JobSeekerDTO
+from modules.common.enums import IndustryDomain
+from modules.simulation.api import AgentID
+from simulation.dtos.api import JobMatchContextDTO
+
+
+def _legacy_matching(context, config=None):
+    """Reference copy of the original O(S*O) greedy matcher."""
+    seekers = sorted(context.available_seekers, key=lambda s: getattr(s, 'talent_score', 1.0), reverse=True)
+    unmatched_offers = sorted(context.available_offers, key=lambda o: getattr(o, 'offer_wage_pennies', 0), reverse=True)
+    compat = getattr(config, 'compatibility', {}) if config else {}
+    m_perfect = compat.get('PERFECT', 1.2)
+    m_partial = compat.get('PARTIAL', 1.0)
+    m_mismatch = compat.get('MISMATCH', 0.8)
+    m_general = compat.get('GENERAL_PENALTY', 1.0)
+
+    matched_pairs, wages, unmatched_seekers = {}, {}, []
+    for seeker in seekers:
+        best_offer, best_score, best_wage = None, -1.0, 0
+        for offer in unmatched_offers:
+            res = seeker.reservation_wage_pennies
+            wage = offer.offer_wage_pennies
+            base = 1.0 if res <= 0 else wage / res
+            if base < 0.9:
+                continue
+            talent_mult = 1.0 + (seeker.talent_score - 1.0) * 0.5
+            if offer.major == seeker.major:
+                major_mult = m_perfect
+            elif seeker.secondary_majors and offer.major in seeker.secondary_majors:
+                major_mult = m_partial
+            elif offer.major == IndustryDomain.GENERAL or seeker.major == IndustryDomain.GENERAL:
+                major_mult = m_general
+            else:
+                major_mult = m_mismatch
+            edu_mult = 1.0
+            if seeker.education_level < offer.required_education:
+                edu_mult = 0.5
+            elif seeker.education_level > offer.required_education:
+                edu_mult = 1.05
+            score = base * major_mult * edu_mult * talent_mult
+            if score > best_score and seeker.talent_score >= offer.min_match_score:
+                best_score, best_offer = score, offer
+                surplus = wage - res
+                best_wage = int(res + surplus * 0.5) if surplus > 0 else wage
+        if best_offer:
+            matched_pairs[seeker.household_id] = best_offer.firm_id
+            wages[seeker.household_id] = best_wage
+            unmatched_offers.remove(best_offer)
+        else:
+            unmatched_seekers.append(seeker.household_id)
+    return matched_pairs, wages, unmatched_seekers, unmatched_offers
+
+
+def _random_market(rng, n_seekers, n_offers):
+    majors = [IndustryDomain.GENERAL, IndustryDomain.FOOD_PROD, IndustryDomain.TECHNOLOGY, IndustryDomain.FINANCE]
+    offers = [
+        JobOfferDTO(
+            firm_id=AgentID(rng.randint(1, n_offers // 3 + 1)),
+            offer_wage_pennies=rng.choice([1000, 1200, 1500, rng.randint(800, 3000)]),
+            required_education=rng.randint(0, 3),
+            major=rng.choice(majors),
+            min_match_score=rng.choice([0.0, 0.0, 0.0, 1.0]),
+        )
+        for _ in range(n_offers)
+    ]
+    seekers = [
+        JobSeekerDTO(
+            household_id=AgentID(1000 + i),
+            reservation_wage_pennies=rng.choice([0, 1000, rng.randint(500, 3000)]),
+            education_level=rng.randint(0, 3),
+            major=rng.choice(majors),
+            secondary_majors=rng.sample(majors, rng.randint(0, 2)),
+            talent_score=rng.choice([1.0, 0.8, rng.uniform(0.5, 2.0)]),
+        )
+        for i in range(n_seekers)
+    ]
+    return seekers, offers
+
+
+class TestBucketedLaborMatching(unittest.TestCase):
+
+    def test_matches_legacy_greedy(self):
+        configs = [None, SimpleNamespace(compatibility={'PERFECT': 1.5, 'MISMATCH': 0.6, 'GENERAL_PENALTY': 0.9})]
+        for seed in range(20):
+            rng = random.Random(seed)
+            seekers, offers = _random_market(rng, rng.randint(1, 80), rng.randint(1, 60))
+            context = JobMatchContextDTO(tick=1, available_seekers=seekers, available_offers=offers, market_panic_index=0.0)
+            for config in configs:
+                expected = _legacy_matching(context, config)
+                result = execute_labor_matching(context, config)
+
+                self.assertEqual(result.matched_pairs, expected[0])
+                self.assertEqual(result.agreed_wages_pennies, expected[1])
+                self.assertEqual(result.unmatched_seekers, expected[2])
+                self.assertEqual([id(o) for o in result.unmatched_offers], [id(o) for o in expected[3]])
+                for seeker_id, offer in result.matched_offers.items():
+                    self.assertEqual(offer.firm_id, result.matched_pairs[seeker_id])
+
+    def test_match_market_reports_offer_actually_taken(self):
+        market = LaborMarket()
+        market.post_job_offer(JobOfferDTO(firm_id=AgentID(1), offer_wage_pennies=2000))
+        market.post_job_offer(JobOfferDTO(firm_id=AgentID(1), offer_wage_pennies=1200))
+        market.post_job_seeker(JobSeekerDTO(household_id=AgentID(10), reservation_wage_pennies=1000, education_level=0, talent_score=1.5))
+        market.post_job_seeker(JobSeekerDTO(household_id=AgentID(11), reservation_wage_pennies=1000, education_level=0))
+
+        matches = {m.employee_id: m for m in market.match_market(current_tick=1)}
+
+        self.assertEqual(matches[10].base_wage_pennies, 2000)
+        self.assertEqual(matches[11].base_wage_pennies, 1200)
+        self.assertEqual(matches[11].surplus_pennies, 200)
@@ -0,0 +1,104 @@
+import pytest
+from unittest.mock import MagicMock
+from modules.system.event_bus.event_bus import EventBus
+from modules.system.event_bus.api import DeliveryMode
+
+
+def _event(event_type, value=0):
+    return {"event_type": event_type, "value": value}
+
+
+def test_immediate_handlers_run_inline():
+    bus = EventBus()
+    handler = MagicMock()
+    bus.subscribe("LOAN_DEFAULTED", handler)
+
+    event = _event("LOAN_DEFAULTED")
+    bus.publish(event)
+
+    handler.assert_called_once_with(event)
+
+
+def test_deferred_handlers_wait_for_their_boundary():
+    bus = EventBus()
+    phase_handler = MagicMock()
+    tick_handler = MagicMock()
+    bus.subscribe("PRICE", phase_handler, delivery=DeliveryMode.PHASE)
+    bus.subscribe("PRICE", tick_handler, delivery=DeliveryMode.TICK)
+
+    bus.publish(_event("PRICE", 1))
+    bus.publish(_event("PRICE", 2))
+    phase_handler.assert_not_called()
+    tick_handler.assert_not_called()
+
+    assert bus.flush(DeliveryMode.PHASE) == 2
+    assert [c.args[0]["value"] for c in phase_handler.call_args_list] == [1, 2]
+    tick_handler.assert_not_called()
+
+    assert bus.flush(DeliveryMode.TICK) == 2
+    assert [c.args[0]["value"] for c in tick_handler.call_args_list] == [1, 2]
+    assert bus.flush(DeliveryMode.TICK) == 0
+
+
+def test_batch_handler_receives_event_list_once():
+    bus = EventBus()
+    received = []
+    bus.subscribe("TRADE", received.append, batch=True)
+
+    for i in range(5):
+        bus.publish(_event("TRADE", i))
+    bus.flush()
+
+    assert len(received) == 1
+    assert [e["value"] for e in received[0]] == [0, 1, 2, 3, 4]
+
+
+def test_events_published_during_flush_are_kept_for_next_flush():
+    bus = EventBus()
+    seen = []
+
+    def handler(event):
+        seen.append(event["value"])
+        if event["value"] == 0:
+            bus.publish(_event("CHAIN", 1))
+
+    bus.subscribe("CHAIN", handler, delivery=DeliveryMode.TICK)
+    bus.publish(_event("CHAIN", 0))
+
+    bus.flush()
+    assert seen == [0]
+    bus.flush()
+    assert seen == [0, 1]
+
+
+def test_subscriber_cache_invalidated_on_subscribe():
+    bus = EventBus()
+    first, second = MagicMock(), MagicMock()
+    bus.subscribe("X", first)
+    bus.publish(_event("X"))
+    bus.subscribe("X", second)
+    bus.publish(_event("X"))
+
+    assert first.call_count == 2
+    assert second.call_count == 1
+
+
+def test_metrics_count_events_and_handler_errors():
+    ticks = iter([0.0, 1.0, 1.5, 2.0, 2.25, 4.0])
+    bus = EventBus(clock=lambda: next(ticks))
+
+    def failing(_):
+        raise ValueError("boom")
+
+    bus.subscribe("A", failing)
+    bus.publish(_event("A"))
+    bus.publish(_event("A"))
+
+    metrics = bus.get_metrics()
+    assert metrics.published == 2
+    assert metrics.handler_calls == 2
+    assert metrics.handler_errors == 2
+    assert metrics.published_by_type == {"A": 2}
+    assert metrics.avg_handler_latency_ms == pytest.approx(375.0)
+    assert metrics.max_handler_latency_ms == pytest.approx(500.0)
+    assert metrics.events_per_sec == pytest.approx(0.5)
@@ -0,0 +1,95 @@
+import pytest
+from unittest.mock import MagicMock
+
+from simulation.orchestration.agent_service import AgentService
+from simulation.orchestration.read_model import ReadModelPublisher, ReadModelReader, ReadModelSnapshot
+from tests.unit.modules.watchtower.test_agent_service import create_mock_household, create_mock_firm
+
+
+@pytest.fixture
+def mock_simulation():
+    sim = MagicMock()
+    sim.world_state = MagicMock()
+    sim.world_state.time = 3
+    sim.world_state.tracker.metrics = {"gdp": [100.0, 110.0, 121.0], "unemployment_rate": [0.05]}
+    agents = {i: create_mock_household(i) for i in range(101, 106)}
+    agents[103].is_active = False
+    agents[201] = create_mock_firm(201)
+    sim.world_state.agents = agents
+    return sim
+
+
+def test_published_model_matches_agent_service(mock_simulation):
+    service = AgentService(mock_simulation)
+    snapshot = ReadModelPublisher(mock_simulation).publish()
+
+    assert snapshot.version == 1 and snapshot.tick == 3
+    assert snapshot.get_agents_basic(limit=500) == service.get_agents_basic(limit=500)
+    assert snapshot.get_agents_basic(limit=2) == service.get_agents_basic(limit=2)
+    for agent_id in (101, 103, 201):
+        assert snapshot.get_agent_detail(agent_id) == service.get_agent_detail(agent_id)
+    assert snapshot.get_agent_detail(999) is None
+    assert list(snapshot.get_indicator("gdp")) == [100.0, 110.0, 121.0]
+
+
+def test_published_snapshot_is_isolated_from_live_state(mock_simulation):
+    publisher = ReadModelPublisher(mock_simulation)
+    first = publisher.publish()
+
+    household = mock_simulation.world_state.agents[101]
+    household.total_wealth = 1
+    household.inventory["apple"] = 99
+    assert publisher.publish() is first  # Same tick: nothing new to publish
+
+    mock_simulation.world_state.time = 4
+    second = publisher.publish()
+    assert second.version == 2 and publisher.latest is second
+    assert first.get_agent_detail(101).wealth == 5000
+    assert first.get_agent_detail(101).inventory == {"apple": 2}
+    assert second.get_agent_detail(101).wealth == 1
+    with pytest.raises(ValueError):
+        first.agents["wealth"][0] = 0
+
+
+def test_reader_maps_published_file(mock_simulation, tmp_path):
+    path = str(tmp_path / "read_model.bin")
+    publisher = ReadModelPublisher(mock_simulation, path=path)
+    reader = ReadModelReader(path)
+    assert len(reader.latest) == 0  # Nothing published yet
+
+    published = publisher.publish()
+    loaded = reader.latest
+    assert loaded.version == published.version and loaded.tick == published.tick
+    assert loaded.get_agents_basic() == published.get_agents_basic()
+    assert loaded.get_agent_detail(201) == published.get_agent_detail(201)
+    assert list(loaded.get_indicator("unemployment_rate")) == [0.05]
+    assert reader.latest is loaded  # Not re-mapped until a new version lands
+
+    mock_simulation.world_state.time = 5
+    publisher.publish()
+    assert reader.latest.version == 2
+    assert loaded.get_agent_detail(101).wealth == 5000  # Old mapping stays readable
+
+
+def test_round_trip_keeps_watchtower_snapshot():
+    from simulation.dtos.watchtower import (
+        WatchtowerSnapshotDTO, IntegrityDTO, MacroDTO, FinanceDTO, FinanceRatesDTO, FinanceSupplyDTO,
+        PoliticsDTO, PoliticsApprovalDTO, PoliticsStatusDTO, PoliticsFiscalDTO, PopulationDTO,
+        PopulationDistributionDTO, PopulationMetricsDTO
+    )
+    watchtower = WatchtowerSnapshotDTO(
+        tick=7, timestamp=1.5, status="RUNNING",
+        integrity=IntegrityDTO(m2_leak=0, fps=2.0),
+        macro=MacroDTO(gdp=1000, cpi=1.02, unemploy=0.05, gini=0.3),
+        finance=FinanceDTO(rates=FinanceRatesDTO(base=5.0, call=5.0, loan=4.0, savings=2.0),
+                           supply=FinanceSupplyDTO(m0=1, m1=2, m2=3, velocity=1.1)),
+        politics=PoliticsDTO(approval=PoliticsApprovalDTO(total=0.6, low=0.6, mid=0.6, high=0.6),
+                             status=PoliticsStatusDTO(ruling_party="BLUE", cohesion=0.5),
+                             fiscal=PoliticsFiscalDTO(revenue=10, welfare=0, debt=0)),
+        population=PopulationDTO(distribution=PopulationDistributionDTO(q1=1, q2=2, q3=3, q4=4, q5=5),
+                                 active_count=10, metrics=PopulationMetricsDTO(birth=0.0, death=0.0)),
+    )
+    snapshot = ReadModelSnapshot(version=1, tick=7, agents=ReadModelSnapshot.empty().agents, watchtower=watchtower)
+
+    assert ReadModelSnapshot.from_buffer(snapshot.to_bytes()).watchtower == watchtower
+    assert ReadModelSnapshot.from_buffer(ReadModelSnapshot.empty().to_bytes()).watchtower is None
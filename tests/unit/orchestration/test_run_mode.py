@@ -0,0 +1,201 @@
+import random
+
+from unittest.mock import MagicMock, patch
+
+import simulation
+from modules.common.config_manager.api import ConfigManager
+from modules.finance.wallet.wallet import Wallet
+from modules.system.api import DEFAULT_CURRENCY
+from simulation.engine import Simulation
+from simulation.orchestration.api import IPhaseStrategy
+from simulation.orchestration.phases.post_sequence import Phase5_PostSequence
+from simulation.orchestration.phases.scenario_analysis import Phase_ScenarioAnalysis
+from simulation.orchestration.run_mode import RunModeController, compute_state_hash
+from simulation.systems.settlement_system import FinancialSentry
+
+
+class Trader:
+    def __init__(self, agent_id):
+        self.id = agent_id
+        self.is_active = True
+        self.wallet = Wallet(agent_id, {DEFAULT_CURRENCY: 10_000})
+        self.inventory = {"food": 5.0}
+
+    def get_all_balances(self):
+        return self.wallet.get_all_balances()
+
+    def get_all_items(self):
+        return dict(self.inventory)
+
+
+class FoodMarket:
+    def __init__(self):
+        self.last_traded_prices = {}
+        self.volume = 0
+
+    def get_daily_volume(self):
+        return self.volume
+
+    def clear_orders(self):
+        pass
+
+
+class Treasury:
+    """Government stand-in: levies a per-trade fee and tracks a running deficit."""
+
+    def __init__(self):
+        self.id = 0
+        self.total_debt = 0
+        self.income_tax_rate = 0.1
+
+    def finalize_tick(self, tick):
+        self.total_debt += tick % 3
+
+
+class TradingPhase(IPhaseStrategy):
+    """Deterministic stand-in economy: seeded trades plus thought logging."""
+
+    def execute(self, state):
+        rng = random.Random(state.time)
+        traders = sorted(state.agents.values(), key=lambda a: a.id)
+        market = state.markets["food"]
+        for _ in range(5):
+            buyer, seller = rng.sample(traders, 2)
+            price = rng.randint(1, 50)
+            if buyer.wallet.get_balance(DEFAULT_CURRENCY) >= price and seller.inventory["food"] >= 1.0:
+                with FinancialSentry.unlocked():
+                    buyer.wallet.subtract(price, DEFAULT_CURRENCY)
+                    seller.wallet.add(price, DEFAULT_CURRENCY)
+                seller.inventory["food"] -= 1.0
+                buyer.inventory["food"] += 1.0
+                market.last_traded_prices["food"] = price / 100.0
+                market.volume += 1
+                simulation.logger.log_thought(state.time, str(buyer.id), "BUY", "OK", "TRADE")
+        return state
+
+
+def build_simulation(fast_forward=None):
+    config_manager = MagicMock(spec=ConfigManager)
+    config_manager.get.side_effect = lambda key, default=None: (
+        fast_forward if key == "simulation.fast_forward" else default
+    )
+    registry = MagicMock()
+    registry.get.side_effect = lambda key, default=None: default
+    with patch("simulation.engine.SimulationLogger"), patch("simulation.engine.DBManager"):
+        sim = Simulation(config_manager, MagicMock(), MagicMock(), MagicMock(), registry,
+                         MagicMock(), MagicMock(), MagicMock(), MagicMock())
+    ws = sim.world_state
+    thoughts, flushes = [], []
+    sim.simulation_logger.suspended = False
+    sim.simulation_logger.log_thought.side_effect = (
+        lambda *args: None if sim.simulation_logger.suspended else thoughts.append(args)
+    )
+    sim.simulation_logger.flush.side_effect = lambda: flushes.append(ws.time)
+
+    ws.agents = {agent_id: Trader(agent_id) for agent_id in range(1, 7)}
+    ws.next_agent_id = 7
+    ws.markets = {"food": FoodMarket()}
+    ws.government = Treasury()
+    ws.batch_save_interval = 10
+    ws.tracker = MagicMock()
+    ws.tracker.get_latest_indicators.return_value = {}
+    ws.tracker.capture_market_context.return_value = None
+    ws.telemetry_collector = MagicMock()
+    ws.scenario_verifier = MagicMock()
+    ws.scenario_verifier.verify_tick.return_value = []
+    ws.telemetry_exchange = None
+    # Recording observers reached from Phase5_PostSequence
+    ws.analytics_system = MagicMock()
+    ws.analytics_system.aggregate_tick_data.return_value = ([], [], None, [])
+    ws.persistence_manager = MagicMock()
+    ws.crisis_monitor = MagicMock()
+    ws.generational_wealth_audit = MagicMock()
+    for name in ("housing_system", "lifecycle_manager", "ma_manager", "bank", "stock_market"):
+        setattr(ws, name, None)
+    sim.tick_orchestrator.phases = [TradingPhase(), Phase_ScenarioAnalysis(ws), Phase5_PostSequence(ws)]
+    return sim, thoughts, flushes
+
+
+def run(sim, ticks):
+    simulation.logger = sim.simulation_logger  # Agents log thoughts through the module global
+    hashes = []
+    for _ in range(ticks):
+        sim.run_tick()
+        hashes.append(compute_state_hash(sim.world_state))
+    return hashes
+
+
+def called_ticks(mock_method):
+    return [c.args[0] for c in mock_method.call_args_list]
+
+
+def test_fast_forward_keeps_state_hash_identical(monkeypatch):
+    monkeypatch.setattr(simulation, "logger", getattr(simulation, "logger", None), raising=False)
+    baseline, baseline_thoughts, baseline_flushes = build_simulation()
+    baseline_hashes = run(baseline, 50)
+    headless, headless_thoughts, headless_flushes = build_simulation(
+        fast_forward=[{"start_tick": 1, "end_tick": 40, "sample_interval": 7}]
+    )
+    headless_hashes = run(headless, 50)
+
+    assert headless_hashes == baseline_hashes
+    assert len(set(baseline_hashes)) > 1  # The economy actually moved
+
+    # Ticks 7, 14, 21, 28, 35 are sampled; 41-50 are outside the window
+    observed = [7, 14, 21, 28, 35] + list(range(41, 51))
+    ws = headless.world_state
+    assert ws.telemetry_collector.harvest.call_count == 15
+    assert baseline.world_state.telemetry_collector.harvest.call_count == 50
+    assert headless.simulation_logger.log_snapshot.call_count == 15
+    assert headless.db_manager.flush.call_count == 15
+    assert ws.run_mode.suspended_ticks == 35
+    suspended = set(range(1, 41)) - set(observed)
+    assert {t[0] for t in headless_thoughts} == {t[0] for t in baseline_thoughts} - suspended
+
+    # Post-sequence observers run on observed ticks only
+    assert ws.analytics_system.aggregate_tick_data.call_count == 15
+    assert ws.persistence_manager.buffer_data.call_count == 15
+    assert called_ticks(ws.crisis_monitor.monitor) == observed
+    assert called_ticks(baseline.world_state.crisis_monitor.monitor) == list(range(1, 51))
+    ws.generational_wealth_audit.run_audit.assert_not_called()
+
+    # Boundaries 10, 20, 30 and 40 fall on suspended ticks and are flushed on the next observed one
+    assert baseline_flushes == [10, 20, 30, 40, 50]
+    assert headless_flushes == [14, 21, 35, 41, 50]
+    assert called_ticks(ws.persistence_manager.checkpoint_state) == [14, 21, 35, 41, 50]
+    assert called_ticks(baseline.world_state.persistence_manager.checkpoint_state) == [10, 20, 30, 40, 50]
+
+
+def test_state_hash_covers_markets_and_institutions(monkeypatch):
+    monkeypatch.setattr(simulation, "logger", getattr(simulation, "logger", None), raising=False)
+    sim, _, _ = build_simulation()
+    run(sim, 3)
+    ws = sim.world_state
+    before = compute_state_hash(ws)
+
+    ws.markets["food"].last_traded_prices["food"] += 0.01
+    after_market = compute_state_hash(ws)
+    ws.government.total_debt += 1
+    after_government = compute_state_hash(ws)
+    ws.bank = MagicMock(base_rate=0.05)
+    ws.bank.get_total_deposits.return_value = 1_000
+    ws.bank.get_all_balances.return_value = {DEFAULT_CURRENCY: 500}
+    with_bank = compute_state_hash(ws)
+    ws.bank.get_total_deposits.return_value = 900
+
+    assert len({before, after_market, after_government, with_bank, compute_state_hash(ws)}) == 5
+
+
+def test_run_mode_windows():
+    run_mode = RunModeController()
+    assert run_mode.should_observe(5)
+
+    run_mode.fast_forward(10, 19)
+    run_mode.fast_forward(100, sample_interval=25)
+    assert run_mode.should_observe(9) and run_mode.should_observe(20)
+    assert not any(run_mode.should_observe(t) for t in range(10, 20))
+    assert run_mode.should_observe(125) and not run_mode.should_observe(10_001)
+
+    run_mode.clear()
+    assert not run_mode.is_headless(15)
+    assert RunModeController.from_config(None).windows == []
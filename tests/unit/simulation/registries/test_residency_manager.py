@@ -0,0 +1,228 @@
+import logging
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from modules.finance.wallet.wallet import Wallet
+from modules.simulation.api import AgentCoreConfigDTO
+from modules.system.api import DEFAULT_CURRENCY
+from simulation.ai.api import Personality
+from simulation.core_agents import Household
+from simulation.models import Talent
+from simulation.registries.estate_registry import EstateRegistry
+from simulation.registries.residency_manager import AgentResidencyManager, ResidentAgentMap
+from simulation.systems.lifecycle.adapters import DeathContextAdapter
+from simulation.systems.lifecycle.api import DeathConfigDTO
+from simulation.systems.lifecycle.death_system import DeathSystem
+from simulation.systems.settlement_system import FinancialSentry, SettlementSystem
+from tests.utils.factories import create_household_config_dto
+
+
+class DormantAgent:
+    """Minimal picklable agent: id, lineage, a wallet and a reference to a world service."""
+
+    def __init__(self, agent_id, wallet, service=None):
+        self.id = agent_id
+        self.is_active = False
+        self.generation = 2
+        self.parent_id = 1
+        self.children_ids = [agent_id + 100]
+        self._econ_state = SimpleNamespace(wallet=wallet, inventory={"food": 3.0})
+        self.service = service
+        self.memory = [float(i) for i in range(500)]
+
+    @property
+    def balance_pennies(self):
+        return self._econ_state.wallet.get_balance(DEFAULT_CURRENCY)
+
+
+class WorldService:
+    pass
+
+
+class HouseholdEngine:
+    """Picklable stand-in for the decision engine a household shares with the world."""
+    pass
+
+
+@pytest.fixture
+def manager():
+    return AgentResidencyManager(cold_after_ticks=10, sweep_interval=5)
+
+
+def test_sweep_evicts_dormant_agent_and_rehydrates_on_access(manager):
+    service = WorldService()
+    manager.share(service, "service")
+    shared_wallet = Wallet(7, {DEFAULT_CURRENCY: 1234})
+    inactive = ResidentAgentMap(manager)
+    inactive[7] = DormantAgent(7, shared_wallet, service)
+
+    assert manager.sweep(5) == 0  # Not dormant long enough
+    assert manager.sweep(10) == 1
+    assert manager.is_cold(7)
+    assert inactive.resident_values() == []
+
+    stub = inactive.get_stub(7)
+    assert stub.id == 7 and stub.agent_type == "DormantAgent"
+    assert stub.children_ids == (107,)
+    assert stub.final_balances == {DEFAULT_CURRENCY: 1234}
+    assert stub.wallet is shared_wallet
+
+    stats = manager.stats()
+    assert stats.cold_count == 1 and stats.live_count == 0 and stats.evictions == 1
+    assert stats.memory_saved_bytes > 0
+
+    agent = inactive[7]
+    assert manager.stats().rehydrations == 1
+    assert not manager.is_cold(7)
+    # Anchored and shared objects keep their identity across the round trip
+    assert agent._econ_state.wallet is shared_wallet
+    assert agent.service is service
+    assert agent._econ_state.inventory == {"food": 3.0}
+    assert agent.memory[-1] == 499.0
+
+
+def test_externally_referenced_agent_stays_resident(manager):
+    inactive = ResidentAgentMap(manager)
+    agent = DormantAgent(8, Wallet(8))
+    inactive[8] = agent
+
+    assert manager.sweep(20) == 0
+    assert not manager.is_cold(8)
+
+    del agent
+    assert manager.sweep(25) == 1
+
+
+def test_unpicklable_agent_is_pinned(manager):
+    agent = DormantAgent(9, Wallet(9))
+    agent.callback = lambda: None
+    manager.admit(agent)
+    del agent
+
+    assert manager.sweep(20) == 0
+    assert manager.stats().pinned_count == 1
+    assert manager.sweep(30) == 0
+
+
+def test_views_share_one_copy(manager):
+    inactive = ResidentAgentMap(manager)
+    estate = EstateRegistry(residency=manager)
+    agent = DormantAgent(10, Wallet(10, {DEFAULT_CURRENCY: 50}))
+    inactive[10] = agent
+    estate.add_to_estate(agent)
+    del agent
+
+    manager.sweep(20)
+    assert estate.get_cold_estate_stubs()[0].id == 10
+    assert 10 in estate and estate.get_resident_estate_agents() == []
+
+    rehydrated = estate.get_agent(10)
+    assert inactive[10] is rehydrated
+    assert estate.get_resident_estate_agents() == [rehydrated]
+
+
+def test_money_supply_counts_cold_estate_without_rehydrating(manager):
+    estate = EstateRegistry(residency=manager)
+    estate.add_to_estate(DormantAgent(11, Wallet(11, {DEFAULT_CURRENCY: 300})))
+    estate.add_to_estate(DormantAgent(12, Wallet(12, {DEFAULT_CURRENCY: 200})))
+    manager.sweep(20)
+    assert manager.stats().cold_count == 2
+
+    agent_registry = MagicMock()
+    agent_registry.get_all_financial_agents.return_value = []
+    settlement = SettlementSystem(agent_registry=agent_registry, estate_registry=estate)
+
+    assert settlement.get_total_circulating_cash(DEFAULT_CURRENCY) == 500
+    assert manager.stats().rehydrations == 0
+
+
+def test_referenced_agent_is_not_remeasured_until_refcount_changes(manager):
+    inactive = ResidentAgentMap(manager)
+    agent = DormantAgent(13, Wallet(13))
+    inactive[13] = agent
+    measured = []
+    measure = manager._measure
+    manager._measure = lambda root: measured.append(root.id) or measure(root)
+
+    assert manager.sweep(20) == 0
+    assert manager.sweep(25) == 0
+    assert measured == [13]  # Second sweep backed off on the unchanged refcount
+    assert manager.stats().referenced_count == 1
+
+    del agent
+    assert manager.sweep(30) == 1
+    assert measured == [13, 13]
+    assert manager.stats().referenced_count == 0
+
+
+def test_deleting_through_views_releases_manager_entry(manager):
+    inactive = ResidentAgentMap(manager)
+    estate = ResidentAgentMap(manager)
+    inactive[14] = estate[14] = DormantAgent(14, Wallet(14))
+    inactive[15] = DormantAgent(15, Wallet(15))
+
+    del inactive[14]
+    assert 14 in manager  # Still listed by the estate view
+    del estate[14]
+    assert 14 not in manager
+
+    manager.sweep(20)
+    assert manager.is_cold(15)
+    inactive.clear()
+    assert 15 not in manager and len(manager) == 0
+
+
+def test_deceased_household_is_evicted_and_restored(manager):
+    engine = HouseholdEngine()
+    core_config = AgentCoreConfigDTO(
+        id=42, name="Household_42", value_orientation="wealth_and_needs",
+        initial_needs={"survival": 10.0}, logger=logging.getLogger("test_residency"), memory_interface=None
+    )
+    household = Household(
+        core_config=core_config, engine=engine, talent=Talent(1.0, {}), goods_data=[],
+        personality=Personality.MISER, config_dto=create_household_config_dto(), initial_assets_record=500
+    )
+    with FinancialSentry.unlocked():
+        household._deposit(500, DEFAULT_CURRENCY)
+    wallet = household._econ_state.wallet
+
+    state = SimpleNamespace(
+        time=0, firms=[], households=[household], agents={42: household}, markets={},
+        inactive_agents=ResidentAgentMap(manager), primary_government=None,
+        currency_registry_handler=None, currency_holders=[household], engine=engine,
+    )
+    manager.share_world(state)
+    manager.agent_lookup = state.agents.get
+    estate = EstateRegistry(residency=manager)
+    settlement = SettlementSystem(agent_registry=MagicMock(), estate_registry=estate)
+    death_system = DeathSystem(
+        DeathConfigDTO(death_tax_rate=0.0, min_inheritance_pennies=0, liquidation_fee_pennies=0, default_fallback_price_pennies=100),
+        inheritance_manager=None, liquidation_manager=None,
+        settlement_system=settlement, public_manager=None,
+        logger=logging.getLogger("test_residency"), estate_registry=estate
+    )
+
+    household.is_active = False
+    death_system.execute(DeathContextAdapter(state))
+    # AgentLifecycleManager's purge of the live collections
+    state.households[:] = [h for h in state.households if h.is_active]
+    del state.agents[42]
+    del household
+
+    assert manager.sweep(10) == 1
+    assert manager.is_cold(42)
+    stub = estate.get_cold_estate_stubs()[0]
+    assert stub.agent_type == "Household" and not stub.is_active
+    assert stub.final_balances == {DEFAULT_CURRENCY: 500}
+    assert stub.wallet is wallet
+    assert settlement.get_total_circulating_cash(DEFAULT_CURRENCY) == 500
+
+    restored = estate.get_agent(42)
+    assert isinstance(restored, Household)
+    assert state.inactive_agents[42] is restored
+    assert restored.id == 42 and not restored.is_active
+    assert restored._econ_state.wallet is wallet
+    assert restored.get_assets_by_currency() == {DEFAULT_CURRENCY: 500}
+    assert restored.decision_engine is engine
+    assert manager.stats().rehydrations == 1
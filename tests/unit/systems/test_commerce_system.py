@@ -62,6 +62,30 @@ def test_execute_consumption_and_leisure(commerce_system):
     # 4. Return Value
     assert leisure_effects[1] == 5.0
 
+@pytest.mark.parametrize("edu_amt, consumed", [(2.0, True), (0.0, False), (None, False), (MagicMock(), False)])
+def test_education_service_consumed_only_for_positive_amounts(commerce_system, edu_amt, consumed):
+    h1 = MagicMock()
+    h1.id = 1
+    h1.is_active = True
+    h1.get_quantity.return_value = edu_amt
+    h1.apply_leisure_effect.return_value = MagicMock(utility_gained=0.0)
+    context: CommerceContext = {
+        "households": [h1],
+        "breeding_planner": MagicMock(),
+        "household_time_allocation": {1: 8.0},
+        "reflux_system": MagicMock(),
+        "market_data": {},
+        "config": commerce_system.config,
+        "time": 1
+    }
+
+    commerce_system.finalize_consumption_and_leisure(context, {})
+
+    consumed_items = h1.apply_leisure_effect.call_args.args[1]
+    assert ("education_service" in consumed_items) == consumed
+    if consumed:
+        h1.consume.assert_any_call("education_service", edu_amt, 1)
+
 def test_fast_track_consumption_if_needed(commerce_system):
     # Case: Inventory 0, Consumes 0 (in vector), Buys 2.
     # Should trigger immediate consumption from bought items.
@@ -107,3 +131,72 @@ def test_fast_track_consumption_if_needed(commerce_system):
     # Verify Immediate Consumption
     # Expect consume call with default 1.0 (from config) or min(bought, default)
     h1.consume.assert_called_with("basic_food", 1.0, 1)
+
+def _scalar_plan(households, decisions, context, pessimism, phase23):
+    """Per-household reference for plan_consumption_and_leisure (pre-vectorization rules)."""
+    from modules.finance.utils.currency_math import round_to_pennies
+    planned, txs = {}, []
+    food_price = decisions['price']
+    tax_rate = context['sales_tax_rate']
+    for i, h in enumerate(households):
+        if not h._bio_state.is_active:
+            continue
+        c_amt = decisions['consume'][i] if i < len(decisions['consume']) else 0.0
+        if pessimism and not h._econ_state.is_employed:
+            c_amt *= (1 - pessimism)
+        planned[h.id] = {"consume_amount": c_amt, "buy_amount": 0.0, "consumed_immediately_from_buy": 0.0}
+        b_amt = decisions['buy'][i] if i < len(decisions['buy']) else 0.0
+        if b_amt <= 0:
+            continue
+        if phase23:
+            price = context['market_data']['basic_food_current_sell_price']
+        elif h._econ_state.assets >= b_amt * food_price * (1 + tax_rate):
+            price = food_price
+        else:
+            continue
+        planned[h.id]["buy_amount"] = b_amt
+        txs.append((h.id, b_amt, round_to_pennies(price * b_amt * 100)))
+    return planned, txs
+
+@pytest.mark.parametrize("scenario", ["none", "deflation", "phase23_industrial_rev"])
+def test_vectorized_plan_matches_scalar_reference(commerce_system, scenario):
+    import random
+    from types import SimpleNamespace
+    rng = random.Random(7)
+    n = 500
+    households = [
+        SimpleNamespace(
+            id=i,
+            _bio_state=SimpleNamespace(is_active=rng.random() > 0.1, needs={"survival": 0.0}),
+            _econ_state=SimpleNamespace(is_employed=rng.random() > 0.3, assets=rng.uniform(0.0, 40.0)),
+        )
+        for i in range(n)
+    ]
+    # Planner output is one short, so the last household falls back to zero
+    decisions = {
+        'consume': [rng.choice([0.0, 0.5, 1.0, 1.5]) for _ in range(n - 1)],
+        'buy': [rng.choice([0.0, 0.0, 1.0, 2.5, 3.3]) for _ in range(n - 1)],
+        'price': 4.95,
+    }
+    planner = MagicMock()
+    planner.decide_consumption_batch.return_value = decisions
+    government = SimpleNamespace(id=42)
+    context = {
+        "households": households, "breeding_planner": planner, "government": government,
+        "market_data": {"basic_food_current_sell_price": 5.05}, "time": 3, "sales_tax_rate": 0.05,
+    }
+    scenario_config = None
+    if scenario != "none":
+        scenario_config = SimpleNamespace(is_active=True, scenario_name=scenario, consumption_pessimism_factor=0.3)
+
+    planned, txs = commerce_system.plan_consumption_and_leisure(context, scenario_config)
+
+    expected_planned, expected_txs = _scalar_plan(
+        households, decisions, context,
+        pessimism=0.3 if scenario == "deflation" else 0.0,
+        phase23=scenario == "phase23_industrial_rev",
+    )
+    assert planned == expected_planned
+    assert [(tx.buyer_id, tx.quantity, tx.total_pennies) for tx in txs] == expected_txs
+    expected_seller = 999999 if scenario == "phase23_industrial_rev" else 42
+    assert all(tx.seller_id == expected_seller and tx.time == 3 for tx in txs)
@@ -103,8 +103,25 @@ class TestHousingSystemRefactor(unittest.TestCase):
 
         self.simulation.real_estate_units = [self.unit]
 
-    def test_process_housing_rent_collection_uses_transfer(self):
-        """Test that rent collection uses SettlementSystem.transfer"""
+    def _make_context(self, settlement_system=None):
+        return HousingContextDTO(
+            tick=self.simulation.time,
+            real_estate_units=self.simulation.real_estate_units,
+            agent_registry=self.simulation.agents,
+            bank=self.simulation.bank,
+            settlement_system=settlement_system or self.simulation.settlement_system,
+            government=self.simulation.government,
+            saga_orchestrator=None,
+            housing_market=None
+        )
+
+    def _submitted_transfers(self):
+        self.simulation.settlement_system.execute_bulk_transfers.assert_called_once()
+        call = self.simulation.settlement_system.execute_bulk_transfers.call_args
+        return call.args[0]
+
+    def test_process_housing_rent_collection_uses_bulk_settlement(self):
+        """Test that rent collection is submitted through the bulk settlement call"""
         # Arrange
         self.unit.owner_id = 2
         self.unit.occupant_id = 1
@@ -123,13 +140,12 @@ class TestHousingSystemRefactor(unittest.TestCase):
         self.housing_system.process_housing(context)
 
         # Assert
-        # Verify transfer was called for rent
-        self.simulation.settlement_system.transfer.assert_any_call(
-            self.tenant, self.owner, 500, "rent_payment", tick=100, currency=DEFAULT_CURRENCY
-        )
+        transfers = self._submitted_transfers()
+        self.assertIn((self.tenant, self.owner, 500, "rent_payment"), transfers)
+        self.simulation.settlement_system.transfer.assert_not_called()
 
-    def test_process_housing_maintenance_uses_transfer(self):
-        """Test that maintenance cost uses SettlementSystem.transfer"""
+    def test_process_housing_maintenance_uses_bulk_settlement(self):
+        """Test that maintenance cost is submitted through the bulk settlement call"""
         # Arrange
         cost = int(10000.0 * 0.01) # 100
 
@@ -147,6 +163,51 @@ class TestHousingSystemRefactor(unittest.TestCase):
         self.housing_system.process_housing(context)
 
         # Assert
-        self.simulation.settlement_system.transfer.assert_any_call(
-            self.owner, self.simulation.government, cost, "housing_maintenance", tick=100, currency=DEFAULT_CURRENCY
+        transfers = self._submitted_transfers()
+        self.assertEqual(transfers[0], (self.owner, self.simulation.government, cost, "housing_maintenance"))
+        self.assertEqual(
+            self.simulation.settlement_system.execute_bulk_transfers.call_args.kwargs,
+            {"tick": 100, "currency": DEFAULT_CURRENCY}
         )
+
+    def test_batch_affordability_tracks_pending_legs_in_unit_order(self):
+        """Rent received earlier in the batch funds later obligations, as in the per-unit path."""
+        # Owner (id=2) rents unit 102 from a third agent, and can only afford it with unit 101's rent.
+        landlord = MockAgent(id=3, balance_pennies=0)
+        self.owner.balance_pennies = 0
+        self.config_mock.MAINTENANCE_RATE_PER_TICK = 0.0
+
+        unit_b = MagicMock()
+        unit_b.id = 102
+        unit_b.owner_id = 3
+        unit_b.occupant_id = 2
+        unit_b.estimated_value = 10000.0
+        unit_b.rent_price = 400.0
+        unit_b.mortgage_id = None
+        unit_b.liens = []
+        self.simulation.real_estate_units = [self.unit, unit_b]
+
+        agents = {1: self.tenant, 2: self.owner, 3: landlord, 999: self.simulation.government}
+        self.simulation.agents.get_agent.side_effect = agents.get
+
+        self.housing_system.process_housing(self._make_context())
+
+        transfers = self._submitted_transfers()
+        self.assertEqual(transfers, [
+            (self.tenant, self.owner, 500, "rent_payment"),
+            (self.owner, landlord, 400, "rent_payment"),
+        ])
+        self.assertEqual(unit_b.occupant_id, 2)
+
+    def test_eviction_derived_from_failed_affordability(self):
+        """A tenant who cannot cover rent is evicted and no rent leg is staged."""
+        self.tenant.balance_pennies = 100
+        self.config_mock.MAINTENANCE_RATE_PER_TICK = 0.0
+
+        self.housing_system.process_housing(self._make_context())
+
+        transfers = self._submitted_transfers() if self.simulation.settlement_system.execute_bulk_transfers.called else []
+        self.assertNotIn("rent_payment", [t[3] for t in transfers])
+        self.assertIsNone(self.unit.occupant_id)
+        self.assertIsNone(self.tenant.residing_property_id)
+        self.assertTrue(self.tenant.is_homeless)
@@ -84,5 +84,137 @@ class TestMAManager(unittest.TestCase):
         # Assert firm deactivated
         self.assertFalse(mock_firm.is_active)
 
+
+
+class _ScreenFirm:
+    """Minimal firm surface used by the M&A screening and matching pass."""
+    def __init__(self, firm_id, balance, valuation, loss_streak=0, profit=0):
+        self.id = firm_id
+        self.is_active = True
+        self.valuation = valuation
+        self.balance = balance
+        self.wallet = MagicMock()
+        self.wallet.get_balance.side_effect = lambda currency=None: self.balance
+        self.finance_state = MagicMock()
+        self.finance_state.valuation_pennies = valuation
+        self.finance_state.consecutive_loss_turns = loss_streak
+        self.finance_state.current_profit = {"USD": profit}
+        self.market_cap = valuation
+
+    def calculate_valuation(self):
+        return self.valuation
+
+    def get_market_cap(self):
+        return self.market_cap
+
+
+def _legacy_matching(manager, firms, tick):
+    """Reference copy of the pre-vectorization list-based matching loop."""
+    import random
+    from modules.finance.utils.currency_math import round_to_pennies
+    avg_assets = sum(manager._get_balance(f) for f in firms) / len(firms)
+    predators, preys, hostile_targets, bankrupts = [], [], [], []
+    for firm in firms:
+        firm.calculate_valuation()
+        bal = manager._get_balance(firm)
+        if bal < 0:
+            bankrupts.append(firm)
+            continue
+        if firm.finance_state.consecutive_loss_turns >= manager.bankruptcy_loss_threshold:
+            preys.append(firm)
+        elif bal < avg_assets * 0.2:
+            preys.append(firm)
+        if firm.get_market_cap() < firm.finance_state.valuation_pennies * manager.config.HOSTILE_TAKEOVER_DISCOUNT_THRESHOLD:
+            hostile_targets.append(firm)
+        if bal > avg_assets * 1.5 and firm.finance_state.current_profit.get("USD", 0) > 0:
+            predators.append(firm)
+    random.shuffle(predators)
+    for predator in list(predators):
+        found = False
+        for target in hostile_targets:
+            if target.id == predator.id or target in bankrupts:
+                continue
+            mcap = target.get_market_cap()
+            if manager._get_balance(predator) > mcap * 1.5:
+                if manager._attempt_hostile_takeover(predator, target, mcap, tick):
+                    found = True
+                    if target in preys: preys.remove(target)
+                    hostile_targets.remove(target)
+                    break
+        if found:
+            predators.remove(predator)
+    for prey in [p for p in preys if p not in bankrupts and p.is_active]:
+        for predator in predators:
+            if predator.id == prey.id:
+                continue
+            offer = round_to_pennies(prey.valuation * manager.config.FRIENDLY_MERGER_PREMIUM)
+            if manager._get_balance(predator) >= offer * manager.config.MIN_ACQUISITION_CASH_RATIO:
+                manager._execute_merger(predator, prey, offer, tick, is_hostile=False)
+                predators.remove(predator)
+                break
+    for firm in bankrupts:
+        if firm.is_active:
+            manager._execute_bankruptcy(firm, tick, {})
+
+
+class TestMAManagerVectorizedMatching(unittest.TestCase):
+    def _build_firms(self, seed):
+        import random
+        rng = random.Random(seed)
+        firms = []
+        for i in range(60):
+            valuation = rng.randint(1_000, 50_000)
+            firm = _ScreenFirm(
+                firm_id=i + 1,
+                balance=rng.choice([-500, rng.randint(0, 5_000), rng.randint(50_000, 400_000)]),
+                valuation=valuation,
+                loss_streak=rng.choice([0, 0, 25]),
+                profit=rng.choice([-10, 100]),
+            )
+            if rng.random() < 0.08:
+                firm.market_cap = int(valuation * 0.5)
+            firms.append(firm)
+        return firms
+
+    def _run(self, use_legacy, seed):
+        import random
+        config = Mock()
+        config.MA_ENABLED = True
+        config.BANKRUPTCY_CONSECUTIVE_LOSS_TICKS = 20
+        config.HOSTILE_TAKEOVER_DISCOUNT_THRESHOLD = 0.7
+        config.HOSTILE_TAKEOVER_PREMIUM = 1.2
+        config.HOSTILE_TAKEOVER_SUCCESS_PROB = 0.6
+        config.FRIENDLY_MERGER_PREMIUM = 1.1
+        config.MIN_ACQUISITION_CASH_RATIO = 1.5
+        simulation = MagicMock()
+        simulation.firms = self._build_firms(seed)
+        manager = MAManager(simulation, config, settlement_system=MagicMock(spec=IMonetaryAuthority))
+
+        events = []
+        def merger(predator, prey, price, tick, is_hostile=False):
+            events.append(("merge", predator.id, prey.id, price, is_hostile))
+            prey.is_active = False
+        def bankruptcy(firm, tick, markets_state=None):
+            events.append(("bankrupt", firm.id))
+            firm.is_active = False
+        manager._execute_merger = merger
+        manager._execute_bankruptcy = bankruptcy
+
+        random.seed(seed)
+        if use_legacy:
+            _legacy_matching(manager, simulation.firms, 5)
+        else:
+            manager.process_market_exits_and_entries(5, markets_state={})
+        return events
+
+    def test_matches_legacy_list_based_loop(self):
+        kinds = set()
+        for seed in range(10):
+            legacy = self._run(True, seed)
+            self.assertTrue(legacy)
+            kinds.update(("hostile" if e[-1] else "friendly") if e[0] == "merge" else e[0] for e in legacy)
+            self.assertEqual(legacy, self._run(False, seed), f"seed={seed}")
+        self.assertEqual(kinds, {"hostile", "friendly", "bankrupt"})
+
 if __name__ == '__main__':
     unittest.main()
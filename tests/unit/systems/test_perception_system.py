@@ -108,3 +108,58 @@ def test_policy_filter():
     # Medium Insight (0.4) -> Amp 1.4x -> 0.7
     p3 = system.apply_policy_filter(0.4, policy)
     assert abs(p3.market_panic_index - 0.7) < 1e-9
+
+def _priced_history(system, mock_snapshot, prices):
+    for i, p in enumerate(prices):
+        snap = replace(mock_snapshot,
+                       tick=i,
+                       market_signals={"food": replace(mock_snapshot.market_signals["food"], last_traded_price=p)},
+                       market_data={"food_avg_price": float(p), "unemployment_rate": 0.1})
+        system.update(snap)
+
+def test_laggards_get_independent_moving_average_copies(mock_snapshot):
+    system = PerceptionSystem(seed=7)
+    _priced_history(system, mock_snapshot, [100, 110, 120])
+
+    first = system.apply_filter(0.5, system.current_snapshot, agent_id=1)
+    second = system.apply_filter(0.6, system.current_snapshot, agent_id=2)
+
+    # Same precomputed 3-tick MA, but one agent's edits don't reach another
+    assert first.market_signals["food"].last_traded_price == 110
+    assert first.market_data == second.market_data
+    first.market_data["food_avg_price"] = 0.0
+    del first.market_signals["food"]
+    assert second.market_data["food_avg_price"] == 110.0
+    assert system.apply_filter(0.5, system.current_snapshot).market_signals["food"].last_traded_price == 110
+
+def test_unseeded_noise_is_reproducible(mock_snapshot):
+    prices = [100 + 10 * i for i in range(10)]
+    views = []
+    for _ in range(2):
+        system = PerceptionSystem()
+        _priced_history(system, mock_snapshot, prices)
+        views.append(system.apply_filter(0.1, system.current_snapshot, agent_id=42).market_data.copy())
+    assert views[0] == views[1]
+
+def test_lemon_noise_is_seeded_per_agent(mock_snapshot):
+    prices = [100 + 10 * i for i in range(10)]
+    system_a = PerceptionSystem(seed=7)
+    system_b = PerceptionSystem(seed=7)
+    _priced_history(system_a, mock_snapshot, prices)
+    _priced_history(system_b, mock_snapshot, prices)
+
+    view_a = system_a.apply_filter(0.1, system_a.current_snapshot, agent_id=42)
+    # Reads in a different order still see the same per-agent draws
+    view_b = system_b.apply_filter(0.1, system_b.current_snapshot, agent_id=42)
+    data_b = view_b.market_data["food_avg_price"]
+    assert view_a.market_signals["food"] == view_b.market_signals["food"]
+    assert view_a.market_data["food_avg_price"] == data_b
+
+    other = system_a.apply_filter(0.1, system_a.current_snapshot, agent_id=43)
+    assert other.market_data["food_avg_price"] != view_a.market_data["food_avg_price"]
+
+    # Lag 5 from tick 9 -> tick 4 (price 140); non-price fields untouched
+    assert view_a.tick == 4
+    assert view_a.market_data["unemployment_rate"] == 0.1
+    assert abs(view_a.market_data["food_avg_price"] - 140.0) < 140.0 * 0.5
+    assert dict(view_a.market_data) == view_a.market_data.copy()
@@ -91,3 +91,46 @@ def test_sensory_dto_missing_tracker(sensory_system):
     dto = sensory_system.generate_government_sensory_dto(context)
     assert dto.gini_index == 0.0
     assert dto.approval_low_asset == 0.5
+
+def test_asset_groups_match_stable_sort_with_ties(sensory_system):
+    import random
+    rng = random.Random(11)
+    snapshots = [
+        {"is_active": rng.random() > 0.1, "total_wealth": float(rng.choice([0, 100, 100, 250, 400, 400, 900])),
+         "approval_rating": rng.random()}
+        for _ in range(257)
+    ]
+    households = []
+    for snap in snapshots:
+        h = Mock(spec=ISensoryDataProvider)
+        h.get_sensory_snapshot.return_value = snap
+        households.append(h)
+
+    mock_tracker = Mock()
+    mock_tracker.get_latest_indicators.return_value = {}
+    context: SensoryContext = {
+        "tracker": mock_tracker, "government": Mock(approval_rating=0.5), "time": 1, "households": households
+    }
+    dto = sensory_system.generate_government_sensory_dto(context)
+
+    combined = sorted((s for s in snapshots if s["is_active"]), key=lambda s: s["total_wealth"])
+    n = len(combined)
+    low = combined[:int(n * 0.5)]
+    high = combined[-int(n * 0.2):]
+    assert dto.approval_low_asset == pytest.approx(sum(s["approval_rating"] for s in low) / len(low))
+    assert dto.approval_high_asset == pytest.approx(sum(s["approval_rating"] for s in high) / len(high))
+
+def test_sma_running_sum_matches_window_mean(sensory_system):
+    mock_tracker = Mock()
+    mock_gov = Mock()
+    context: SensoryContext = {"tracker": mock_tracker, "government": mock_gov, "time": 1}
+    rates = [0.01 * (i % 7) for i in range(25)]
+    for i, rate in enumerate(rates):
+        mock_tracker.get_latest_indicators.return_value = {"unemployment_rate": rate, "avg_wage": float(i)}
+        mock_gov.approval_rating = rate
+        dto = sensory_system.generate_government_sensory_dto(context)
+
+    assert dto.unemployment_sma == pytest.approx(sum(rates[-10:]) / 10)
+    assert dto.wage_sma == pytest.approx(sum(range(15, 25)) / 10)
+    assert dto.approval_sma == pytest.approx(sum(rates[-10:]) / 10)
+    assert len(sensory_system.unemployment_buffer) == 10
@@ -446,3 +446,44 @@ def test_settle_atomic_credit_fail_rollback(settlement_system):
     assert success is None
     assert settlement_system.get_balance(agent_a.id) == 100 # Refunded
     assert settlement_system.get_balance(agent_b.id) == 0
+
+def test_execute_bulk_transfers_matches_sequential_transfers(settlement_system):
+    # A pays B 60, B forwards 80 (affordable only after the first leg), C cannot pay 500.
+    agent_a = MockAgent("A", 100)
+    agent_b = MockAgent("B", 30)
+    agent_c = MockAgent("C", 10)
+    for agent in (agent_a, agent_b, agent_c):
+        settlement_system.agent_registry.register(agent)
+
+    transfers = [
+        (agent_a, agent_b, 60, "rent_payment"),
+        (agent_b, agent_c, 80, "rent_payment"),
+        (agent_c, agent_a, 500, "rent_payment"),
+    ]
+
+    results = settlement_system.execute_bulk_transfers(transfers, tick=3)
+
+    assert len(results) == 3
+    assert results[0] is not None and results[0].total_pennies == 60
+    assert results[1] is not None and results[1].time == 3
+    assert results[2] is None  # Failing leg does not abort the batch
+    assert settlement_system.get_balance(agent_a.id) == 40
+    assert settlement_system.get_balance(agent_b.id) == 10
+    assert settlement_system.get_balance(agent_c.id) == 90
+
+def test_execute_bulk_transfers_aggregates_m2_contraction(settlement_system, mock_bank):
+    ledger = MagicMock()
+    settlement_system.set_monetary_ledger(ledger)
+    agent_a = MockAgent("A", 100)
+    agent_b = MockAgent("B", 100)
+    settlement_system.agent_registry.register(agent_a)
+    settlement_system.agent_registry.register(agent_b)
+
+    transfers = [
+        (agent_a, mock_bank, 10, "housing_maintenance"),
+        (agent_b, mock_bank, 15, "housing_maintenance"),
+    ]
+    settlement_system.execute_bulk_transfers(transfers, tick=1)
+
+    ledger.record_monetary_contraction.assert_called_once_with(25, source="housing_maintenance", currency=DEFAULT_CURRENCY)
+    ledger.record_monetary_expansion.assert_not_called()
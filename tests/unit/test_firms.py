@@ -222,3 +222,83 @@ class TestFirmSales:
         # New Budget = 100 * 0.8 + 20 * 0.2 = 80 + 4 = 84.
 
         assert firm.sales_state.marketing_budget_pennies == 84
+
+
+class TestFirmStateDTOCache:
+    @pytest.fixture
+    def firm(self):
+        dto = create_firm_config_dto()
+        dto.profit_history_ticks = 10
+        return create_firm(
+            id=7,
+            name="Firm_7",
+            engine=Mock(),
+            specialization="test",
+            productivity_factor=1.0,
+            config_dto=dto,
+            sector="FOOD_PROD",
+            assets=0
+        )
+
+    @staticmethod
+    def _employee(emp_id, skill=1.0):
+        emp = Mock()
+        emp.id = emp_id
+        emp.labor_skill = skill
+        emp.age = 30
+        emp.education_level = 2
+        return emp
+
+    def test_cached_dto_equals_fresh_build(self, firm):
+        firm.hr_state.employees.append(self._employee(101))
+        firm.hr_state.employee_wages[101] = 1500
+        with InventorySentry.unlocked():
+            firm.add_item("test", 5.0)
+
+        first = firm.get_state_dto()
+        second = firm.get_state_dto()
+
+        assert second is first
+        assert second == firm._build_state_dto()
+
+    def test_mutations_invalidate_cache(self, firm):
+        stats = Firm.state_dto_cache_stats
+        emp = self._employee(101)
+        firm.hr_state.employees.append(emp)
+
+        mutations = [
+            lambda: firm.finance_state.revenue_this_turn.__setitem__(DEFAULT_CURRENCY, 500),
+            lambda: firm.finance_state.profit_history.append(42),
+            lambda: firm.hr_state.employee_wages.__setitem__(101, 2000),
+            lambda: setattr(emp, "labor_skill", 2.5),
+            lambda: setattr(firm.production_state, "automation_level", 0.3),
+            lambda: firm.sales_state.last_prices.__setitem__("test", 900),
+            lambda: firm.needs.__setitem__("liquidity_need", 3.0),
+        ]
+        for mutate in mutations:
+            before = firm.get_state_dto()
+            misses = stats.misses
+            mutate()
+            after = firm.get_state_dto()
+            assert after is not before
+            assert stats.misses == misses + 1
+            assert after == firm._build_state_dto()
+
+        with InventorySentry.unlocked():
+            firm.add_item("test", 1.0)
+        assert firm.get_state_dto().production.inventory["test"] == 1.0
+
+        with FinancialSentry.unlocked():
+            firm.wallet.add(300, DEFAULT_CURRENCY)
+        assert firm.get_state_dto().finance.balance == 300
+
+    def test_noop_assignment_keeps_cache(self, firm):
+        stats = Firm.state_dto_cache_stats
+        first = firm.get_state_dto()
+        hits = stats.hits
+
+        firm.hr_state.hires_prev_tick = firm.hr_state.hires_prev_tick
+
+        assert firm.get_state_dto() is first
+        assert stats.hits == hits + 1
+        assert 0.0 < stats.hit_rate <= 1.0
@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import MagicMock
-from simulation.ai.household_system2 import HouseholdSystem2Planner, HousingDecisionInputs
+import random
+from simulation.ai.household_system2 import HouseholdSystem2Planner, HousingDecisionInputs, HOUSING_NPV_RTOL
 from simulation.core_agents import Household
 from simulation.ai.api import Personality
 from collections import deque
@@ -67,5 +68,44 @@ class TestHouseholdSystem2(unittest.TestCase):
          decision = self.planner.decide(inputs)
          self.assertEqual(decision, "BUY")
 
+    def _loop_npv(self, inputs):
+        # Month-by-month discounting, as the formulas are written
+        T_years = self.mock_config.HOUSING_NPV_HORIZON_YEARS
+        r = (inputs.risk_free_rate + self.mock_config.HOUSING_NPV_RISK_PREMIUM) / 12.0
+        cost_own = inputs.market_price * self.mock_config.HOUSING_ANNUAL_MAINTENANCE_RATE / 12.0
+        g = min(inputs.price_growth_expectation, self.mock_config.HOUSING_EXPECTATION_CAP)
+        principal = inputs.market_price * self.mock_config.MORTGAGE_DEFAULT_DOWN_PAYMENT_RATE
+        income_invest = principal * (inputs.risk_free_rate / 12.0)
+        buy = rent = 0.0
+        for t in range(1, T_years * 12 + 1):
+            buy += (inputs.market_rent_monthly - cost_own) / (1.0 + r) ** t
+            rent += (income_invest - inputs.market_rent_monthly) / (1.0 + r) ** t
+        terminal = (1.0 + r) ** (T_years * 12)
+        buy += inputs.market_price * (1.0 + g) ** T_years / terminal - inputs.market_price
+        rent += principal / terminal
+        return buy, rent
+
+    def test_closed_form_matches_loop_and_batch_matches_scalar(self):
+        rng = random.Random(7)
+        cases = [
+            HousingDecisionInputs(
+                current_wealth=rng.uniform(0, 500000.0),
+                annual_income=rng.uniform(5000.0, 150000.0),
+                market_rent_monthly=rng.uniform(200.0, 3000.0),
+                market_price=rng.uniform(50000.0, 800000.0),
+                risk_free_rate=rng.choice([-0.02, 0.0, rng.uniform(0.0, 0.1)]),
+                price_growth_expectation=rng.uniform(-0.05, 0.1),
+            )
+            for _ in range(200)
+        ]
+        for inputs in cases:
+            result = self.planner.calculate_housing_npv(inputs)
+            buy, rent = self._loop_npv(inputs)
+            scale = inputs.market_price
+            self.assertLessEqual(abs(result["npv_buy"] - buy), HOUSING_NPV_RTOL * scale)
+            self.assertLessEqual(abs(result["npv_rent"] - rent), HOUSING_NPV_RTOL * scale)
+
+        self.assertEqual(self.planner.decide_batch(cases), [self.planner.decide(i) for i in cases])
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,3 +1,4 @@
+import copy
 import pytest
 from unittest.mock import MagicMock
 from simulation.components.engines.hr_engine import HREngine
@@ -176,3 +177,71 @@ def test_process_payroll_context_immutability(hr_engine, hr_state, config, conte
 
     # Check balance - should be unchanged in the DTO
     assert context.wallet_balances[DEFAULT_CURRENCY] == initial_balance
+
+def _employee(emp_id, skill, education, employer_id=1):
+    emp = MagicMock(spec=IEmployeeDataProvider)
+    emp.id = emp_id
+    emp.employer_id = employer_id
+    emp.is_employed = True
+    emp.labor_skill = skill
+    emp.education_level = education
+    return emp
+
+def test_roster_is_id_indexed_and_tracked(hr_engine):
+    state = HRState()
+    employees = [_employee(i, 1.0, 0.0) for i in range(5)]
+    state.employees = list(employees)
+    assert state.employees.get(3) is employees[3]
+
+    revision = state.revision
+    hr_engine.finalize_firing(state, 2)
+    assert state.revision > revision
+    assert [e.id for e in state.employees] == [0, 1, 3, 4]
+    assert employees[2] not in state.employees
+    assert hr_engine.create_fire_transaction(state, 1, 10_000, 2, 100, 1) is None
+
+    clone = copy.deepcopy(state)
+    assert [e.id for e in clone.employees] == [0, 1, 3, 4]
+    assert clone.employees.get(4) is not None
+
+def test_payroll_batch_matches_per_employee_formula(hr_engine, config, context):
+    state = HRState()
+    employees = [_employee(i, 0.5 + 0.37 * i, (i % 4) * 0.5) for i in range(40)]
+    employees.append(_employee(99, 1.0, 0.0, employer_id=2))  # Not ours: skipped
+    state.employees = employees
+    state.employee_wages = {i: 300 + 41 * i for i in range(0, 40, 3)}
+
+    intent = hr_engine.calculate_payroll_obligations(state, context, config)
+    batch = intent.payroll_batch
+
+    expected = []
+    for emp in employees[:40]:
+        wage = hr_engine.calculate_wage(emp, state.employee_wages.get(emp.id, context.labor_market_min_wage), config)
+        tax = int(wage * context.tax_policy.income_tax_rate) if wage > context.tax_policy.survival_cost else 0
+        expected.append((emp.id, wage, tax))
+    assert list(zip(batch.employee_ids.tolist(), batch.gross_pennies.tolist(), batch.tax_pennies.tolist())) == expected
+
+    # Two aggregate obligations instead of two per employee; the audit view expands them.
+    assert len(intent.wage_obligations) == 2
+    assert sum(ob.amount_pennies for ob in intent.wage_obligations) == intent.total_wages_pennies
+    audit = batch.to_obligations()
+    assert sum(ob.amount_pennies for ob in audit) == intent.total_wages_pennies
+    assert audit[0].recipient_id == 0 and audit[0].description == "Wage for 0"
+
+def test_process_payroll_pays_affordable_prefix_then_falls_back(hr_engine, config):
+    state = HRState()
+    state.employees = [_employee(1, 1.0, 0.0), _employee(2, 2.0, 0.0), _employee(3, 1.0, 0.0)]
+    state.employee_wages = {1: 1000, 2: 1000, 3: 500}
+    ctx = HRPayrollContextDTO(
+        exchange_rates={DEFAULT_CURRENCY: 1.0},
+        tax_policy=None,
+        current_time=100,
+        firm_id=1,
+        wallet_balances={DEFAULT_CURRENCY: 2000},
+    )
+
+    result = hr_engine.process_payroll(state, ctx, config)
+
+    # Employee 2 (2000) no longer fits after employee 1, but employee 3 (500) still does.
+    assert [(t.seller_id, t.total_pennies) for t in result.transactions] == [(1, 1000), (3, 500)]
+    assert 2 in state.unpaid_wages
@@ -0,0 +1,73 @@
+import sqlite3
+
+import numpy as np
+import pytest
+
+from simulation.db.analytics_repository import AnalyticsRepository
+from simulation.db.schema import create_tables
+from simulation.metrics.history_store import IndicatorHistoryStore, RingColumn
+
+
+def test_ring_column_keeps_newest_values_contiguous():
+    column = RingColumn(4)
+    for value in range(3):
+        column.append(value)
+    assert column.view().tolist() == [0, 1, 2]
+
+    for value in range(3, 10):
+        column.append(value)
+    view = column.view()
+    assert view.tolist() == [6, 7, 8, 9]
+    assert view.base is not None  # A slice of the buffer, not a copy
+    assert column.view(last=2).tolist() == [8, 9]
+    assert column.latest() == 9
+    with pytest.raises(ValueError):
+        view[0] = 0
+
+
+def test_store_memory_is_constant_and_tiers_downsample():
+    store = IndicatorHistoryStore(capacity=50, strides=(1, 10, 100))
+    store.declare(["gdp"])
+    nbytes = store.nbytes
+
+    for tick in range(1000):
+        store.record(tick, {"gdp": float(tick)})
+
+    assert store.nbytes == nbytes
+    assert store.series("gdp").tolist() == [float(t) for t in range(950, 1000)]
+    assert store.ticks(10)[-1] == 999
+    assert store.series("gdp", 10)[-1] == np.mean(range(990, 1000))
+    assert store.series("gdp", 100).tolist() == [np.mean(range(b, b + 100)) for b in range(0, 1000, 100)]
+    assert store.latest() == {"gdp": 999.0}
+
+
+def test_late_indicator_stays_aligned_with_ticks():
+    store = IndicatorHistoryStore(capacity=8, strides=(1,))
+    store.declare(["gdp"])
+    assert len(store.raw["gdp"]) == 0 and "gdp" not in store.latest()
+
+    store.record(0, {"gdp": 1.0})
+    store.record(1, {"gdp": 2.0, "gini": 0.3})
+    assert np.isnan(store.raw["gini"][0]) and store.raw["gini"][1] == 0.3
+    assert len(store.raw["gini"]) == len(store.ticks()) == 2
+
+
+def test_completed_laps_spill_to_persistence():
+    conn = sqlite3.connect(":memory:")
+    create_tables(conn)
+    repo = AnalyticsRepository(conn)
+    spills = []
+    store = IndicatorHistoryStore(capacity=5, strides=(1, 10), spill=spills.append)
+
+    for tick in range(12):
+        store.record(tick, {"gdp": float(tick)})
+
+    # Two full raw laps; the stride-10 tier has a single row, not yet a lap
+    assert [(s.stride, s.ticks.tolist()) for s in spills] == [(1, [0, 1, 2, 3, 4]), (1, [5, 6, 7, 8, 9])]
+    store.record(12, {"gdp": 12.0})
+    assert spills[0].columns["gdp"].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]  # Copies survive overwrites
+
+    repo.save_indicator_history_batch(7, spills)
+    rows = conn.execute("SELECT time, value FROM indicator_history WHERE run_id = 7 AND name = 'gdp' ORDER BY time").fetchall()
+    assert rows == [(t, float(t)) for t in range(10)]
+    conn.close()
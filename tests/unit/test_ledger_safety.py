@@ -95,3 +95,36 @@ class TestLedgerSafety(unittest.TestCase):
 
         # Let's verify 'record_revenue' is NOT called on seller
         seller.record_revenue.assert_not_called()
+
+    def test_dividend_distribution_settles_in_one_bulk_pass(self):
+        """A summarized dividend expands into one execute_bulk_transfers call, firm -> holders."""
+        import numpy as np
+        from modules.finance.dtos import DividendDistributionDTO
+        from modules.system.api import TransactionMetadataDTO
+
+        handler = FinancialTransactionHandler()
+        firm = MagicMock()
+        holders = {10: MagicMock(), 11: MagicMock(), 12: MagicMock()}
+        context = MagicMock()
+        context.time = 5
+        context.agents = holders
+        context.inactive_agents = {}
+        context.settlement_system.execute_bulk_transfers.side_effect = lambda legs, tick, currency: [MagicMock() for _ in legs]
+
+        distribution = DividendDistributionDTO(
+            firm_id=1, currency="USD", total_pennies=600,
+            holder_ids=np.array([10, 11, 12]), amounts_pennies=np.array([100, 200, 300])
+        )
+        tx = Transaction(
+            buyer_id=1, seller_id=1, item_id="dividend", quantity=1, price=6.0,
+            transaction_type="dividend_distribution", time=5, total_pennies=600, market_id="financial",
+            metadata=TransactionMetadataDTO(original_metadata={"distribution": distribution})
+        )
+
+        self.assertTrue(handler.handle(tx, firm, firm, context))
+
+        context.settlement_system.execute_bulk_transfers.assert_called_once()
+        legs = context.settlement_system.execute_bulk_transfers.call_args[0][0]
+        self.assertEqual([(debit, credit, amount) for debit, credit, amount, _ in legs],
+                         [(firm, holders[10], 100), (firm, holders[11], 200), (firm, holders[12], 300)])
+        self.assertTrue(all(isinstance(amount, int) for _, _, amount, _ in legs))
@@ -58,3 +58,24 @@ def test_portfolio_optimization_under_stagflation():
     safety_assets_normal = target_cash_normal + target_deposit_normal
     safety_assets_stag = target_cash_stag + target_deposit_stag
     assert safety_assets_stag > safety_assets_normal
+
+def test_batch_optimization_matches_scalar_exactly():
+    import random
+    rng = random.Random(3)
+    n = 500
+    liquid = [rng.choice([0.0, rng.uniform(0, 400.0), rng.uniform(0, 50000.0)]) for _ in range(n)]
+    lambdas = [rng.uniform(0.1, 10.0) for _ in range(n)]
+    survival = [rng.uniform(50.0, 600.0) for _ in range(n)]
+    stagflation = MacroFinancialContext(
+        inflation_rate=0.08, gdp_growth_rate=-0.02, market_volatility=0.3, interest_rate_trend=0.01
+    )
+
+    for context in (None, stagflation):
+        cash, deposit, equity = PortfolioManager.optimize_portfolios(
+            liquid, lambdas, 0.02, 0.15, survival, 0.02, macro_context=context
+        )
+        for i in range(n):
+            expected = PortfolioManager.optimize_portfolio(
+                liquid[i], lambdas[i], 0.02, 0.15, survival[i], 0.02, macro_context=context
+            )
+            assert (float(cash[i]), float(deposit[i]), float(equity[i])) == expected
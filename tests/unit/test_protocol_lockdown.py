@@ -37,6 +37,9 @@ class MockSettlementSystem:
     def execute_swap(self, match):
         return None
 
+    def execute_bulk_transfers(self, transfers, tick, currency="USD"):
+        return [None for _ in transfers]
+
     def get_balance(self, agent_id, currency="USD"):
         return 100
 
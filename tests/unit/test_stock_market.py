@@ -146,4 +146,42 @@ class TestOrderExpiry:
         removed = stock_market.clear_expired_orders(current_tick=5)
         assert removed == 1
         summary = stock_market.get_market_summary(firm_id)
-        assert summary['buy_order_count'] == 0
\ No newline at end of file
+        assert summary['buy_order_count'] == 0
+    def test_expiry_index_skips_closed_orders(self):
+        stock_market = StockMarket(config_dto=StockMarketConfigDTO(order_expiry_ticks=3), shareholder_registry=MagicMock())
+        firm_id = 100
+        stock_market.reference_prices[firm_id] = 50.0
+        filled = OrderDTO(agent_id=1, side='BUY', item_id=f'stock_{firm_id}', quantity=5.0, price_limit=50.0, price_pennies=5000, market_id='stock')
+        seller = OrderDTO(agent_id=2, side='SELL', item_id=f'stock_{firm_id}', quantity=5.0, price_limit=48.0, price_pennies=4800, market_id='stock')
+        cancelled = OrderDTO(agent_id=3, side='BUY', item_id=f'stock_{firm_id}', quantity=1.0, price_limit=44.0, price_pennies=4400, market_id='stock')
+        resting = OrderDTO(agent_id=4, side='BUY', item_id=f'stock_{firm_id}', quantity=1.0, price_limit=45.0, price_pennies=4500, market_id='stock')
+        young = OrderDTO(agent_id=5, side='SELL', item_id=f'stock_{firm_id}', quantity=1.0, price_limit=52.0, price_pennies=5200, market_id='stock')
+        for order in (filled, seller, cancelled, resting):
+            stock_market.place_order(order, tick=1)
+        stock_market.place_order(young, tick=3)
+        assert len(stock_market.match_orders(tick=1)) == 1
+        stock_market.cancel_orders("3")
+
+        removed = stock_market.clear_expired_orders(current_tick=4)
+
+        assert removed == 1
+        assert stock_market.get_best_bid(firm_id) is None
+        assert stock_market.get_best_ask(firm_id) == 52.0
+
+class TestStockBookMaintenance:
+
+    def test_partial_fill_keeps_price_order_and_remaining_quantity(self, stock_market):
+        firm_id = 100
+        stock_market.reference_prices[firm_id] = 50.0
+        for agent_id, price in ((1, 46.0), (2, 52.0), (3, 49.0)):
+            stock_market.place_order(OrderDTO(agent_id=agent_id, side='BUY', item_id=f'stock_{firm_id}', quantity=10.0, price_limit=price, price_pennies=int(round(price * 100)), market_id='stock'), tick=1)
+        stock_market.place_order(OrderDTO(agent_id=9, side='SELL', item_id=f'stock_{firm_id}', quantity=4.0, price_limit=45.0, price_pennies=4500, market_id='stock'), tick=1)
+
+        transactions = stock_market.match_orders(tick=1)
+
+        assert [tx.buyer_id for tx in transactions] == [2]
+        book = stock_market.buy_orders[firm_id]
+        assert [m.order.agent_id for m in book] == [2, 3, 1]
+        assert book[0].order.quantity == 6.0
+        assert stock_market.get_best_bid(firm_id) == 52.0
+        assert stock_market.get_best_ask(firm_id) is None
@@ -88,6 +88,11 @@ class MockSettlementSystem:
             return tx
         return None
 
+    def execute_bulk_transfers(self, transfers, tick, currency=DEFAULT_CURRENCY):
+        # Legs settle independently, in order
+        return [self.transfer(debit, credit, amount, memo, tick=tick, currency=currency)
+                for debit, credit, amount, memo in transfers]
+
     def get_balance(self, agent_id, currency=DEFAULT_CURRENCY):
         return 0 # Not used in these specific tests as assertions check objects directly
 